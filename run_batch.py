@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Exécution sans interface d'Orchestr'IA : file de jobs de génération.
+
+Exemples :
+    python run_batch.py add jobs.yaml           # ajouter des jobs à la file
+    python run_batch.py run                     # traiter la file puis s'arrêter
+    python run_batch.py run --watch             # démon : surveiller la file
+    python run_batch.py status                  # statut des jobs
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.core.job_runner import JobQueue, JobRunner, load_job_specs  # noqa: E402
+from src.utils.config import load_default_config, load_env  # noqa: E402
+from src.utils.logger import setup_logging  # noqa: E402
+
+
+def _queue_dir(config: dict, override: str = None) -> Path:
+    if override:
+        return Path(override)
+    configured = config.get("headless", {}).get("queue_dir")
+    if configured:
+        return Path(configured)
+    return ROOT_DIR / config.get("paths", {}).get("projects", "projects") / "_jobs"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="File de jobs de génération Orchestr'IA (sans interface)")
+    parser.add_argument("--queue-dir", help="Dossier de la file (défaut : headless.queue_dir)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Ajouter les jobs d'un fichier YAML/JSON")
+    add.add_argument("spec_file", type=Path)
+
+    run = commands.add_parser("run", help="Traiter la file")
+    run.add_argument("--watch", action="store_true", help="Surveiller la file sans s'arrêter")
+    run.add_argument("--concurrency", type=int, help="Projets simultanés (défaut : headless.max_concurrent_projects)")
+
+    commands.add_parser("status", help="Afficher le statut des jobs")
+
+    args = parser.parse_args(argv)
+    load_env()
+    setup_logging()
+    config = load_default_config()
+    queue = JobQueue(_queue_dir(config, args.queue_dir))
+
+    if args.command == "add":
+        count = queue.submit(load_job_specs(args.spec_file))
+        print(f"{count} job(s) ajouté(s) à {queue.queue_dir}")
+        return 0
+
+    if args.command == "status":
+        queue.load()
+        for record in queue.records.values():
+            line = f"{record.status:8} {record.job_id}  passes={record.completed_passes} tentatives={record.attempts}"
+            if record.error:
+                line += f"  erreur : {record.error}"
+            print(line)
+        pending = len(list(queue.inbox_dir.glob("*.json")))
+        if pending:
+            print(f"{pending} job(s) en attente d'intégration")
+        return 0
+
+    if args.concurrency:
+        config.setdefault("headless", {})["max_concurrent_projects"] = args.concurrency
+    counts = JobRunner(queue, base_config=config).run(watch=args.watch)
+    return 1 if counts.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
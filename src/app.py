@@ -8,6 +8,7 @@ ROOT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 
 import streamlit as st
+from src.core.generation_jobs import GenerationJobManager
 from src.utils.config import load_env, load_default_config, ROOT_DIR
 from src.utils.file_utils import save_json
 from src.utils.logger import ActivityLog, setup_logging
@@ -84,9 +85,11 @@ def render_sidebar():
             if is_disabled:
                 st.markdown(f"  {label}", help="Générez des sections avant d'accéder à l'export")
             elif st.button(label, key=f"nav_{page_id}", use_container_width=True):
-                # Persister l'état avant navigation
+                # Persister l'état avant navigation (sauf génération en tâche
+                # de fond : le job persiste lui-même l'état qu'il modifie)
                 project_id = st.session_state.get("current_project")
-                if state and project_id:
+                job = GenerationJobManager.get_instance().get(project_id) if project_id else None
+                if state and project_id and not (job and job.is_running):
                     state_path = ROOT_DIR / "projects" / project_id / "state.json"
                     save_json(state_path, state.to_dict())
                 st.session_state.current_page = page_id
@@ -0,0 +1,137 @@
+"""Exécution de lots de requêtes via les Batch APIs des fournisseurs.
+
+Phase 6 (Perf) : le travail sans dépendance entre sections (passes de
+raffinement, évaluation qualité en masse) est soumis en un seul batch —
+débit bien supérieur et coût réduit de moitié chez OpenAI et Anthropic.
+Le batch_id est communiqué à l'appelant dès la soumission pour qu'un
+redémarrage puisse reprendre le polling au lieu de resoumettre ; chaque
+requête absente ou vide dans les résultats est rejouée en temps réel.
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+from src.providers.base import AIResponse, BaseProvider, BatchError, BatchRequest, BatchStatusEnum
+from src.utils.token_counter import count_tokens
+
+logger = logging.getLogger("orchestria")
+
+# Statut porté par les réponses issues d'un batch (finish_reason)
+BATCH_FINISH_REASON = "batch"
+
+_TERMINAL_FAILURES = (BatchStatusEnum.FAILED, BatchStatusEnum.EXPIRED, BatchStatusEnum.CANCELLED)
+
+
+class BatchExecutor:
+    """Soumet, suit et récupère un batch, avec repli temps réel par requête."""
+
+    def __init__(
+        self,
+        provider: BaseProvider,
+        poll_interval: float = 30,
+        timeout: float = 3600,
+        fallback_to_realtime: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.provider = provider
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.fallback_to_realtime = fallback_to_realtime
+        self._sleep = sleep
+
+    def run(
+        self,
+        requests: list[BatchRequest],
+        batch_id: Optional[str] = None,
+        on_submit: Optional[Callable[[str], None]] = None,
+    ) -> dict[str, AIResponse]:
+        """Exécute les requêtes en batch.
+
+        Args:
+            requests: Requêtes à exécuter (custom_id uniques).
+            batch_id: Batch déjà soumis à reprendre (après redémarrage).
+            on_submit: Appelé avec le batch_id juste après la soumission.
+
+        Returns:
+            Dict {custom_id: AIResponse}. Les réponses issues du batch ont
+            ``finish_reason == "batch"`` et des tokens estimés localement
+            (l'API de résultats ne renvoie que le texte).
+
+        Raises:
+            BatchError: si le batch échoue et que le repli est désactivé.
+        """
+        if not requests:
+            return {}
+
+        contents: dict[str, str] = {}
+        try:
+            if batch_id is None:
+                batch_id = self.provider.submit_batch(requests)
+                if on_submit:
+                    on_submit(batch_id)
+            contents = self._wait_for_results(batch_id)
+        except BatchError:
+            if not self.fallback_to_realtime:
+                raise
+        except Exception as e:
+            if not self.fallback_to_realtime:
+                raise BatchError(f"Batch {self.provider.name} échoué : {e}") from e
+            logger.warning(f"Batch {self.provider.name} indisponible, repli temps réel : {e}")
+
+        results: dict[str, AIResponse] = {}
+        missing: list[BatchRequest] = []
+        for req in requests:
+            content = contents.get(req.custom_id, "")
+            if content:
+                results[req.custom_id] = self._to_response(req, content)
+            else:
+                missing.append(req)
+
+        if missing:
+            if not self.fallback_to_realtime:
+                raise BatchError(f"{len(missing)} requêtes sans résultat dans le batch {batch_id}")
+            logger.info(f"Batch {batch_id} : {len(missing)} requêtes rejouées en temps réel")
+            for req in missing:
+                try:
+                    results[req.custom_id] = self.provider.generate(
+                        prompt=req.prompt,
+                        system_prompt=req.system_prompt or None,
+                        model=req.model or None,
+                        temperature=req.temperature,
+                        max_tokens=req.max_tokens,
+                    )
+                except Exception as e:
+                    logger.error(f"Erreur temps réel pour {req.custom_id}: {e}")
+        return results
+
+    def _wait_for_results(self, batch_id: str) -> dict[str, str]:
+        """Attend la fin du batch et retourne {custom_id: contenu}."""
+        start = time.monotonic()
+        while time.monotonic() - start < self.timeout:
+            try:
+                status = self.provider.poll_batch(batch_id)
+            except Exception as e:
+                logger.warning(f"Erreur polling batch {batch_id} : {e}")
+            else:
+                logger.info(f"Batch {batch_id}: {status.status.value} ({status.completed}/{status.total})")
+                if status.status == BatchStatusEnum.COMPLETED:
+                    return self.provider.retrieve_batch_results(batch_id)
+                if status.status in _TERMINAL_FAILURES:
+                    raise BatchError(f"Batch {batch_id} échoué : {status.status.value}")
+            self._sleep(self.poll_interval)
+        raise BatchError(f"Timeout batch {batch_id} après {self.timeout}s")
+
+    def _to_response(self, req: BatchRequest, content: str) -> AIResponse:
+        model = req.model or self.provider.get_default_model()
+        input_tokens = count_tokens(req.system_prompt + req.prompt, model)
+        output_tokens = count_tokens(content, model)
+        return AIResponse(
+            content=content,
+            model=model,
+            provider=self.provider.name,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            finish_reason=BATCH_FINISH_REASON,
+        )
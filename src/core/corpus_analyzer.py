@@ -0,0 +1,219 @@
+"""Analyse du corpus (tokens, qualité, doublons) avec résultats persistés.
+
+Phase 6 (Perf) : la page d'acquisition ré-analysait chaque fichier à chaque
+exécution Streamlit — extraction (ou relecture du cache JSON complet),
+tokenisation tiktoken intégrale, détection anti-bot, déduplication — l'un
+après l'autre. CorpusAnalyzer conserve un enregistrement compact par
+fichier dans ``corpus/analysis_index.json`` :
+  - ``files`` : nom → taille, mtime_ns et hash SHA-256 du fichier ;
+  - ``records`` : hash → tokens, pages, qualité, statut, méthode, taille.
+
+Un fichier dont la taille et la date sont inchangées n'est pas relu ; un
+fichier modifié est re-hashé, et seul un contenu inconnu est ré-analysé.
+Les analyses à faire sont réparties sur un ProcessPoolExecutor
+(compute_optimal_workers). Les statuts de doublon dépendent de l'ensemble
+du corpus : ils sont recalculés à chaque appel à partir des hash, sans
+extraction.
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from src.core.corpus_deduplicator import CorpusDeduplicator
+from src.utils.file_utils import load_json, sha256_file
+
+logger = logging.getLogger("orchestria")
+
+INDEX_FILENAME = "analysis_index.json"
+INDEX_VERSION = 1
+
+# Texte plus court : source jugée suspecte (page d'erreur, paywall...)
+MIN_TEXT_CHARS = 200
+
+
+@dataclass
+class FileAnalysis:
+    """Analyse d'un fichier du corpus."""
+    filename: str
+    hash_binary: str = ""
+    hash_text: str = ""
+    tokens: int = 0
+    page_count: int = 0
+    quality: str = "OK"  # "OK", "Suspect", "Vide"
+    status: str = ""     # statut d'extraction
+    method: str = ""
+    size_bytes: int = 0
+    error: str = ""
+    dedup_status: str = "unique"  # "unique", "doublon_exact", "doublon_probable"
+    original_ref: Optional[str] = None
+
+
+# Champs propres au contenu, persistés par hash (le reste dépend du corpus)
+_RECORD_FIELDS = ("hash_text", "tokens", "page_count", "quality", "status", "method", "size_bytes", "error")
+
+
+def assess_quality(text: str) -> str:
+    """Qualité du texte extrait : « Vide », « Suspect » (anti-bot, trop court) ou « OK »."""
+    from src.utils.content_validator import is_antibot_page
+
+    if not text:
+        return "Vide"
+    if is_antibot_page(text) or len(text.strip()) < MIN_TEXT_CHARS:
+        return "Suspect"
+    return "OK"
+
+
+def _analyze_path(path_str: str, force: bool = False) -> dict:
+    """Worker : extrait et analyse un fichier (exécuté dans un processus du pool)."""
+    from src.core.text_extractor import extract
+    from src.utils.token_counter import count_tokens
+
+    path = Path(path_str)
+    try:
+        result = extract(path, force=force)
+    except Exception as e:
+        return {"status": "failed", "method": "", "quality": "Vide", "error": str(e),
+                "size_bytes": path.stat().st_size if path.exists() else 0}
+    return {
+        "hash_text": result.hash_text,
+        "tokens": count_tokens(result.text) if result.text else 0,
+        "page_count": result.page_count,
+        "quality": assess_quality(result.text),
+        "status": result.status,
+        "method": result.extraction_method,
+        "size_bytes": result.source_size_bytes,
+        "error": result.error_message or "",
+    }
+
+
+class CorpusAnalyzer:
+    """Analyse incrémentale et parallèle d'un dossier de corpus.
+
+    Args:
+        corpus_dir: Dossier du corpus (l'index y est enregistré).
+        workers: Processus d'analyse ; "auto" = compute_optimal_workers(),
+            1 = dans le processus courant.
+    """
+
+    def __init__(self, corpus_dir: Path, workers: Union[int, str] = "auto"):
+        self.corpus_dir = Path(corpus_dir)
+        self.index_path = self.corpus_dir / INDEX_FILENAME
+        self.workers = workers
+        self.last_stats: dict = {}
+
+    def analyze(self, files: Optional[Iterable[Path]] = None, force: Iterable[str] = ()) -> list[FileAnalysis]:
+        """Analyse les fichiers du corpus, dans l'ordre des noms.
+
+        Args:
+            files: Fichiers à analyser (par défaut, ceux du dossier).
+            force: Noms de fichiers à ré-extraire même s'ils sont connus.
+
+        Returns:
+            Une FileAnalysis par fichier, statut de doublon compris.
+        """
+        files = sorted(files if files is not None else self.list_files(), key=lambda f: f.name)
+        force = set(force)
+        index = self._load_index()
+        known_files, records = index["files"], index["records"]
+
+        files_entries: dict[str, dict] = {}
+        todo: dict[str, Path] = {}  # hash → fichier à analyser
+        for path in files:
+            stat = path.stat()
+            entry = known_files.get(path.name)
+            if not (entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns):
+                entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": sha256_file(path)}
+            files_entries[path.name] = entry
+            if path.name in force or entry["hash"] not in records:
+                todo.setdefault(entry["hash"], path)
+
+        for file_hash, record in self._run(todo, force).items():
+            records[file_hash] = record
+
+        analyses = []
+        deduplicator = CorpusDeduplicator(self.corpus_dir)
+        for path in files:
+            file_hash = files_entries[path.name]["hash"]
+            record = records[file_hash]
+            analysis = FileAnalysis(
+                filename=path.name,
+                hash_binary=file_hash,
+                **{k: record[k] for k in _RECORD_FIELDS if k in record},
+            )
+            if analysis.status != "failed":
+                dedup = deduplicator.check_hashes(path.name, analysis.hash_binary, analysis.hash_text)
+                analysis.dedup_status = dedup.status
+                analysis.original_ref = dedup.original_ref
+                if dedup.status == "unique":
+                    deduplicator.register(dedup)
+            analyses.append(analysis)
+
+        # Seuls les fichiers présents et leurs contenus sont conservés
+        used = {entry["hash"] for entry in files_entries.values()}
+        self._save_index({"files": files_entries, "records": {h: r for h, r in records.items() if h in used}})
+        self.last_stats = {"files": len(files), "analyzed": len(todo), "reused": len(files) - len(todo)}
+        if todo:
+            logger.info(f"Analyse du corpus : {len(todo)} fichier(s) analysé(s), {len(files) - len(todo)} repris de l'index")
+        return analyses
+
+    def list_files(self) -> list[Path]:
+        """Fichiers du corpus (hors fichiers cachés et index JSON)."""
+        if not self.corpus_dir.exists():
+            return []
+        return [
+            f for f in self.corpus_dir.iterdir()
+            if f.is_file() and not f.name.startswith(".") and f.suffix != ".json"
+        ]
+
+    def _run(self, todo: dict[str, Path], force: set[str]) -> dict[str, dict]:
+        """Analyse les fichiers en attente, en parallèle au-delà d'un fichier."""
+        if not todo:
+            return {}
+        workers = self._worker_count(len(todo))
+        if workers <= 1:
+            return {h: _analyze_path(str(p), p.name in force) for h, p in todo.items()}
+
+        results = {}
+        logger.info(f"Analyse parallèle de {len(todo)} fichiers avec {workers} workers")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_analyze_path, str(p), p.name in force): h for h, p in todo.items()}
+            for future in as_completed(futures):
+                file_hash = futures[future]
+                try:
+                    results[file_hash] = future.result()
+                except Exception as e:
+                    logger.warning(f"Analyse échouée pour {todo[file_hash].name} : {e}")
+                    results[file_hash] = {"status": "failed", "quality": "Vide", "error": str(e)}
+        return results
+
+    def _worker_count(self, pending: int) -> int:
+        if self.workers == "auto":
+            from src.core.text_extractor import compute_optimal_workers
+            workers = compute_optimal_workers()
+        else:
+            workers = int(self.workers or 1)
+        return max(1, min(workers, pending))
+
+    def _load_index(self) -> dict:
+        if self.index_path.exists():
+            try:
+                data = load_json(self.index_path)
+                if data.get("version") == INDEX_VERSION:
+                    return {"files": data.get("files", {}), "records": data.get("records", {})}
+            except Exception as e:
+                logger.warning(f"Index d'analyse du corpus illisible, reconstruction : {e}")
+        return {"files": {}, "records": {}}
+
+    def _save_index(self, index: dict) -> None:
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, **index}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Impossible d'enregistrer l'index d'analyse du corpus : {e}")
@@ -107,28 +107,30 @@ class CorpusDeduplicator:
 
         Retourne une DeduplicationEntry avec le statut approprié.
         """
-        filename = extraction.source_filename
+        return self.check_hashes(extraction.source_filename, extraction.hash_binary, extraction.hash_text)
 
+    def check_hashes(self, filename: str, hash_binary: str, hash_text: str) -> DeduplicationEntry:
+        """Vérifie un document à partir de ses seuls hash (sans ré-extraction)."""
         # Vérification par hash binaire (doublons exacts)
-        if extraction.hash_binary and extraction.hash_binary in self._binary_index:
-            original = self._binary_index[extraction.hash_binary]
+        if hash_binary and hash_binary in self._binary_index:
+            original = self._binary_index[hash_binary]
             logger.info(f"Doublon exact détecté : {filename} ↔ {original}")
             return DeduplicationEntry(
                 filename=filename,
-                hash_binary=extraction.hash_binary,
-                hash_text=extraction.hash_text,
+                hash_binary=hash_binary,
+                hash_text=hash_text,
                 status="doublon_exact",
                 original_ref=original,
             )
 
         # Vérification par hash textuel (doublons de contenu)
-        if extraction.hash_text and extraction.hash_text in self._text_index:
-            original = self._text_index[extraction.hash_text]
+        if hash_text and hash_text in self._text_index:
+            original = self._text_index[hash_text]
             logger.info(f"Doublon de contenu détecté : {filename} ↔ {original}")
             return DeduplicationEntry(
                 filename=filename,
-                hash_binary=extraction.hash_binary,
-                hash_text=extraction.hash_text,
+                hash_binary=hash_binary,
+                hash_text=hash_text,
                 status="doublon_probable",
                 original_ref=original,
             )
@@ -136,8 +138,8 @@ class CorpusDeduplicator:
         # Document unique
         return DeduplicationEntry(
             filename=filename,
-            hash_binary=extraction.hash_binary,
-            hash_text=extraction.hash_text,
+            hash_binary=hash_binary,
+            hash_text=hash_text,
             status="unique",
         )
 
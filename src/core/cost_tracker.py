@@ -1,7 +1,7 @@
 """Estimation et suivi des coûts d'utilisation des API."""
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +10,15 @@ from src.utils.token_counter import count_tokens
 
 logger = logging.getLogger("orchestria")
 
+# Phase 6 (Perf) : remise appliquée par OpenAI et Anthropic aux Batch APIs
+BATCH_DISCOUNT = 0.5
+
+# Phase 6 (Perf) : prix des tokens lus / écrits dans le cache de prompt du
+# fournisseur, en fraction du prix "input" (si model_pricing.yaml ne précise
+# pas cached_input / cache_write)
+CACHED_INPUT_RATIO = {"anthropic": 0.1, "openai": 0.5, "google": 0.25}
+CACHE_WRITE_RATIO = {"anthropic": 1.25}
+
 
 @dataclass
 class CostEntry:
@@ -21,6 +30,10 @@ class CostEntry:
     output_tokens: int
     cost_usd: float
     task_type: str = ""  # "generation", "summary", "plan", etc.
+    cached: bool = False  # Phase 6 (Perf) : servi par le cache de réponses (coût nul)
+    saved_usd: float = 0.0
+    cached_input_tokens: int = 0  # Phase 6 (Perf) : lus depuis le cache de prompt
+    cache_write_tokens: int = 0
 
 
 @dataclass
@@ -31,12 +44,23 @@ class CostReport:
     total_output_tokens: int = 0
     total_cost_usd: float = 0.0
     estimated_cost_usd: float = 0.0
+    cache_hits: int = 0
+    total_saved_usd: float = 0.0
+    total_cached_input_tokens: int = 0
+    total_cache_write_tokens: int = 0
 
     def add(self, entry: CostEntry) -> None:
         self.entries.append(entry)
+        if entry.cached:
+            # Tokens non facturés : seule l'économie est comptabilisée
+            self.cache_hits += 1
+            self.total_saved_usd += entry.saved_usd
+            return
         self.total_input_tokens += entry.input_tokens
         self.total_output_tokens += entry.output_tokens
         self.total_cost_usd += entry.cost_usd
+        self.total_cached_input_tokens += entry.cached_input_tokens
+        self.total_cache_write_tokens += entry.cache_write_tokens
 
     def to_dict(self) -> dict:
         return {
@@ -44,6 +68,10 @@ class CostReport:
             "total_output_tokens": self.total_output_tokens,
             "total_cost_usd": round(self.total_cost_usd, 6),
             "estimated_cost_usd": round(self.estimated_cost_usd, 6),
+            "cache_hits": self.cache_hits,
+            "total_saved_usd": round(self.total_saved_usd, 6),
+            "total_cached_input_tokens": self.total_cached_input_tokens,
+            "total_cache_write_tokens": self.total_cache_write_tokens,
             "entries": [
                 {
                     "section_id": e.section_id,
@@ -53,11 +81,30 @@ class CostReport:
                     "output_tokens": e.output_tokens,
                     "cost_usd": round(e.cost_usd, 6),
                     "task_type": e.task_type,
+                    "cached": e.cached,
+                    "saved_usd": round(e.saved_usd, 6),
+                    "cached_input_tokens": e.cached_input_tokens,
+                    "cache_write_tokens": e.cache_write_tokens,
                 }
                 for e in self.entries
             ],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "CostReport":
+        """Reconstruit un rapport persisté (reprise d'un projet), totaux et entrées compris."""
+        entry_fields = {f.name for f in fields(CostEntry)}
+        report = cls()
+        for raw in data.get("entries", []):
+            try:
+                report.entries.append(CostEntry(**{k: v for k, v in raw.items() if k in entry_fields}))
+            except TypeError:
+                logger.warning(f"Entrée de coût persistée invalide ignorée : {raw}")
+        for f in fields(cls):
+            if f.name != "entries" and f.name in data:
+                setattr(report, f.name, data[f.name])
+        return report
+
 
 class CostTracker:
     """Estimation et suivi des coûts API."""
@@ -71,14 +118,34 @@ class CostTracker:
         provider_pricing = self._pricing.get(provider, {})
         return provider_pricing.get(model)
 
-    def calculate_cost(self, provider: str, model: str, input_tokens: int, output_tokens: int) -> float:
-        """Calcule le coût d'un appel API."""
+    def calculate_cost(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cached_input_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float:
+        """Calcule le coût d'un appel API.
+
+        ``cached_input_tokens`` et ``cache_write_tokens`` (inclus dans
+        ``input_tokens``) sont facturés au tarif du cache de prompt.
+        """
         pricing = self.get_model_pricing(provider, model)
         if not pricing:
             logger.warning(f"Tarifs non trouvés pour {provider}/{model}")
             return 0.0
 
-        input_cost = (input_tokens / 1_000_000) * pricing.get("input", 0)
+        input_price = pricing.get("input", 0)
+        cached_price = pricing.get("cached_input", input_price * CACHED_INPUT_RATIO.get(provider, 1.0))
+        write_price = pricing.get("cache_write", input_price * CACHE_WRITE_RATIO.get(provider, 1.0))
+        uncached = max(input_tokens - cached_input_tokens - cache_write_tokens, 0)
+        input_cost = (
+            uncached * input_price
+            + cached_input_tokens * cached_price
+            + cache_write_tokens * write_price
+        ) / 1_000_000
         output_cost = (output_tokens / 1_000_000) * pricing.get("output", 0)
         return input_cost + output_cost
 
@@ -90,9 +157,26 @@ class CostTracker:
         input_tokens: int,
         output_tokens: int,
         task_type: str = "generation",
+        batch: bool = False,
+        cached: bool = False,
+        cached_input_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> CostEntry:
-        """Enregistre un appel API et retourne l'entrée de coût."""
-        cost = self.calculate_cost(provider, model, input_tokens, output_tokens)
+        """Enregistre un appel API et retourne l'entrée de coût.
+
+        ``batch=True`` applique la remise des Batch APIs (BATCH_DISCOUNT).
+        ``cached=True`` (réponse servie par le cache) enregistre un coût nul
+        et le montant économisé. ``cached_input_tokens`` / ``cache_write_tokens``
+        proviennent du cache de prompt du fournisseur (AIResponse).
+        """
+        cost = self.calculate_cost(
+            provider, model, input_tokens, output_tokens, cached_input_tokens, cache_write_tokens,
+        )
+        if batch:
+            cost *= BATCH_DISCOUNT
+        saved = 0.0
+        if cached:
+            saved, cost = cost, 0.0
         entry = CostEntry(
             section_id=section_id,
             model=model,
@@ -101,6 +185,10 @@ class CostTracker:
             output_tokens=output_tokens,
             cost_usd=cost,
             task_type=task_type,
+            cached=cached,
+            saved_usd=saved,
+            cached_input_tokens=cached_input_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
         self._report.add(entry)
         return entry
@@ -0,0 +1,241 @@
+"""Cache persistant d'embeddings adressé par contenu.
+
+Phase 6 (Perf) : évite de recalculer les vecteurs des chunks déjà vectorisés
+lors d'une ré-indexation (ajout d'un document, reset(), projet cloné).
+
+La clé est (provider d'embedding, modèle, mode de préfixe, SHA-256 du texte).
+Les trois premiers éléments déterminent le répertoire du cache ; le SHA-256
+identifie la ligne dans ce répertoire.
+
+Format disque (un répertoire par modèle) :
+  - vectors.f32 : matrice float32 brute (append-only), une ligne par chunk
+  - keys.bin    : digests SHA-256 (32 octets) dans le même ordre que les lignes
+  - meta.json   : provider, modèle, mode de préfixe et dimension
+
+Les vecteurs sont écrits avant les clés : après un arrêt brutal, les lignes
+orphelines sont simplement tronquées au rechargement.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.utils.file_utils import ensure_dir, sanitize_filename
+
+logger = logging.getLogger("orchestria")
+
+KEY_SIZE = 32  # Taille d'un digest SHA-256 en octets
+
+VECTORS_FILENAME = "vectors.f32"
+KEYS_FILENAME = "keys.bin"
+META_FILENAME = "meta.json"
+
+
+def text_digest(text: str) -> bytes:
+    """Calcule le digest SHA-256 (binaire) d'un texte de chunk."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Cache disque des embeddings pour un couple (provider, modèle, préfixe).
+
+    Thread-safe : le pipeline d'indexation consulte le cache depuis un
+    thread d'arrière-plan pendant que le thread principal écrit dans ChromaDB.
+    """
+
+    def __init__(self, cache_dir: Path, provider: str, model: str, prefix_mode: str = "none"):
+        self.provider = provider
+        self.model = model
+        self.prefix_mode = prefix_mode
+        identity = f"{provider}::{model}::{prefix_mode}"
+        slug = sanitize_filename(f"{provider}__{model}__{prefix_mode}".replace("/", "_"))
+        suffix = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:8]
+        self.directory = Path(cache_dir) / f"{slug}_{suffix}"
+
+        self._lock = threading.Lock()
+        self._index: Optional[dict[bytes, int]] = None
+        self._dim: Optional[int] = None
+        self._mmap: Optional[np.memmap] = None
+        self._mmap_rows = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ── Chargement ──
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.directory / VECTORS_FILENAME
+
+    @property
+    def _keys_path(self) -> Path:
+        return self.directory / KEYS_FILENAME
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.directory / META_FILENAME
+
+    def _load_index(self) -> None:
+        """Charge l'index digest → ligne depuis keys.bin (paresseux)."""
+        if self._index is not None:
+            return
+        self._index = {}
+        if not self._meta_path.exists():
+            return
+        try:
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                self._dim = int(json.load(f)["dimension"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Cache d'embeddings illisible ({self.directory}), réinitialisé : {e}")
+            self._dim = None
+            for path in (self._keys_path, self._vectors_path, self._meta_path):
+                path.unlink(missing_ok=True)
+            return
+
+        raw_keys = self._keys_path.read_bytes() if self._keys_path.exists() else b""
+        vectors_size = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+        row_bytes = self._dim * 4
+        n_rows = min(len(raw_keys) // KEY_SIZE, vectors_size // row_bytes)
+
+        # Réparation après arrêt brutal : tronquer les écritures incomplètes
+        if len(raw_keys) != n_rows * KEY_SIZE:
+            with open(self._keys_path, "r+b") as f:
+                f.truncate(n_rows * KEY_SIZE)
+        if vectors_size != n_rows * row_bytes:
+            with open(self._vectors_path, "r+b") as f:
+                f.truncate(n_rows * row_bytes)
+
+        for row in range(n_rows):
+            self._index[raw_keys[row * KEY_SIZE:(row + 1) * KEY_SIZE]] = row
+
+    def _get_mmap(self) -> Optional[np.memmap]:
+        """Retourne une vue mmap des vecteurs, rouverte si le fichier a grandi."""
+        n_rows = len(self._index)
+        if not n_rows or self._dim is None:
+            return None
+        if self._mmap is None or self._mmap_rows != n_rows:
+            self._mmap = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(n_rows, self._dim))
+            self._mmap_rows = n_rows
+        return self._mmap
+
+    # ── API publique ──
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load_index()
+            return len(self._index)
+
+    def lookup(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray, list[int]]:
+        """Recherche les embeddings en cache pour une liste de textes.
+
+        Args:
+            texts: Textes des chunks (sans préfixe).
+
+        Returns:
+            Tuple (hit_positions, hit_vectors, miss_positions) : hit_positions
+            (int64) donne la position dans ``texts`` de chaque ligne de
+            hit_vectors (float32), miss_positions liste les positions à calculer.
+        """
+        hit_positions: list[int] = []
+        hit_rows: list[int] = []
+        misses: list[int] = []
+        with self._lock:
+            self._load_index()
+            for pos, text in enumerate(texts):
+                row = self._index.get(text_digest(text))
+                if row is None:
+                    misses.append(pos)
+                else:
+                    hit_positions.append(pos)
+                    hit_rows.append(row)
+
+            mmap = self._get_mmap() if hit_rows else None
+            if mmap is not None:
+                hit_vectors = np.asarray(mmap[hit_rows], dtype=np.float32)
+            else:
+                hit_vectors = np.empty((0, self._dim or 0), dtype=np.float32)
+
+            self.hits += len(hit_positions)
+            self.misses += len(misses)
+        return np.asarray(hit_positions, dtype=np.int64), hit_vectors, misses
+
+    def store(self, texts: list[str], embeddings) -> int:
+        """Ajoute des embeddings au cache (les textes déjà présents sont ignorés).
+
+        Returns:
+            Nombre de nouveaux vecteurs écrits.
+        """
+        if not texts or len(texts) != len(embeddings):
+            return 0
+        with self._lock:
+            self._load_index()
+            new_keys: list[bytes] = []
+            new_rows: list[int] = []
+            seen: set[bytes] = set()
+            for i, text in enumerate(texts):
+                key = text_digest(text)
+                if key in self._index or key in seen:
+                    continue
+                seen.add(key)
+                new_keys.append(key)
+                new_rows.append(i)
+            if not new_keys:
+                return 0
+
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            if len(new_rows) != len(texts):
+                matrix = matrix[new_rows]
+            if matrix.ndim != 2:
+                return 0
+            if self._dim is None:
+                ensure_dir(self.directory)
+                self._dim = int(matrix.shape[1])
+                with open(self._meta_path, "w", encoding="utf-8") as f:
+                    json.dump({
+                        "provider": self.provider,
+                        "model": self.model,
+                        "prefix_mode": self.prefix_mode,
+                        "dimension": self._dim,
+                    }, f)
+            elif matrix.shape[1] != self._dim:
+                logger.warning(
+                    f"Dimension d'embedding inattendue ({matrix.shape[1]} vs {self._dim}), cache ignoré"
+                )
+                return 0
+
+            # Vecteurs d'abord, clés ensuite (voir docstring du module)
+            with open(self._vectors_path, "ab") as f:
+                f.write(np.ascontiguousarray(matrix).tobytes())
+            with open(self._keys_path, "ab") as f:
+                f.write(b"".join(new_keys))
+
+            start = len(self._index)
+            for offset, key in enumerate(new_keys):
+                self._index[key] = start + offset
+            return len(new_keys)
+
+    def reset_stats(self) -> None:
+        """Remet à zéro les compteurs de hits/misses."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Taux de hits depuis le dernier reset_stats()."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Statistiques du cache (pour logs et UI)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "entries": len(self),
+            "directory": str(self.directory),
+        }
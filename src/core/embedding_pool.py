@@ -0,0 +1,171 @@
+"""Pool multi-processus pour les embeddings locaux (indexation de masse).
+
+Phase 6 (Perf) : LocalEmbedder tourne dans un seul processus avec quelques
+threads ONNX, ce qui laisse la plupart des cœurs inutilisés lors de
+l'indexation d'un gros corpus. EmbeddingPool découpe les textes en tranches
+(shards) réparties sur N processus, chacun avec sa propre session ONNX et son
+propre nombre de threads, puis réassemble les vecteurs dans l'ordre.
+
+Le nombre de processus est calculé automatiquement à partir des cœurs et de
+la RAM disponibles (même principe que compute_optimal_workers pour Docling).
+Le débit (chunks/s) du dernier appel est exposé dans last_stats.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from src.core.local_embedder import DEFAULT_THREADS, LocalEmbedder
+
+logger = logging.getLogger("orchestria")
+
+DEFAULT_SHARD_SIZE = 256
+# Empreinte estimée d'un worker : modèle ONNX FastEmbed (fp32, non quantifié)
+# chargé en entier dans chaque processus + activations. Modèle inconnu :
+# budget prudent de RAM_PER_WORKER_GB.
+RAM_PER_WORKER_GB = 3.0
+MODEL_RAM_GB = {
+    "intfloat/multilingual-e5-large": 3.0,  # ~2,2 Go de poids
+    "intfloat/multilingual-e5-base": 1.5,
+    "intfloat/multilingual-e5-small": 1.0,
+}
+RAM_SECURITY_GB = 2.0
+
+
+def ram_per_worker_gb(model_name: Optional[str] = None) -> float:
+    """Budget RAM d'un worker pour le modèle d'embedding configuré."""
+    return MODEL_RAM_GB.get(model_name or "", RAM_PER_WORKER_GB)
+
+
+def compute_embedding_workers(threads_per_worker: int = DEFAULT_THREADS, model_name: Optional[str] = None) -> int:
+    """Calcule le nombre de processus d'embedding selon RAM et CPU disponibles.
+
+    Formule : workers = min(CPU_COUNT // THREADS, (RAM_DISPO_GB - 2GB) // RAM_MODELE_GB)
+    Fallback : toujours au moins 1 worker.
+    """
+    threads_per_worker = max(1, threads_per_worker)
+    worker_ram_gb = ram_per_worker_gb(model_name)
+    try:
+        import psutil
+        ram_available_gb = psutil.virtual_memory().available / (1024 ** 3)
+        cpu_count = os.cpu_count() or 1
+        cpu_workers = cpu_count // threads_per_worker
+        ram_workers = int((ram_available_gb - RAM_SECURITY_GB) / worker_ram_gb)
+        workers = max(1, min(cpu_workers, ram_workers))
+        logger.info(
+            f"Pool d'embeddings : RAM dispo={ram_available_gb:.1f}GB, CPU={cpu_count}, "
+            f"threads/worker={threads_per_worker}, RAM/worker={worker_ram_gb}GB, workers calculés={workers}"
+        )
+        return workers
+    except ImportError:
+        logger.warning("psutil non disponible, pool d'embeddings limité à 1 worker")
+        return 1
+    except Exception as e:
+        logger.warning(f"Erreur calcul workers d'embedding : {e}, fallback à 1")
+        return 1
+
+
+# --- Worker (initialisé une seule fois par processus) ---
+
+_worker_embedder: Optional[LocalEmbedder] = None
+
+
+def _init_embedding_worker(model_name: str, cache_dir: str, threads: int) -> None:
+    """Initializer du ProcessPoolExecutor : une session ONNX par processus."""
+    global _worker_embedder
+    _worker_embedder = LocalEmbedder(model_name, cache_dir, threads=threads)
+
+
+def _embed_shard(args: tuple[list[str], int]) -> np.ndarray:
+    """Vectorise une tranche de documents dans le processus worker."""
+    texts, batch_size = args
+    return _worker_embedder.embed_documents(texts, batch_size=batch_size)
+
+
+class EmbeddingPool:
+    """Répartit l'embedding de documents sur plusieurs processus FastEmbed."""
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str,
+        workers: int,
+        threads_per_worker: int = DEFAULT_THREADS,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+    ):
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self.workers = max(1, workers)
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.shard_size = max(1, shard_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.last_stats: dict = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                logger.info(
+                    f"Démarrage du pool d'embeddings : {self.workers} processus "
+                    f"x {self.threads_per_worker} threads ONNX"
+                )
+                # spawn : les runtimes ONNX/BLAS du processus parent (embedder de
+                # requêtes, reranker) ne survivent pas proprement à un fork.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_embedding_worker,
+                    initargs=(self.model_name, self.cache_dir, self.threads_per_worker),
+                )
+            return self._executor
+
+    def embed_documents(self, texts: list[str], batch_size: int = 16) -> np.ndarray:
+        """Encode des documents en parallèle (préfixe 'passage:' appliqué par les workers).
+
+        Les tranches sont soumises à tous les processus et les résultats sont
+        recopiés au fil de l'eau, dans l'ordre, dans une matrice pré-allouée.
+
+        Returns:
+            Matrice float32 (len(texts), dimension).
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        start = time.perf_counter()
+        shards = [
+            (texts[i:i + self.shard_size], batch_size)
+            for i in range(0, len(texts), self.shard_size)
+        ]
+        out: Optional[np.ndarray] = None
+        row = 0
+        for vectors in self._get_executor().map(_embed_shard, shards):
+            if out is None:
+                out = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            out[row:row + len(vectors)] = vectors
+            row += len(vectors)
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "chunks": len(texts),
+            "seconds": round(elapsed, 3),
+            "chunks_per_s": round(len(texts) / elapsed, 1) if elapsed > 0 else 0.0,
+            "workers": self.workers,
+            "shards": len(shards),
+        }
+        logger.info(
+            f"Pool d'embeddings : {len(texts)} chunks en {elapsed:.1f}s "
+            f"({self.last_stats['chunks_per_s']} chunks/s, {self.workers} workers)"
+        )
+        return out
+
+    def close(self) -> None:
+        """Arrête les processus workers (libère la RAM des modèles)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,338 @@
+"""Cache disque des extractions de texte, adressé par le contenu du fichier.
+
+Phase 6 (Perf) : le cache Phase 5 (data/cache/) indexait chaque entrée par
+MD5(contenu + mtime), calculé deux fois lors d'un échec de cache, puis
+_make_result relisait le fichier pour son SHA-256 : trois lectures
+complètes d'un PDF de plusieurs centaines de Mo. Les entrées étaient du
+JSON indenté (texte et structure compris), sans limite de taille.
+
+ExtractionCache :
+  - Clé : SHA-256 du contenu (= ``hash_binary``), calculé en une seule
+    lecture et mémorisé par (chemin, taille, mtime_ns) ; l'extension fait
+    partie du nom d'entrée car elle détermine l'extracteur.
+  - Deux fichiers par entrée : ``<clé>.meta.json`` (métadonnées compactes)
+    et ``<clé>.payload.z`` (texte + structure, JSON compressé zlib), lu
+    seulement au premier accès à ``text`` ou ``structure``.
+  - Taille bornée (``extraction_cache.max_size_mb``) avec éviction LRU ;
+    la date de modification du fichier meta sert de dernier accès.
+  - Compteurs hits / misses / évictions (``stats()``).
+
+Chaque processus (workers compris) a son instance ; les écritures sont
+atomiques (fichier temporaire + os.replace), le répertoire peut donc être
+partagé. text_extractor importe ce module à la demande (dépendance
+circulaire sur ExtractionResult).
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.core.text_extractor import ExtractionResult
+from src.utils.file_utils import ensure_dir, sha256_file
+
+logger = logging.getLogger("orchestria")
+
+META_SUFFIX = ".meta.json"
+PAYLOAD_SUFFIX = ".payload.z"
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+HASH_MEMO_SIZE = 4096
+
+# Champs lus à la demande depuis le payload compressé
+LAZY_FIELDS = ("text", "structure")
+
+# Entrées du format Phase 5 : <md5>.json
+_LEGACY_ENTRY = re.compile(r"^[0-9a-f]{32}\.json$")
+
+
+def _read_payload(payload_path: Path) -> dict:
+    with open(payload_path, "rb") as f:
+        return json.loads(zlib.decompress(f.read()).decode("utf-8"))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _lazy_field(name: str) -> property:
+    def getter(self):
+        if name in self._overrides:
+            return self._overrides[name]
+        if self._payload is None:
+            try:
+                self._payload = _read_payload(self._payload_path)
+            except (OSError, zlib.error, ValueError) as e:
+                logger.warning(f"Payload d'extraction illisible ({self._payload_path.name}) : {e}")
+                self._payload = {}
+        return self._payload.get(name, "" if name == "text" else None)
+
+    def setter(self, value):
+        self._overrides[name] = value
+
+    return property(getter, setter)
+
+
+class LazyExtractionResult(ExtractionResult):
+    """ExtractionResult chargé depuis le cache ; ``text`` et ``structure``
+    ne sont décompressés qu'au premier accès."""
+
+    def __init__(self, payload_path: Path, **meta):
+        self._payload_path = payload_path
+        self._payload: Optional[dict] = None
+        self._overrides: dict = {}
+        for f in fields(ExtractionResult):
+            if f.name not in LAZY_FIELDS:
+                setattr(self, f.name, meta[f.name])
+
+    text = _lazy_field("text")
+    structure = _lazy_field("structure")
+
+
+class ExtractionCache:
+    """Cache des ExtractionResult, borné en taille (éviction LRU).
+
+    Args:
+        directory: Répertoire du cache.
+        max_bytes: Taille maximale (meta + payloads) avant éviction.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max(1, max_bytes)
+        self._lock = threading.Lock()
+        self._hash_memo: OrderedDict[tuple, str] = OrderedDict()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hashed_bytes = 0
+
+    # --- Clé ---
+
+    def content_hash(self, path: Path) -> str:
+        """SHA-256 du contenu, lu une seule fois tant que taille et mtime sont inchangés."""
+        path = Path(path)
+        stat = path.stat()
+        memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._hash_memo.get(memo_key)
+            if cached is not None:
+                self._hash_memo.move_to_end(memo_key)
+                return cached
+        digest = sha256_file(path)
+        with self._lock:
+            self.hashed_bytes += stat.st_size
+            self._hash_memo[memo_key] = digest
+            while len(self._hash_memo) > HASH_MEMO_SIZE:
+                self._hash_memo.popitem(last=False)
+        return digest
+
+    @staticmethod
+    def entry_name(content_hash: str, suffix: str = "") -> str:
+        ext = suffix.lower().lstrip(".")
+        return f"{content_hash}_{ext}" if ext else content_hash
+
+    def _meta_path(self, entry: str) -> Path:
+        return self.directory / f"{entry}{META_SUFFIX}"
+
+    def _payload_path(self, entry: str) -> Path:
+        return self.directory / f"{entry}{PAYLOAD_SUFFIX}"
+
+    # --- Lecture / écriture ---
+
+    def get(self, path: Path, content_hash: Optional[str] = None) -> Optional[ExtractionResult]:
+        """Résultat en cache pour ``path`` (métadonnées du fichier courant), ou None."""
+        path = Path(path)
+        content_hash = content_hash or self.content_hash(path)
+        entry = self.entry_name(content_hash, path.suffix)
+        meta_path = self._meta_path(entry)
+        payload_path = self._payload_path(entry)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if not payload_path.exists():
+                raise FileNotFoundError(payload_path.name)
+            # Contenu identique sous un autre nom : métadonnées du fichier demandé
+            stat = path.stat()
+            meta.update(
+                source_filename=path.name,
+                source_size_bytes=stat.st_size,
+                source_modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            )
+            result = LazyExtractionResult(payload_path, **meta)
+            os.utime(meta_path)  # dernier accès (LRU)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Cache d'extraction invalide ({entry[:12]}...), suppression : {e}")
+            self._remove(entry)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        logger.info(f"[CACHE] Résultat chargé depuis le cache pour {path.name} (hash={content_hash[:12]}...)")
+        return result
+
+    def put(self, result: ExtractionResult, content_hash: str, suffix: str = "") -> None:
+        """Enregistre un ExtractionResult et évince les entrées les plus anciennes au-delà de max_bytes."""
+        entry = self.entry_name(content_hash, suffix)
+        data = asdict(result)
+        payload = zlib.compress(
+            json.dumps({k: data.pop(k) for k in LAZY_FIELDS}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+        meta = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        try:
+            ensure_dir(self.directory)
+            previous = self._entry_size(entry)
+            # Payload d'abord : une meta présente garantit un payload complet
+            _write_atomic(self._payload_path(entry), payload)
+            _write_atomic(self._meta_path(entry), meta)
+        except OSError as e:
+            logger.warning(f"Impossible de sauvegarder le cache pour {result.source_filename}: {e}")
+            return
+        logger.info(f"[EXTRACTION] Cache sauvegardé pour {result.source_filename} (hash={content_hash[:12]}...)")
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(payload) + len(meta) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def contains(self, path: Path, content_hash: Optional[str] = None) -> bool:
+        path = Path(path)
+        entry = self.entry_name(content_hash or self.content_hash(path), path.suffix)
+        return self._meta_path(entry).exists()
+
+    def invalidate(self, path: Path, content_hash: Optional[str] = None) -> bool:
+        """Supprime l'entrée de ``path`` ; True si elle existait."""
+        path = Path(path)
+        entry = self.entry_name(content_hash or self.content_hash(path), path.suffix)
+        removed = self._remove(entry)
+        if removed:
+            with self._lock:
+                self._total_bytes = None
+        return removed
+
+    def clear(self) -> None:
+        """Vide le cache (entrées Phase 5 comprises)."""
+        with self._lock:
+            if self.directory.exists():
+                for f in self.directory.iterdir():
+                    if f.is_file():
+                        f.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def stats(self) -> dict:
+        """Compteurs du cache (pour logs et UI)."""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bytes": self._total_bytes,
+                "hashed_bytes": self.hashed_bytes,
+                "directory": str(self.directory),
+            }
+
+    # --- Taille et éviction ---
+
+    def _entry_size(self, entry: str) -> int:
+        size = 0
+        for p in (self._meta_path(entry), self._payload_path(entry)):
+            try:
+                size += p.stat().st_size
+            except OSError:
+                pass
+        return size
+
+    def _remove(self, entry: str) -> bool:
+        meta_path = self._meta_path(entry)
+        existed = meta_path.exists()
+        meta_path.unlink(missing_ok=True)
+        self._payload_path(entry).unlink(missing_ok=True)
+        return existed
+
+    def _scan_size(self) -> int:
+        # Appelé sous self._lock ; les entrées Phase 5 (JSON indenté) sont retirées
+        if not self.directory.exists():
+            return 0
+        total = 0
+        legacy = 0
+        for f in self.directory.iterdir():
+            if _LEGACY_ENTRY.match(f.name):
+                f.unlink(missing_ok=True)
+                legacy += 1
+            elif f.is_file():
+                total += f.stat().st_size
+        if legacy:
+            logger.info(f"Cache d'extraction : {legacy} entrée(s) de l'ancien format supprimée(s)")
+        return total
+
+    def _evict(self) -> None:
+        # Appelé sous self._lock ; relit le disque (d'autres processus écrivent aussi)
+        entries = []
+        total = 0
+        for meta_path in self.directory.glob(f"*{META_SUFFIX}"):
+            entry = meta_path.name[: -len(META_SUFFIX)]
+            try:
+                last_used = meta_path.stat().st_mtime
+            except OSError:
+                continue
+            size = self._entry_size(entry)
+            entries.append((last_used, entry, size))
+            total += size
+        entries.sort()
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(entry)
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
+
+
+_caches: dict[str, ExtractionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_extraction_cache(directory: Path, max_bytes: Optional[int] = None) -> ExtractionCache:
+    """Instance du processus pour ``directory`` (partagée par extract, clear_cache, ...).
+
+    ``max_bytes`` absent : ``extraction_cache.max_size_mb`` de default.yaml.
+    """
+    key = str(Path(directory).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            if max_bytes is None:
+                max_bytes = _configured_max_bytes()
+            cache = _caches[key] = ExtractionCache(directory, max_bytes)
+        return cache
+
+
+def _configured_max_bytes() -> int:
+    try:
+        from src.utils.config import load_default_config
+        cfg = load_default_config().get("extraction_cache", {}) or {}
+        return int(float(cfg.get("max_size_mb", DEFAULT_MAX_BYTES // (1024 * 1024))) * 1024 * 1024)
+    except Exception:
+        return DEFAULT_MAX_BYTES
@@ -6,6 +6,7 @@ Phase 4 (Perf) : évaluation parallèle des claims via ThreadPoolExecutor,
            réutilisation des corpus_chunks déjà récupérés par l'orchestrateur.
 """
 
+import contextvars
 import json
 import logging
 import re
@@ -16,6 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from src.core.response_cache import llm_task
 from src.providers.base import BaseProvider
 from src.utils.file_utils import ensure_dir, save_json, load_json
 
@@ -211,13 +213,14 @@ class FactcheckEngine:
         else:
             corpus_text = self._get_corpus_excerpts(section_title, section_description)
 
-        if word_count < 2000 and corpus_text:
-            # Short section: combined extraction + evaluation
-            report = self._check_combined(section_id, content, corpus_text, model)
-        else:
-            # Long section: extract claims first, then evaluate in parallel
-            claims = self._extract_claims(content, model)
-            report = self._evaluate_claims(section_id, claims, corpus_text, model)
+        with llm_task("factcheck"):
+            if word_count < 2000 and corpus_text:
+                # Short section: combined extraction + evaluation
+                report = self._check_combined(section_id, content, corpus_text, model)
+            else:
+                # Long section: extract claims first, then evaluate in parallel
+                claims = self._extract_claims(content, model)
+                report = self._evaluate_claims(section_id, claims, corpus_text, model)
 
         # Save report
         if self.project_dir:
@@ -383,8 +386,10 @@ class FactcheckEngine:
 
         max_workers = min(self.max_concurrent_evaluations, len(valid_claims))
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Phase 6 (Perf) : chaque thread hérite de la priorité de débit et
+            # du type de tâche de l'appelant (contextvars non propagés par l'executor)
             futures = {
-                executor.submit(evaluate_single, claim): claim
+                executor.submit(contextvars.copy_context().run, evaluate_single, claim): claim
                 for claim in valid_claims
             }
             for future in as_completed(futures):
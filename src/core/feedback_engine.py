@@ -10,6 +10,7 @@ import re
 from datetime import datetime
 from typing import Optional
 
+from src.core.response_cache import llm_task
 from src.providers.base import BaseProvider
 
 logger = logging.getLogger("orchestria")
@@ -135,13 +136,14 @@ class FeedbackEngine:
 
         try:
             model = self.analysis_model or self.provider.get_default_model()
-            response = self.provider.generate(
-                prompt=prompt,
-                system_prompt="Tu es un analyste de qualité rédactionnelle. Retourne uniquement du JSON valide.",
-                model=model,
-                temperature=0.3,
-                max_tokens=500,
-            )
+            with llm_task("feedback"):
+                response = self.provider.generate(
+                    prompt=prompt,
+                    system_prompt="Tu es un analyste de qualité rédactionnelle. Retourne uniquement du JSON valide.",
+                    model=model,
+                    temperature=0.3,
+                    max_tokens=500,
+                )
             data = self._parse_json(response.content)
             if not data:
                 return None
@@ -0,0 +1,251 @@
+"""Génération en tâche de fond, indépendante des exécutions Streamlit.
+
+Phase 6 (Perf) : la page de génération exécutait toute la boucle multi-passe
+dans le script Streamlit ; un rafraîchissement du navigateur interrompait ou
+dupliquait le travail, et chaque exécution reconstruisait l'Orchestrator.
+Le GenerationJobManager (un par processus) possède désormais un thread de
+génération par projet : la page démarre le job puis se contente d'en lire
+les événements, et retrouve le job et son Orchestrator après un
+rafraîchissement.
+
+Les événements (passe, section démarrée/terminée/en échec, tokens, coût)
+sont publiés sur un EventBus : tampon circulaire en mémoire pour
+l'interface, plus une fin de journal persistée
+(``<projet>/generation_events.jsonl``) consultable après un redémarrage.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger("orchestria")
+
+EVENTS_FILENAME = "generation_events.jsonl"
+DEFAULT_TAIL_SIZE = 500
+
+
+@dataclass
+class GenerationEvent:
+    """Événement de progression d'un job de génération."""
+    seq: int
+    type: str  # "job_started", "pass_started", "section_started", "section_finished", ...
+    data: dict = field(default_factory=dict)
+    timestamp: str = ""
+
+    def __post_init__(self):
+        if not self.timestamp:
+            self.timestamp = datetime.now().isoformat()
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class EventBus:
+    """Bus d'événements d'un job : tampon en mémoire + fin de journal sur disque.
+
+    Args:
+        path: Fichier JSONL de la fin de journal (None = mémoire seule).
+        tail_size: Événements conservés en mémoire et sur disque.
+    """
+
+    def __init__(self, path: Optional[Path] = None, tail_size: int = DEFAULT_TAIL_SIZE):
+        self.path = path
+        self.tail_size = tail_size
+        self._events: deque[GenerationEvent] = deque(maxlen=tail_size)
+        self._condition = threading.Condition()
+        self._seq = 0
+        self._persisted_lines = 0
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Une nouvelle génération repart d'un journal vide
+            path.write_text("", encoding="utf-8")
+
+    def publish(self, event_type: str, **data) -> GenerationEvent:
+        with self._condition:
+            self._seq += 1
+            event = GenerationEvent(seq=self._seq, type=event_type, data=data)
+            self._events.append(event)
+            if self.path is not None:
+                self._persist(event)
+            self._condition.notify_all()
+        return event
+
+    def since(self, seq: int = 0) -> list[GenerationEvent]:
+        """Événements de numéro strictement supérieur à ``seq``."""
+        with self._condition:
+            return [e for e in self._events if e.seq > seq]
+
+    def wait(self, seq: int, timeout: Optional[float] = None) -> list[GenerationEvent]:
+        """Attend un événement postérieur à ``seq`` (abonnement par long polling)."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._seq > seq, timeout=timeout)
+        return self.since(seq)
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def _persist(self, event: GenerationEvent) -> None:
+        try:
+            if self._persisted_lines >= 2 * self.tail_size:
+                # Compaction : seule la fin du journal est conservée
+                lines = [json.dumps(e.to_dict(), ensure_ascii=False) for e in self._events]
+                self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+                self._persisted_lines = len(lines)
+                return
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+            self._persisted_lines += 1
+        except OSError as e:
+            logger.warning(f"Écriture du journal d'événements échouée : {e}")
+
+
+def read_event_tail(project_dir: Path, limit: int = 50) -> list[dict]:
+    """Lit les derniers événements persistés d'un projet (après redémarrage)."""
+    path = Path(project_dir) / EVENTS_FILENAME
+    if not path.exists():
+        return []
+    events = []
+    for line in path.read_text(encoding="utf-8").splitlines()[-limit:]:
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue  # ligne tronquée par un arrêt brutal
+    return events
+
+
+class GenerationJob:
+    """Génération multi-passe d'un projet exécutée dans un thread dédié."""
+
+    def __init__(self, project_id: str, orchestrator, bus: EventBus):
+        self.project_id = project_id
+        self.orchestrator = orchestrator
+        self.bus = bus
+        self.status = "pending"  # "pending", "running", "done", "failed"
+        self.error = ""
+        self.progress = 0.0
+        self.message = ""
+        self.live_text: dict[str, str] = {}  # section_id → texte en flux
+        self.started_at = ""
+        self.finished_at = ""
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _on_progress(self, message: str, percent: float) -> None:
+        self.message = message
+        self.progress = percent
+        self.bus.publish("progress", message=message, percent=percent)
+
+    def _on_event(self, event_type: str, data: dict) -> None:
+        if event_type in ("section_finished", "section_failed"):
+            self.live_text.pop(data.get("section_id"), None)
+        self.bus.publish(event_type, **data)
+
+    def _on_stream(self, section_id: str, text: str) -> None:
+        # Texte en flux : mémoire seule (trop fréquent pour le bus)
+        self.live_text[section_id] = text
+
+    def _run(self, num_passes: Optional[int], before_run: Optional[Callable[[], None]]) -> None:
+        orchestrator = self.orchestrator
+        orchestrator.event_callback = self._on_event
+        orchestrator.stream_callback = self._on_stream
+        self.status = "running"
+        self.started_at = datetime.now().isoformat()
+        self.bus.publish("job_started", project_id=self.project_id)
+        try:
+            if before_run is not None:
+                before_run()
+            orchestrator.generate_multi_pass(num_passes=num_passes, progress_callback=self._on_progress)
+            self.status = "done"
+            self.bus.publish(
+                "job_finished",
+                cost_usd=orchestrator.cost_tracker.report.total_cost_usd,
+                sections=len(orchestrator.state.generated_sections) if orchestrator.state else 0,
+            )
+        except Exception as e:
+            logger.exception(f"Génération en tâche de fond échouée ({self.project_id})")
+            self.status = "failed"
+            self.error = str(e)
+            self.bus.publish("job_failed", error=str(e))
+            if orchestrator.state is not None:
+                orchestrator.save_state()
+        finally:
+            self.finished_at = datetime.now().isoformat()
+            self.live_text.clear()
+            orchestrator.event_callback = None
+            orchestrator.stream_callback = None
+
+
+class GenerationJobManager:
+    """Registre des jobs de génération du processus, un par projet."""
+
+    _instance: Optional["GenerationJobManager"] = None
+    _lock = threading.Lock()
+
+    def __init__(self, tail_size: int = DEFAULT_TAIL_SIZE):
+        self.tail_size = tail_size
+        self._jobs: dict[str, GenerationJob] = {}
+        self._jobs_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "GenerationJobManager":
+        """Retourne l'instance du processus (partagée par toutes les sessions)."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Réinitialise le singleton (utile pour les tests)."""
+        cls._instance = None
+
+    def get(self, project_id: str) -> Optional[GenerationJob]:
+        with self._jobs_lock:
+            return self._jobs.get(project_id)
+
+    def start(
+        self,
+        project_id: str,
+        orchestrator,
+        num_passes: Optional[int] = None,
+        before_run: Optional[Callable[[], None]] = None,
+    ) -> GenerationJob:
+        """Démarre la génération d'un projet en tâche de fond.
+
+        Si un job est déjà en cours pour ce projet, il est retourné tel quel
+        (un double clic ou une seconde session ne duplique pas le travail).
+        L'Orchestrator d'un job terminé est fermé lorsqu'il est remplacé.
+
+        Args:
+            before_run: Préparation exécutée dans le thread du job avant la
+                génération (ex. extraction du corpus).
+        """
+        with self._jobs_lock:
+            previous = self._jobs.get(project_id)
+            if previous is not None and previous.is_running:
+                return previous
+            bus = EventBus(Path(orchestrator.project_dir) / EVENTS_FILENAME, tail_size=self.tail_size)
+            job = GenerationJob(project_id, orchestrator, bus)
+            job._thread = threading.Thread(
+                target=job._run, args=(num_passes, before_run),
+                name=f"generation-{project_id}", daemon=True,
+            )
+            self._jobs[project_id] = job
+        if previous is not None and previous.orchestrator is not orchestrator:
+            previous.orchestrator.close()
+        job._thread.start()
+        return job
@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from src.core.response_cache import llm_task
 from src.providers.base import BaseProvider
 from src.utils.file_utils import save_json, load_json
 
@@ -232,13 +233,14 @@ class GlossaryEngine:
         """Appel IA commun pour la génération de termes."""
         try:
             model = model or provider.get_default_model()
-            response = provider.generate(
-                prompt=prompt,
-                system_prompt="Tu es un terminologue expert. Retourne uniquement du JSON valide.",
-                model=model,
-                temperature=0.3,
-                max_tokens=2000,
-            )
+            with llm_task("glossary"):
+                response = provider.generate(
+                    prompt=prompt,
+                    system_prompt="Tu es un terminologue expert. Retourne uniquement du JSON valide.",
+                    model=model,
+                    temperature=0.3,
+                    max_tokens=2000,
+                )
             return self._parse_terms(response.content)
         except Exception as e:
             logger.warning(f"Génération du glossaire échouée : {e}")
@@ -0,0 +1,437 @@
+"""Exécution sans interface d'une file de projets (runs de nuit).
+
+Phase 6 (Perf) : l'interface Streamlit pilote un projet à la fois depuis une
+session navigateur. JobRunner traite une file de spécifications (fichier de
+plan ou objectif, dossier de corpus, profil) sans Streamlit : plusieurs
+projets sont générés simultanément sur une même boucle asyncio
+(``Orchestrator.agenerate_all_sections``), en partageant les instances de
+fournisseurs, les limiteurs de débit par fournisseur/modèle et les
+singletons d'embedding et de reranking du processus.
+
+La file vit dans un dossier (``headless.queue_dir``) :
+  - ``inbox/`` : spécifications déposées par ``submit()`` (une par fichier,
+    écriture atomique) — on peut ajouter des jobs pendant qu'un runner tourne ;
+  - ``jobs.json`` : statut de chaque job, réécrit atomiquement par le seul
+    runner. Un job resté « running » (arrêt brutal) repasse « pending » au
+    chargement et reprend depuis l'état persisté de son projet : sections
+    déjà générées et passes terminées ne sont pas refaites.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.core.corpus_extractor import CorpusExtractor
+from src.core.cost_tracker import CostTracker
+from src.core.orchestrator import Orchestrator
+from src.core.plan_parser import NormalizedPlan, PlanParser
+from src.providers.base import BaseProvider
+from src.utils.config import ROOT_DIR, load_default_config, load_yaml
+from src.utils.file_utils import ensure_dir, load_json, sanitize_filename
+
+logger = logging.getLogger("orchestria")
+
+JOBS_FILENAME = "jobs.json"
+INBOX_DIRNAME = "inbox"
+
+JOB_STATUSES = ("pending", "running", "done", "failed")
+
+
+@dataclass
+class JobSpec:
+    """Spécification d'un document à produire."""
+    name: str
+    plan: Optional[str] = None            # Fichier de plan (tout format extractible)
+    objective: str = ""                   # Plan généré par l'IA si aucun fichier
+    corpus: Optional[str] = None          # Dossier du corpus
+    profile: Optional[str] = None         # Identifiant de profil (profiles/)
+    provider: Optional[str] = None        # null = default_provider de la config
+    model: Optional[str] = None
+    target_pages: Optional[float] = None
+    passes: Optional[int] = None          # null = generation.number_of_passes
+    config: dict = field(default_factory=dict)  # Surcharges de configuration
+
+    @property
+    def job_id(self) -> str:
+        return sanitize_filename(self.name)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobSpec":
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Clés inconnues dans la spécification de job : {sorted(unknown)}")
+        spec = cls(**data)
+        if not spec.name:
+            raise ValueError("Spécification de job sans nom")
+        if not spec.plan and not spec.objective:
+            raise ValueError(f"Job {spec.name!r} : 'plan' ou 'objective' requis")
+        return spec
+
+
+@dataclass
+class JobRecord:
+    """Statut persisté d'un job de la file."""
+    spec: JobSpec
+    status: str = "pending"  # "pending", "running", "done", "failed"
+    attempts: int = 0
+    completed_passes: int = 0
+    error: str = ""
+    output_path: str = ""
+    cost_usd: float = 0.0
+    created_at: str = ""
+    started_at: str = ""
+    finished_at: str = ""
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = datetime.now().isoformat()
+
+    @property
+    def job_id(self) -> str:
+        return self.spec.job_id
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["spec"] = self.spec.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobRecord":
+        data = dict(data)
+        spec = JobSpec.from_dict(data.pop("spec"))
+        return cls(spec=spec, **data)
+
+
+def load_job_specs(path: Path) -> list[JobSpec]:
+    """Charge des spécifications depuis un fichier YAML ou JSON.
+
+    Le fichier contient une liste de jobs, à la racine ou sous la clé
+    ``jobs``. Les chemins relatifs (plan, corpus) sont résolus par rapport
+    au dossier du fichier.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        data = load_yaml(path)
+    entries = data.get("jobs", []) if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError(f"{path} : liste de jobs attendue")
+
+    specs = []
+    for entry in entries:
+        spec = JobSpec.from_dict(entry)
+        for attr in ("plan", "corpus"):
+            value = getattr(spec, attr)
+            if value and not Path(value).is_absolute():
+                setattr(spec, attr, str((path.parent / value).resolve()))
+        specs.append(spec)
+    return specs
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class JobQueue:
+    """File de jobs persistée dans un dossier (boîte de dépôt + statuts).
+
+    Args:
+        queue_dir: Dossier de la file.
+    """
+
+    def __init__(self, queue_dir: Path):
+        self.queue_dir = ensure_dir(Path(queue_dir))
+        self.inbox_dir = ensure_dir(self.queue_dir / INBOX_DIRNAME)
+        self.jobs_path = self.queue_dir / JOBS_FILENAME
+        self.records: dict[str, JobRecord] = {}
+
+    def submit(self, specs: list[JobSpec]) -> int:
+        """Dépose des spécifications dans la boîte de dépôt (sûr pendant un run)."""
+        for i, spec in enumerate(specs):
+            name = f"{time.time_ns()}_{i:04d}_{spec.job_id}.json"
+            _write_json_atomic(self.inbox_dir / name, spec.to_dict())
+        return len(specs)
+
+    def load(self) -> "JobQueue":
+        """Charge les statuts ; les jobs interrompus repassent en attente."""
+        self.records = {}
+        if self.jobs_path.exists():
+            for entry in load_json(self.jobs_path).get("jobs", []):
+                record = JobRecord.from_dict(entry)
+                if record.status == "running":
+                    logger.info(f"Job {record.job_id} interrompu, reprise")
+                    record.status = "pending"
+                self.records[record.job_id] = record
+        return self
+
+    def ingest(self) -> int:
+        """Intègre les spécifications déposées dans la boîte de dépôt.
+
+        Un job déjà connu et non en cours est remplacé et remis en attente
+        (son projet reprend depuis l'état persisté) ; un job en cours garde
+        son fichier de dépôt jusqu'à la fin de son exécution.
+
+        Returns:
+            Nombre de jobs intégrés.
+        """
+        added = 0
+        for path in sorted(self.inbox_dir.glob("*.json")):
+            try:
+                spec = JobSpec.from_dict(load_json(path))
+            except (ValueError, TypeError, json.JSONDecodeError) as e:
+                logger.error(f"Spécification de job invalide ignorée ({path.name}) : {e}")
+                path.rename(path.with_suffix(".invalid"))
+                continue
+            existing = self.records.get(spec.job_id)
+            if existing and existing.status == "running":
+                continue
+            self.records[spec.job_id] = JobRecord(spec=spec)
+            path.unlink()
+            added += 1
+        if added:
+            self.save()
+        return added
+
+    def save(self) -> None:
+        _write_json_atomic(self.jobs_path, {"jobs": [r.to_dict() for r in self.records.values()]})
+
+    def pending(self) -> list[JobRecord]:
+        return [r for r in self.records.values() if r.status == "pending"]
+
+    def counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for record in self.records.values():
+            counts[record.status] = counts.get(record.status, 0) + 1
+        return counts
+
+
+def build_job_config(spec: JobSpec, base_config: Optional[dict] = None, profile_config: Optional[dict] = None) -> dict:
+    """Configuration d'un projet : défauts, profil, puis choix de la spécification.
+
+    Même ordre de priorité que la création de projet dans l'interface. Le
+    mode agentique est imposé : aucun checkpoint ne peut attendre un humain.
+    """
+    config = copy.deepcopy(base_config if base_config is not None else load_default_config())
+    gen = config.get("generation", {})
+    config.setdefault("model", config.get("default_model", "gpt-4o"))
+    config.setdefault("temperature", gen.get("temperature", 0.7))
+    config.setdefault("max_tokens", gen.get("max_tokens", 4096))
+    config.setdefault("number_of_passes", gen.get("number_of_passes", 1))
+    if profile_config:
+        config.update(profile_config)
+
+    config.update(copy.deepcopy(spec.config))
+    if spec.provider:
+        config["default_provider"] = spec.provider
+    if spec.model:
+        config["model"] = spec.model
+    if spec.target_pages is not None:
+        config["target_pages"] = spec.target_pages
+    if spec.passes:
+        config["number_of_passes"] = spec.passes
+    if spec.objective:
+        config["objective"] = spec.objective
+    config["mode"] = "agentic"
+    return config
+
+
+def _provider_from_env(provider_name: str) -> BaseProvider:
+    """Crée un fournisseur à partir de la clé API en variable d'environnement."""
+    from src.utils.providers_registry import create_provider, get_provider_info
+
+    info = get_provider_info(provider_name)
+    api_key = os.environ.get(info["env_var"], "")
+    if not api_key or api_key == info.get("placeholder"):
+        raise RuntimeError(f"Clé API absente pour {provider_name} ({info['env_var']})")
+    return create_provider(provider_name, api_key)
+
+
+class JobRunner:
+    """Exécute les jobs d'une JobQueue, plusieurs projets à la fois.
+
+    Args:
+        queue: File de jobs.
+        projects_dir: Dossier des projets (un sous-dossier par job).
+        output_dir: Dossier des DOCX exportés.
+        base_config: Configuration par défaut (config/default.yaml si None).
+        provider_factory: callable(nom) → BaseProvider ; clé API de
+            l'environnement par défaut. Une instance par fournisseur est
+            partagée entre les projets.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        projects_dir: Optional[Path] = None,
+        output_dir: Optional[Path] = None,
+        base_config: Optional[dict] = None,
+        provider_factory: Optional[Callable[[str], BaseProvider]] = None,
+    ):
+        self.queue = queue
+        self.base_config = base_config if base_config is not None else load_default_config()
+        paths = self.base_config.get("paths", {})
+        self.projects_dir = Path(projects_dir or ROOT_DIR / paths.get("projects", "projects"))
+        self.output_dir = Path(output_dir or ROOT_DIR / paths.get("output", "output"))
+        headless = self.base_config.get("headless", {})
+        self.max_concurrent_projects = max(1, int(headless.get("max_concurrent_projects", 2) or 1))
+        self.max_attempts = max(1, int(headless.get("max_attempts", 2) or 1))
+        self.poll_interval = float(headless.get("poll_interval_seconds", 30))
+        self.export_docx = headless.get("export_docx", True)
+        self._provider_factory = provider_factory or _provider_from_env
+        self._providers: dict[str, BaseProvider] = {}
+        self._profile_mgr = None
+
+    def run(self, watch: bool = False) -> dict[str, int]:
+        """Traite la file jusqu'à épuisement (ou indéfiniment si ``watch``).
+
+        Returns:
+            Nombre de jobs par statut.
+        """
+        return asyncio.run(self.arun(watch=watch))
+
+    async def arun(self, watch: bool = False) -> dict[str, int]:
+        """Version asyncio de run()."""
+        self.queue.load()
+        self.queue.ingest()
+        self.queue.save()
+        running: dict[asyncio.Task, JobRecord] = {}
+
+        while True:
+            for record in self.queue.pending():
+                if len(running) >= self.max_concurrent_projects:
+                    break
+                record.status = "running"
+                running[asyncio.ensure_future(self._arun_job(record))] = record
+
+            if not running and not watch:
+                break
+            timeout = self.poll_interval if watch else None
+            if running:
+                finished, _ = await asyncio.wait(list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    running.pop(task)
+            else:
+                await asyncio.sleep(self.poll_interval)
+            self.queue.ingest()
+
+        counts = self.queue.counts()
+        logger.info(f"File de jobs traitée : {counts}")
+        return counts
+
+    async def _arun_job(self, record: JobRecord) -> None:
+        """Exécute un job ; échec définitif après ``max_attempts`` tentatives."""
+        record.status = "running"
+        record.attempts += 1
+        record.error = ""
+        record.started_at = datetime.now().isoformat()
+        self.queue.save()
+        logger.info(f"Job {record.job_id} démarré (tentative {record.attempts}/{self.max_attempts})")
+        try:
+            await self._execute(record)
+            record.status = "done"
+            logger.info(f"Job {record.job_id} terminé (${record.cost_usd:.4f})")
+        except Exception as e:
+            record.error = str(e)
+            record.status = "failed" if record.attempts >= self.max_attempts else "pending"
+            logger.error(f"Job {record.job_id} en échec : {e}")
+        finally:
+            record.finished_at = datetime.now().isoformat()
+            self.queue.save()
+
+    async def _execute(self, record: JobRecord) -> None:
+        spec = record.spec
+        config = build_job_config(spec, self.base_config, self._profile_config(spec.profile))
+        provider = self._provider(config.get("default_provider", "openai"))
+        orchestrator = Orchestrator(
+            provider=provider,
+            project_dir=self.projects_dir / spec.job_id,
+            cost_tracker=CostTracker(),
+            config=config,
+        )
+        try:
+            state = await asyncio.to_thread(orchestrator.load_state)
+            corpus = None
+            if spec.corpus:
+                corpus = await asyncio.to_thread(CorpusExtractor().extract_corpus, Path(spec.corpus))
+            if state is None or state.plan is None:
+                plan = await asyncio.to_thread(self._build_plan, spec, orchestrator, corpus)
+                await asyncio.to_thread(orchestrator.init_project, spec.name, plan, corpus)
+            else:
+                state.corpus = corpus
+
+            num_passes = int(orchestrator.config.get("number_of_passes", 1) or 1)
+            for pass_number in range(record.completed_passes + 1, num_passes + 1):
+                await orchestrator.agenerate_all_sections(pass_number=pass_number)
+                failed = [s.id for s in orchestrator.state.plan.sections if s.status == "failed"]
+                if failed:
+                    # Nouvelle tentative : seules ces sections seront régénérées
+                    raise RuntimeError(f"Passe {pass_number} : {len(failed)} section(s) en échec ({', '.join(failed)})")
+                record.completed_passes = pass_number
+                self.queue.save()
+
+            if self.export_docx:
+                record.output_path = str(await asyncio.to_thread(self._export, orchestrator))
+        finally:
+            record.cost_usd = orchestrator.cost_tracker.report.total_cost_usd
+            await asyncio.to_thread(orchestrator.close)
+
+    def _provider(self, name: str) -> BaseProvider:
+        if name not in self._providers:
+            provider = self._provider_factory(name)
+            if provider is None:
+                raise RuntimeError(f"Fournisseur inconnu : {name}")
+            self._providers[name] = provider
+        return self._providers[name]
+
+    def _profile_config(self, profile_id: Optional[str]) -> dict:
+        if not profile_id:
+            return {}
+        if self._profile_mgr is None:
+            from src.core.profile_manager import ProfileManager
+            self._profile_mgr = ProfileManager()
+        config = self._profile_mgr.get_profile_config(profile_id)
+        if not config:
+            raise ValueError(f"Profil introuvable : {profile_id}")
+        return config
+
+    @staticmethod
+    def _build_plan(spec: JobSpec, orchestrator: Orchestrator, corpus) -> NormalizedPlan:
+        target_pages = orchestrator.config.get("target_pages")
+        if spec.plan:
+            parser = PlanParser()
+            plan = parser.parse_file(Path(spec.plan))
+            if spec.objective:
+                plan.objective = spec.objective
+            if target_pages:
+                parser.distribute_page_budget(plan, target_pages)
+            return plan
+        return orchestrator.generate_plan_from_objective(spec.objective, target_pages, corpus)
+
+    def _export(self, orchestrator: Orchestrator) -> Path:
+        from src.core.export_engine import ExportEngine
+
+        state = orchestrator.state
+        output_path = self.output_dir / f"{sanitize_filename(state.name)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
+        engine = ExportEngine(styling=orchestrator.config.get("styling", {}))
+        return engine.export_docx(
+            plan=state.plan,
+            generated_sections=state.generated_sections,
+            output_path=output_path,
+            project_name=state.name,
+        )
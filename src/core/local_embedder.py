@@ -9,17 +9,24 @@ IMPORTANT : Le modèle E5 exige des préfixes différents :
 L'omission de ces préfixes dégrade la qualité de 15-20%.
 
 Note : sentence-transformers reste installé pour le Reranker (cross-encoder).
+
+Phase 6 (Perf) : les vecteurs sont retournés sous forme de ndarray float32
+contigus (une ligne par texte) au lieu de listes de floats Python, ce qui
+divise l'empreinte mémoire par ~8 et supprime la conversion élément par élément.
 """
 
 import logging
 import os
 import threading
-from typing import Optional
+from typing import Iterable, Optional
+
+import numpy as np
 
 logger = logging.getLogger("orchestria")
 
 DEFAULT_MODEL = "intfloat/multilingual-e5-large"
 DEFAULT_CACHE_DIR = "./models"
+DEFAULT_THREADS = 2
 
 
 class LocalEmbedder:
@@ -28,9 +35,15 @@ class LocalEmbedder:
     _instance: Optional["LocalEmbedder"] = None
     _lock = threading.Lock()
 
-    def __init__(self, model_name: Optional[str] = None, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
         self._model_name = model_name or DEFAULT_MODEL
         self._cache_dir = cache_dir or os.environ.get("ORCHESTRIA_MODELS_DIR", DEFAULT_CACHE_DIR)
+        self._threads = threads or DEFAULT_THREADS
         self._model = None
 
     def _load_model(self):
@@ -47,7 +60,7 @@ class LocalEmbedder:
             self._model = TextEmbedding(
                 model_name=self._model_name,
                 cache_dir=self._cache_dir,
-                threads=2,
+                threads=self._threads,
             )
             logger.info("Modèle d'embedding FastEmbed chargé (ONNX Quantized)")
         return self._model
@@ -66,7 +79,7 @@ class LocalEmbedder:
         """Réinitialise le singleton (utile pour les tests)."""
         cls._instance = None
 
-    def embed_documents(self, texts: list[str], batch_size: int = 16) -> list[list[float]]:
+    def embed_documents(self, texts: list[str], batch_size: int = 16) -> np.ndarray:
         """Encode une liste de textes de corpus (avec préfixe 'passage:').
 
         Args:
@@ -74,27 +87,72 @@ class LocalEmbedder:
             batch_size: Taille des lots pour l'inférence (défaut: 16, conservateur pour RAM).
 
         Returns:
-            Liste de vecteurs normalisés (float Python natif, pas np.float32).
+            Matrice float32 contiguë (len(texts), dimension) de vecteurs normalisés.
         """
         model = self._load_model()
         prefixed = [f"passage: {t}" for t in texts]
-        embeddings = model.embed(prefixed, batch_size=batch_size)
-        return [list(float(x) for x in e) for e in embeddings]
+        return _stack_embeddings(model.embed(prefixed, batch_size=batch_size), len(texts))
 
-    def embed_query(self, query: str) -> list[float]:
+    def embed_query(self, query: str) -> np.ndarray:
         """Encode une requête de recherche (avec préfixe 'query:').
 
         Args:
             query: Texte de la requête.
 
         Returns:
-            Vecteur normalisé (float Python natif).
+            Vecteur float32 normalisé (1 dimension).
         """
+        return self.embed_queries([query])[0]
+
+    def embed_queries(self, queries: list[str], batch_size: int = 16) -> np.ndarray:
+        """Encode plusieurs requêtes en un seul appel au modèle (préfixe 'query:').
+
+        Utilisé par RAGEngine.search_many() pour vectoriser les requêtes de
+        toutes les sections du plan en une passe.
+
+        Args:
+            queries: Textes des requêtes.
+            batch_size: Taille des lots pour l'inférence.
+
+        Returns:
+            Matrice float32 contiguë (len(queries), dimension).
+        """
+        if not queries:
+            return np.empty((0, self.dimension), dtype=np.float32)
         model = self._load_model()
-        embeddings = list(model.embed([f"query: {query}"]))
-        return [float(x) for x in embeddings[0]]
+        prefixed = [f"query: {q}" for q in queries]
+        return _stack_embeddings(model.embed(prefixed, batch_size=batch_size), len(queries))
+
+    @property
+    def model_name(self) -> str:
+        """Nom du modèle FastEmbed utilisé (sert de clé au cache d'embeddings)."""
+        return self._model_name
+
+    @property
+    def cache_dir(self) -> str:
+        """Répertoire de cache des modèles FastEmbed."""
+        return self._cache_dir
 
     @property
     def dimension(self) -> int:
         """Dimension des vecteurs produits."""
         return 1024
+
+
+def _stack_embeddings(vectors: Iterable, count: int) -> np.ndarray:
+    """Empile les vecteurs produits par FastEmbed dans une matrice float32 pré-allouée.
+
+    Les vecteurs sont copiés au fil de l'eau (le générateur FastEmbed n'est
+    jamais matérialisé en liste), ce qui borne le pic mémoire à une matrice.
+    """
+    out: Optional[np.ndarray] = None
+    filled = 0
+    for i, vector in enumerate(vectors):
+        vector = np.asarray(vector, dtype=np.float32)
+        if out is None:
+            out = np.empty((count, vector.shape[-1]), dtype=np.float32)
+        out[i] = vector
+        filled = i + 1
+    if out is None:
+        return np.empty((0, 0), dtype=np.float32)
+    return out[:filled] if filled != count else out
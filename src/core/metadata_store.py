@@ -5,6 +5,9 @@ dans une base SQLite locale, complémentaire à ChromaDB (qui ne stocke
 que des métadonnées simples).
 
 Prépare les fondations pour les citations APA (Phase 3).
+
+Phase 6 (Perf) : manifeste d'indexation par document (index_manifest) pour
+la ré-indexation incrémentale du corpus.
 """
 
 import json
@@ -95,6 +98,15 @@ CREATE TABLE IF NOT EXISTS chunks (
     FOREIGN KEY (doc_id) REFERENCES documents(doc_id)
 );
 
+CREATE TABLE IF NOT EXISTS index_manifest (
+    doc_id TEXT PRIMARY KEY,
+    hash_binary TEXT,
+    hash_textual TEXT,
+    chunking_signature TEXT,
+    chunk_count INTEGER DEFAULT 0,
+    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE INDEX IF NOT EXISTS idx_chunks_doc ON chunks(doc_id);
 CREATE INDEX IF NOT EXISTS idx_docs_language ON documents(language);
 CREATE INDEX IF NOT EXISTS idx_docs_hash ON documents(hash_textual);
@@ -266,6 +278,13 @@ class MetadataStore:
                 )
             conn.commit()
 
+    def delete_chunks(self, doc_id: str) -> None:
+        """Supprime les chunks d'un document (le document est conservé)."""
+        conn = self._get_conn()
+        with self._db_lock:
+            conn.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
+            conn.commit()
+
     def get_chunks_by_doc(self, doc_id: str) -> list[dict]:
         """Récupère tous les chunks d'un document, triés par index."""
         conn = self._get_conn()
@@ -293,6 +312,56 @@ class MetadataStore:
         row = conn.execute("SELECT COUNT(*) as cnt FROM chunks").fetchone()
         return row["cnt"]
 
+    # ── Manifeste d'indexation (Phase 6) ──
+
+    def get_index_manifest(self) -> dict[str, dict]:
+        """Retourne le manifeste d'indexation : doc_id → entrée."""
+        conn = self._get_conn()
+        rows = conn.execute("SELECT * FROM index_manifest").fetchall()
+        return {r["doc_id"]: dict(r) for r in rows}
+
+    def upsert_index_manifest(self, entries: list[dict]) -> None:
+        """Enregistre (ou remplace) des entrées du manifeste d'indexation.
+
+        Args:
+            entries: Dicts avec les clés doc_id, hash_binary, hash_textual,
+                chunking_signature et chunk_count.
+        """
+        if not entries:
+            return
+        conn = self._get_conn()
+        now = datetime.now().isoformat()
+        with self._db_lock:
+            conn.executemany(
+                """INSERT OR REPLACE INTO index_manifest
+                (doc_id, hash_binary, hash_textual, chunking_signature, chunk_count, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        e["doc_id"], e.get("hash_binary"), e.get("hash_textual"),
+                        e.get("chunking_signature"), e.get("chunk_count", 0), now,
+                    )
+                    for e in entries
+                ],
+            )
+            conn.commit()
+
+    def delete_index_manifest(self, doc_ids: list[str]) -> None:
+        """Supprime des entrées du manifeste d'indexation."""
+        if not doc_ids:
+            return
+        conn = self._get_conn()
+        with self._db_lock:
+            conn.executemany("DELETE FROM index_manifest WHERE doc_id = ?", [(d,) for d in doc_ids])
+            conn.commit()
+
+    def clear_index_manifest(self) -> None:
+        """Vide le manifeste d'indexation (avant une reconstruction complète)."""
+        conn = self._get_conn()
+        with self._db_lock:
+            conn.execute("DELETE FROM index_manifest")
+            conn.commit()
+
     # ── Phase 3 methods ──
 
     def update_from_grobid(self, doc_id: str, grobid_data: dict) -> None:
@@ -7,25 +7,38 @@ Phase 4 (Perf) : pipelining — la génération de la section N+1 démarre
            pendant que l'évaluation post-génération de la section N tourne
            en arrière-plan via un ThreadPoolExecutor. Un verrou (Lock)
            protège save_state et les mutations de self.state.
+Phase 6 (Perf) : scheduler parallèle — les sections sans dépendance de
+           contexte (chapitres distincts, passes de raffinement) sont
+           générées simultanément (generation.max_parallel_sections).
+           Mode batch — passes de raffinement et évaluation qualité soumises
+           aux Batch APIs des fournisseurs (batch.use_for_refinement).
 """
 
+import asyncio
 import json
 import logging
 import threading
+import time
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from src.core.checkpoint_manager import CheckpointManager, CheckpointType
 from src.core.corpus_extractor import CorpusExtractor, StructuredCorpus
-from src.core.cost_tracker import CostTracker
+from src.core.cost_tracker import CostReport, CostTracker
 from src.core.plan_parser import NormalizedPlan, PlanSection
-from src.core.prompt_engine import PromptEngine
-from src.providers.base import BaseProvider
-from src.utils.file_utils import ensure_dir, save_json, load_json
+from src.core.prompt_engine import PreparedPrompt, PromptEngine, format_previous_context
+from src.core.response_cache import CachedProvider, ResponseCache, llm_task
+from src.core.section_summarizer import ExtractiveSummarizer, summary_mode
+from src.core.state_store import StateJournal, StateSaver
+from src.providers.base import (
+    AIResponse, BaseProvider, BatchError, BatchRequest, consume_stream, strip_cache_boundary,
+)
+from src.utils.file_utils import ensure_dir, sha256_text
 from src.utils.logger import ActivityLog
+from src.utils.rate_limiter import Priority, request_priority
 from src.utils.token_counter import count_tokens
 
 logger = logging.getLogger("orchestria")
@@ -54,6 +67,10 @@ class ProjectState:
     personas: dict = field(default_factory=dict)           # personas config
     citations: dict = field(default_factory=dict)          # citations resolved
     feedback_history: list = field(default_factory=list)   # feedback loop entries
+    # Phase 6 (Perf) : batches soumis non encore récupérés (clé → batch_id, custom_ids)
+    pending_batches: dict = field(default_factory=dict)
+    # Phase 6 (Perf) : texte partiel des sections en cours de génération en flux
+    partial_sections: dict = field(default_factory=dict)
     created_at: str = ""
     updated_at: str = ""
 
@@ -91,6 +108,8 @@ class ProjectState:
             "personas": self.personas,
             "citations": self.citations,
             "feedback_history": self.feedback_history,
+            "pending_batches": self.pending_batches,
+            "partial_sections": self.partial_sections,
             "created_at": self.created_at,
             "updated_at": datetime.now().isoformat(),
         }
@@ -115,6 +134,8 @@ class ProjectState:
             personas=data.get("personas", {}),
             citations=data.get("citations", {}),
             feedback_history=data.get("feedback_history", []),
+            pending_batches=data.get("pending_batches", {}),
+            partial_sections=data.get("partial_sections", {}),
             created_at=data.get("created_at", ""),
             updated_at=data.get("updated_at", ""),
         )
@@ -142,6 +163,14 @@ def _normalize_config(config: dict) -> dict:
         ("conditional_generation", "min_relevant_blocks"): "coverage_min_blocks",
         # anti_hallucination.*
         ("anti_hallucination", "enabled"): "anti_hallucination_enabled",
+        # generation.* — Phase 6 (Perf) : scheduler parallèle des sections
+        ("generation", "max_parallel_sections"): "max_parallel_sections",
+        ("generation", "summary_window"): "summary_window",
+        ("generation", "max_inflight_requests"): "max_inflight_requests",
+        ("generation", "prefetch_sections"): "prefetch_sections",
+        ("generation", "prompt_caching"): "prompt_caching",
+        ("generation", "streaming"): "streaming",
+        ("generation", "stream_checkpoint_seconds"): "stream_checkpoint_seconds",
         # plan_corpus_linking.* — kept nested (read via .get("plan_corpus_linking", {}))
         # batch.* — kept nested for now
     }
@@ -155,6 +184,51 @@ def _normalize_config(config: dict) -> dict:
     return config
 
 
+@dataclass
+class _PassSettings:
+    """Paramètres communs à toutes les sections d'une passe de génération."""
+    plan: NormalizedPlan
+    pass_number: int
+    model: str
+    temperature: float
+    max_tokens: int
+    target_pages: Optional[int]
+    use_rag: bool
+
+    @property
+    def is_refinement(self) -> bool:
+        return self.pass_number > 1
+
+    @property
+    def task_type(self) -> str:
+        return "refinement" if self.is_refinement else "generation"
+
+
+@dataclass
+class _SectionJob:
+    """Requête de génération préparée pour une section (prompts et contexte RAG)."""
+    prompt: str
+    system_prompt: str
+    corpus_chunks: list = field(default_factory=list)
+
+
+@dataclass
+class _SectionPrefetch:
+    """Partie d'une section calculable avant que le résumé précédent soit connu."""
+    corpus_chunks: list = field(default_factory=list)
+    assessment: Optional[object] = None  # CoverageAssessment si génération conditionnelle
+    system_prompt: str = ""
+    prepared_prompt: Optional[PreparedPrompt] = None
+    static_tokens: int = 0
+
+
+def _summary_section_id(entry: str) -> str:
+    """Extrait l'identifiant de section d'un résumé « [id] titre: résumé »."""
+    if entry.startswith("[") and "]" in entry:
+        return entry[1:entry.index("]")]
+    return ""
+
+
 class Orchestrator:
     """Orchestre le pipeline de génération séquentielle.
 
@@ -173,25 +247,53 @@ class Orchestrator:
     ):
         import copy as _copy
 
-        self.provider = provider
         self.project_dir = ensure_dir(project_dir)
         self.checkpoint_mgr = checkpoint_manager or CheckpointManager()
         self.cost_tracker = cost_tracker or CostTracker()
         self.activity_log = activity_log or ActivityLog()
         self.config = _normalize_config(_copy.deepcopy(config or {}))
+        self.provider = self._with_response_cache(provider)
         self.prompt_engine = PromptEngine(
             persistent_instructions=self.config.get("persistent_instructions", ""),
             anti_hallucination_enabled=self.config.get("anti_hallucination_enabled", True),
+            prompt_caching=self.config.get("prompt_caching", True),
         )
         self.rag_engine = None
         self.conditional_generator = None
         self.state: Optional[ProjectState] = None
+        # Phase 6 (Perf) : appelé avec (section_id, texte cumulé) pendant la
+        # génération en flux — depuis les threads du scheduler en mode parallèle
+        self.stream_callback: Optional[Callable[[str, str], None]] = None
+        # Phase 6 (Perf) : appelé avec (type, données) aux étapes de la
+        # génération (passe, section démarrée/terminée/en échec), cf. generation_jobs
+        self.event_callback: Optional[Callable[[str, dict], None]] = None
         self._metadata_store = None  # Phase 2.5 : MetadataStore SQLite
         self._last_plan_context = None  # Phase 2.5 : dernier PlanContext pour affichage UI
         # Phase 4 (Perf) : pipelining — évaluation post-génération en arrière-plan
         self._background_executor = ThreadPoolExecutor(max_workers=2)
         self._state_lock = threading.Lock()
         self._pending_evaluations: list[Future] = []
+        # Phase 6 (Perf) : résumé local des sections (summarization.mode)
+        summarization = self.config.get("summarization", {})
+        self._extractive_summarizer = ExtractiveSummarizer(
+            max_sentences=summarization.get("max_sentences", 3),
+            max_chars=summarization.get("max_chars", 600),
+        )
+        # Phase 6 (Perf) : pré-calcul RAG/prompt des sections suivantes
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        # Phase 6 (Perf) : persistance incrémentale (instantané + journal)
+        persistence = self.config.get("persistence", {})
+        self._state_store = StateJournal(
+            self.project_dir,
+            compact_bytes=int(persistence.get("journal_compact_mb", 4) * 1024 * 1024),
+            fsync=persistence.get("fsync", True),
+        )
+        # Phase 6 (Perf) : écriture différée regroupée (un seul thread d'écriture)
+        self._state_saver = StateSaver(
+            self._state_store,
+            self._state_snapshot,
+            interval_ms=persistence.get("write_behind_ms", 200),
+        )
         # Phase 3 engines (lazy-initialized)
         self._quality_evaluator = None
         self._factcheck_engine = None
@@ -201,6 +303,18 @@ class Orchestrator:
         self._feedback_engine = None
         self._hitl_journal = None
 
+    def _with_response_cache(self, provider: BaseProvider) -> BaseProvider:
+        """Phase 6 (Perf) : enveloppe le fournisseur dans le cache de réponses si activé."""
+        rc_config = self.config.get("response_cache", {})
+        if not rc_config.get("enabled", False) or isinstance(provider, CachedProvider):
+            return provider
+        directory = rc_config.get("directory")
+        cache = ResponseCache(
+            Path(directory) if directory else self.project_dir / "response_cache",
+            max_bytes=int(rc_config.get("max_size_mb", 256) * 1024 * 1024),
+        )
+        return CachedProvider(provider, cache, tasks=rc_config.get("tasks"))
+
     def _init_phase3_engines(self) -> None:
         """Initialise les engines Phase 3 si nécessaire."""
         # Quality evaluator
@@ -295,6 +409,7 @@ class Orchestrator:
                 glossary_engine=self._glossary_engine,
                 persona_engine=self._persona_engine,
                 persistent_instructions_engine=self._persistent_instructions_engine,
+                prompt_caching=self.config.get("prompt_caching", True),
             )
             self._phase3_prompt_engine_initialized = True
 
@@ -315,11 +430,13 @@ class Orchestrator:
         if self.rag_engine is not None:
             return
         try:
-            import chromadb  # noqa: F401 – check availability before creating engine
+            backend = self.config.get("rag", {}).get("vector_store", "chromadb")
+            if backend == "chromadb":
+                import chromadb  # noqa: F401 – check availability before creating engine
             from src.core.rag_engine import RAGEngine
             persist_dir = self.project_dir / "chromadb"
             ensure_dir(persist_dir)
-            logger.info(f"Initialisation ChromaDB — répertoire de persistance : {persist_dir}")
+            logger.info(f"Initialisation du RAG ({backend}) — répertoire de persistance : {persist_dir}")
             self.rag_engine = RAGEngine(
                 persist_dir=persist_dir,
                 top_k=self.config.get("rag", {}).get("top_k", self.config.get("rag_top_k", 10)),
@@ -365,6 +482,11 @@ class Orchestrator:
         Utilise le pipeline : ExtractionResult → semantic_chunker → index_corpus_semantic.
         Fallback sur l'ancien index_corpus() si semantic_chunker échoue.
 
+        Phase 6 (Perf) : mode incrémental (rag.incremental_indexing) — les
+        hash des documents sont comparés au manifeste d'indexation SQLite ;
+        seuls les documents nouveaux ou modifiés sont chunkés et vectorisés,
+        et les documents retirés sont supprimés de ChromaDB et de SQLite.
+
         Returns:
             Nombre de blocs indexés.
         """
@@ -388,29 +510,46 @@ class Orchestrator:
                 max_chunk_tokens = chunking_config.get("max_chunk_tokens", 800)
                 min_chunk_tokens = chunking_config.get("min_chunk_tokens", 100)
                 overlap_sentences = chunking_config.get("overlap_sentences", 2)
+                chunking_signature = self._chunking_signature()
+
+                # Phase 6 (Perf) : manifeste d'indexation pour le mode incrémental.
+                # Un manifeste incohérent avec ChromaDB (ou un changement de
+                # paramètres de chunking) force une reconstruction complète.
+                manifest = {}
+                if self.config.get("rag", {}).get("incremental_indexing", True):
+                    manifest = metadata_store.get_index_manifest()
+                    if manifest and not self._index_manifest_is_consistent(manifest, chunking_signature):
+                        logger.info("Manifeste d'indexation incohérent, reconstruction complète")
+                        manifest = {}
+                incremental = bool(manifest)
 
                 chunks_by_doc = {}
+                reindexed_chunks: dict = {}
+                manifest_entries: list[dict] = []
+                current_doc_ids: set[str] = set()
 
-                # Phase 3 : instancier le client GROBID si activé
+                # Phase 3 : client GROBID si activé, créé au premier PDF à (ré)indexer
+                # (Phase 6 : un corpus inchangé ne sollicite pas le serveur)
                 grobid_client = None
-                grobid_config = self.config.get("grobid", {})
-                if grobid_config.get("enabled", False):
-                    try:
-                        from src.core.grobid_client import GrobidClient
-                        grobid_client = GrobidClient(
-                            server_url=grobid_config.get("server_url", "http://localhost:8070"),
-                            enabled=True,
-                        )
-                        if not grobid_client.is_available():
-                            logger.warning("GROBID activé mais serveur inaccessible, désactivation")
-                            grobid_client = None
-                    except ImportError:
-                        logger.warning("Module grobid_client non disponible")
+                grobid_checked = not self.config.get("grobid", {}).get("enabled", False)
 
                 for ext in self.state.corpus.extractions:
-                    doc_id = ext.hash_binary if ext.hash_binary else f"{ext.source_filename}_{hash(ext.text[:50])}"
+                    doc_id = self._doc_id_for(ext)
+                    current_doc_ids.add(doc_id)
+
+                    # Phase 6 (Perf) : document inchangé depuis la dernière indexation
+                    entry = manifest.get(doc_id)
+                    if (
+                        entry
+                        and entry.get("hash_binary") == ext.hash_binary
+                        and entry.get("hash_textual") == ext.hash_text
+                    ):
+                        continue
 
                     # Phase 3 : enrichir les métadonnées via GROBID pour les PDFs
+                    if not grobid_checked and ext.source_filename.lower().endswith(".pdf"):
+                        grobid_client = self._create_grobid_client()
+                        grobid_checked = True
                     if grobid_client and ext.source_filename.lower().endswith(".pdf"):
                         try:
                             # Rechercher le fichier PDF dans le corpus
@@ -480,15 +619,43 @@ class Orchestrator:
                     )
                     if chunks:
                         chunks_by_doc[doc_id] = chunks
+                    reindexed_chunks[doc_id] = chunks or []
+                    manifest_entries.append({
+                        "doc_id": doc_id,
+                        "hash_binary": ext.hash_binary,
+                        "hash_textual": ext.hash_text,
+                        "chunking_signature": chunking_signature,
+                        "chunk_count": len(chunks or []),
+                    })
+
+                if incremental:
+                    removed = [d for d in manifest if d not in current_doc_ids]
+                    if reindexed_chunks or removed:
+                        self.rag_engine.update_corpus_semantic(reindexed_chunks, removed, metadata_store)
+                        metadata_store.delete_index_manifest(removed)
+                        metadata_store.upsert_index_manifest(manifest_entries)
+                    count = self.rag_engine.indexed_count
+                    self.activity_log.info(
+                        f"Corpus mis à jour (incrémental) : {len(reindexed_chunks)} documents ré-indexés, "
+                        f"{len(removed)} retirés, {count} blocs au total"
+                    )
+                    self._log_embedding_cache_stats()
+                    self._metadata_store = metadata_store
+                    if self._citation_engine:
+                        self._citation_engine.metadata_store = metadata_store
+                    return count
 
                 if chunks_by_doc:
                     count = self.rag_engine.index_corpus_semantic(chunks_by_doc, metadata_store)
+                    metadata_store.clear_index_manifest()
+                    metadata_store.upsert_index_manifest(manifest_entries)
                     persist_dir = self.project_dir / "chromadb"
                     logger.info(
                         f"Corpus indexé (sémantique) : {count} blocs dans {persist_dir}, "
                         f"métadonnées dans {metadata_store.db_path}"
                     )
                     self.activity_log.info(f"Corpus indexé (sémantique) : {count} blocs")
+                    self._log_embedding_cache_stats()
                     # Stocker metadata_store pour réutilisation (plan_corpus_linker, etc.)
                     self._metadata_store = metadata_store
                     # Phase 3: update citation engine with metadata store
@@ -500,21 +667,157 @@ class Orchestrator:
                 logger.warning(f"Chunking sémantique échoué, fallback chunking fixe : {e}")
 
         # Fallback : ancien chunking fixe (Phase 2)
-        extractions = []
-        for ext in self.state.corpus.extractions:
-            extractions.append({
-                "text": ext.text,
-                "source_file": ext.source_filename,
-                "page_count": ext.page_count,
-                "metadata": ext.metadata,
-            })
-
-        count = self.rag_engine.index_corpus(extractions)
+        # Phase 6 (Perf) : le chunking fixe reconstruit toute la collection ; il
+        # n'est relancé que si le corpus diffère du manifeste d'indexation.
+        from src.core.metadata_store import MetadataStore
+
+        metadata_store = self._metadata_store or MetadataStore(str(self.project_dir))
+        chunking_signature = self._fixed_chunking_signature()
+        try:
+            if (
+                self.config.get("rag", {}).get("incremental_indexing", True)
+                and self._corpus_matches_manifest(metadata_store.get_index_manifest(), chunking_signature)
+            ):
+                count = self.rag_engine.indexed_count
+                self.activity_log.info(f"Corpus inchangé depuis la dernière indexation : {count} blocs")
+                return count
+
+            extractions = []
+            for ext in self.state.corpus.extractions:
+                extractions.append({
+                    "text": ext.text,
+                    "source_file": ext.source_filename,
+                    "page_count": ext.page_count,
+                    "metadata": ext.metadata,
+                })
+
+            count = self.rag_engine.index_corpus(extractions)
+            chunk_counts = self.rag_engine.last_chunk_counts
+            metadata_store.clear_index_manifest()
+            metadata_store.upsert_index_manifest([
+                {
+                    "doc_id": self._doc_id_for(ext),
+                    "hash_binary": ext.hash_binary,
+                    "hash_textual": ext.hash_text,
+                    "chunking_signature": chunking_signature,
+                    "chunk_count": chunk_counts.get(ext.source_filename, 0),
+                }
+                for ext in self.state.corpus.extractions
+            ])
+        finally:
+            if metadata_store is not self._metadata_store:
+                metadata_store.close()
         self.activity_log.info(f"Corpus indexé dans ChromaDB : {count} blocs")
+        self._log_embedding_cache_stats()
         return count
 
+    @staticmethod
+    def _doc_id_for(ext) -> str:
+        """Identifiant d'un document du corpus dans l'index (hash binaire si connu)."""
+        return ext.hash_binary if ext.hash_binary else f"{ext.source_filename}_{sha256_text(ext.text[:50])[:16]}"
+
+    def _chunking_signature(self) -> str:
+        """Phase 6 (Perf) : paramètres de chunking enregistrés dans le manifeste."""
+        chunking_config = self.config.get("rag", {}).get("chunking", {})
+        if chunking_config.get("strategy", "semantic") != "semantic":
+            return self._fixed_chunking_signature()
+        return (
+            f"{chunking_config.get('max_chunk_tokens', 800)}:"
+            f"{chunking_config.get('min_chunk_tokens', 100)}:"
+            f"{chunking_config.get('overlap_sentences', 2)}"
+        )
+
+    def _fixed_chunking_signature(self) -> str:
+        return f"fixed:{self.rag_engine.chunk_size}:{self.rag_engine.chunk_overlap}"
+
+    def _create_grobid_client(self):
+        """Client GROBID si activé et joignable, sinon None."""
+        grobid_config = self.config.get("grobid", {})
+        try:
+            from src.core.grobid_client import GrobidClient
+        except ImportError:
+            logger.warning("Module grobid_client non disponible")
+            return None
+        client = GrobidClient(
+            server_url=grobid_config.get("server_url", "http://localhost:8070"),
+            enabled=True,
+        )
+        if not client.is_available():
+            logger.warning("GROBID activé mais serveur inaccessible, désactivation")
+            return None
+        return client
+
+    def _corpus_matches_manifest(self, manifest: dict, chunking_signature: str) -> bool:
+        """Phase 6 (Perf) : vrai si la collection indexée correspond au corpus courant."""
+        if not manifest or not self._index_manifest_is_consistent(manifest, chunking_signature):
+            return False
+        current = {self._doc_id_for(ext): ext for ext in self.state.corpus.extractions}
+        if set(current) != set(manifest):
+            return False
+        return all(
+            manifest[doc_id].get("hash_binary") == ext.hash_binary
+            and manifest[doc_id].get("hash_textual") == ext.hash_text
+            for doc_id, ext in current.items()
+        )
+
+    def _index_manifest_is_consistent(self, manifest: dict, chunking_signature: str) -> bool:
+        """Phase 6 (Perf) : vérifie que le manifeste décrit bien la collection ChromaDB."""
+        if any(e.get("chunking_signature") != chunking_signature for e in manifest.values()):
+            return False
+        expected = sum(e.get("chunk_count") or 0 for e in manifest.values())
+        return expected == self.rag_engine.indexed_count
+
+    def needs_corpus_indexing(self) -> bool:
+        """Indique si index_corpus_rag() doit être appelé avant la génération.
+
+        Vrai si la collection est vide ; en mode incrémental, vrai seulement
+        si les hash du corpus (ou les paramètres de chunking) diffèrent du
+        manifeste d'indexation.
+        """
+        if not self.rag_engine or not self.state or not self.state.corpus:
+            return False
+        if self.rag_engine.indexed_count == 0:
+            return True
+        if not self.config.get("rag", {}).get("incremental_indexing", True):
+            return False
+
+        from src.core.metadata_store import MetadataStore
+
+        store = self._metadata_store
+        try:
+            if store is None:
+                store = MetadataStore(str(self.project_dir))
+            manifest = store.get_index_manifest()
+        except Exception as e:
+            logger.warning(f"Manifeste d'indexation illisible, ré-indexation : {e}")
+            return True
+        finally:
+            if store is not None and store is not self._metadata_store:
+                store.close()
+        return not self._corpus_matches_manifest(manifest, self._chunking_signature())
+
+    def _log_embedding_cache_stats(self) -> None:
+        """Phase 6 (Perf) : journalise le taux de hits du cache et le débit d'embedding."""
+        stats = self.rag_engine.last_embedding_cache_stats if self.rag_engine else {}
+        if stats and (stats.get("hits") or stats.get("misses")):
+            self.activity_log.info(
+                f"Cache d'embeddings : {stats['hits']} vecteurs réutilisés, "
+                f"{stats['misses']} calculés (taux de hits {stats['hit_rate']:.0%})"
+            )
+        throughput = self.rag_engine.last_embedding_throughput if self.rag_engine else {}
+        if throughput:
+            self.activity_log.info(
+                f"Débit d'embedding : {throughput['chunks_per_s']} chunks/s "
+                f"({throughput['chunks']} chunks, {throughput['workers']} worker(s))"
+            )
+
     def generate_all_sections(self, pass_number: int = 1, progress_callback=None) -> dict:
-        """Génère toutes les sections du plan séquentiellement.
+        """Génère toutes les sections du plan.
+
+        Séquentiellement par défaut ; en parallèle selon les dépendances de
+        contexte si ``max_parallel_sections`` > 1 et qu'aucun checkpoint ne
+        peut interrompre la passe ; via la Batch API du fournisseur pour les
+        passes de raffinement si ``batch.use_for_refinement`` est activé.
 
         Args:
             pass_number: Numéro de la passe (1 = brouillon, 2+ = raffinement).
@@ -524,6 +827,120 @@ class Orchestrator:
         Returns:
             Dictionnaire section_id → contenu généré.
         """
+        settings, sections_to_generate = self._begin_pass(pass_number)
+
+        max_parallel = int(self.config.get("max_parallel_sections", 1) or 1)
+        if settings.is_refinement and sections_to_generate and self._use_batch("refinement"):
+            try:
+                self._generate_sections_batch(sections_to_generate, settings, progress_callback)
+            except BatchError as e:
+                # Le batch_id reste dans state.pending_batches : un nouvel appel
+                # reprendra le polling au lieu de resoumettre.
+                self.activity_log.error(f"Passe {pass_number} en batch interrompue : {e}")
+                self.save_state()
+                return self.state.generated_sections
+        elif max_parallel > 1 and len(sections_to_generate) > 1 and not self._generation_may_pause():
+            self._generate_sections_parallel(sections_to_generate, settings, max_parallel, progress_callback)
+        else:
+            total = len(sections_to_generate)
+            prefetch_depth = int(self.config.get("prefetch_sections", 2) or 0)
+            prefetches: dict[str, Future] = {}
+            for i, section in enumerate(sections_to_generate):
+                if progress_callback:
+                    progress_callback(f"Génération de la section : {section.title}...", i / max(total, 1))
+
+                # Vérifier si la section est reportée (génération conditionnelle)
+                if self._skip_deferred(section, settings):
+                    continue
+
+                # Phase 6 (Perf) : préparer les K sections suivantes pendant
+                # l'appel API de la section courante
+                for upcoming in sections_to_generate[i + 1:i + 1 + prefetch_depth]:
+                    if upcoming.id not in prefetches and upcoming.id not in self.state.deferred_sections:
+                        prefetches[upcoming.id] = self._prefetch_executor.submit(
+                            self._prefetch_section, upcoming, settings,
+                        )
+
+                outcome = self._generate_section(
+                    section, settings, previous_summaries=self.state.section_summaries, fallback_index=i,
+                    prefetched=self._take_prefetch(prefetches.pop(section.id, None), section),
+                )
+                if outcome == "paused":
+                    return self.state.generated_sections
+
+        self._end_pass(pass_number, progress_callback)
+        return self.state.generated_sections
+
+    async def agenerate_all_sections(self, pass_number: int = 1, progress_callback=None) -> dict:
+        """Phase 6 (Perf) : version asyncio de generate_all_sections().
+
+        Les appels API passent par provider.agenerate() : une seule boucle
+        d'événements porte jusqu'à ``max_inflight_requests`` requêtes
+        simultanées, sans thread par requête. Plusieurs projets peuvent être
+        générés sur la même boucle (asyncio.gather). L'ordonnancement suit le
+        même graphe de dépendances que le scheduler parallèle ; si un
+        checkpoint peut interrompre la passe, les sections sont traitées une à
+        une dans l'ordre du plan.
+
+        Returns:
+            Dictionnaire section_id → contenu généré.
+        """
+        settings, sections = await asyncio.to_thread(self._begin_pass, pass_number)
+
+        if self._generation_may_pause():
+            max_inflight = 1
+        else:
+            max_inflight = max(1, int(self.config.get("max_inflight_requests", 64) or 1))
+
+        scheduler, context = self._build_scheduler(sections, settings)
+        running: dict[asyncio.Task, PlanSection] = {}
+        total = len(sections)
+        done = 0
+        paused = False
+
+        while (scheduler.has_ready or running) and not paused:
+            while scheduler.has_ready and len(running) < max_inflight:
+                section = scheduler.next_ready()
+                if self._skip_deferred(section, settings):
+                    done += 1
+                    scheduler.complete(section.id)
+                    continue
+                previous = self._previous_summaries_for(section, settings, context)
+                task = asyncio.ensure_future(self._agenerate_section(
+                    section, settings, previous, scheduler.order[section.id],
+                ))
+                running[task] = section
+
+            if not running:
+                continue
+            finished, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(finished, key=lambda t: scheduler.order[running[t].id]):
+                section = running.pop(task)
+                try:
+                    outcome = task.result()
+                except Exception as e:
+                    outcome = self._fail_section(section, e)
+                if outcome == "paused":
+                    paused = True
+                done += 1
+                scheduler.complete(section.id)
+                if progress_callback:
+                    progress_callback(f"Section terminée : {section.title}", done / max(total, 1))
+
+        if running:
+            await asyncio.wait(list(running))
+        if paused:
+            return self.state.generated_sections
+
+        await asyncio.to_thread(self._end_pass, pass_number, progress_callback)
+        return self.state.generated_sections
+
+    def _begin_pass(self, pass_number: int) -> tuple["_PassSettings", list[PlanSection]]:
+        """Prépare une passe : moteurs, RAG, glossaire, pré-chargement RAG.
+
+        Returns:
+            Les paramètres de la passe et les sections à générer.
+        """
         if not self.state or not self.state.plan:
             raise RuntimeError("Projet non initialisé ou plan manquant")
 
@@ -554,7 +971,7 @@ class Orchestrator:
         if self.state.corpus or has_persisted_rag:
             self._init_rag()
             self._init_conditional_generator()
-            if self.state.corpus and self.rag_engine and self.rag_engine.indexed_count == 0:
+            if self.needs_corpus_indexing():
                 self.index_corpus_rag()
         use_rag = self.rag_engine is not None and self.rag_engine.indexed_count > 0
 
@@ -575,204 +992,700 @@ class Orchestrator:
             except Exception as e:
                 logger.warning(f"Génération automatique du glossaire échouée : {e}")
 
-        total = len(sections_to_generate)
-        for i, section in enumerate(sections_to_generate):
-            if progress_callback:
-                progress_callback(f"Génération de la section : {section.title}...", i / max(total, 1))
+        # Phase 6 (Perf) : recherche RAG groupée pour tout le plan avant la
+        # boucle de génération (alimente le cache de search_for_section)
+        if use_rag:
+            self._prefetch_rag(sections_to_generate)
 
-            # Vérifier si la section est reportée (génération conditionnelle)
-            if section.id in self.state.deferred_sections and not is_refinement:
-                self.activity_log.warning(
-                    f"Section {section.id} reportée (corpus insuffisant)",
-                    section=section.id,
+        self._emit("pass_started", pass_number=pass_number, sections=len(sections_to_generate))
+        settings = _PassSettings(
+            plan=plan,
+            pass_number=pass_number,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            target_pages=target_pages,
+            use_rag=use_rag,
+        )
+        return settings, sections_to_generate
+
+    def _end_pass(self, pass_number: int, progress_callback=None) -> None:
+        """Finalise une passe : évaluations en attente, rapport de coûts, sauvegarde."""
+        # Phase 4 (Perf) : attendre la fin de toutes les évaluations en arrière-plan
+        # avant de finaliser la passe.
+        if self._pending_evaluations:
+            logger.info(f"Attente de {len(self._pending_evaluations)} évaluations en arrière-plan...")
+            for future in self._pending_evaluations:
+                try:
+                    future.result()  # Attendre la fin
+                except Exception as e:
+                    logger.warning(f"Évaluation en arrière-plan échouée : {e}")
+            self._pending_evaluations.clear()
+
+        if progress_callback:
+            progress_callback("Génération terminée !", 1.0)
+
+        self.state.current_step = "review"
+        self.state.cost_report = self.cost_tracker.report.to_dict()
+        self.activity_log.success(f"Passe {pass_number} terminée pour toutes les sections")
+        self.save_state()
+        self._emit("pass_finished", pass_number=pass_number, cost_usd=self.cost_tracker.report.total_cost_usd)
+
+    def _generation_may_pause(self) -> bool:
+        """Indique si un checkpoint peut interrompre la boucle de génération.
+
+        Les checkpoints par section imposent un déroulement séquentiel : le
+        scheduler parallèle n'est utilisé que lorsqu'aucun ne peut se déclencher.
+        """
+        if self.is_agentic:
+            return False
+        return (
+            self.checkpoint_mgr.should_pause(CheckpointType.PROMPT_GENERATION)
+            or self.checkpoint_mgr.should_pause(CheckpointType.GENERATION)
+        )
+
+    @staticmethod
+    def _take_prefetch(future: Optional[Future], section: PlanSection) -> Optional["_SectionPrefetch"]:
+        """Récupère un pré-calcul ; None (calcul immédiat) s'il a échoué."""
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Pré-calcul de la section {section.id} échoué, calcul immédiat : {e}")
+            return None
+
+    def _skip_deferred(self, section: PlanSection, settings: "_PassSettings") -> bool:
+        """Vérifie si la section est reportée (génération conditionnelle)."""
+        if section.id in self.state.deferred_sections and not settings.is_refinement:
+            self.activity_log.warning(
+                f"Section {section.id} reportée (corpus insuffisant)",
+                section=section.id,
+            )
+            return True
+        return False
+
+    def _generate_section(
+        self,
+        section: PlanSection,
+        settings: "_PassSettings",
+        previous_summaries: list[str],
+        fallback_index: int = 0,
+        prefetched: Optional["_SectionPrefetch"] = None,
+    ) -> str:
+        """Génère une section (RAG, prompt, appel API, résumé, évaluation).
+
+        Utilisé par la boucle séquentielle et par le scheduler parallèle ;
+        les mutations de self.state sont protégées par self._state_lock.
+
+        Returns:
+            "generated", "deferred", "failed" ou "paused" (checkpoint atteint).
+        """
+        job = self._prepare_section(section, settings, previous_summaries, fallback_index, prefetched)
+        if isinstance(job, str):
+            return job
+
+        # Appel API
+        try:
+            # Phase 6 (Perf) : la génération passe avant l'évaluation en arrière-plan
+            with request_priority(Priority.GENERATION), llm_task(settings.task_type):
+                response = self._call_section_api(section, settings, job)
+                content = self._record_section_content(section, settings, response)
+
+                # Générer un résumé pour le contexte IMMÉDIATEMENT
+                # (nécessaire pour la section suivante — ne peut pas être différé)
+                if not settings.is_refinement:
+                    self._summarize_section(section, content, settings.model, job.system_prompt, settings.plan)
+
+                self._submit_evaluation(section, content, settings, job.corpus_chunks)
+        except Exception as e:
+            return self._fail_section(section, e)
+
+        return self._finish_section(section, settings, content, response)
+
+    def _call_section_api(self, section: PlanSection, settings: "_PassSettings", job: "_SectionJob") -> AIResponse:
+        """Appel API d'une section, en flux si ``generation.streaming`` est activé.
+
+        Phase 6 (Perf) : le texte cumulé est transmis à ``stream_callback`` à
+        chaque fragment et journalisé dans state.partial_sections au plus
+        toutes les ``stream_checkpoint_seconds`` (un crash en cours de réponse
+        n'en perd que la fin). Le résumé démarre dès la fermeture du flux.
+        """
+        request = dict(
+            prompt=job.prompt,
+            system_prompt=job.system_prompt,
+            model=settings.model,
+            temperature=settings.temperature,
+            max_tokens=settings.max_tokens,
+        )
+        if not self.config.get("streaming", False):
+            return self.provider.generate(**request)
+
+        interval = float(self.config.get("stream_checkpoint_seconds", 2.0))
+        last_checkpoint = time.monotonic()
+
+        def on_text(text: str) -> None:
+            nonlocal last_checkpoint
+            if self.stream_callback is not None:
+                self.stream_callback(section.id, text)
+            now = time.monotonic()
+            if now - last_checkpoint >= interval:
+                last_checkpoint = now
+                with self._state_lock:
+                    self.state.partial_sections[section.id] = text
+                self.mark_state_dirty()
+
+        return consume_stream(self.provider.generate_stream(**request), on_text)
+
+    async def _agenerate_section(
+        self,
+        section: PlanSection,
+        settings: "_PassSettings",
+        previous_summaries: list[str],
+        fallback_index: int = 0,
+    ) -> str:
+        """Phase 6 (Perf) : équivalent asyncio de _generate_section().
+
+        Les appels API (section et résumé) sont asynchrones ; la recherche RAG
+        et la préparation du prompt (_prefetch_section) tournent dans un
+        thread pour ne pas bloquer la boucle d'événements.
+        """
+        prefetched = await asyncio.to_thread(self._prefetch_section, section, settings)
+        job = self._prepare_section(section, settings, previous_summaries, fallback_index, prefetched)
+        if isinstance(job, str):
+            return job
+
+        try:
+            # Phase 6 (Perf) : la génération passe avant l'évaluation en arrière-plan
+            with request_priority(Priority.GENERATION), llm_task(settings.task_type):
+                response = await self.provider.agenerate(
+                    prompt=job.prompt,
+                    system_prompt=job.system_prompt,
+                    model=settings.model,
+                    temperature=settings.temperature,
+                    max_tokens=settings.max_tokens,
                 )
-                continue
+                content = self._record_section_content(section, settings, response)
+
+                if not settings.is_refinement:
+                    await self._asummarize_section(section, content, settings.model, job.system_prompt, settings.plan)
+
+                self._submit_evaluation(section, content, settings, job.corpus_chunks)
+        except Exception as e:
+            return self._fail_section(section, e)
+
+        return self._finish_section(section, settings, content, response)
+
+    def _prefetch_section(self, section: PlanSection, settings: "_PassSettings") -> "_SectionPrefetch":
+        """Calcule la partie d'une section indépendante des résumés précédents.
 
-            # Stocker l'index absolu dans plan.sections (pas l'index filtré)
+        Phase 6 (Perf) : recherche RAG (avec rerank), évaluation de couverture,
+        prompt système, glossaire et prompt préparé. Sans effet sur self.state,
+        ce calcul peut tourner en arrière-plan pendant la génération de la
+        section précédente.
+        """
+        # Récupérer les chunks de corpus (RAG ou fallback simple)
+        corpus_chunks = []
+        extra_instruction = ""
+        assessment = None
+        if settings.use_rag:
+            rag_result = self.rag_engine.search_for_section(
+                section.id, section.title, section.description or ""
+            )
+            corpus_chunks = rag_result.chunks
+
+            # Évaluation de la couverture conditionnelle
+            if self.conditional_generator and not settings.is_refinement:
+                assessment = self.conditional_generator.assess_coverage(rag_result)
+                if not assessment.should_generate:
+                    return _SectionPrefetch(corpus_chunks=corpus_chunks, assessment=assessment)
+                extra_instruction = assessment.extra_prompt_instruction or ""
+        elif self.state.corpus:
+            corpus_chunks = self.state.corpus.get_chunks_for_section(section.title)
+
+        # Build per-section system prompt (with section_id for hierarchical
+        # instructions and has_corpus to control anti-hallucination block)
+        system_prompt = self.prompt_engine.build_system_prompt(
+            has_corpus=bool(corpus_chunks),
+            section_id=section.id,
+        )
+
+        # Préparer le prompt (le contexte des sections précédentes est inséré au dernier moment)
+        if settings.is_refinement:
+            prepared = self.prompt_engine.prepare_refinement_prompt(
+                section=section,
+                plan=settings.plan,
+                draft_content=self.state.generated_sections.get(section.id, ""),
+                corpus_chunks=corpus_chunks,
+                target_pages=settings.target_pages,
+                extra_instruction=extra_instruction,
+            )
+        else:
+            prepared = self.prompt_engine.prepare_section_prompt(
+                section=section,
+                plan=settings.plan,
+                corpus_chunks=corpus_chunks,
+                target_pages=settings.target_pages,
+                extra_instruction=extra_instruction,
+            )
+
+        return _SectionPrefetch(
+            corpus_chunks=corpus_chunks,
+            assessment=assessment,
+            system_prompt=system_prompt,
+            prepared_prompt=prepared,
+            static_tokens=count_tokens(prepared.static_text + system_prompt, settings.model),
+        )
+
+    def _prepare_section(
+        self,
+        section: PlanSection,
+        settings: "_PassSettings",
+        previous_summaries: list[str],
+        fallback_index: int = 0,
+        prefetched: Optional["_SectionPrefetch"] = None,
+    ):
+        """Prépare la génération d'une section : RAG, couverture, prompts.
+
+        Args:
+            prefetched: Résultat de _prefetch_section() calculé en avance ;
+                calculé ici s'il est absent.
+
+        Returns:
+            Un _SectionJob prêt pour l'appel API, ou "deferred" / "paused".
+        """
+        plan = settings.plan
+
+        # Stocker l'index absolu dans plan.sections (pas l'index filtré)
+        with self._state_lock:
             try:
                 self.state.current_section_index = plan.sections.index(section)
             except ValueError:
-                self.state.current_section_index = i
+                self.state.current_section_index = fallback_index
             section.status = "generating"
-            self.activity_log.info(
-                f"[Passe {pass_number}] Section {section.id}: {section.title}",
-                section=section.id,
+        self.activity_log.info(
+            f"[Passe {settings.pass_number}] Section {section.id}: {section.title}",
+            section=section.id,
+        )
+
+        if prefetched is None:
+            prefetched = self._prefetch_section(section, settings)
+
+        assessment = prefetched.assessment
+        if assessment is not None:
+            with self._state_lock:
+                self.state.rag_coverage[section.id] = assessment.to_dict()
+
+            if not assessment.should_generate:
+                with self._state_lock:
+                    section.status = "deferred"
+                    if section.id not in self.state.deferred_sections:
+                        self.state.deferred_sections.append(section.id)
+                self.activity_log.warning(assessment.message, section=section.id)
+                self.mark_state_dirty()
+                self._emit("section_deferred", section_id=section.id, title=section.title)
+                return "deferred"
+
+            if assessment.extra_prompt_instruction:
+                self.activity_log.warning(assessment.message, section=section.id)
+
+        system_prompt = prefetched.system_prompt
+        corpus_chunks = prefetched.corpus_chunks
+        prompt = prefetched.prepared_prompt.render(previous_summaries)
+
+        # Vérification de la taille du contexte
+        prompt_tokens = prefetched.static_tokens + count_tokens(
+            format_previous_context(previous_summaries), settings.model,
+        )
+        self._check_context_window(prompt_tokens, settings.model)
+
+        # Checkpoint avant génération (si activé et mode manuel)
+        if not self.is_agentic and self.checkpoint_mgr.should_pause(CheckpointType.PROMPT_GENERATION):
+            checkpoint = self.checkpoint_mgr.create_checkpoint(
+                CheckpointType.PROMPT_GENERATION,
+                content=strip_cache_boundary(prompt),
+                section_id=section.id,
             )
+            if checkpoint:
+                self.save_state()
+                return "paused"
 
-            # Récupérer les chunks de corpus (RAG ou fallback simple)
-            corpus_chunks = []
-            extra_instruction = ""
-            if use_rag:
-                rag_result = self.rag_engine.search_for_section(
-                    section.id, section.title, section.description or ""
-                )
-                corpus_chunks = rag_result.chunks
-
-                # Évaluation de la couverture conditionnelle
-                if self.conditional_generator and not is_refinement:
-                    assessment = self.conditional_generator.assess_coverage(rag_result)
-                    self.state.rag_coverage[section.id] = assessment.to_dict()
-
-                    if not assessment.should_generate:
-                        section.status = "deferred"
-                        if section.id not in self.state.deferred_sections:
-                            self.state.deferred_sections.append(section.id)
-                        self.activity_log.warning(assessment.message, section=section.id)
-                        self.save_state()
-                        continue
+        self._emit(
+            "section_started", section_id=section.id, title=section.title, pass_number=settings.pass_number,
+        )
+        return _SectionJob(prompt=prompt, system_prompt=system_prompt, corpus_chunks=corpus_chunks)
+
+    def _record_section_content(
+        self, section: PlanSection, settings: "_PassSettings", response, batch: bool = False,
+    ) -> str:
+        """Enregistre le coût et le contenu nettoyé d'une section générée."""
+        self.cost_tracker.record(
+            section_id=section.id,
+            model=settings.model,
+            provider=self.provider.name,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            task_type=settings.task_type,
+            batch=batch,
+            cached=response.cached,
+            cached_input_tokens=response.cached_input_tokens,
+            cache_write_tokens=response.cache_write_tokens,
+        )
 
-                    if assessment.extra_prompt_instruction:
-                        extra_instruction = assessment.extra_prompt_instruction
-                        self.activity_log.warning(assessment.message, section=section.id)
-            elif self.state.corpus:
-                corpus_chunks = self.state.corpus.get_chunks_for_section(section.title)
+        # Post-traitement : nettoyage des références [Source N] résiduelles
+        from src.utils.reference_cleaner import clean_source_references
+        content = clean_source_references(response.content)
+        with self._state_lock:
+            self.state.partial_sections.pop(section.id, None)
+            self.state.generated_sections[section.id] = content
+            section.status = "generated"
+            section.generated_content = content
+
+        task_label = "raffinée" if settings.is_refinement else "générée"
+        self.activity_log.success(
+            f"Section {section.id} {task_label} ({response.output_tokens} tokens)",
+            section=section.id,
+        )
+        self._emit(
+            "section_finished",
+            section_id=section.id,
+            title=section.title,
+            pass_number=settings.pass_number,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cost_usd=self.cost_tracker.report.total_cost_usd,
+        )
+        return content
 
-            # Build per-section system prompt (with section_id for hierarchical
-            # instructions and has_corpus to control anti-hallucination block)
-            system_prompt = self.prompt_engine.build_system_prompt(
-                has_corpus=bool(corpus_chunks),
+    def _submit_evaluation(
+        self,
+        section: PlanSection,
+        content: str,
+        settings: "_PassSettings",
+        corpus_chunks: list,
+        quality_ai_scores: Optional[dict] = None,
+    ) -> None:
+        """Phase 4 (Perf) : soumet l'évaluation post-génération en arrière-plan
+        pour ne pas bloquer la génération de la section suivante.
+        Le résumé est déjà généré, donc le contexte est prêt.
+        """
+        eval_future = self._background_executor.submit(
+            self._run_post_generation_evaluation_background,
+            section, content, settings.plan, corpus_chunks,
+            settings.is_refinement, quality_ai_scores,
+        )
+        with self._state_lock:
+            self._pending_evaluations.append(eval_future)
+
+    def _fail_section(self, section: PlanSection, error: Exception) -> str:
+        """Marque une section en échec ; en mode manuel, crée un checkpoint d'erreur."""
+        section.status = "failed"
+        self.activity_log.error(f"Erreur génération section {section.id}: {error}", section=section.id)
+        logger.error(f"Erreur génération {section.id}: {error}")
+        self._emit("section_failed", section_id=section.id, title=section.title, error=str(error))
+        if not self.is_agentic and self.checkpoint_mgr:
+            # En mode manuel, créer un checkpoint pour informer l'utilisateur.
+            # Use GENERATION checkpoint type so should_pause() can match it
+            # against the config (the old f"error_{section.id}" never matched
+            # any CheckpointConfig attribute, making this a silent no-op).
+            self.checkpoint_mgr.create_checkpoint(
+                checkpoint_type=CheckpointType.GENERATION,
+                content=f"Erreur lors de la génération de {section.title}: {error}",
+                section_id=section.id,
+                metadata={"error": str(error)},
+            )
+        return "failed"
+
+    def _finish_section(self, section: PlanSection, settings: "_PassSettings", content: str, response) -> str:
+        """Checkpoint après génération (mode manuel uniquement) puis sauvegarde."""
+        if not self.is_agentic and self.checkpoint_mgr.should_pause(CheckpointType.GENERATION):
+            checkpoint = self.checkpoint_mgr.create_checkpoint(
+                CheckpointType.GENERATION,
+                content=content,
                 section_id=section.id,
+                metadata={"tokens": response.output_tokens, "pass": settings.pass_number},
             )
+            if checkpoint:
+                self.save_state()
+                return "paused"
 
-            # Construire le prompt
-            if is_refinement:
-                prompt = self.prompt_engine.build_refinement_prompt(
-                    section=section,
-                    plan=plan,
-                    draft_content=self.state.generated_sections.get(section.id, ""),
-                    corpus_chunks=corpus_chunks,
-                    previous_summaries=self.state.section_summaries,
-                    target_pages=target_pages,
-                    extra_instruction=extra_instruction,
-                )
-            else:
-                prompt = self.prompt_engine.build_section_prompt(
-                    section=section,
-                    plan=plan,
-                    corpus_chunks=corpus_chunks,
-                    previous_summaries=self.state.section_summaries,
-                    target_pages=target_pages,
-                    extra_instruction=extra_instruction,
-                )
+        self.mark_state_dirty()
+        return "generated"
 
-            # Vérification de la taille du contexte
-            prompt_tokens = count_tokens(prompt + system_prompt, model)
-            self._check_context_window(prompt_tokens, model)
+    def _emit(self, event_type: str, **data) -> None:
+        """Phase 6 (Perf) : transmet un événement de progression à event_callback."""
+        if self.event_callback is None:
+            return
+        try:
+            self.event_callback(event_type, data)
+        except Exception as e:
+            logger.warning(f"Publication de l'événement {event_type} échouée : {e}")
 
-            # Checkpoint avant génération (si activé et mode manuel)
-            if not self.is_agentic and self.checkpoint_mgr.should_pause(CheckpointType.PROMPT_GENERATION):
-                checkpoint = self.checkpoint_mgr.create_checkpoint(
-                    CheckpointType.PROMPT_GENERATION,
-                    content=prompt,
-                    section_id=section.id,
-                )
-                if checkpoint:
-                    self.save_state()
-                    return self.state.generated_sections
+    def _store_summary(self, section: PlanSection, summary: str, plan: NormalizedPlan) -> None:
+        """Insère le résumé d'une section à sa place dans l'ordre du plan.
 
-            # Appel API
-            try:
-                response = self.provider.generate(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+        Phase 6 (Perf) : avec le scheduler parallèle, les sections se terminent
+        dans un ordre arbitraire ; l'insertion ordonnée garde
+        state.section_summaries identique d'une exécution à l'autre.
+        """
+        position = {s.id: i for i, s in enumerate(plan.sections)}
+        rank = position.get(section.id, len(position))
+        entry = f"[{section.id}] {section.title}: {summary}"
+        with self._state_lock:
+            summaries = self.state.section_summaries
+            index = len(summaries)
+            while index > 0:
+                previous_id = _summary_section_id(summaries[index - 1])
+                if position.get(previous_id, -1) <= rank:
+                    break
+                index -= 1
+            summaries.insert(index, entry)
+
+    def _context_summaries(self, context_ids: list[str]) -> list[str]:
+        """Retourne les résumés disponibles des sections de contexte (ordre du plan)."""
+        with self._state_lock:
+            by_id = {_summary_section_id(s): s for s in self.state.section_summaries}
+        return [by_id[sid] for sid in context_ids if sid in by_id]
 
-                self.cost_tracker.record(
-                    section_id=section.id,
-                    model=model,
-                    provider=self.provider.name,
-                    input_tokens=response.input_tokens,
-                    output_tokens=response.output_tokens,
-                    task_type="refinement" if is_refinement else "generation",
-                )
+    def _build_scheduler(self, sections: list[PlanSection], settings: "_PassSettings"):
+        """Construit le scheduler de dépendances et le contexte de résumés de la passe."""
+        from src.core.section_scheduler import SectionScheduler, build_generation_dag, section_context_ids
 
-                # Post-traitement : nettoyage des références [Source N] résiduelles
-                from src.utils.reference_cleaner import clean_source_references
-                content = clean_source_references(response.content)
-                with self._state_lock:
-                    self.state.generated_sections[section.id] = content
-                section.status = "generated"
-                section.generated_content = content
+        summary_window = int(self.config.get("summary_window", 5))
+        dag = build_generation_dag(
+            sections, settings.plan, summary_window=summary_window, independent=settings.is_refinement,
+        )
+        context = {} if settings.is_refinement else section_context_ids(settings.plan, summary_window)
+        return SectionScheduler(sections, dag), context
+
+    def _previous_summaries_for(
+        self, section: PlanSection, settings: "_PassSettings", context: dict[str, list[str]],
+    ) -> list[str]:
+        """Résumés transmis au prompt d'une section ordonnancée par dépendances.
+
+        En raffinement, les résumés sont figés : la liste complète est
+        transmise, comme en séquentiel. En brouillon, seuls les résumés des
+        sections de contexte le sont, pour ne pas dépendre de l'ordre de
+        complétion.
+        """
+        if settings.is_refinement:
+            with self._state_lock:
+                return list(self.state.section_summaries)
+        return self._context_summaries(context.get(section.id, []))
 
-                task_label = "raffinée" if is_refinement else "générée"
-                self.activity_log.success(
-                    f"Section {section.id} {task_label} ({response.output_tokens} tokens)",
-                    section=section.id,
-                )
+    def _generate_sections_parallel(
+        self,
+        sections: list[PlanSection],
+        settings: "_PassSettings",
+        max_parallel: int,
+        progress_callback=None,
+    ) -> None:
+        """Phase 6 (Perf) : génère les sections indépendantes en parallèle.
 
-                # Générer un résumé pour le contexte IMMÉDIATEMENT
-                # (nécessaire pour la section suivante — ne peut pas être différé)
-                if not is_refinement:
-                    summary = self._generate_summary(section, content, model, system_prompt)
-                    with self._state_lock:
-                        self.state.section_summaries.append(f"[{section.id}] {section.title}: {summary}")
+        Une section n'est lancée qu'une fois ses dépendances (parent et
+        sections précédentes du chapitre, cf. section_scheduler) terminées ;
+        son prompt ne reçoit que les résumés de ce contexte, ce qui le rend
+        indépendant de l'ordre de complétion. Les sections prêtes sont lancées
+        dans l'ordre du plan, au plus ``max_parallel`` à la fois.
+        """
+        from concurrent.futures import FIRST_COMPLETED, wait
 
-                # Phase 4 (Perf) : soumettre l'évaluation post-génération en arrière-plan
-                # pour ne pas bloquer la génération de la section suivante.
-                # Le résumé est déjà généré ci-dessus, donc le contexte est prêt.
-                eval_future = self._background_executor.submit(
-                    self._run_post_generation_evaluation_background,
-                    section, content, plan, corpus_chunks,
-                    is_refinement,
-                )
-                self._pending_evaluations.append(eval_future)
+        scheduler, context = self._build_scheduler(sections, settings)
+        running: dict[Future, PlanSection] = {}
+        total = len(sections)
+        done = 0
 
-            except Exception as e:
-                section.status = "failed"
-                self.activity_log.error(f"Erreur génération section {section.id}: {e}", section=section.id)
-                logger.error(f"Erreur génération {section.id}: {e}")
-                if self.is_agentic:
-                    continue  # En mode agentique, on continue
-                else:
-                    # En mode manuel, créer un checkpoint pour informer l'utilisateur.
-                    # Use GENERATION checkpoint type so should_pause() can match it
-                    # against the config (the old f"error_{section.id}" never matched
-                    # any CheckpointConfig attribute, making this a silent no-op).
-                    if self.checkpoint_mgr:
-                        self.checkpoint_mgr.create_checkpoint(
-                            checkpoint_type=CheckpointType.GENERATION,
-                            content=f"Erreur lors de la génération de {section.title}: {e}",
-                            section_id=section.id,
-                            metadata={"error": str(e)},
-                        )
+        self.activity_log.info(
+            f"Génération parallèle : {total} sections, {max_parallel} en simultané"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="section") as pool:
+            while scheduler.has_ready or running:
+                while scheduler.has_ready and len(running) < max_parallel:
+                    section = scheduler.next_ready()
+                    if self._skip_deferred(section, settings):
+                        done += 1
+                        scheduler.complete(section.id)
+                        continue
+                    previous = self._previous_summaries_for(section, settings, context)
+                    future = pool.submit(
+                        self._generate_section, section, settings, previous, scheduler.order[section.id],
+                    )
+                    running[future] = section
+
+                if not running:
                     continue
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(finished, key=lambda f: scheduler.order[running[f].id]):
+                    section = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self._fail_section(section, e)
+                    done += 1
+                    scheduler.complete(section.id)
+                    if progress_callback:
+                        progress_callback(f"Section terminée : {section.title}", done / max(total, 1))
+
+    def _use_batch(self, kind: str) -> bool:
+        """Phase 6 (Perf) : indique si le travail ``kind`` passe par la Batch API.
+
+        Requiert batch.enabled, l'option batch.use_for_<kind>, un fournisseur
+        compatible et l'absence de checkpoint pouvant interrompre la passe.
+        """
+        batch_config = self.config.get("batch", {})
+        return (
+            bool(batch_config.get("enabled", False))
+            and bool(batch_config.get(f"use_for_{kind}", False))
+            and self.provider.supports_batch()
+            and not self._generation_may_pause()
+        )
 
-            # Checkpoint après génération (mode manuel uniquement)
-            if not self.is_agentic and self.checkpoint_mgr.should_pause(CheckpointType.GENERATION):
-                checkpoint = self.checkpoint_mgr.create_checkpoint(
-                    CheckpointType.GENERATION,
-                    content=content,
-                    section_id=section.id,
-                    metadata={"tokens": response.output_tokens, "pass": pass_number},
-                )
-                if checkpoint:
-                    self.save_state()
-                    return self.state.generated_sections
+    def _run_batch(self, key: str, requests: list[BatchRequest]) -> dict[str, AIResponse]:
+        """Exécute un batch en persistant son batch_id dans state.pending_batches.
 
+        Si un batch de même clé et de mêmes custom_ids est en attente (arrêt
+        pendant le polling), il est repris au lieu d'être resoumis.
+        """
+        from src.core.batch_executor import BatchExecutor
+
+        batch_config = self.config.get("batch", {})
+        executor = BatchExecutor(
+            self.provider,
+            poll_interval=batch_config.get("poll_interval_seconds", 30),
+            timeout=batch_config.get("timeout_seconds", 3600),
+            fallback_to_realtime=batch_config.get("fallback_to_realtime", True),
+        )
+        custom_ids = [r.custom_id for r in requests]
+        pending = self.state.pending_batches.get(key)
+        batch_id = None
+        if pending and pending.get("custom_ids") == custom_ids and pending.get("provider") == self.provider.name:
+            batch_id = pending["batch_id"]
+            self.activity_log.info(f"Reprise du batch {batch_id} ({len(requests)} requêtes)")
+
+        def on_submit(new_batch_id: str) -> None:
+            with self._state_lock:
+                self.state.pending_batches[key] = {
+                    "batch_id": new_batch_id,
+                    "provider": self.provider.name,
+                    "custom_ids": custom_ids,
+                    "submitted_at": datetime.now().isoformat(),
+                }
             self.save_state()
+            self.activity_log.info(f"Batch {new_batch_id} soumis ({len(requests)} requêtes)")
 
-        # Phase 4 (Perf) : attendre la fin de toutes les évaluations en arrière-plan
-        # avant de finaliser la passe.
-        if self._pending_evaluations:
-            logger.info(f"Attente de {len(self._pending_evaluations)} évaluations en arrière-plan...")
-            for future in self._pending_evaluations:
-                try:
-                    future.result()  # Attendre la fin
-                except Exception as e:
-                    logger.warning(f"Évaluation en arrière-plan échouée : {e}")
-            self._pending_evaluations.clear()
+        results = executor.run(requests, batch_id=batch_id, on_submit=on_submit)
+        with self._state_lock:
+            self.state.pending_batches.pop(key, None)
+        self.save_state()
+        return results
+
+    def _generate_sections_batch(
+        self,
+        sections: list[PlanSection],
+        settings: "_PassSettings",
+        progress_callback=None,
+    ) -> None:
+        """Phase 6 (Perf) : passe de raffinement via la Batch API.
 
+        Les prompts de toutes les sections sont préparés puis soumis en un
+        seul batch ; les sections sans résultat sont rejouées en temps réel
+        par BatchExecutor. Si batch.use_for_evaluation est activé,
+        l'évaluation qualité IA de la passe est elle aussi soumise en batch.
+        """
+        from src.core.batch_executor import BATCH_FINISH_REASON
+
+        jobs: dict[str, tuple[PlanSection, _SectionJob]] = {}
+        for i, section in enumerate(sections):
+            job = self._prepare_section(section, settings, self.state.section_summaries, fallback_index=i)
+            if isinstance(job, _SectionJob):
+                # custom_id : [a-zA-Z0-9_-] uniquement (contrainte Anthropic)
+                jobs[f"pass{settings.pass_number}-{i}"] = (section, job)
+
+        requests = [
+            BatchRequest(
+                custom_id=custom_id,
+                prompt=job.prompt,
+                system_prompt=job.system_prompt,
+                model=settings.model,
+                temperature=settings.temperature,
+                max_tokens=settings.max_tokens,
+            )
+            for custom_id, (_, job) in jobs.items()
+        ]
         if progress_callback:
-            progress_callback("Génération terminée !", 1.0)
+            progress_callback(f"Batch de raffinement : {len(requests)} sections soumises...", 0.0)
+        results = self._run_batch(f"refinement_pass_{settings.pass_number}", requests)
+
+        generated: list[tuple[str, PlanSection, str, _SectionJob]] = []
+        for custom_id, (section, job) in jobs.items():
+            response = results.get(custom_id)
+            if response is None:
+                self._fail_section(section, RuntimeError("aucun résultat batch ni temps réel"))
+                continue
+            content = self._record_section_content(
+                section, settings, response, batch=response.finish_reason == BATCH_FINISH_REASON,
+            )
+            generated.append((custom_id, section, content, job))
 
-        self.state.current_step = "review"
-        self.state.cost_report = self.cost_tracker.report.to_dict()
-        self.activity_log.success(f"Passe {pass_number} terminée pour toutes les sections")
+        quality_scores = self._batch_quality_scores(generated, settings)
+        for custom_id, section, content, job in generated:
+            self._submit_evaluation(
+                section, content, settings, job.corpus_chunks,
+                quality_ai_scores=quality_scores.get(custom_id),
+            )
         self.save_state()
-        return self.state.generated_sections
+
+    def _batch_quality_scores(self, generated: list, settings: "_PassSettings") -> dict[str, dict]:
+        """Phase 6 (Perf) : évaluation qualité IA (C1-C3) de la passe en un batch.
+
+        Returns:
+            Dict {custom_id: scores parsés} ; vide si le mode est désactivé
+            (l'évaluation se fait alors section par section en temps réel).
+        """
+        if not generated or not self._use_batch("evaluation"):
+            return {}
+        try:
+            self._init_phase3_engines()
+        except Exception as e:
+            logger.warning(f"Initialisation Phase 3 échouée : {e}")
+            return {}
+        evaluator = self._quality_evaluator
+        if not evaluator:
+            return {}
+
+        requests = []
+        for custom_id, section, content, job in generated:
+            request = evaluator.build_ai_request(
+                f"quality-{custom_id}", section, content, job.corpus_chunks, self.state.section_summaries,
+            )
+            if request:
+                requests.append(request)
+        if not requests:
+            return {}
+
+        try:
+            results = self._run_batch(f"quality_pass_{settings.pass_number}", requests)
+        except BatchError as e:
+            logger.warning(f"Évaluation qualité en batch échouée, repli par section : {e}")
+            return {}
+        return {
+            custom_id.removeprefix("quality-"): evaluator.parse_ai_response(response.content)
+            for custom_id, response in results.items()
+        }
+
+    def _prefetch_rag(self, sections: list[PlanSection]) -> None:
+        """Phase 6 (Perf) : pré-remplit le cache RAG pour une liste de sections.
+
+        Un échec n'est pas bloquant : search_for_section() retombe sur une
+        recherche unitaire pour les sections absentes du cache.
+        """
+        if not sections or not self.rag_engine:
+            return
+        try:
+            self.rag_engine.search_many(sections)
+        except Exception as e:
+            logger.warning(f"Pré-chargement RAG groupé échoué, recherche par section : {e}")
 
     def generate_multi_pass(self, num_passes: Optional[int] = None, progress_callback=None) -> dict:
         """Exécute la génération en passes multiples (brouillon + raffinements).
@@ -836,22 +1749,28 @@ class Orchestrator:
         plan: NormalizedPlan,
         corpus_chunks: list,
         is_refinement: bool = False,
+        quality_ai_scores: Optional[dict] = None,
     ) -> None:
         """Wrapper thread-safe pour l'évaluation post-génération en arrière-plan.
 
         Phase 4 (Perf) : exécuté dans le _background_executor. Les mutations
         de self.state sont protégées par self._state_lock.
+
+        Phase 6 (Perf) : les appels API de l'évaluation ont la priorité
+        BACKGROUND auprès du limiteur de débit partagé.
         """
         try:
-            corrected = self._run_post_generation_evaluation(
-                section, content, plan, corpus_chunks,
-                is_refinement=is_refinement,
-            )
+            with request_priority(Priority.BACKGROUND):
+                corrected = self._run_post_generation_evaluation(
+                    section, content, plan, corpus_chunks,
+                    is_refinement=is_refinement,
+                    quality_ai_scores=quality_ai_scores,
+                )
             if corrected:
                 with self._state_lock:
                     self.state.generated_sections[section.id] = corrected
                     section.generated_content = corrected
-            self.save_state()
+            self.mark_state_dirty()
         except Exception as e:
             logger.warning(f"Évaluation arrière-plan échouée pour {section.id}: {e}")
 
@@ -862,9 +1781,12 @@ class Orchestrator:
         plan: NormalizedPlan,
         corpus_chunks: list,
         is_refinement: bool = False,
+        quality_ai_scores: Optional[dict] = None,
     ) -> Optional[str]:
         """Exécute l'évaluation qualité et factcheck après génération (Phase 3).
 
+        ``quality_ai_scores`` : scores C1-C3 déjà obtenus en batch (Phase 6).
+
         Returns:
             Updated content if auto-correction was applied, None otherwise.
         """
@@ -915,6 +1837,7 @@ class Orchestrator:
                     corpus_chunks=corpus_chunks,
                     previous_summaries=self.state.section_summaries,
                     factcheck_score=factcheck_score,
+                    ai_scores=quality_ai_scores,
                 )
                 with self._state_lock:
                     self.state.quality_reports[section.id] = qr.to_dict()
@@ -1015,13 +1938,14 @@ class Orchestrator:
                 section_id=section.id,
             )
 
-            response = self.provider.generate(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            with llm_task("auto_correction"):
+                response = self.provider.generate(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
 
             self.cost_tracker.record(
                 section_id=section.id,
@@ -1030,6 +1954,9 @@ class Orchestrator:
                 input_tokens=response.input_tokens,
                 output_tokens=response.output_tokens,
                 task_type="auto_correction",
+                cached=response.cached,
+                cached_input_tokens=response.cached_input_tokens,
+                cache_write_tokens=response.cache_write_tokens,
             )
 
             from src.utils.reference_cleaner import clean_source_references
@@ -1073,14 +2000,71 @@ class Orchestrator:
         except Exception as e:
             logger.warning(f"Analyse feedback échouée pour {section_id}: {e}")
 
-    def _generate_summary(self, section: PlanSection, content: str, model: str, system_prompt: str) -> str:
-        """Génère un résumé de section pour le contexte."""
-        try:
-            summary_prompt = self.prompt_engine.build_summary_prompt(section.title, content)
-            # Summaries are about already-generated content, not corpus;
-            # disable the anti-hallucination block so the model isn't
-            # told to rely exclusively on corpus sources.
-            summary_system = self.prompt_engine.build_system_prompt(has_corpus=False)
+    def _summarize_section(
+        self, section: PlanSection, content: str, model: str, system_prompt: str, plan: NormalizedPlan,
+    ) -> str:
+        """Calcule et enregistre le résumé d'une section selon ``summarization.mode``.
+
+        Phase 6 (Perf) : en mode ``extractive`` ou ``hybrid``, le résumé local
+        ne fait aucun appel API ; en mode ``hybrid``, le résumé IA est calculé
+        en arrière-plan et remplace le résumé local à son arrivée.
+        """
+        mode = summary_mode(self.config)
+        if mode == "llm":
+            summary = self._generate_summary(section, content, model, system_prompt)
+            self._store_summary(section, summary, plan)
+            return summary
+        summary = self._extractive_summary(section, content)
+        self._store_summary(section, summary, plan)
+        if mode == "hybrid":
+            self._submit_summary_upgrade(section, content, model)
+        return summary
+
+    async def _asummarize_section(
+        self, section: PlanSection, content: str, model: str, system_prompt: str, plan: NormalizedPlan,
+    ) -> str:
+        """Phase 6 (Perf) : équivalent asyncio de _summarize_section()."""
+        if summary_mode(self.config) != "llm":
+            return self._summarize_section(section, content, model, system_prompt, plan)
+        summary = await self._agenerate_summary(section, content, model)
+        self._store_summary(section, summary, plan)
+        return summary
+
+    def _extractive_summary(self, section: PlanSection, content: str) -> str:
+        summary = self._extractive_summarizer.summarize(content, section.title)
+        return summary or self._summary_fallback(section, content, ValueError("texte sans phrase exploitable"))
+
+    def _submit_summary_upgrade(self, section: PlanSection, content: str, model: str) -> None:
+        """Mode ``hybrid`` : remplace le résumé local par le résumé IA en arrière-plan."""
+        def upgrade():
+            with request_priority(Priority.BACKGROUND):
+                try:
+                    summary = self._llm_summary(section, content, model)
+                except Exception as e:
+                    logger.info(f"Résumé IA de {section.id} indisponible, résumé extractif conservé : {e}")
+                    return
+            if summary:
+                self._replace_summary(section, summary)
+
+        future = self._background_executor.submit(upgrade)
+        with self._state_lock:
+            self._pending_evaluations.append(future)
+
+    def _replace_summary(self, section: PlanSection, summary: str) -> None:
+        """Remplace le résumé enregistré d'une section (mode ``hybrid``)."""
+        entry = f"[{section.id}] {section.title}: {summary}"
+        with self._state_lock:
+            summaries = self.state.section_summaries
+            for i, existing in enumerate(summaries):
+                if _summary_section_id(existing) == section.id:
+                    summaries[i] = entry
+                    break
+        self.mark_state_dirty()
+
+    def _llm_summary(self, section: PlanSection, content: str, model: str) -> str:
+        """Résumé IA d'une section (lève une exception en cas d'échec)."""
+        summary_prompt, summary_system = self._summary_prompts(section, content)
+        with llm_task("summary"):
             response = self.provider.generate(
                 prompt=summary_prompt,
                 system_prompt=summary_system,
@@ -1088,18 +2072,57 @@ class Orchestrator:
                 temperature=0.3,
                 max_tokens=200,
             )
-            self.cost_tracker.record(
-                section_id=section.id,
-                model=model,
-                provider=self.provider.name,
-                input_tokens=response.input_tokens,
-                output_tokens=response.output_tokens,
-                task_type="summary",
-            )
-            return response.content.strip()
+        return self._summary_from_response(section, model, response)
+
+    def _generate_summary(self, section: PlanSection, content: str, model: str, system_prompt: str) -> str:
+        """Génère un résumé de section pour le contexte."""
+        try:
+            return self._llm_summary(section, content, model)
+        except Exception as e:
+            return self._summary_fallback(section, content, e)
+
+    async def _agenerate_summary(self, section: PlanSection, content: str, model: str) -> str:
+        """Phase 6 (Perf) : équivalent asyncio de _generate_summary()."""
+        try:
+            summary_prompt, summary_system = self._summary_prompts(section, content)
+            with llm_task("summary"):
+                response = await self.provider.agenerate(
+                    prompt=summary_prompt,
+                    system_prompt=summary_system,
+                    model=model,
+                    temperature=0.3,
+                    max_tokens=200,
+                )
+            return self._summary_from_response(section, model, response)
         except Exception as e:
-            logger.warning(f"Impossible de générer le résumé pour {section.id}: {e}")
-            return content[:200] + ("..." if len(content) > 200 else "")
+            return self._summary_fallback(section, content, e)
+
+    def _summary_prompts(self, section: PlanSection, content: str) -> tuple[str, str]:
+        summary_prompt = self.prompt_engine.build_summary_prompt(section.title, content)
+        # Summaries are about already-generated content, not corpus;
+        # disable the anti-hallucination block so the model isn't
+        # told to rely exclusively on corpus sources.
+        summary_system = self.prompt_engine.build_system_prompt(has_corpus=False)
+        return summary_prompt, summary_system
+
+    def _summary_from_response(self, section: PlanSection, model: str, response) -> str:
+        self.cost_tracker.record(
+            section_id=section.id,
+            model=model,
+            provider=self.provider.name,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            task_type="summary",
+            cached=response.cached,
+            cached_input_tokens=response.cached_input_tokens,
+            cache_write_tokens=response.cache_write_tokens,
+        )
+        return response.content.strip()
+
+    @staticmethod
+    def _summary_fallback(section: PlanSection, content: str, error: Exception) -> str:
+        logger.warning(f"Impossible de générer le résumé pour {section.id}: {error}")
+        return content[:200] + ("..." if len(content) > 200 else "")
 
     def _check_context_window(self, token_count: int, model: str) -> None:
         """Vérifie si le prompt ne dépasse pas la fenêtre de contexte."""
@@ -1117,28 +2140,56 @@ class Orchestrator:
         logger.debug(f"Modèle {model} non trouvé dans les tarifs, vérification de contexte ignorée")
 
     def save_state(self) -> None:
-        """Sauvegarde l'état du projet sur disque (thread-safe).
+        """Sauvegarde l'état du projet sur disque (barrière synchrone).
+
+        Phase 4 (Perf) : thread-safe — l'état est sérialisé sous
+        self._state_lock, les tâches de fond (factcheck, qualité) le
+        modifiant simultanément.
+
+        Phase 6 (Perf) : réservé aux barrières (fin de passe, checkpoint,
+        soumission de batch) — écrit un instantané complet durable (fsync +
+        renommage atomique), modifications différées comprises. En cours de
+        génération, utiliser mark_state_dirty().
+        """
+        self._state_saver.flush(barrier=True)
+
+    def mark_state_dirty(self) -> None:
+        """Phase 6 (Perf) : signale une modification de l'état.
 
-        Phase 4 (Perf) : protégé par un verrou pour éviter les conflits
-        entre le thread principal (génération) et les tâches de fond
-        (factcheck, qualité) qui modifient self.state simultanément.
+        Le thread d'écriture regroupe les modifications et ajoute au journal
+        au plus une écriture par intervalle (persistence.write_behind_ms),
+        sans bloquer la génération ni garder le verrou d'état pendant les I/O.
         """
+        self._state_saver.mark_dirty()
+
+    def _state_snapshot(self) -> Optional[dict]:
         with self._state_lock:
-            if self.state:
-                state_path = self.project_dir / "state.json"
-                save_json(state_path, self.state.to_dict())
+            return self.state.to_dict() if self.state else None
+
+    def close(self) -> None:
+        """Barrière d'arrêt : écrit l'état en attente et arrête les exécuteurs."""
+        for future in self._pending_evaluations:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Évaluation en arrière-plan échouée : {e}")
+        self._pending_evaluations.clear()
+        if self._state_saver.dirty:
+            self.save_state()
+        self._background_executor.shutdown(wait=True)
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        if isinstance(self.provider, CachedProvider):
+            self.provider.cache.close()
 
     def load_state(self) -> Optional[ProjectState]:
-        """Charge l'état du projet depuis le disque."""
-        state_path = self.project_dir / "state.json"
-        if state_path.exists():
-            data = load_json(state_path)
+        """Charge l'état du projet depuis le disque (instantané + journal)."""
+        data = self._state_store.load()
+        if data is not None:
             self.state = ProjectState.from_dict(data)
             # Réhydratation du CostTracker depuis l'état persisté
+            # (tous les champs : cache_hits, économies, tokens en cache...)
             if self.state and self.state.cost_report:
-                self.cost_tracker._report.total_input_tokens = self.state.cost_report.get("total_input_tokens", 0)
-                self.cost_tracker._report.total_output_tokens = self.state.cost_report.get("total_output_tokens", 0)
-                self.cost_tracker._report.total_cost_usd = self.state.cost_report.get("total_cost_usd", 0.0)
+                self.cost_tracker._report = CostReport.from_dict(self.state.cost_report)
             return self.state
         return None
 
@@ -1217,13 +2268,14 @@ class Orchestrator:
             has_corpus=bool(corpus) or use_plan_corpus,
         )
 
-        response = self.provider.generate(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            model=self.config.get("model", self.provider.get_default_model()),
-            temperature=0.7,
-            max_tokens=2000,
-        )
+        with llm_task("plan_generation"):
+            response = self.provider.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                model=self.config.get("model", self.provider.get_default_model()),
+                temperature=0.7,
+                max_tokens=2000,
+            )
 
         self.cost_tracker.record(
             section_id="plan",
@@ -1232,6 +2284,9 @@ class Orchestrator:
             input_tokens=response.input_tokens,
             output_tokens=response.output_tokens,
             task_type="plan_generation",
+            cached=response.cached,
+            cached_input_tokens=response.cached_input_tokens,
+            cache_write_tokens=response.cache_write_tokens,
         )
 
         parser = PlanParser()
@@ -39,7 +39,7 @@ def link_plan_to_corpus(
     Args:
         objective: Objectif du document décrit par l'utilisateur.
         metadata_store: Instance de MetadataStore (SQLite).
-        collection: Collection ChromaDB indexée.
+        collection: VectorStore indexé (ChromaDB ou index plat NumPy, voir vector_store.py).
         config: Configuration du projet.
         provider: Fournisseur IA pour l'extraction de thèmes (optionnel).
 
@@ -1,13 +1,22 @@
 """Génération et gestion des prompts pour le pipeline.
 
 Phase 2.5 : ajout des garde-fous anti-hallucination et du marqueur {{NEEDS_SOURCE}}.
+Phase 6 (Perf) : prompts préparés (PreparedPrompt) — tout sauf le contexte des
+           sections précédentes, pour être pré-calculés pendant la génération
+           de la section en cours.
+Phase 6 (Perf) : disposition stable pour le cache de prompt des fournisseurs —
+           préfixe commun à toutes les sections (règles, persona, objectif,
+           glossaire partagé, consignes de rédaction), PROMPT_CACHE_BOUNDARY,
+           puis la partie propre à la section.
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Optional
 
 from src.core.plan_parser import PlanSection, NormalizedPlan
 from src.core.corpus_extractor import CorpusChunk
+from src.providers.base import PROMPT_CACHE_BOUNDARY
 
 logger = logging.getLogger("orchestria")
 
@@ -47,11 +56,20 @@ Règles générales :
 - Respecte strictement la structure et les consignes fournies.
 - Base-toi exclusivement sur le corpus fourni pour les informations factuelles.
 - Ne fabrique pas de données ou de statistiques.
-{persistent_instructions}{anti_hallucination}"""
+{persona}{anti_hallucination}{cache_boundary}{persistent_instructions}"""
 
+# Phase 6 (Perf) : le préfixe (objectif, glossaire partagé, consignes) est
+# identique pour toutes les sections d'un document ; {cache_boundary} le
+# sépare de la partie propre à la section.
 SECTION_PROMPT_TEMPLATE = """═══ OBJECTIF DU DOCUMENT ═══
 {objective}
-
+{shared_glossary}
+═══ INSTRUCTIONS ═══
+Rédige le contenu de la section décrite ci-dessous en respectant ses consignes.
+Le texte doit être structuré, professionnel et directement exploitable dans un document final.
+N'inclus pas le titre de la section dans ta réponse (il sera ajouté automatiquement).
+N'utilise pas de titres Markdown (# ou ##) dans ta réponse. Si tu as besoin de sous-titres internes, utilise le format en gras : **Sous-titre**.
+{cache_boundary}
 ═══ SECTION À RÉDIGER ═══
 Titre : {section_title}
 Niveau hiérarchique : {section_level}
@@ -65,12 +83,6 @@ Niveau hiérarchique : {section_level}
 
 ═══ CORPUS SOURCE PERTINENT ═══
 {corpus_content}
-
-═══ INSTRUCTIONS ═══
-Rédige le contenu de cette section en respectant les consignes ci-dessus.
-Le texte doit être structuré, professionnel et directement exploitable dans un document final.
-N'inclus pas le titre de la section dans ta réponse (il sera ajouté automatiquement).
-N'utilise pas de titres Markdown (# ou ##) dans ta réponse. Si tu as besoin de sous-titres internes, utilise le format en gras : **Sous-titre**.
 """
 
 PLAN_GENERATION_PROMPT = """À partir de l'objectif suivant, génère un plan structuré détaillé pour un document professionnel.
@@ -92,7 +104,17 @@ PLAN_GENERATION_PROMPT = """À partir de l'objectif suivant, génère un plan st
 
 REFINEMENT_PROMPT_TEMPLATE = """═══ OBJECTIF DU DOCUMENT ═══
 {objective}
-
+{shared_glossary}
+═══ INSTRUCTIONS DE RAFFINEMENT ═══
+Améliore le brouillon de la section décrite ci-dessous en :
+- Renforçant la précision et la richesse du contenu à partir du corpus source.
+- Améliorant la structure, la clarté et la fluidité du texte.
+- Corrigeant les erreurs factuelles, grammaticales ou stylistiques.
+- Respectant la longueur cible.
+- Conservant les éléments de qualité du brouillon.
+- N'utilisant pas de titres Markdown (# ou ##). Utilise des sous-titres en gras (**Sous-titre**) si nécessaire.
+Retourne uniquement la version améliorée, sans commentaires ni explications.
+{cache_boundary}
 ═══ SECTION À RAFFINER ═══
 Titre : {section_title}
 Niveau hiérarchique : {section_level}
@@ -109,17 +131,32 @@ Niveau hiérarchique : {section_level}
 
 ═══ BROUILLON ACTUEL À AMÉLIORER ═══
 {draft_content}
-{extra_instruction}
-═══ INSTRUCTIONS DE RAFFINEMENT ═══
-Améliore le brouillon ci-dessus en :
-- Renforçant la précision et la richesse du contenu à partir du corpus source.
-- Améliorant la structure, la clarté et la fluidité du texte.
-- Corrigeant les erreurs factuelles, grammaticales ou stylistiques.
-- Respectant la longueur cible.
-- Conservant les éléments de qualité du brouillon.
-- N'utilisant pas de titres Markdown (# ou ##). Utilise des sous-titres en gras (**Sous-titre**) si nécessaire.
-Retourne uniquement la version améliorée, sans commentaires ni explications.
-"""
+{extra_instruction}"""
+
+
+# Emplacement réservé au contexte des sections précédentes dans un PreparedPrompt
+PREVIOUS_CONTEXT_SLOT = "\x00previous_context\x00"
+
+
+def format_previous_context(previous_summaries: list[str]) -> str:
+    """Formate les résumés des sections précédentes (5 derniers au plus)."""
+    if not previous_summaries:
+        return "Aucune section précédente."
+    return "\n".join(f"- {s}" for s in previous_summaries[-5:])
+
+
+@dataclass
+class PreparedPrompt:
+    """Prompt de section dont seul le contexte des sections précédentes reste à insérer."""
+    template: str
+
+    @property
+    def static_text(self) -> str:
+        """Texte du prompt sans le contexte (pour le comptage de tokens)."""
+        return self.template.replace(PREVIOUS_CONTEXT_SLOT, "")
+
+    def render(self, previous_summaries: list[str]) -> str:
+        return self.template.replace(PREVIOUS_CONTEXT_SLOT, format_previous_context(previous_summaries))
 
 
 class PromptEngine:
@@ -128,6 +165,8 @@ class PromptEngine:
     Phase 2.5 : injection systématique du bloc anti-hallucination.
     Phase 3 : support glossaire, persona, instructions persistantes hiérarchiques,
               templates, citations conditionnelles.
+    Phase 6 (Perf) : ``prompt_caching`` insère PROMPT_CACHE_BOUNDARY après le
+              préfixe stable des prompts système, de section et de raffinement.
     """
 
     def __init__(
@@ -139,6 +178,7 @@ class PromptEngine:
         persona_engine=None,
         persistent_instructions_engine=None,
         template_library=None,
+        prompt_caching: bool = True,
     ):
         self.persistent_instructions = persistent_instructions
         self.anti_hallucination_enabled = anti_hallucination_enabled
@@ -147,6 +187,11 @@ class PromptEngine:
         self.persona_engine = persona_engine
         self.persistent_instructions_engine = persistent_instructions_engine
         self.template_library = template_library
+        self.prompt_caching = prompt_caching
+
+    @property
+    def _cache_boundary(self) -> str:
+        return PROMPT_CACHE_BOUNDARY if self.prompt_caching else ""
 
     def build_system_prompt(self, has_corpus: bool = True, section_id: Optional[str] = None) -> str:
         """Construit le prompt système avec instructions persistantes et garde-fous.
@@ -196,9 +241,13 @@ class PromptEngine:
                 )
                 anti_hallucination = f"\n{block}"
 
+        # Phase 6 (Perf) : les instructions (éventuellement propres à la
+        # section) viennent après le préfixe mis en cache
         return SYSTEM_PROMPT_TEMPLATE.format(
-            persistent_instructions=instructions + persona_block,
+            persona=persona_block,
             anti_hallucination=anti_hallucination,
+            cache_boundary=self._cache_boundary,
+            persistent_instructions=instructions,
         )
 
     def build_section_prompt(
@@ -211,6 +260,19 @@ class PromptEngine:
         extra_instruction: str = "",
     ) -> str:
         """Construit le prompt pour générer une section."""
+        return self.prepare_section_prompt(
+            section, plan, corpus_chunks, target_pages, extra_instruction,
+        ).render(previous_summaries)
+
+    def prepare_section_prompt(
+        self,
+        section: PlanSection,
+        plan: NormalizedPlan,
+        corpus_chunks: list,
+        target_pages: Optional[float] = None,
+        extra_instruction: str = "",
+    ) -> PreparedPrompt:
+        """Prépare le prompt d'une section sans le contexte des sections précédentes."""
         # Description de la section
         description = ""
         if section.description:
@@ -224,11 +286,6 @@ class PromptEngine:
         else:
             length_instruction = "Longueur adaptée au contenu à couvrir."
 
-        # Contexte des sections précédentes
-        previous_context = "Aucune section précédente." if not previous_summaries else "\n".join(
-            f"- {s}" for s in previous_summaries[-5:]  # Limiter aux 5 derniers résumés
-        )
-
         # Corpus pertinent (regroupé par document source)
         if corpus_chunks:
             corpus_content = self._format_corpus_chunks_grouped(corpus_chunks)
@@ -239,24 +296,26 @@ class PromptEngine:
                 "{{NEEDS_SOURCE: [description du point]}}."
             )
 
+        shared_glossary, section_glossary = self._build_glossary_blocks(section.title, corpus_chunks)
         prompt = SECTION_PROMPT_TEMPLATE.format(
             objective=plan.objective or plan.title or "Document professionnel",
+            shared_glossary=shared_glossary,
+            cache_boundary=self._cache_boundary,
             section_title=section.title,
             section_level=section.level,
             section_description=description,
             length_instruction=length_instruction,
-            previous_context=previous_context,
+            previous_context=PREVIOUS_CONTEXT_SLOT,
             corpus_content=corpus_content,
         )
 
-        # Phase 3: injection du glossaire
-        glossary_block = self._build_glossary_block(section.title, corpus_chunks)
-        if glossary_block:
-            prompt += f"\n\n{glossary_block}\n"
+        # Phase 3: injection du glossaire (sélection propre à la section)
+        if section_glossary:
+            prompt += f"\n{section_glossary}\n"
 
         if extra_instruction:
             prompt += f"\n\n═══ CONSIGNE SUPPLÉMENTAIRE ═══\n{extra_instruction}\n"
-        return prompt
+        return PreparedPrompt(prompt)
 
     def build_refinement_prompt(
         self,
@@ -269,6 +328,20 @@ class PromptEngine:
         extra_instruction: str = "",
     ) -> str:
         """Construit le prompt de raffinement pour une section existante."""
+        return self.prepare_refinement_prompt(
+            section, plan, draft_content, corpus_chunks, target_pages, extra_instruction,
+        ).render(previous_summaries)
+
+    def prepare_refinement_prompt(
+        self,
+        section: PlanSection,
+        plan: NormalizedPlan,
+        draft_content: str,
+        corpus_chunks: list,
+        target_pages: Optional[float] = None,
+        extra_instruction: str = "",
+    ) -> PreparedPrompt:
+        """Prépare le prompt de raffinement sans le contexte des sections précédentes."""
         description = ""
         if section.description:
             description = f"Description : {section.description}"
@@ -280,10 +353,6 @@ class PromptEngine:
         else:
             length_instruction = "Longueur adaptée au contenu à couvrir."
 
-        previous_context = "Aucune section précédente." if not previous_summaries else "\n".join(
-            f"- {s}" for s in previous_summaries[-5:]
-        )
-
         if corpus_chunks:
             corpus_content = self._format_corpus_chunks_grouped(corpus_chunks)
         else:
@@ -293,19 +362,24 @@ class PromptEngine:
                 "{{NEEDS_SOURCE: [description du point]}}."
             )
 
-        extra_block = f"\n═══ CONSIGNE SUPPLÉMENTAIRE ═══\n{extra_instruction}" if extra_instruction else ""
+        extra_block = f"\n═══ CONSIGNE SUPPLÉMENTAIRE ═══\n{extra_instruction}\n" if extra_instruction else ""
+        shared_glossary, section_glossary = self._build_glossary_blocks(section.title, corpus_chunks)
+        if section_glossary:
+            extra_block = f"\n{section_glossary}\n{extra_block}"
 
-        return REFINEMENT_PROMPT_TEMPLATE.format(
+        return PreparedPrompt(REFINEMENT_PROMPT_TEMPLATE.format(
             objective=plan.objective or plan.title or "Document professionnel",
+            shared_glossary=shared_glossary,
+            cache_boundary=self._cache_boundary,
             section_title=section.title,
             section_level=section.level,
             section_description=description,
             length_instruction=length_instruction,
-            previous_context=previous_context,
+            previous_context=PREVIOUS_CONTEXT_SLOT,
             corpus_content=corpus_content,
             draft_content=draft_content or "[Aucun brouillon disponible]",
             extra_instruction=extra_block,
-        )
+        ))
 
     def build_plan_generation_prompt(
         self,
@@ -418,6 +492,27 @@ class PromptEngine:
         except Exception:
             return ""
 
+    def _build_glossary_blocks(self, section_title: str, corpus_chunks: Optional[list] = None) -> tuple[str, str]:
+        """Répartit le glossaire entre préfixe partagé et partie propre à la section.
+
+        Phase 6 (Perf) : un glossaire tenant dans la limite par prompt est
+        injecté en entier, dans son ordre d'origine, dans le préfixe stable ;
+        au-delà, la sélection par section reste dans la partie variable.
+
+        Returns:
+            (bloc partagé, bloc propre à la section) — l'un des deux est vide.
+        """
+        if not self.glossary_engine or not self.glossary_engine.enabled:
+            return "", ""
+        try:
+            terms = self.glossary_engine.get_all_terms()
+            if len(terms) <= self.glossary_engine.max_terms_per_prompt:
+                block = self.glossary_engine.format_for_prompt(terms)
+                return (f"\n{block}\n" if block else ""), ""
+        except Exception:
+            return "", ""
+        return "", self._build_glossary_block(section_title, corpus_chunks)
+
     @staticmethod
     def _format_corpus_chunks_grouped(corpus_chunks: list) -> str:
         """Regroupe les chunks par document source pour le prompt.
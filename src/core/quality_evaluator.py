@@ -2,6 +2,8 @@
 
 Phase 3 : évalue chaque section sur 6 critères et produit un rapport
 structuré avec score global pondéré.
+Phase 6 (Perf) : la requête IA (C1-C3) peut être construite séparément
+           (build_ai_request) pour être soumise en batch par l'orchestrateur.
 """
 
 import logging
@@ -11,7 +13,8 @@ from typing import Optional
 
 from src.core.export_engine import detect_needs_source_markers
 from src.core.plan_parser import PlanSection, NormalizedPlan
-from src.providers.base import BaseProvider
+from src.core.response_cache import llm_task
+from src.providers.base import BaseProvider, BatchRequest
 
 logger = logging.getLogger("orchestria")
 
@@ -25,6 +28,8 @@ DEFAULT_WEIGHTS = {
     "source_traceability": 1.2,
 }
 
+EVALUATION_SYSTEM_PROMPT = "Tu es un évaluateur de qualité. Retourne uniquement du JSON valide."
+
 EVALUATION_PROMPT = """Tu es un évaluateur de qualité documentaire. Évalue le contenu suivant selon les critères demandés.
 
 ═══ SECTION ÉVALUÉE ═══
@@ -137,6 +142,7 @@ class QualityEvaluator:
         corpus_chunks: Optional[list] = None,
         previous_summaries: Optional[list[str]] = None,
         factcheck_score: Optional[float] = None,
+        ai_scores: Optional[dict] = None,
     ) -> QualityReport:
         """Évalue une section sur les 6 critères.
 
@@ -147,6 +153,8 @@ class QualityEvaluator:
             corpus_chunks: Les blocs de corpus utilisés.
             previous_summaries: Résumés des sections précédentes.
             factcheck_score: Score de fiabilité factuelle (0-100, du factcheck_engine).
+            ai_scores: Scores C1-C3 déjà obtenus (réponse batch parsée par
+                parse_ai_response) ; évite l'appel IA.
 
         Returns:
             Rapport de qualité complet.
@@ -158,7 +166,8 @@ class QualityEvaluator:
         criteria = []
 
         # C1, C2, C3 : évaluation par IA
-        ai_scores = self._evaluate_with_ai(section, content, corpus_chunks, previous_summaries)
+        if ai_scores is None:
+            ai_scores = self._evaluate_with_ai(section, content, corpus_chunks, previous_summaries)
 
         # C1 — Conformité au plan
         c1_score = ai_scores.get("C1", {}).get("score", 3.0)
@@ -229,6 +238,57 @@ class QualityEvaluator:
         if not self.provider:
             return {}
 
+        prompt = self._build_ai_prompt(section, content, corpus_chunks, previous_summaries)
+        try:
+            model = self.evaluation_model or self.provider.get_default_model()
+            with llm_task("quality"):
+                response = self.provider.generate(
+                    prompt=prompt,
+                    system_prompt=EVALUATION_SYSTEM_PROMPT,
+                    model=model,
+                    temperature=0.2,
+                    max_tokens=500,
+                )
+            return self._parse_ai_scores(response.content)
+        except Exception as e:
+            logger.warning(f"Évaluation IA échouée pour {section.id}: {e}")
+            return {}
+
+    def build_ai_request(
+        self,
+        custom_id: str,
+        section: PlanSection,
+        content: str,
+        corpus_chunks: Optional[list] = None,
+        previous_summaries: Optional[list[str]] = None,
+    ) -> Optional[BatchRequest]:
+        """Construit la requête d'évaluation IA (C1-C3) pour un batch.
+
+        Returns:
+            La requête, ou None si l'évaluation IA est indisponible.
+        """
+        if not self.enabled or not self.provider:
+            return None
+        return BatchRequest(
+            custom_id=custom_id,
+            prompt=self._build_ai_prompt(section, content, corpus_chunks, previous_summaries),
+            system_prompt=EVALUATION_SYSTEM_PROMPT,
+            model=self.evaluation_model or self.provider.get_default_model(),
+            temperature=0.2,
+            max_tokens=500,
+        )
+
+    def parse_ai_response(self, response_text: str) -> dict:
+        """Parse la réponse d'une requête construite par build_ai_request()."""
+        return self._parse_ai_scores(response_text)
+
+    @staticmethod
+    def _build_ai_prompt(
+        section: PlanSection,
+        content: str,
+        corpus_chunks: Optional[list] = None,
+        previous_summaries: Optional[list[str]] = None,
+    ) -> str:
         corpus_summary = "Aucun corpus fourni."
         if corpus_chunks:
             texts = []
@@ -241,7 +301,7 @@ class QualityEvaluator:
         if previous_summaries:
             summaries_text = "\n".join(f"- {s}" for s in previous_summaries[-3:])
 
-        prompt = EVALUATION_PROMPT.format(
+        return EVALUATION_PROMPT.format(
             section_title=section.title,
             section_description=section.description or "Pas de description",
             content=content[:3000],
@@ -249,20 +309,6 @@ class QualityEvaluator:
             previous_summaries=summaries_text,
         )
 
-        try:
-            model = self.evaluation_model or self.provider.get_default_model()
-            response = self.provider.generate(
-                prompt=prompt,
-                system_prompt="Tu es un évaluateur de qualité. Retourne uniquement du JSON valide.",
-                model=model,
-                temperature=0.2,
-                max_tokens=500,
-            )
-            return self._parse_ai_scores(response.content)
-        except Exception as e:
-            logger.warning(f"Évaluation IA échouée pour {section.id}: {e}")
-            return {}
-
     @staticmethod
     def _parse_ai_scores(response_text: str) -> dict:
         """Parse la réponse JSON de l'évaluation IA."""
@@ -15,20 +15,48 @@ Phase 4.2 (Perf) : pipeline d'embedding asynchrone — le flush ChromaDB du lot
   s'exécute en parallèle avec le calcul des embeddings du lot N+1.
 Phase 5 (Sécurité mémoire) : segmentation RAM par lots de MAX_RAM_BATCH_SIZE
   pour éviter les OOM sur les très gros corpus (500k+ chunks).
+Phase 6 (Perf) : cache persistant d'embeddings adressé par contenu — seuls les
+  chunks absents du cache sont envoyés à l'embedder local ou aux API.
+  Ré-indexation incrémentale (update_corpus_semantic) des seuls documents
+  nouveaux, modifiés ou retirés.
+  Recherche groupée (search_many) : un embedding, une requête ChromaDB et un
+  reranking pour toutes les sections du plan.
+  Chemin NumPy natif : les embeddings circulent en matrices float32 de
+  l'embedder jusqu'à ChromaDB, sans conversion élément par élément.
+  Cache de recherche borné (LRU) avec tier disque indexé par l'empreinte de
+  la collection (voir search_cache.py).
+  Pool multi-processus pour l'embedder local (voir embedding_pool.py) et
+  mesure du débit d'embedding (chunks/s) à chaque indexation.
+  Stockage vectoriel interchangeable (rag.vector_store) : ChromaDB ou index
+  plat NumPy en mémoire mappée (voir vector_store.py), avec quantification
+  int8/binaire optionnelle et mesure du recall@k (evaluate_index_recall).
 """
 
+import hashlib
 import logging
-import threading
+import time
+import uuid
 from concurrent.futures import Future, ThreadPoolExecutor
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
+from src.core.search_cache import SearchCache, persistent_key
+from src.core.vector_store import create_vector_store
+
 logger = logging.getLogger("orchestria")
 
 # Nombre maximal de chunks gardés en mémoire avant écriture dans ChromaDB.
 # Évite les OOM sur les très gros corpus (500k+ chunks).
-MAX_RAM_BATCH_SIZE = 10_000
+# Phase 6 (Perf) : relevé de 10 000 à 25 000 — les vecteurs d'un lot sont une
+# matrice float32 (~100 Mo pour 25k x 1024) au lieu de listes de floats Python.
+MAX_RAM_BATCH_SIZE = 25_000
+
+# Fichier (dans persist_dir) contenant la version de l'index, régénérée à
+# chaque écriture : elle entre dans l'empreinte du cache de recherche disque.
+INDEX_VERSION_FILENAME = "orchestria_index_version"
 
 
 @dataclass
@@ -87,9 +115,13 @@ class RAGEngine:
         self.top_k = top_k
         self.relevance_threshold = relevance_threshold
         self.config = config or {}
-        self._client = None
-        self._collection = None
         rag_cfg = self.config.get("rag", {})
+        # Phase 6 (Perf) : backend vectoriel configurable ("chromadb" | "numpy")
+        self._vector_store_backend = rag_cfg.get("vector_store", "chromadb")
+        quant_cfg = rag_cfg.get("vector_quantization", {})
+        self._vector_quantization = quant_cfg.get("mode", "none")
+        self._rescore_factor = quant_cfg.get("rescore_factor", 8)
+        self._vector_store = None
         self._embedding_provider = rag_cfg.get("embedding_provider", "local")
         self._embedding_model = rag_cfg.get("embedding_model", "text-embedding-3-small")
         self._embedding_batch_size = rag_cfg.get("batch_size", 512)
@@ -98,47 +130,99 @@ class RAGEngine:
             and rag_cfg.get("embedding_mode", "local") == "local"
         )
         self._reranking_enabled = rag_cfg.get("reranking_enabled", True)
+        self._reranker_model = rag_cfg.get("reranker_model")
+        self._rerank_cache_size = rag_cfg.get("rerank_cache_size")
         self._initial_candidates = rag_cfg.get("initial_candidates", 20)
 
+        # Phase 6 (Perf) : cache persistant d'embeddings (clé = SHA-256 du chunk)
+        cache_cfg = rag_cfg.get("embedding_cache", {})
+        self._embedding_cache_enabled = cache_cfg.get("enabled", True)
+        cache_dir = cache_cfg.get("directory")
+        if cache_dir:
+            self._embedding_cache_dir: Optional[Path] = Path(cache_dir)
+        elif persist_dir:
+            self._embedding_cache_dir = Path(persist_dir).parent / "embedding_cache"
+        else:
+            self._embedding_cache_dir = None
+        self._embedding_cache = None
+        self.last_embedding_cache_stats: dict = {}
+
+        # Phase 6 (Perf) : pool multi-processus pour l'embedder local (indexation)
+        pool_cfg = rag_cfg.get("embedding_pool", {})
+        self._embedding_pool_workers = pool_cfg.get("workers", 1)
+        self._embedding_pool_threads = pool_cfg.get("threads_per_worker", 2)
+        self._embedding_pool_shard_size = pool_cfg.get("shard_size", 256)
+        self._embedding_pool = None
+        self._embed_seconds = 0.0
+        self._embedded_chunks = 0
+        self.last_embedding_throughput: dict = {}
+        # Blocs par fichier source du dernier index_corpus() (manifeste d'indexation)
+        self.last_chunk_counts: dict[str, int] = {}
+
         # Phase 4.1 (Perf) : cache LRU pour search_for_section
-        self._search_cache: dict[str, "RAGResult"] = {}
-        self._search_cache_lock = threading.Lock()
-
-    def _get_client(self):
-        """Initialise le client ChromaDB (lazy)."""
-        if self._client is None:
-            import chromadb
-            if self.persist_dir:
-                self._client = chromadb.PersistentClient(path=str(self.persist_dir))
-            else:
-                self._client = chromadb.Client()
-        return self._client
+        # Phase 6 (Perf) : LRU borné + tier disque indexé par l'empreinte de la collection
+        sc_cfg = rag_cfg.get("search_cache", {})
+        disk_dir = None
+        if sc_cfg.get("persistent", True) and persist_dir:
+            disk_dir = Path(persist_dir).parent / "search_cache"
+        self._search_cache = SearchCache(
+            max_entries=sc_cfg.get("max_entries", 1024),
+            max_bytes=int(sc_cfg.get("max_mb", 64) * 1024 * 1024),
+            disk_dir=disk_dir,
+        )
 
     def _get_collection(self):
-        """Récupère ou crée la collection ChromaDB."""
-        if self._collection is None:
-            client = self._get_client()
-            self._collection = client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"hnsw:space": "cosine"},
+        """Récupère ou crée le stockage vectoriel.
+
+        Phase 6 (Perf) : retourne un VectorStore (ChromaDB ou index plat NumPy
+        selon rag.vector_store) exposant l'API Collection utilisée ici.
+        """
+        if self._vector_store is None:
+            self._vector_store = create_vector_store(
+                self._vector_store_backend,
+                self.collection_name,
+                self.persist_dir,
+                embedding_function=lambda texts, mode: self._get_embeddings(texts, mode=mode),
+                quantization=self._vector_quantization,
+                rescore_factor=self._rescore_factor,
             )
-        return self._collection
+        return self._vector_store
+
+    def evaluate_index_recall(self, k: int = 10, sample_size: int = 100, modes: Optional[list[str]] = None) -> list[dict]:
+        """Phase 6 (Perf) : recall@k des modes de quantification face à la recherche exacte.
 
-    def _get_embeddings(self, texts: list[str], mode: str = "document") -> list[list[float]]:
+        Disponible avec le backend "numpy" uniquement (liste vide sinon).
+        """
+        store = self._get_collection()
+        if not hasattr(store, "evaluate_recall"):
+            logger.warning("Évaluation du recall disponible uniquement avec rag.vector_store = \"numpy\"")
+            return []
+        report = store.evaluate_recall(k=k, sample_size=sample_size, modes=modes)
+        for entry in report:
+            logger.info(
+                f"Recall@{entry['k']} ({entry['mode']}, rescoring x{entry['rescore_factor']}) : "
+                f"{entry['recall_at_k']:.1%} — codes {entry['code_bytes'] / 1e6:.1f} Mo "
+                f"vs vecteurs {entry['vector_bytes'] / 1e6:.1f} Mo"
+            )
+        return report
+
+    def _get_embeddings(self, texts: list[str], mode: str = "document") -> np.ndarray:
         """Calcule les embeddings en local ou via API externe.
 
         Phase 2.5 : utilise les embeddings locaux par défaut.
         Phase 4 (Perf) : support des providers externes (OpenAI, Gemini) pour
         accélération vectorielle (GPU côté serveur, pas de dépendance locale).
         Le batch_size est configurable en YAML (défaut: 512).
+        Phase 6 (Perf) : retourne une matrice float32 (len(texts), dim) ;
+        une matrice vide signifie fallback sur les embeddings ChromaDB.
         """
         # ── Provider OpenAI ──
         if self._embedding_provider == "openai":
-            return self._get_embeddings_openai(texts)
+            return _as_float32_matrix(self._get_embeddings_openai(texts))
 
         # ── Provider Gemini ──
         if self._embedding_provider == "gemini":
-            return self._get_embeddings_gemini(texts)
+            return _as_float32_matrix(self._get_embeddings_gemini(texts))
 
         # ── Provider local (défaut) ──
         if self._use_local_embeddings:
@@ -146,14 +230,64 @@ class RAGEngine:
                 from src.core.local_embedder import LocalEmbedder
                 embedder = LocalEmbedder.get_instance()
                 if mode == "query":
-                    return [embedder.embed_query(t) for t in texts]
-                else:
-                    return embedder.embed_documents(texts, batch_size=self._embedding_batch_size)
+                    return embedder.embed_queries(texts)
+                pool = self._get_embedding_pool(embedder) if len(texts) >= 2 * self._embedding_pool_shard_size else None
+                if pool is not None:
+                    try:
+                        return pool.embed_documents(texts, batch_size=self._embedding_batch_size)
+                    except Exception as e:
+                        logger.warning(f"Pool d'embeddings en échec, repli sur l'embedder local : {e}")
+                        self._close_embedding_pool()
+                        self._embedding_pool_workers = 1
+                return embedder.embed_documents(texts, batch_size=self._embedding_batch_size)
             except ImportError:
                 logger.warning("Embeddings locaux non disponibles, utilisation des embeddings ChromaDB par défaut")
                 self._use_local_embeddings = False
         # Fallback : ChromaDB gère les embeddings en interne
-        return []
+        return _as_float32_matrix([])
+
+    def _get_embedding_pool(self, embedder):
+        """Retourne le pool multi-processus (lazy), ou None s'il est désactivé.
+
+        workers: 1 = embedder in-process (défaut), "auto" = calculé selon
+        CPU et RAM disponibles, N = N processus.
+        """
+        if self._embedding_pool is not None:
+            return self._embedding_pool
+        from src.core.embedding_pool import EmbeddingPool, compute_embedding_workers
+
+        if self._embedding_pool_workers == "auto":
+            self._embedding_pool_workers = compute_embedding_workers(self._embedding_pool_threads, embedder.model_name)
+        try:
+            workers = int(self._embedding_pool_workers)
+        except (TypeError, ValueError):
+            logger.warning(f"rag.embedding_pool.workers invalide : {self._embedding_pool_workers!r}")
+            workers = 1
+        if workers <= 1:
+            self._embedding_pool_workers = 1
+            return None
+        self._embedding_pool = EmbeddingPool(
+            model_name=embedder.model_name,
+            cache_dir=embedder.cache_dir,
+            workers=workers,
+            threads_per_worker=self._embedding_pool_threads,
+            shard_size=self._embedding_pool_shard_size,
+        )
+        return self._embedding_pool
+
+    def _close_embedding_pool(self) -> None:
+        """Arrête les processus du pool d'embeddings (fin d'indexation)."""
+        if self._embedding_pool is not None:
+            self._embedding_pool.close()
+            self._embedding_pool = None
+
+    def _embed_documents_timed(self, texts: list[str]) -> np.ndarray:
+        """Vectorise des documents en cumulant le temps passé (débit chunks/s)."""
+        start = time.perf_counter()
+        embeddings = _as_float32_matrix(self._get_embeddings(texts, mode="document"))
+        self._embed_seconds += time.perf_counter() - start
+        self._embedded_chunks += len(embeddings)
+        return embeddings
 
     def _get_embeddings_openai(self, texts: list[str]) -> list[list[float]]:
         """Calcule les embeddings via l'API OpenAI par lots.
@@ -216,20 +350,76 @@ class RAGEngine:
             logger.warning(f"Erreur embeddings Gemini : {e}, fallback ChromaDB")
             return []
 
-    def _compute_embeddings_only(self, documents: list[str]) -> Optional[list[list[float]]]:
+    def _get_embedding_cache(self):
+        """Phase 6 (Perf) : retourne le cache d'embeddings du modèle courant (lazy).
+
+        Returns:
+            EmbeddingCache, ou None si le cache est désactivé ou indisponible
+            (pas de répertoire, fallback embeddings ChromaDB, numpy absent).
+        """
+        if self._embedding_cache is not None:
+            return self._embedding_cache
+        if not self._embedding_cache_enabled or self._embedding_cache_dir is None:
+            return None
+
+        if self._embedding_provider in ("openai", "gemini"):
+            provider, model, prefix_mode = self._embedding_provider, self._embedding_model, "none"
+        elif self._use_local_embeddings:
+            try:
+                from src.core.local_embedder import LocalEmbedder
+                model = LocalEmbedder.get_instance().model_name
+            except ImportError:
+                return None
+            provider, prefix_mode = "local", "passage"
+        else:
+            return None
+
+        try:
+            from src.core.embedding_cache import EmbeddingCache
+        except ImportError:
+            logger.warning("numpy non disponible, cache d'embeddings désactivé")
+            self._embedding_cache_enabled = False
+            return None
+        self._embedding_cache = EmbeddingCache(
+            self._embedding_cache_dir, provider=provider, model=model, prefix_mode=prefix_mode,
+        )
+        return self._embedding_cache
+
+    def _compute_embeddings_only(self, documents: list[str]) -> Optional[np.ndarray]:
         """Phase 4.2 (Perf) : calcule les embeddings sans écrire dans ChromaDB.
 
         Utilisé pour pipeliner le calcul des embeddings du lot N+1
         pendant l'écriture ChromaDB du lot N.
+        Phase 6 (Perf) : seuls les chunks absents du cache d'embeddings sont
+        vectorisés ; les nouveaux vecteurs sont ajoutés au cache.
 
         Returns:
-            Liste de vecteurs, ou None si fallback ChromaDB nécessaire.
+            Matrice float32 (len(documents), dim), ou None si fallback ChromaDB nécessaire.
         """
         if not self._use_local_embeddings and self._embedding_provider == "local":
             return None
         try:
-            embeddings = self._get_embeddings(documents, mode="document")
-            return embeddings if embeddings else None
+            cache = self._get_embedding_cache()
+            if cache is None:
+                embeddings = self._embed_documents_timed(documents)
+                return embeddings if len(embeddings) else None
+
+            hit_positions, hit_vectors, misses = cache.lookup(documents)
+            if not misses:
+                return hit_vectors
+
+            miss_texts = [documents[i] for i in misses]
+            computed = self._embed_documents_timed(miss_texts)
+            if len(computed) != len(miss_texts):
+                return None
+            cache.store(miss_texts, computed)
+
+            if not len(hit_positions):
+                return computed
+            out = np.empty((len(documents), computed.shape[1]), dtype=np.float32)
+            out[hit_positions] = hit_vectors
+            out[misses] = computed
+            return out
         except Exception as e:
             logger.warning(f"Erreur calcul embeddings pipelinés : {e}")
             return None
@@ -240,7 +430,7 @@ class RAGEngine:
         documents: list[str],
         metadatas: list[dict],
         ids: list[str],
-        embeddings: Optional[list[list[float]]] = None,
+        embeddings: Optional[np.ndarray] = None,
         chromadb_batch_size: int = 5000,
     ) -> None:
         """Écrit des chunks (avec embeddings pré-calculés) dans ChromaDB.
@@ -260,7 +450,7 @@ class RAGEngine:
                 "metadatas": metadatas[start:end],
                 "ids": ids[start:end],
             }
-            if embeddings:
+            if embeddings is not None and len(embeddings):
                 kwargs["embeddings"] = embeddings[start:end]
             collection.add(**kwargs)
 
@@ -302,6 +492,10 @@ class RAGEngine:
         embeddings du lot suivant, réduisant le temps total d'indexation.
 
         Si un seul lot, utilise le flush classique (pas de pipeline).
+        Phase 6 (Perf) : le taux de hits du cache d'embeddings est journalisé
+        et exposé dans last_embedding_cache_stats ; le débit d'embedding
+        (chunks/s) dans last_embedding_throughput. Le pool d'embeddings
+        éventuel est arrêté en fin d'indexation.
 
         Returns:
             Nombre total de chunks indexés.
@@ -309,6 +503,41 @@ class RAGEngine:
         if not batches:
             return 0
 
+        cache = self._get_embedding_cache()
+        if cache is not None:
+            cache.reset_stats()
+        self._embed_seconds = 0.0
+        self._embedded_chunks = 0
+        self.last_embedding_throughput = {}
+        try:
+            return self._run_index_pipeline(collection, batches)
+        finally:
+            self._close_embedding_pool()
+            if self._embedded_chunks:
+                rate = self._embedded_chunks / self._embed_seconds if self._embed_seconds > 0 else 0.0
+                self.last_embedding_throughput = {
+                    "chunks": self._embedded_chunks,
+                    "seconds": round(self._embed_seconds, 3),
+                    "chunks_per_s": round(rate, 1),
+                    "workers": self._embedding_pool_workers,
+                }
+                logger.info(
+                    f"Débit d'embedding : {self._embedded_chunks} chunks en "
+                    f"{self._embed_seconds:.1f}s ({rate:.1f} chunks/s)"
+                )
+            if cache is not None:
+                self.last_embedding_cache_stats = cache.stats()
+                logger.info(
+                    f"Cache d'embeddings : {cache.hits} hits / {cache.misses} misses "
+                    f"(taux de hits {cache.hit_rate:.1%})"
+                )
+
+    def _run_index_pipeline(
+        self,
+        collection,
+        batches: list[tuple[list[str], list[dict], list[str]]],
+    ) -> int:
+        """Corps du pipeline embedding(N+1) // write(N) (voir _pipeline_index_batches)."""
         total_indexed = 0
 
         # Un seul lot : flush classique, pas besoin de pipeline
@@ -384,9 +613,7 @@ class RAGEngine:
         # Vider la collection existante si elle contient des données
         existing = collection.count()
         if existing > 0:
-            all_ids = collection.get()["ids"]
-            if all_ids:
-                collection.delete(ids=all_ids)
+            collection.clear()
             logger.info(f"Collection existante vidée ({existing} blocs supprimés)")
 
         # ── Collecte de tous les lots ──
@@ -394,6 +621,7 @@ class RAGEngine:
         documents: list[str] = []
         metadatas: list[dict] = []
         ids: list[str] = []
+        self.last_chunk_counts = {}
 
         for extraction in extractions:
             text = extraction.get("text", "")
@@ -404,6 +632,7 @@ class RAGEngine:
                 continue
 
             chunks = self._split_text(text)
+            self.last_chunk_counts[source] = self.last_chunk_counts.get(source, 0) + len(chunks)
             for i, chunk_text in enumerate(chunks):
                 doc_id = f"{source}_chunk_{i:04d}"
                 documents.append(chunk_text)
@@ -456,13 +685,72 @@ class RAGEngine:
         collection = self._get_collection()
 
         # Vider la collection existante
-        existing = collection.count()
-        if existing > 0:
-            all_ids = collection.get()["ids"]
-            if all_ids:
-                collection.delete(ids=all_ids)
+        if collection.count() > 0:
+            collection.clear()
 
-        # ── Collecte de tous les lots ──
+        batches = self._collect_semantic_batches(chunks_by_doc, metadata_store)
+
+        # ── Indexation pipelinée ──
+        total_indexed = self._pipeline_index_batches(collection, batches)
+
+        self._invalidate_search_cache()
+        logger.info(f"Corpus indexé (sémantique) : {total_indexed} chunks")
+        return total_indexed
+
+    def update_corpus_semantic(
+        self,
+        chunks_by_doc: dict,
+        removed_doc_ids: Optional[list[str]] = None,
+        metadata_store=None,
+    ) -> int:
+        """Phase 6 (Perf) : mise à jour incrémentale de l'index sémantique.
+
+        Supprime les vecteurs (et les lignes ``chunks`` SQLite) des documents
+        retirés ou modifiés, puis indexe uniquement les chunks des documents
+        nouveaux ou modifiés. Les autres documents ne sont pas touchés.
+
+        Args:
+            chunks_by_doc: Dict {doc_id: list[Chunk]} des documents nouveaux ou modifiés.
+            removed_doc_ids: doc_id des documents retirés du corpus.
+            metadata_store: Instance de MetadataStore à maintenir en cohérence.
+
+        Returns:
+            Nombre de blocs ajoutés.
+        """
+        removed_doc_ids = list(removed_doc_ids or [])
+        collection = self._get_collection()
+
+        stale_doc_ids = removed_doc_ids + [d for d in chunks_by_doc if d not in removed_doc_ids]
+        for start in range(0, len(stale_doc_ids), 500):
+            batch = stale_doc_ids[start:start + 500]
+            collection.delete(where={"doc_id": {"$in": batch}})
+
+        if metadata_store:
+            for doc_id in removed_doc_ids:
+                metadata_store.delete_document(doc_id)
+            for doc_id in chunks_by_doc:
+                metadata_store.delete_chunks(doc_id)
+
+        batches = self._collect_semantic_batches(chunks_by_doc, metadata_store)
+        total_indexed = self._pipeline_index_batches(collection, batches)
+
+        self._invalidate_search_cache()
+        logger.info(
+            f"Corpus mis à jour (incrémental) : {total_indexed} chunks ajoutés "
+            f"pour {len(chunks_by_doc)} documents, {len(removed_doc_ids)} documents retirés"
+        )
+        return total_indexed
+
+    @staticmethod
+    def _collect_semantic_batches(
+        chunks_by_doc: dict,
+        metadata_store=None,
+    ) -> list[tuple[list[str], list[dict], list[str]]]:
+        """Regroupe les chunks sémantiques en lots de MAX_RAM_BATCH_SIZE.
+
+        Les chunks sont aussi enregistrés dans SQLite (par document) si un
+        metadata_store est fourni.
+        """
         batches: list[tuple[list[str], list[dict], list[str]]] = []
         documents: list[str] = []
         metadatas: list[dict] = []
@@ -495,13 +783,7 @@ class RAGEngine:
         # Lot résiduel
         if documents:
             batches.append((list(documents), list(metadatas), list(ids)))
-
-        # ── Indexation pipelinée ──
-        total_indexed = self._pipeline_index_batches(collection, batches)
-
-        self._invalidate_search_cache()
-        logger.info(f"Corpus indexé (sémantique) : {total_indexed} chunks")
-        return total_indexed
+        return batches
 
     def search(self, query: str, top_k: Optional[int] = None) -> RAGResult:
         """Recherche les blocs les plus pertinents pour une requête.
@@ -522,40 +804,136 @@ class RAGEngine:
         n_results = min(self._initial_candidates, collection.count())
 
         # Phase 2.5 : utiliser les embeddings locaux pour la requête
-        query_embedding = None
-        if self._use_local_embeddings:
-            try:
-                embeddings = self._get_embeddings([query], mode="query")
-                if embeddings:
-                    query_embedding = embeddings[0]
-            except Exception as e:
-                logger.warning(f"Erreur embedding requête, fallback : {e}")
+        query_embeddings = self._embed_queries([query])
+        results = self._query_collection(collection, [query], query_embeddings, n_results)
 
-        if query_embedding:
-            results = collection.query(
-                query_embeddings=[query_embedding],
-                n_results=n_results,
-                include=["documents", "metadatas", "distances"],
-            )
+        chunks, scores = self._candidates_from_results(results, 0)
+
+        # Phase 2.5 : Reranking par cross-encoder
+        if self._reranking_enabled and len(chunks) > top_k:
+            chunks, scores = self._rerank(query, chunks, scores, top_k)
         else:
-            results = collection.query(
-                query_texts=[query],
+            chunks = chunks[:top_k]
+            scores = scores[:top_k]
+
+        return self._build_result(query, chunks, scores)
+
+    def search_many(self, sections: list, top_k: Optional[int] = None) -> dict[str, RAGResult]:
+        """Phase 6 (Perf) : recherche groupée pour toutes les sections d'un plan.
+
+        Les requêtes non présentes dans le cache sont vectorisées en un seul
+        appel à l'embedder, interrogées en une seule requête ChromaDB
+        multi-requêtes, puis rerankées en un seul appel au cross-encoder.
+        Les résultats alimentent le cache de search_for_section(), ce qui
+        retire la recherche du chemin critique de la génération.
+
+        Args:
+            sections: Objets section (attributs id, title, description).
+            top_k: Nombre de résultats par section (défaut: self.top_k).
+
+        Returns:
+            Dictionnaire section_id → RAGResult.
+        """
+        top_k = top_k or self.top_k
+        results: dict[str, RAGResult] = {}
+        pending: list[tuple[str, str, str]] = []  # (section_id, titre, requête)
+        fingerprint = self._collection_fingerprint()
+
+        for section in sections:
+            query = self._section_query(section.title, section.description or "")
+            cached = self._cached_section_result(section.id, section.title, query, top_k, fingerprint)
+            if cached is not None:
+                results[section.id] = cached
+            else:
+                pending.append((section.id, section.title, query))
+
+        if not pending:
+            return results
+
+        collection = self._get_collection()
+        total = collection.count()
+        queries = [p[2] for p in pending]
+
+        if total == 0:
+            section_results = [RAGResult(section_id="", section_title=q) for q in queries]
+        else:
+            n_results = min(self._initial_candidates, total)
+            query_embeddings = self._embed_queries(queries)
+            raw = self._query_collection(collection, queries, query_embeddings, n_results)
+
+            candidates = [self._candidates_from_results(raw, i) for i in range(len(queries))]
+            ranked: list[tuple[list[dict], list[float]]] = [
+                (chunks[:top_k], scores[:top_k]) for chunks, scores in candidates
+            ]
+
+            # Reranking groupé des requêtes ayant plus de top_k candidats
+            to_rerank = [
+                i for i, (chunks, _) in enumerate(candidates)
+                if self._reranking_enabled and len(chunks) > top_k
+            ]
+            if to_rerank:
+                reranked = self._rerank_many(
+                    [queries[i] for i in to_rerank],
+                    [candidates[i][0] for i in to_rerank],
+                    [candidates[i][1] for i in to_rerank],
+                    top_k,
+                )
+                for i, pair in zip(to_rerank, reranked):
+                    ranked[i] = pair
+
+            section_results = [
+                self._build_result(q, chunks, scores) for q, (chunks, scores) in zip(queries, ranked)
+            ]
+
+        for (section_id, title, query), result in zip(pending, section_results):
+            result.section_id = section_id
+            result.section_title = title
+            self._store_section_result(query, top_k, result, fingerprint)
+            results[section_id] = result
+
+        logger.info(f"Pré-chargement RAG : {len(pending)} sections recherchées en une passe groupée")
+        return results
+
+    def _embed_queries(self, queries: list[str]) -> Optional[np.ndarray]:
+        """Vectorise des requêtes avec l'embedder local (None si indisponible)."""
+        if not self._use_local_embeddings:
+            return None
+        try:
+            embeddings = _as_float32_matrix(self._get_embeddings(queries, mode="query"))
+            if len(embeddings) and len(embeddings) == len(queries):
+                return embeddings
+        except Exception as e:
+            logger.warning(f"Erreur embedding requête, fallback : {e}")
+        return None
+
+    @staticmethod
+    def _query_collection(collection, queries: list[str], query_embeddings: Optional[np.ndarray], n_results: int) -> dict:
+        """Interroge ChromaDB pour une ou plusieurs requêtes en un seul appel."""
+        if query_embeddings is not None:
+            return collection.query(
+                query_embeddings=query_embeddings,
                 n_results=n_results,
                 include=["documents", "metadatas", "distances"],
             )
+        return collection.query(
+            query_texts=queries,
+            n_results=n_results,
+            include=["documents", "metadatas", "distances"],
+        )
 
+    @staticmethod
+    def _candidates_from_results(results: dict, index: int) -> tuple[list[dict], list[float]]:
+        """Convertit les résultats ChromaDB de la requête ``index`` en chunks et scores."""
         chunks = []
         scores = []
-        total_tokens = 0
 
-        if results and results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                distance = results["distances"][0][i] if results["distances"] else 0
+        if results and results["documents"] and len(results["documents"]) > index and results["documents"][index]:
+            for i, doc in enumerate(results["documents"][index]):
+                distance = results["distances"][index][i] if results["distances"] else 0
                 similarity = max(0.0, 1.0 - distance)
 
-                metadata = results["metadatas"][0][i] if results["metadatas"] else {}
+                metadata = results["metadatas"][index][i] if results["metadatas"] else {}
                 token_estimate = metadata.get("token_estimate", metadata.get("token_count", len(doc) // 4))
-                total_tokens += token_estimate
 
                 chunks.append({
                     "text": doc,
@@ -566,17 +944,14 @@ class RAGEngine:
                     "page_number": metadata.get("page_number", 0),
                     "section_title": metadata.get("section_title", ""),
                     "doc_id": metadata.get("doc_id", ""),
-                    "chunk_id": results["ids"][0][i] if results.get("ids") else "",
+                    "chunk_id": results["ids"][index][i] if results.get("ids") else "",
                 })
                 scores.append(similarity)
 
-        # Phase 2.5 : Reranking par cross-encoder
-        if self._reranking_enabled and len(chunks) > top_k:
-            chunks, scores = self._rerank(query, chunks, scores, top_k)
-        else:
-            chunks = chunks[:top_k]
-            scores = scores[:top_k]
+        return chunks, scores
 
+    def _build_result(self, query: str, chunks: list[dict], scores: list[float]) -> RAGResult:
+        """Construit le RAGResult final à partir des chunks retenus."""
         # Recalculate total_tokens to reflect only returned chunks (not all candidates)
         total_tokens = sum(c.get("token_estimate", len(c.get("text", "")) // 4) for c in chunks)
 
@@ -605,48 +980,79 @@ class RAGEngine:
         Returns:
             Tuple (chunks_rerankés, scores_rerankés).
         """
+        return self._rerank_many([query], [chunks], [scores], top_k)[0]
+
+    def _rerank_many(
+        self,
+        queries: list[str],
+        chunk_lists: list[list[dict]],
+        score_lists: list[list[float]],
+        top_k: int,
+    ) -> list[tuple[list[dict], list[float]]]:
+        """Applique le reranking cross-encoder sur les candidats de plusieurs requêtes.
+
+        Returns:
+            Pour chaque requête, un tuple (chunks_rerankés, scores_rerankés).
+        """
+        fallback = [(chunks[:top_k], scores[:top_k]) for chunks, scores in zip(chunk_lists, score_lists)]
         try:
             from src.core.reranker import Reranker, ScoredChunk
 
-            reranker = Reranker.get_instance()
-            scored_chunks = [
-                ScoredChunk(
-                    chunk_id=c.get("chunk_id", f"chunk_{i}"),
-                    doc_id=c.get("doc_id", c.get("source_file", "")),
-                    text=c["text"],
-                    page_number=c.get("page_number", 0),
-                    section_title=c.get("section_title", ""),
-                    cosine_score=s,
-                )
-                for i, (c, s) in enumerate(zip(chunks, scores))
+            reranker = Reranker.get_instance(self._reranker_model, score_cache_size=self._rerank_cache_size)
+            scored_lists = [
+                [
+                    ScoredChunk(
+                        chunk_id=c.get("chunk_id", f"chunk_{i}"),
+                        doc_id=c.get("doc_id", c.get("source_file", "")),
+                        text=c["text"],
+                        page_number=c.get("page_number", 0),
+                        section_title=c.get("section_title", ""),
+                        cosine_score=s,
+                    )
+                    for i, (c, s) in enumerate(zip(chunks, scores))
+                ]
+                for chunks, scores in zip(chunk_lists, score_lists)
             ]
 
-            reranked = reranker.rerank(query, scored_chunks, top_k=top_k)
-
-            reranked_chunks = []
-            reranked_scores = []
-            for sc in reranked:
-                reranked_chunks.append({
-                    "text": sc.text,
-                    "source_file": sc.doc_id,
-                    "chunk_index": 0,
-                    "similarity": round(sc.cosine_score, 4),
-                    "rerank_score": round(sc.rerank_score, 4),
-                    "token_estimate": len(sc.text) // 4,
-                    "page_number": sc.page_number,
-                    "section_title": sc.section_title,
-                    "doc_id": sc.doc_id,
-                    "chunk_id": sc.chunk_id,
-                })
-                reranked_scores.append(sc.rerank_score if sc.rerank_score > 0 else sc.cosine_score)
-
-            return reranked_chunks, reranked_scores
+            if len(queries) == 1:
+                reranked_lists = [reranker.rerank(queries[0], scored_lists[0], top_k=top_k)]
+            else:
+                reranked_lists = reranker.rerank_many(queries, scored_lists, top_k=top_k)
+
+            output = []
+            for reranked in reranked_lists:
+                reranked_chunks = []
+                reranked_scores = []
+                for sc in reranked:
+                    reranked_chunks.append({
+                        "text": sc.text,
+                        "source_file": sc.doc_id,
+                        "chunk_index": 0,
+                        "similarity": round(sc.cosine_score, 4),
+                        "rerank_score": round(sc.rerank_score, 4),
+                        "token_estimate": len(sc.text) // 4,
+                        "page_number": sc.page_number,
+                        "section_title": sc.section_title,
+                        "doc_id": sc.doc_id,
+                        "chunk_id": sc.chunk_id,
+                    })
+                    reranked_scores.append(sc.rerank_score if sc.rerank_score > 0 else sc.cosine_score)
+                output.append((reranked_chunks, reranked_scores))
+
+            return output
         except ImportError:
             logger.warning("Reranker non disponible, utilisation de l'ordre ChromaDB")
-            return chunks[:top_k], scores[:top_k]
+            return fallback
         except Exception as e:
             logger.warning(f"Erreur reranking, fallback : {e}")
-            return chunks[:top_k], scores[:top_k]
+            return fallback
+
+    @staticmethod
+    def _section_query(section_title: str, section_description: str = "") -> str:
+        """Construit la requête de recherche d'une section du plan."""
+        if section_description:
+            return f"{section_title}. {section_description}"
+        return section_title
 
     def search_for_section(self, section_id: str, section_title: str, section_description: str = "") -> RAGResult:
         """Recherche les blocs pertinents pour une section du plan.
@@ -654,6 +1060,8 @@ class RAGEngine:
         Phase 4.1 (Perf) : les résultats sont mis en cache par (section_id, query)
         pour éviter les recherches redondantes (factcheck, qualité, etc.).
         Le cache est invalidé à chaque reset() ou nouvel index_corpus().
+        Phase 6 (Perf) : en cas d'absence en mémoire, le tier disque est
+        consulté (valide tant que l'empreinte de la collection est inchangée).
 
         Args:
             section_id: Identifiant de la section.
@@ -663,24 +1071,124 @@ class RAGEngine:
         Returns:
             RAGResult avec les résultats de la recherche.
         """
-        query = section_title
-        if section_description:
-            query = f"{section_title}. {section_description}"
+        query = self._section_query(section_title, section_description)
+        fingerprint = self._collection_fingerprint()
 
-        cache_key = f"{section_id}::{query}"
-        with self._search_cache_lock:
-            if cache_key in self._search_cache:
-                return self._search_cache[cache_key]
+        cached = self._cached_section_result(section_id, section_title, query, self.top_k, fingerprint)
+        if cached is not None:
+            return cached
 
         result = self.search(query)
         result.section_id = section_id
         result.section_title = section_title
 
-        with self._search_cache_lock:
-            self._search_cache[cache_key] = result
+        self._store_section_result(query, self.top_k, result, fingerprint)
+        return result
 
+    # ── Cache de recherche (Phase 6) ──
+
+    def _memory_cache_key(self, section_id: str, query: str, top_k: int) -> str:
+        return f"{section_id}::{query}::{top_k}::{int(bool(self._reranking_enabled))}"
+
+    @staticmethod
+    def _result_size(result: RAGResult) -> int:
+        """Estimation de l'empreinte mémoire d'un RAGResult (en octets)."""
+        return 512 + sum(len(c.get("text", "")) + 256 for c in result.chunks)
+
+    def _cached_section_result(
+        self,
+        section_id: str,
+        section_title: str,
+        query: str,
+        top_k: int,
+        fingerprint: Optional[str],
+    ) -> Optional[RAGResult]:
+        """Cherche un résultat en mémoire, puis dans le tier disque."""
+        memory_key = self._memory_cache_key(section_id, query, top_k)
+        result = self._search_cache.get(memory_key)
+        if result is not None:
+            return result
+        if not fingerprint:
+            return None
+
+        payload = self._search_cache.get_persistent(
+            persistent_key(fingerprint, query, top_k, self._reranking_enabled)
+        )
+        if payload is None:
+            return None
+        try:
+            result = RAGResult(**payload)
+        except TypeError:
+            return None
+        result.section_id = section_id
+        result.section_title = section_title
+        self._search_cache.put(memory_key, result, self._result_size(result))
         return result
 
+    def _store_section_result(
+        self,
+        query: str,
+        top_k: int,
+        result: RAGResult,
+        fingerprint: Optional[str],
+    ) -> None:
+        """Enregistre un résultat en mémoire et dans le tier disque."""
+        self._search_cache.put(
+            self._memory_cache_key(result.section_id, query, top_k),
+            result,
+            self._result_size(result),
+        )
+        if fingerprint:
+            self._search_cache.put_persistent(
+                persistent_key(fingerprint, query, top_k, self._reranking_enabled),
+                fingerprint,
+                asdict(result),
+            )
+
+    def _collection_fingerprint(self) -> Optional[str]:
+        """Empreinte du contenu de la collection et des paramètres de recherche.
+
+        Combine la version de l'index (régénérée à chaque écriture), le
+        nombre de chunks et la configuration d'embedding/reranking. Retourne
+        None si le tier disque est désactivé.
+        """
+        if not self._search_cache.persistent or not self.persist_dir:
+            return None
+        try:
+            version = (Path(self.persist_dir) / INDEX_VERSION_FILENAME).read_text(encoding="utf-8").strip()
+        except OSError:
+            version = ""
+        rag_cfg = self.config.get("rag", {})
+        raw = "|".join(str(part) for part in (
+            self.collection_name,
+            self._vector_store_backend,
+            self._vector_quantization,
+            version,
+            self.indexed_count,
+            self._embedding_provider,
+            self._embedding_model,
+            rag_cfg.get("local_model", ""),
+            rag_cfg.get("reranker_model", ""),
+            self._initial_candidates,
+            self.relevance_threshold,
+        ))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _bump_index_version(self) -> None:
+        """Régénère la version de l'index (invalide le tier disque du cache)."""
+        if not self.persist_dir:
+            return
+        try:
+            Path(self.persist_dir).mkdir(parents=True, exist_ok=True)
+            (Path(self.persist_dir) / INDEX_VERSION_FILENAME).write_text(uuid.uuid4().hex, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Impossible de mettre à jour la version de l'index : {e}")
+
+    @property
+    def search_cache_stats(self) -> dict:
+        """Compteurs du cache de recherche (hits, misses, évictions...)."""
+        return self._search_cache.stats()
+
     def search_corpus(
         self,
         query: str,
@@ -708,12 +1216,10 @@ class RAGEngine:
         # Étape 1 : Recherche vectorielle
         n_results = min(self._initial_candidates, collection.count())
 
-        query_embedding = None
+        query_embeddings = None
         if self._use_local_embeddings:
             try:
-                embeddings = self._get_embeddings([query], mode="query")
-                if embeddings:
-                    query_embedding = embeddings[0]
+                query_embeddings = self._embed_queries([query])
             except Exception:
                 pass
 
@@ -728,8 +1234,8 @@ class RAGEngine:
         if where_filter:
             query_kwargs["where"] = where_filter
 
-        if query_embedding:
-            query_kwargs["query_embeddings"] = [query_embedding]
+        if query_embeddings is not None:
+            query_kwargs["query_embeddings"] = query_embeddings
         else:
             query_kwargs["query_texts"] = [query]
 
@@ -758,7 +1264,7 @@ class RAGEngine:
         if self._reranking_enabled and len(candidates) > top_k:
             try:
                 from src.core.reranker import Reranker
-                reranker = Reranker.get_instance()
+                reranker = Reranker.get_instance(self._reranker_model, score_cache_size=self._rerank_cache_size)
                 candidates = reranker.rerank(query, candidates, top_k=top_k)
             except ImportError:
                 logger.warning("Reranker non disponible")
@@ -839,20 +1345,21 @@ class RAGEngine:
         return chunks
 
     def reset(self) -> None:
-        """Réinitialise la collection ChromaDB."""
-        if self._client is not None:
-            try:
-                self._client.delete_collection(self.collection_name)
-            except Exception:
-                pass
-            self._collection = None
+        """Réinitialise la collection (ChromaDB ou index plat NumPy)."""
+        if self._vector_store is not None:
+            self._vector_store.drop()
+            self._vector_store = None
         self._invalidate_search_cache()
         logger.info("Collection RAG réinitialisée")
 
     def _invalidate_search_cache(self) -> None:
-        """Invalide le cache de recherche (appelé après indexation ou reset)."""
-        with self._search_cache_lock:
-            self._search_cache.clear()
+        """Invalide le cache de recherche (appelé après indexation ou reset).
+
+        Phase 6 (Perf) : la nouvelle version d'index change l'empreinte de la
+        collection, ce qui rend le tier disque inaccessible pour l'ancien contenu.
+        """
+        self._search_cache.clear()
+        self._bump_index_version()
 
     @property
     def indexed_count(self) -> int:
@@ -865,5 +1372,18 @@ class RAGEngine:
 
     @property
     def collection(self):
-        """Accès direct à la collection ChromaDB (pour plan_corpus_linker)."""
+        """Accès direct au VectorStore (pour plan_corpus_linker)."""
         return self._get_collection()
+
+
+def _as_float32_matrix(embeddings) -> np.ndarray:
+    """Convertit des embeddings (ndarray ou listes) en matrice float32 contiguë.
+
+    Sans copie si l'entrée est déjà une matrice float32 contiguë.
+    """
+    if embeddings is None or (not isinstance(embeddings, np.ndarray) and not len(embeddings)):
+        return np.empty((0, 0), dtype=np.float32)
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
@@ -6,17 +6,52 @@ Le reranking améliore la précision de 10-20% par rapport à la recherche
 vectorielle seule.
 
 Phase 4 (Perf) : détection automatique du device (cuda > mps > cpu).
+
+Phase 6 (Perf) : backends interchangeables, choisis via rag.reranker_model :
+  - "cross-encoder/..." : sentence-transformers (torch), comportement historique ;
+  - "onnx:<modèle>"     : cross-encoder ONNX quantifié via FastEmbed, sans
+    torch (import rapide, ~5x moins de RAM, inférence CPU plus rapide).
+Les scores ONNX (logits) passent par une sigmoïde pour rester sur la même
+échelle [0, 1] que sentence-transformers. La latence par paire du dernier
+appel est exposée dans last_stats.
+
+Phase 6 (Perf) : cache LRU borné des scores (modèle, requête, chunk) → score.
+Les passes de factcheck, d'évaluation qualité, de raffinement et les reprises
+relancent les mêmes requêtes, et les sections voisines partagent la plupart
+de leurs candidats : seules les paires jamais vues passent par le modèle.
 """
 
+import hashlib
 import logging
 import os
 import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger("orchestria")
 
 DEFAULT_RERANKER_MODEL = "cross-encoder/ms-marco-MiniLM-L-12-v2"
+DEFAULT_RERANK_BATCH_SIZE = 32
+DEFAULT_SCORE_CACHE_SIZE = 50_000
+
+ONNX_PREFIX = "onnx:"
+# Équivalents ONNX (FastEmbed) des cross-encoders sentence-transformers
+ONNX_MODEL_ALIASES = {
+    "cross-encoder/ms-marco-MiniLM-L-6-v2": "Xenova/ms-marco-MiniLM-L-6-v2",
+    "cross-encoder/ms-marco-MiniLM-L-12-v2": "Xenova/ms-marco-MiniLM-L-12-v2",
+}
+
+
+def resolve_reranker_backend(model_spec: str) -> tuple[str, str]:
+    """Retourne (backend, nom du modèle) pour une valeur de rag.reranker_model."""
+    if model_spec.startswith(ONNX_PREFIX):
+        name = model_spec[len(ONNX_PREFIX):] or DEFAULT_RERANKER_MODEL
+        return "onnx", ONNX_MODEL_ALIASES.get(name, name)
+    return "sentence-transformers", model_spec
 
 
 @dataclass
@@ -49,20 +84,57 @@ class ScoredChunk:
         }
 
 
+class _OnnxCrossEncoder:
+    """Cross-encoder ONNX (FastEmbed) exposant la même interface predict que CrossEncoder."""
+
+    def __init__(self, model_name: str, cache_dir: str):
+        from fastembed.rerank.cross_encoder import TextCrossEncoder
+        self._model = TextCrossEncoder(model_name=model_name, cache_dir=cache_dir)
+
+    def predict(self, pairs: list[tuple[str, str]], batch_size: int = DEFAULT_RERANK_BATCH_SIZE) -> np.ndarray:
+        logits = np.fromiter(
+            self._model.rerank_pairs(pairs, batch_size=batch_size),
+            dtype=np.float32,
+            count=len(pairs),
+        )
+        return 1.0 / (1.0 + np.exp(-logits))
+
+
 class Reranker:
     """Cross-encoder pour le reranking post-retrieval."""
 
     _instance: Optional["Reranker"] = None
     _lock = threading.Lock()
 
-    def __init__(self, model_name: Optional[str] = None, cache_dir: Optional[str] = None):
-        self._model_name = model_name or DEFAULT_RERANKER_MODEL
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        score_cache_size: Optional[int] = None,
+    ):
+        self._backend, self._model_name = resolve_reranker_backend(model_name or DEFAULT_RERANKER_MODEL)
         self._cache_dir = cache_dir or os.environ.get("ORCHESTRIA_MODELS_DIR", "./models")
         self._model = None
+        self.last_stats: dict = {}
+
+        # Phase 6 (Perf) : cache LRU des scores (0 = désactivé)
+        self._score_cache_size = DEFAULT_SCORE_CACHE_SIZE if score_cache_size is None else score_cache_size
+        self._score_cache: OrderedDict[tuple[str, bytes], float] = OrderedDict()
+        self._score_cache_lock = threading.Lock()
+        self.score_cache_hits = 0
+        self.score_cache_misses = 0
+
+    @property
+    def backend(self) -> str:
+        """Backend d'inférence : "sentence-transformers" ou "onnx"."""
+        return self._backend
 
     def _load_model(self):
-        """Charge le cross-encoder de manière paresseuse sur le meilleur device disponible."""
+        """Charge le cross-encoder de manière paresseuse (backend selon la configuration)."""
         if self._model is None:
+            if self._backend == "onnx":
+                self._model = self._load_onnx_model()
+                return self._model
             try:
                 from sentence_transformers import CrossEncoder
                 device = self._detect_device()
@@ -76,6 +148,37 @@ class Reranker:
                 )
         return self._model
 
+    def _load_onnx_model(self) -> _OnnxCrossEncoder:
+        """Charge le cross-encoder ONNX quantifié (FastEmbed, sans torch)."""
+        try:
+            logger.info(f"Chargement du modèle de reranking ONNX : {self._model_name}")
+            model = _OnnxCrossEncoder(self._model_name, self._cache_dir)
+            logger.info("Modèle de reranking ONNX chargé (CPU).")
+            return model
+        except ImportError:
+            raise ImportError(
+                "fastembed est requis pour le reranking ONNX. "
+                "Installez-le avec : pip install fastembed"
+            )
+
+    def _score(self, pairs: list[tuple[str, str]]) -> np.ndarray:
+        """Score un lot de paires (requête, texte) et mesure la latence par paire."""
+        model = self._load_model()
+        start = time.perf_counter()
+        scores = model.predict(pairs, batch_size=DEFAULT_RERANK_BATCH_SIZE)
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            "backend": self._backend,
+            "pairs": len(pairs),
+            "seconds": round(elapsed, 4),
+            "ms_per_pair": round(elapsed * 1000 / len(pairs), 3),
+        }
+        logger.debug(
+            f"Reranking ({self._backend}) : {len(pairs)} paires en {elapsed * 1000:.0f} ms "
+            f"({self.last_stats['ms_per_pair']} ms/paire)"
+        )
+        return scores
+
     @staticmethod
     def _detect_device() -> str:
         """Détecte le meilleur device disponible pour l'inférence."""
@@ -90,12 +193,24 @@ class Reranker:
         return "cpu"
 
     @classmethod
-    def get_instance(cls, model_name: Optional[str] = None, cache_dir: Optional[str] = None) -> "Reranker":
-        """Retourne l'instance singleton (thread-safe)."""
-        if cls._instance is None:
+    def get_instance(
+        cls,
+        model_name: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        score_cache_size: Optional[int] = None,
+    ) -> "Reranker":
+        """Retourne l'instance singleton (thread-safe).
+
+        Phase 6 (Perf) : l'instance est recréée si un autre modèle/backend est
+        demandé explicitement (changement de rag.reranker_model).
+        """
+        wanted = resolve_reranker_backend(model_name) if model_name else None
+        instance = cls._instance
+        if instance is None or (wanted and wanted != (instance._backend, instance._model_name)):
             with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls(model_name, cache_dir)
+                instance = cls._instance
+                if instance is None or (wanted and wanted != (instance._backend, instance._model_name)):
+                    cls._instance = cls(model_name, cache_dir, score_cache_size)
         return cls._instance
 
     @classmethod
@@ -121,16 +236,98 @@ class Reranker:
         """
         if not candidates:
             return []
+        return self.rerank_many([query], [candidates], top_k=top_k)[0]
 
-        model = self._load_model()
-        pairs = [(query, c.text) for c in candidates]
-        scores = model.predict(pairs)
+    def rerank_many(
+        self,
+        queries: list[str],
+        candidate_lists: list[list[ScoredChunk]],
+        top_k: int = 10,
+    ) -> list[list[ScoredChunk]]:
+        """Re-classe les candidats de plusieurs requêtes en un seul appel predict.
+
+        Les paires (requête, chunk) de toutes les requêtes sont regroupées
+        pour amortir le coût d'inférence du cross-encoder. Phase 6 (Perf) :
+        seules les paires uniques absentes du cache de scores sont évaluées.
+
+        Args:
+            queries: Requêtes de recherche.
+            candidate_lists: Candidats de chaque requête (même ordre que queries).
+            top_k: Nombre maximum de résultats par requête.
+
+        Returns:
+            Une liste triée par rerank_score décroissant pour chaque requête.
+        """
+        if len(queries) != len(candidate_lists):
+            raise ValueError("queries et candidate_lists doivent avoir la même longueur")
+
+        if not any(candidate_lists):
+            return [[] for _ in queries]
+
+        keys = [
+            [self._score_key(q, c) for c in candidates]
+            for q, candidates in zip(queries, candidate_lists)
+        ]
+        scores: dict[tuple[str, bytes], float] = {}
+        pending: dict[tuple[str, bytes], tuple[str, str]] = {}
+        with self._score_cache_lock:
+            for q, candidates, cand_keys in zip(queries, candidate_lists, keys):
+                for chunk, key in zip(candidates, cand_keys):
+                    if key in scores or key in pending:
+                        continue
+                    cached = self._score_cache.get(key)
+                    if cached is not None:
+                        self._score_cache.move_to_end(key)
+                        scores[key] = cached
+                        self.score_cache_hits += 1
+                    else:
+                        pending[key] = (q, chunk.text)
+                        self.score_cache_misses += 1
+
+        if pending:
+            computed = self._score(list(pending.values()))
+            new_scores = {key: float(score) for key, score in zip(pending, computed)}
+            scores.update(new_scores)
+            self._store_scores(new_scores)
+
+        reranked = []
+        for candidates, cand_keys in zip(candidate_lists, keys):
+            for chunk, key in zip(candidates, cand_keys):
+                chunk.rerank_score = scores[key]
+            candidates.sort(key=lambda c: c.rerank_score, reverse=True)
+            reranked.append(candidates[:top_k])
+        return reranked
+
+    def _score_key(self, query: str, chunk: ScoredChunk) -> tuple[str, bytes]:
+        """Clé du cache : (modèle, empreinte de la requête, du chunk_id et du texte).
+
+        Le texte entre dans l'empreinte car certains chemins d'indexation
+        attribuent des chunk_id synthétiques (chunk_0, chunk_1...).
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (query, chunk.chunk_id, chunk.text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        return self._model_name, digest.digest()
 
-        for chunk, score in zip(candidates, scores):
-            chunk.rerank_score = float(score)
+    def _store_scores(self, new_scores: dict[tuple[str, bytes], float]) -> None:
+        if self._score_cache_size <= 0:
+            return
+        with self._score_cache_lock:
+            self._score_cache.update(new_scores)
+            while len(self._score_cache) > self._score_cache_size:
+                self._score_cache.popitem(last=False)
 
-        candidates.sort(key=lambda c: c.rerank_score, reverse=True)
-        return candidates[:top_k]
+    def score_cache_stats(self) -> dict:
+        """Compteurs du cache de scores (pour logs et UI)."""
+        with self._score_cache_lock:
+            lookups = self.score_cache_hits + self.score_cache_misses
+            return {
+                "entries": len(self._score_cache),
+                "hits": self.score_cache_hits,
+                "misses": self.score_cache_misses,
+                "hit_rate": round(self.score_cache_hits / lookups, 4) if lookups else 0.0,
+            }
 
 
 def build_context(chunks: list[ScoredChunk]) -> str:
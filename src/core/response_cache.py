@@ -0,0 +1,309 @@
+"""Cache déterministe des réponses IA, indexé par empreinte du prompt.
+
+Phase 6 (Perf) : reprises, relances après crash et appels répétés à basse
+température (factcheck à 0.1, résumés à 0.3, évaluation qualité) renvoient
+régulièrement des prompts identiques octet pour octet. CachedProvider
+enveloppe n'importe quel BaseProvider et sert ces appels depuis le disque.
+
+  - Clé : SHA-256 de (fournisseur, modèle, prompt système, prompt,
+    température, max_tokens).
+  - Stockage : base SQLite compacte (réponses compressées zlib) sous le
+    projet ou un répertoire partagé, éviction LRU au-delà d'une taille max.
+  - Activation par type de tâche : l'appelant déclare sa tâche avec
+    ``llm_task("factcheck")`` (contextvar, comme la priorité de débit).
+
+Les réponses servies depuis le cache ont ``cached=True`` : CostTracker les
+enregistre à coût nul et comptabilise l'économie réalisée.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.providers.base import AIResponse, BaseProvider, StreamChunk
+from src.utils.file_utils import ensure_dir
+
+logger = logging.getLogger("orchestria")
+
+DB_FILENAME = "responses.db"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TASK = "default"
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    task TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+_current_task: ContextVar[str] = ContextVar("orchestria_llm_task", default=DEFAULT_TASK)
+
+
+@contextmanager
+def llm_task(task_type: str):
+    """Déclare le type de tâche des appels IA du contexte courant."""
+    token = _current_task.set(task_type)
+    try:
+        yield
+    finally:
+        _current_task.reset(token)
+
+
+def current_task() -> str:
+    return _current_task.get()
+
+
+def response_key(
+    provider: str,
+    model: str,
+    system_prompt: Optional[str],
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Empreinte déterministe d'une requête."""
+    raw = json.dumps(
+        [provider, model, system_prompt or "", prompt, round(float(temperature), 4), int(max_tokens)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Stockage disque des réponses IA, borné en taille (éviction LRU)."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max(1, max_bytes)
+        self._db_path = self.directory / DB_FILENAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # Appelé sous self._lock
+        if self._conn is None:
+            ensure_dir(self.directory)
+            self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA_SQL)
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return self._conn
+
+    def get(self, key: str) -> Optional[AIResponse]:
+        """Retourne la réponse en cache (``cached=True``) ou None."""
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                row = conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+                data = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+            except (sqlite3.Error, zlib.error, ValueError) as e:
+                logger.warning(f"Cache de réponses illisible : {e}")
+                return None
+            self.hits += 1
+        return AIResponse(**data, cached=True)
+
+    def put(self, key: str, response: AIResponse, task_type: str = DEFAULT_TASK) -> None:
+        """Enregistre une réponse et évince les plus anciennes au-delà de max_bytes."""
+        payload = zlib.compress(json.dumps({
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "total_tokens": response.total_tokens,
+            "finish_reason": response.finish_reason,
+        }, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                previous = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, task, payload, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (key, task_type, payload, len(payload), time.time()),
+                )
+                self._total_bytes += len(payload) - (previous[0] if previous else 0)
+                self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Écriture du cache de réponses échouée : {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used ASC LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict:
+        """Compteurs du cache (pour logs et UI)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bytes": self._total_bytes or 0,
+                "directory": str(self.directory),
+            }
+
+
+class CachedProvider(BaseProvider):
+    """Enveloppe un fournisseur et sert les requêtes identiques depuis le cache.
+
+    ``tasks`` active le cache par type de tâche (voir llm_task) ; les types
+    absents utilisent l'entrée ``"default"``. Les réponses vides ne sont pas
+    mises en cache.
+    """
+
+    def __init__(self, provider: BaseProvider, cache: ResponseCache, tasks: Optional[dict[str, bool]] = None):
+        self.inner = provider
+        self.cache = cache
+        self.tasks = dict(tasks or {})
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    def cache_enabled_for(self, task_type: str) -> bool:
+        return bool(self.tasks.get(task_type, self.tasks.get(DEFAULT_TASK, False)))
+
+    def _lookup(self, prompt, system_prompt, model, temperature, max_tokens) -> tuple[Optional[str], Optional[AIResponse]]:
+        task_type = current_task()
+        if not self.cache_enabled_for(task_type):
+            return None, None
+        model = model or self.inner.get_default_model()
+        key = response_key(self.inner.name, model, system_prompt, prompt, temperature, max_tokens)
+        return key, self.cache.get(key)
+
+    def _store(self, key: Optional[str], response: AIResponse) -> AIResponse:
+        if key is not None and response.content:
+            self.cache.put(key, response, current_task())
+        return response
+
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AIResponse:
+        key, cached = self._lookup(prompt, system_prompt, model, temperature, max_tokens)
+        if cached is not None:
+            return cached
+        response = self.inner.generate(
+            prompt=prompt, system_prompt=system_prompt, model=model,
+            temperature=temperature, max_tokens=max_tokens,
+        )
+        return self._store(key, response)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AIResponse:
+        key, cached = await asyncio.to_thread(self._lookup, prompt, system_prompt, model, temperature, max_tokens)
+        if cached is not None:
+            return cached
+        response = await self.inner.agenerate(
+            prompt=prompt, system_prompt=system_prompt, model=model,
+            temperature=temperature, max_tokens=max_tokens,
+        )
+        return self._store(key, response)
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[StreamChunk]:
+        """Un succès du cache est servi en un seul fragment ; sinon flux du fournisseur."""
+        key, cached = self._lookup(prompt, system_prompt, model, temperature, max_tokens)
+        if cached is not None:
+            yield StreamChunk(text=cached.content, response=cached)
+            return
+        for chunk in self.inner.generate_stream(
+            prompt=prompt, system_prompt=system_prompt, model=model,
+            temperature=temperature, max_tokens=max_tokens,
+        ):
+            if chunk.response is not None:
+                self._store(key, chunk.response)
+            yield chunk
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    def get_default_model(self) -> str:
+        return self.inner.get_default_model()
+
+    def list_models(self) -> list[str]:
+        return self.inner.list_models()
+
+    def supports_batch(self) -> bool:
+        return self.inner.supports_batch()
+
+    def submit_batch(self, requests):
+        return self.inner.submit_batch(requests)
+
+    def poll_batch(self, batch_id: str):
+        return self.inner.poll_batch(batch_id)
+
+    def retrieve_batch_results(self, batch_id: str) -> dict[str, str]:
+        return self.inner.retrieve_batch_results(batch_id)
+
+    def __getattr__(self, attr):
+        # Attributs propres au fournisseur enveloppé (clients, options...)
+        if attr == "inner":
+            raise AttributeError(attr)
+        return getattr(self.inner, attr)
@@ -0,0 +1,203 @@
+"""Cache des résultats de recherche RAG : LRU borné en mémoire + tier disque.
+
+Phase 6 (Perf) : remplace le dict non borné de RAGEngine.
+  - Tier mémoire : LRU borné en nombre d'entrées et en octets (estimés),
+    avec compteurs hits / misses / évictions.
+  - Tier disque (optionnel) : base SQLite sous le répertoire du projet,
+    indexée par (empreinte de la collection, requête, top_k, reranking).
+    Permet aux reprises de génération, au factcheck et à l'évaluation
+    qualité de réutiliser les recherches après un redémarrage.
+
+L'empreinte de la collection est fournie par l'appelant : lorsqu'elle
+change (ré-indexation), les anciennes entrées disque deviennent
+inaccessibles puis sont purgées.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils.file_utils import ensure_dir
+
+logger = logging.getLogger("orchestria")
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_ENTRIES = 20_000
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS search_results (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_fingerprint ON search_results(fingerprint);
+CREATE INDEX IF NOT EXISTS idx_search_last_used ON search_results(last_used);
+"""
+
+
+def persistent_key(fingerprint: str, query: str, top_k: int, reranking: bool) -> str:
+    """Clé du tier disque : (empreinte, requête, top_k, reranking)."""
+    raw = f"{fingerprint}\x1f{query}\x1f{top_k}\x1f{int(bool(reranking))}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """LRU borné et instrumenté, avec tier disque SQLite optionnel."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: Optional[Path] = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.max_disk_entries = max_disk_entries
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+        self._db_path = Path(disk_dir) / "search_cache.db" if disk_dir else None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_pruned_fingerprint: Optional[str] = None
+
+    # ── Tier mémoire ──
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retourne la valeur en mémoire (et la marque comme récemment utilisée)."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: str, value: Any, size_bytes: int = 0) -> None:
+        """Ajoute une valeur en mémoire, en évinçant les entrées les moins récentes."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size_bytes)
+            self._bytes += size_bytes
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Vide le tier mémoire (le tier disque est protégé par l'empreinte)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ── Tier disque ──
+
+    @property
+    def persistent(self) -> bool:
+        return self._db_path is not None
+
+    def _get_conn(self) -> sqlite3.Connection:
+        # Appelé sous self._lock
+        if self._conn is None:
+            ensure_dir(self._db_path.parent)
+            self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA_SQL)
+            self._conn.commit()
+        return self._conn
+
+    def get_persistent(self, key: str) -> Optional[dict]:
+        """Lit un résultat sérialisé depuis le tier disque."""
+        if not self.persistent:
+            return None
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                row = conn.execute("SELECT payload FROM search_results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.disk_misses += 1
+                    return None
+                conn.execute("UPDATE search_results SET last_used = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+                self.disk_hits += 1
+                return json.loads(row[0])
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Cache de recherche disque illisible : {e}")
+                return None
+
+    def put_persistent(self, key: str, fingerprint: str, payload: dict) -> None:
+        """Écrit un résultat sérialisé dans le tier disque.
+
+        Les entrées d'une autre empreinte (collection modifiée) sont purgées
+        au premier enregistrement avec la nouvelle empreinte.
+        """
+        if not self.persistent:
+            return
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                if fingerprint != self._last_pruned_fingerprint:
+                    conn.execute("DELETE FROM search_results WHERE fingerprint != ?", (fingerprint,))
+                    self._last_pruned_fingerprint = fingerprint
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_results (key, fingerprint, payload, last_used) VALUES (?, ?, ?, ?)",
+                    (key, fingerprint, json.dumps(payload, ensure_ascii=False, separators=(",", ":")), time.time()),
+                )
+                count = conn.execute("SELECT COUNT(*) FROM search_results").fetchone()[0]
+                if count > self.max_disk_entries:
+                    conn.execute(
+                        "DELETE FROM search_results WHERE key IN "
+                        "(SELECT key FROM search_results ORDER BY last_used ASC LIMIT ?)",
+                        (count - self.max_disk_entries,),
+                    )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Écriture du cache de recherche disque échouée : {e}")
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite du tier disque."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── Statistiques ──
+
+    def stats(self) -> dict:
+        """Compteurs du cache (pour logs et UI)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "disk_hits": self.disk_hits,
+                "disk_misses": self.disk_misses,
+            }
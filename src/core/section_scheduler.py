@@ -0,0 +1,114 @@
+"""Ordonnancement des sections à générer selon leurs dépendances de contexte.
+
+Phase 6 (Perf) : en brouillon, le prompt d'une section n'a besoin que des
+résumés de son parent et des dernières sections de son chapitre. Les
+chapitres (sections racines et leurs descendants) sont donc indépendants
+entre eux et peuvent être générés en parallèle ; en raffinement, toutes les
+sections sont indépendantes (les résumés sont déjà figés).
+"""
+
+import heapq
+
+from src.core.plan_parser import NormalizedPlan, PlanSection
+
+
+def chapter_of(section: PlanSection, by_id: dict[str, PlanSection]) -> str:
+    """Retourne l'identifiant de la section racine (chapitre) d'une section."""
+    current = section
+    seen = {current.id}
+    while current.parent_id and current.parent_id in by_id and current.parent_id not in seen:
+        current = by_id[current.parent_id]
+        seen.add(current.id)
+    return current.id
+
+
+def section_context_ids(plan: NormalizedPlan, summary_window: int = 5) -> dict[str, list[str]]:
+    """Calcule, pour chaque section, les sections dont les résumés forment son contexte.
+
+    Le contexte d'une section est son parent et les ``summary_window``
+    sections qui la précèdent dans le même chapitre, dans l'ordre du plan.
+
+    Returns:
+        Dictionnaire section_id → identifiants de contexte (ordre du plan).
+    """
+    by_id = {s.id: s for s in plan.sections}
+    position = {s.id: i for i, s in enumerate(plan.sections)}
+    previous_in_chapter: dict[str, list[str]] = {}
+    context: dict[str, list[str]] = {}
+
+    for section in plan.sections:
+        chapter = chapter_of(section, by_id)
+        preceding = previous_in_chapter.setdefault(chapter, [])
+        ids = set(preceding[-summary_window:]) if summary_window > 0 else set()
+        if section.parent_id in by_id:
+            ids.add(section.parent_id)
+        ids.discard(section.id)
+        context[section.id] = sorted(ids, key=position.__getitem__)
+        preceding.append(section.id)
+
+    return context
+
+
+def build_generation_dag(
+    sections: list[PlanSection],
+    plan: NormalizedPlan,
+    summary_window: int = 5,
+    independent: bool = False,
+) -> dict[str, list[str]]:
+    """Construit le graphe de dépendances des sections à générer.
+
+    Args:
+        sections: Sections à générer (sous-ensemble du plan).
+        plan: Plan complet (sert au calcul des chapitres et de l'ordre).
+        summary_window: Nombre de sections précédentes du chapitre à attendre.
+        independent: True en raffinement — aucune dépendance.
+
+    Returns:
+        Dictionnaire section_id → sections à générer qui doivent la précéder.
+        Les sections déjà générées lors d'un run précédent ne sont pas des
+        dépendances : leur résumé est déjà disponible.
+    """
+    if independent:
+        return {s.id: [] for s in sections}
+    context = section_context_ids(plan, summary_window)
+    pending = {s.id for s in sections}
+    return {
+        s.id: [dep for dep in context.get(s.id, []) if dep in pending]
+        for s in sections
+    }
+
+
+class SectionScheduler:
+    """Suivi des sections prêtes à générer selon le graphe de dépendances.
+
+    Indépendant du mode d'exécution (threads ou asyncio) : l'appelant retire
+    les sections prêtes avec next_ready() — toujours dans l'ordre du plan —
+    et signale leur fin avec complete().
+    """
+
+    def __init__(self, sections: list[PlanSection], dag: dict[str, list[str]]):
+        self.order = {s.id: i for i, s in enumerate(sections)}
+        self._by_id = {s.id: s for s in sections}
+        self._waiting_on = {sid: set(deps) for sid, deps in dag.items()}
+        self._dependents: dict[str, list[str]] = {}
+        for sid, deps in dag.items():
+            for dep in deps:
+                self._dependents.setdefault(dep, []).append(sid)
+        self._ready = [(self.order[sid], sid) for sid, deps in self._waiting_on.items() if not deps]
+        heapq.heapify(self._ready)
+
+    @property
+    def has_ready(self) -> bool:
+        return bool(self._ready)
+
+    def next_ready(self) -> PlanSection:
+        """Retire la prochaine section prête (ordre du plan)."""
+        _, section_id = heapq.heappop(self._ready)
+        return self._by_id[section_id]
+
+    def complete(self, section_id: str) -> None:
+        """Marque une section terminée (générée, reportée ou en échec)."""
+        for child in self._dependents.get(section_id, []):
+            self._waiting_on[child].discard(section_id)
+            if not self._waiting_on[child]:
+                heapq.heappush(self._ready, (self.order[child], child))
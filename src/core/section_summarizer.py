@@ -0,0 +1,132 @@
+"""Résumé local des sections générées (contexte des sections suivantes).
+
+Phase 6 (Perf) : le résumé IA de chaque section (≈ 200 tokens) coûte un
+aller-retour API bloquant sur le chemin critique de la génération. Le
+résumé extractif sélectionne localement les phrases les plus
+représentatives de la section : similarité cosinus TF-IDF de chaque phrase
+au centroïde de la section (tokeniseur et mots vides de corpus_extractor),
+avec élimination des phrases redondantes.
+
+Modes (``summarization.mode``, par projet) :
+  - ``llm`` : résumé par l'IA (comportement historique) ;
+  - ``extractive`` : résumé local uniquement ;
+  - ``hybrid`` : résumé local immédiat, remplacé par le résumé IA calculé
+    en arrière-plan dès qu'il est disponible.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+from src.core.corpus_extractor import _STOP_WORDS_FR, _tokenize
+
+SUMMARY_MODES = ("llm", "extractive", "hybrid")
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?…])\s+|\n+")
+_MARKDOWN_RE = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+|\*\*|__|`|^#+\s*", re.MULTILINE)
+_NEEDS_SOURCE_RE = re.compile(r"\{\{NEEDS_SOURCE:[^}]*\}\}")
+
+
+def _terms(text: str) -> list[str]:
+    return [w for w in _tokenize(text) if w not in _STOP_WORDS_FR]
+
+
+def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(weight * b.get(term, 0.0) for term, weight in a.items())
+    norm = math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values()))
+    return dot / norm if norm else 0.0
+
+
+class ExtractiveSummarizer:
+    """Résumé extractif par similarité TF-IDF au centroïde de la section.
+
+    Args:
+        max_sentences: Nombre maximal de phrases retenues.
+        max_chars: Longueur maximale du résumé (≈ 200 tokens).
+        min_terms: Phrases plus courtes (en termes utiles) ignorées.
+        redundancy_threshold: Similarité au-delà de laquelle une phrase
+            est jugée redondante avec une phrase déjà retenue.
+    """
+
+    def __init__(
+        self,
+        max_sentences: int = 3,
+        max_chars: int = 600,
+        min_terms: int = 4,
+        redundancy_threshold: float = 0.6,
+    ):
+        self.max_sentences = max_sentences
+        self.max_chars = max_chars
+        self.min_terms = min_terms
+        self.redundancy_threshold = redundancy_threshold
+
+    @staticmethod
+    def split_sentences(content: str) -> list[str]:
+        """Découpe le texte en phrases, sans balisage Markdown ni marqueurs."""
+        text = _NEEDS_SOURCE_RE.sub("", content)
+        text = _MARKDOWN_RE.sub("", text)
+        return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s and s.strip()]
+
+    def summarize(self, content: str, title: str = "") -> str:
+        """Retourne les phrases les plus représentatives, dans l'ordre du texte."""
+        sentences = self.split_sentences(content)
+        candidates = []
+        for position, sentence in enumerate(sentences):
+            terms = _terms(sentence)
+            if len(terms) >= self.min_terms:
+                candidates.append((position, sentence, Counter(terms)))
+        if not candidates:
+            return self._truncate(" ".join(sentences))
+
+        # IDF calculé sur les phrases de la section
+        df = Counter()
+        for _, _, counts in candidates:
+            df.update(counts.keys())
+        n = len(candidates)
+        idf = {term: math.log((1 + n) / (1 + freq)) + 1.0 for term, freq in df.items()}
+
+        vectors = [{t: c * idf[t] for t, c in counts.items()} for _, _, counts in candidates]
+        centroid: dict[str, float] = Counter()
+        for vector in vectors:
+            centroid.update(vector)
+        title_terms = set(_terms(title))
+
+        scored = []
+        for (position, sentence, counts), vector in zip(candidates, vectors):
+            score = _cosine(vector, centroid)
+            if title_terms:
+                score += 0.1 * len(title_terms & counts.keys()) / len(title_terms)
+            if position == 0:
+                score += 0.05  # les sections annoncent souvent leur propos d'entrée
+            scored.append((score, position, sentence, vector))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        selected: list[tuple[int, str, dict[str, float]]] = []
+        length = 0
+        for _, position, sentence, vector in scored:
+            if len(selected) >= self.max_sentences:
+                break
+            if any(_cosine(vector, other) >= self.redundancy_threshold for _, _, other in selected):
+                continue
+            if selected and length + len(sentence) + 1 > self.max_chars:
+                continue
+            selected.append((position, sentence, vector))
+            length += len(sentence) + 1
+
+        selected.sort(key=lambda item: item[0])
+        return self._truncate(" ".join(sentence for _, sentence, _ in selected))
+
+    def _truncate(self, text: str) -> str:
+        if len(text) <= self.max_chars:
+            return text
+        cut = text[:self.max_chars].rsplit(" ", 1)[0]
+        return cut + "..."
+
+
+def summary_mode(config: Optional[dict]) -> str:
+    """Mode de résumé configuré (``summarization.mode``), ``llm`` par défaut."""
+    mode = ((config or {}).get("summarization") or {}).get("mode", "llm")
+    return mode if mode in SUMMARY_MODES else "llm"
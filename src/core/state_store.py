@@ -0,0 +1,296 @@
+"""Persistance incrémentale de l'état projet : instantané + journal append-only.
+
+Phase 6 (Perf) : au lieu de réécrire tout state.json après chaque section,
+seules les entrées modifiées (une section générée, un rapport qualité, un
+champ scalaire...) sont ajoutées à state.journal, suivies d'une ligne de
+commit. Au chargement, les lots commités sont rejoués sur l'instantané ; un
+lot incomplet (arrêt brutal pendant l'écriture) est ignoré. Quand le journal
+dépasse ``compact_bytes``, l'instantané complet est réécrit atomiquement
+(fichier temporaire + os.replace) et le journal vidé.
+
+state.json reste un ProjectState.to_dict() complet : les anciens projets se
+chargent tels quels et le code qui réécrit state.json directement (pages
+Streamlit) reste compatible — chaque commit porte l'identité de l'instantané
+sur lequel il s'applique, et les lots antérieurs à une réécriture externe
+sont ignorés.
+
+Phase 6 (Perf) : StateSaver ajoute une écriture différée (write-behind).
+Les appelants marquent l'état modifié ; un unique thread d'écriture regroupe
+les modifications et écrit au plus une fois par intervalle, hors du verrou
+d'état. Les barrières (fin de passe, checkpoint, arrêt) écrivent de façon
+synchrone un instantané complet (fsync + renommage atomique).
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.utils.file_utils import load_json
+
+logger = logging.getLogger("orchestria")
+
+SNAPSHOT_FILENAME = "state.json"
+JOURNAL_FILENAME = "state.journal"
+DEFAULT_COMPACT_BYTES = 4 * 1024 * 1024
+
+# Champs dictionnaires journalisés clé par clé (section_id → valeur)
+SPLIT_FIELDS = (
+    "generated_sections",
+    "rag_coverage",
+    "quality_reports",
+    "factcheck_reports",
+    "citations",
+    "pending_batches",
+    "partial_sections",
+)
+
+_SEP = "\x1f"
+
+
+def _flatten(data: dict) -> dict[str, object]:
+    """Découpe un état en entrées indépendantes (chemin → valeur)."""
+    entries: dict[str, object] = {}
+    for key, value in data.items():
+        if key in SPLIT_FIELDS and isinstance(value, dict):
+            entries[key] = {}
+            for sub_key, sub_value in value.items():
+                entries[_SEP.join((key, str(sub_key)))] = sub_value
+        elif key == "plan" and isinstance(value, dict):
+            sections = value.get("sections", [])
+            entries["plan"] = {k: v for k, v in value.items() if k != "sections"}
+            entries[_SEP.join(("plan", "order"))] = [s.get("id") for s in sections]
+            for section in sections:
+                entries[_SEP.join(("plan", "section", str(section.get("id"))))] = section
+        else:
+            entries[key] = value
+    return entries
+
+
+def _unflatten(entries: dict[str, object]) -> dict:
+    """Reconstruit un état à partir de ses entrées."""
+    data: dict = {}
+    sections: dict[str, dict] = {}
+    order: list = []
+    for path, value in entries.items():
+        parts = path.split(_SEP)
+        if len(parts) == 1:
+            data[path] = copy.copy(value) if isinstance(value, dict) else value
+        elif parts[0] == "plan" and parts[1] == "order":
+            order = value
+        elif parts[0] == "plan":
+            sections[parts[2]] = value
+        else:
+            data.setdefault(parts[0], {})[parts[1]] = value
+    if isinstance(data.get("plan"), dict):
+        data["plan"]["sections"] = [sections[sid] for sid in order if sid in sections]
+    return data
+
+
+class StateJournal:
+    """Instantané state.json + journal des entrées modifiées depuis."""
+
+    def __init__(self, project_dir: Path, compact_bytes: int = DEFAULT_COMPACT_BYTES, fsync: bool = True):
+        self.project_dir = Path(project_dir)
+        self.snapshot_path = self.project_dir / SNAPSHOT_FILENAME
+        self.journal_path = self.project_dir / JOURNAL_FILENAME
+        self.compact_bytes = compact_bytes
+        self.fsync = fsync
+        # Dernières valeurs persistées (None : état disque inconnu → compaction)
+        self._persisted: Optional[dict[str, object]] = None
+        self._snapshot_id: Optional[list] = None
+        self._seq = 0
+
+    # ── Lecture ──
+
+    def load(self) -> Optional[dict]:
+        """Charge l'instantané et rejoue les lots commités du journal."""
+        if not self.snapshot_path.exists():
+            return None
+        data = load_json(self.snapshot_path)
+        if not self.journal_path.exists():
+            return data
+
+        entries = _flatten(data)
+        snapshot_id = self._current_snapshot_id()
+        applied = 0
+        pending: list[dict] = []
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Ligne tronquée : fin du journal exploitable
+                if "commit" not in record:
+                    pending.append(record)
+                    continue
+                if record.get("snapshot") == snapshot_id:
+                    for op in pending:
+                        if "del" in op:
+                            entries.pop(op["del"], None)
+                        else:
+                            entries[op["set"]] = op["v"]
+                    applied += 1
+                pending = []
+        if applied:
+            logger.debug(f"Journal d'état : {applied} lots rejoués")
+        return _unflatten(entries)
+
+    # ── Écriture ──
+
+    def save(self, data: dict) -> None:
+        """Persiste les entrées modifiées depuis la dernière sauvegarde."""
+        if self._persisted is None or self._current_snapshot_id() != self._snapshot_id:
+            # Premier enregistrement du processus ou state.json réécrit par
+            # un autre composant : repartir d'un instantané complet.
+            self.compact(data)
+            return
+
+        entries = _flatten(data)
+        changed = [
+            path for path, value in entries.items()
+            if path not in self._persisted or self._persisted[path] != value
+        ]
+        deleted = [path for path in self._persisted if path not in entries]
+        if not changed and not deleted:
+            return
+
+        self._seq += 1
+        lines = [json.dumps({"set": path, "v": entries[path]}, ensure_ascii=False) for path in changed]
+        lines.extend(json.dumps({"del": path}) for path in deleted)
+        lines.append(json.dumps({"commit": self._seq, "snapshot": self._snapshot_id}))
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+        for path in changed:
+            self._persisted[path] = copy.deepcopy(entries[path])
+        for path in deleted:
+            del self._persisted[path]
+
+        if self.journal_path.stat().st_size > self.compact_bytes:
+            self.compact(data)
+
+    def compact(self, data: dict) -> None:
+        """Réécrit l'instantané complet atomiquement et vide le journal."""
+        self.project_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # Un journal résiduel ne s'applique plus : l'identité de l'instantané a changé
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self._snapshot_id = self._current_snapshot_id()
+        self._persisted = copy.deepcopy(_flatten(data))
+        self._seq = 0
+
+    def _current_snapshot_id(self) -> Optional[list]:
+        try:
+            stat = self.snapshot_path.stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_state_dict(project_dir: Path) -> Optional[dict]:
+    """Charge l'état d'un projet (instantané + journal) sous forme de dict."""
+    return StateJournal(project_dir).load()
+
+
+class StateSaver:
+    """Écriture différée et regroupée de l'état dans un StateJournal.
+
+    ``snapshot`` retourne le dict à persister (ou None) ; il est appelé au
+    moment de l'écriture, de sorte que toutes les modifications marquées
+    depuis la dernière écriture sont persistées ensemble.
+    """
+
+    def __init__(self, store: StateJournal, snapshot: Callable[[], Optional[dict]], interval_ms: float = 200):
+        self.store = store
+        self.interval = max(interval_ms, 0) / 1000
+        self._snapshot = snapshot
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._dirty = False
+        self._writer: Optional[threading.Thread] = None
+        self._last_write = 0.0
+        _live_savers.add(self)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Signale une modification ; l'écriture aura lieu en arrière-plan."""
+        with self._cond:
+            self._dirty = True
+            if self._writer is None:
+                # Le thread s'arrête dès que plus rien n'est à écrire
+                self._writer = threading.Thread(target=self._run, name="state-writer", daemon=True)
+                self._writer.start()
+            self._cond.notify()
+
+    def flush(self, barrier: bool = True) -> None:
+        """Écrit immédiatement l'état courant.
+
+        Args:
+            barrier: True pour un instantané complet durable (fsync + renommage
+                atomique) ; False pour un simple lot de journal.
+        """
+        with self._cond:
+            self._dirty = False
+            self._cond.notify()  # le thread d'écriture n'a plus rien à faire
+        self._write(barrier)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._dirty:
+                    self._writer = None
+                    return
+                remaining = self._last_write + self.interval - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                self._dirty = False
+            self._write(barrier=False)
+
+    def _write(self, barrier: bool) -> None:
+        with self._io_lock:
+            try:
+                data = self._snapshot()
+                if data is None:
+                    return
+                if barrier:
+                    self.store.compact(data)
+                else:
+                    self.store.save(data)
+            except Exception as e:
+                if barrier:
+                    raise
+                logger.warning(f"Sauvegarde différée de l'état échouée : {e}")
+            finally:
+                self._last_write = time.monotonic()
+
+
+_live_savers: "weakref.WeakSet[StateSaver]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_savers() -> None:
+    """Barrière d'arrêt : écrit les modifications encore en attente."""
+    for saver in list(_live_savers):
+        if saver.dirty:
+            saver.flush()
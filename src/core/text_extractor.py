@@ -7,21 +7,22 @@ Phase 4 (Perf) : parallélisation ProcessPoolExecutor + psutil pour gestion dyna
                   compute_optimal_workers() est publique pour réutilisation par d'autres modules.
 Phase 5 (Cache) : cache JSON disque dans data/cache/ indexé par MD5(contenu+mtime),
                    clear_cache() pour invalidation manuelle.
+Phase 6 (Perf) : cache adressé par le SHA-256 du contenu, calculé en une lecture et
+                 réutilisé pour hash_binary ; entrées compressées, texte chargé à la
+                 demande, taille bornée avec éviction LRU (voir extraction_cache).
 """
 
 import gc
-import hashlib
-import json
 import logging
 import os
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from src.utils.config import ROOT_DIR, load_default_config
-from src.utils.file_utils import ensure_dir, sha256_file, sha256_text
+from src.utils.file_utils import sha256_text
 
 logger = logging.getLogger("orchestria")
 
@@ -32,81 +33,30 @@ logging.getLogger("streamlit.runtime.scriptrunner.script_runner").setLevel(loggi
 CACHE_DIR = ROOT_DIR / "data" / "cache"
 
 
-# --- Cache disque JSON ---
+# --- Cache disque des extractions ---
 
 
-def _get_file_hash(file_path: Path) -> str:
-    """Calcule un hash MD5 combinant le contenu binaire et la date de modification.
-
-    Ce hash sert de clé de cache : si le fichier change (contenu ou mtime),
-    le hash change et le cache est invalidé naturellement.
-    """
-    hasher = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    mtime = str(file_path.stat().st_mtime)
-    hasher.update(mtime.encode("utf-8"))
-    return hasher.hexdigest()
-
-
-def _cache_path_for(file_hash: str) -> Path:
-    """Retourne le chemin du fichier cache JSON pour un hash donné."""
-    return CACHE_DIR / f"{file_hash}.json"
-
-
-def _save_to_cache(file_hash: str, result: "ExtractionResult") -> None:
-    """Sauvegarde un ExtractionResult en JSON dans le cache disque."""
-    try:
-        ensure_dir(CACHE_DIR)
-        data = asdict(result)
-        cache_file = _cache_path_for(file_hash)
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        logger.info(f"[EXTRACTION] Cache sauvegardé pour {result.source_filename} (hash={file_hash[:12]}...)")
-    except Exception as e:
-        logger.warning(f"Impossible de sauvegarder le cache pour {result.source_filename}: {e}")
-
-
-def _load_from_cache(file_hash: str) -> Optional["ExtractionResult"]:
-    """Charge un ExtractionResult depuis le cache disque JSON.
-
-    Returns:
-        L'ExtractionResult reconstitué, ou None si absent/invalide.
-    """
-    cache_file = _cache_path_for(file_hash)
-    if not cache_file.exists():
-        return None
-    try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        result = ExtractionResult(**data)
-        logger.info(f"[CACHE] Résultat chargé depuis le cache pour {result.source_filename} (hash={file_hash[:12]}...)")
-        return result
-    except Exception as e:
-        logger.warning(f"Cache invalide pour hash={file_hash[:12]}..., suppression : {e}")
-        cache_file.unlink(missing_ok=True)
-        return None
+def _get_cache():
+    """Cache d'extraction du processus pour CACHE_DIR (voir extraction_cache)."""
+    from src.core.extraction_cache import get_extraction_cache
+    return get_extraction_cache(CACHE_DIR)
 
 
 def clear_cache(file_path: Path) -> bool:
     """Invalide le cache d'extraction pour un fichier donné.
 
-    Supprime le fichier JSON correspondant dans data/cache/.
+    Supprime l'entrée correspondante dans data/cache/.
     Gère silencieusement le cas où le cache n'existe pas.
 
     Args:
         file_path: Chemin du fichier dont on veut invalider le cache.
 
     Returns:
-        True si un fichier cache a été supprimé, False sinon.
+        True si une entrée de cache a été supprimée, False sinon.
     """
     try:
-        file_hash = _get_file_hash(file_path)
-        cache_file = _cache_path_for(file_hash)
-        if cache_file.exists():
-            cache_file.unlink()
-            logger.info(f"Cache supprimé pour {file_path.name} (hash={file_hash[:12]}...)")
+        if _get_cache().invalidate(file_path):
+            logger.info(f"Cache supprimé pour {file_path.name}")
             return True
         logger.debug(f"Pas de cache à supprimer pour {file_path.name}")
         return False
@@ -344,7 +294,7 @@ def is_extraction_cached(path: Path, metadata_store) -> bool:
     if metadata_store is None:
         return False
     try:
-        file_hash = sha256_file(path)
+        file_hash = _get_cache().content_hash(path)
         if not file_hash:
             return False
         conn = metadata_store._get_conn()
@@ -863,13 +813,17 @@ def extract(path: Path, metadata_store=None, force: bool = False) -> ExtractionR
             status="cached",
         )
 
-    # Vérification cache disque JSON (data/cache/)
-    if not force and path.exists():
+    # Vérification cache disque (data/cache/) : une seule lecture du fichier pour
+    # la clé, réutilisée par _make_result pour hash_binary
+    cache = _get_cache()
+    file_hash = ""
+    if path.exists():
         try:
-            file_hash = _get_file_hash(path)
-            cached_result = _load_from_cache(file_hash)
-            if cached_result is not None:
-                return cached_result
+            file_hash = cache.content_hash(path)
+            if not force:
+                cached_result = cache.get(path, file_hash)
+                if cached_result is not None:
+                    return cached_result
         except Exception as e:
             logger.debug(f"Erreur vérification cache disque pour {path.name}: {e}")
 
@@ -892,10 +846,9 @@ def extract(path: Path, metadata_store=None, force: bool = False) -> ExtractionR
         )
 
     # Sauvegarder en cache disque si l'extraction a réussi
-    if result.status in ("success", "partial") and path.exists():
+    if result.status in ("success", "partial") and file_hash:
         try:
-            file_hash = _get_file_hash(path)
-            _save_to_cache(file_hash, result)
+            cache.put(result, file_hash, path.suffix)
             logger.info(f"[EXTRACTION] {path.name} extrait avec {result.extraction_method}")
         except Exception as e:
             logger.debug(f"Impossible de mettre en cache {path.name}: {e}")
@@ -932,7 +885,7 @@ def _make_result(
         source_filename=path.name,
         source_size_bytes=size,
         source_modified=modified,
-        hash_binary=sha256_file(path) if path.exists() and status != "failed" else "",
+        hash_binary=_get_cache().content_hash(path) if path.exists() and status != "failed" else "",
         hash_text=sha256_text(text) if text else "",
         error_message=error,
     )
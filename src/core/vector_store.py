@@ -0,0 +1,793 @@
+"""Stockage vectoriel interchangeable pour le pipeline RAG.
+
+Phase 6 (Perf) : RAGEngine et plan_corpus_linker passent par l'interface
+VectorStore au lieu d'utiliser directement une collection ChromaDB.
+L'interface reprend le sous-ensemble de l'API Collection de ChromaDB déjà
+utilisé par le code (add, get, delete, query, count), avec des résultats de
+même forme, ce qui garde les deux backends interchangeables :
+
+  - "chromadb" : collection ChromaDB persistante (index HNSW), défaut ;
+  - "numpy"    : index plat exact en mémoire mappée (vectors.f32) avec un
+    fichier compagnon pour les identifiants, textes et métadonnées.
+    Recherche exacte par produit scalaire — plus rapide à ouvrir et à
+    interroger que HNSW en dessous de ~50k chunks, et trivial à copier.
+
+Format disque du backend numpy (répertoire flat_index/ du projet) :
+  - vectors.f32   : matrice float32 normalisée (append-only), une ligne par chunk
+  - records.jsonl : {"id", "document", "metadata"} dans le même ordre
+  - meta.json     : dimension, nombre de lignes validées et SHA-256 de
+    leurs identifiants, écrit en dernier (remplacement atomique)
+
+Comme pour le cache d'embeddings, les vecteurs sont écrits avant les
+enregistrements : après un arrêt brutal, les lignes orphelines au-delà
+des lignes validées par meta.json sont tronquées au rechargement. Les
+suppressions réécrivent les deux fichiers : si un arrêt survient entre les
+deux remplacements, les lignes validées ne concordent plus avec meta.json
+et l'index est rejeté (vidé, donc réindexé) au lieu d'être tronqué, ce
+qui associerait des identifiants aux mauvais vecteurs.
+
+Mode quantifié (rag.vector_quantization) pour les corpus de 500k+ chunks :
+seuls des codes compacts restent en RAM — int8 (1 octet/dimension, 4x plus
+petit) ou binaire (1 bit/dimension, 32x plus petit) — pour générer une
+liste restreinte de n_results x rescore_factor candidats, rescorés ensuite
+avec les vecteurs float32 lus paresseusement dans vectors.f32 (mmap).
+evaluate_recall() mesure le recall@k de chaque mode face à la recherche
+exacte, pour choisir le niveau de compression par projet.
+  - codes.int8 + scales.f32 : codes int8 et facteur d'échelle par ligne
+  - codes.bin               : signes des composantes (np.packbits)
+Les codes sont dérivés des vecteurs : absents ou incohérents, ils sont
+reconstruits au chargement.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.utils.file_utils import ensure_dir
+
+logger = logging.getLogger("orchestria")
+
+VECTOR_STORE_BACKENDS = ("chromadb", "numpy")
+FLAT_INDEX_DIRNAME = "flat_index"
+
+VECTORS_FILENAME = "vectors.f32"
+RECORDS_FILENAME = "records.jsonl"
+META_FILENAME = "meta.json"
+SCALES_FILENAME = "scales.f32"
+CODES_FILENAMES = {"int8": "codes.int8", "binary": "codes.bin"}
+
+QUANTIZATION_MODES = ("none", "int8", "binary")
+DEFAULT_RESCORE_FACTOR = 8
+# Lignes de codes décodées par bloc lors du scan approximatif (borne la RAM)
+SCAN_BLOCK_ROWS = 65_536
+
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint16)
+
+# Signature : (textes, mode "document" | "query") → matrice float32
+EmbeddingFunction = Callable[[list[str], str], np.ndarray]
+
+
+class VectorStore(ABC):
+    """Interface commune des backends de stockage vectoriel."""
+
+    backend: str = ""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Nombre de chunks indexés."""
+
+    @abstractmethod
+    def add(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict],
+        embeddings: Optional[np.ndarray] = None,
+    ) -> None:
+        """Ajoute des chunks (les vecteurs sont calculés par le backend si absents)."""
+
+    @abstractmethod
+    def get(self, ids: Optional[list[str]] = None, where: Optional[dict] = None, include: Optional[list[str]] = None) -> dict:
+        """Retourne {"ids", "documents", "metadatas"} des chunks sélectionnés."""
+
+    @abstractmethod
+    def delete(self, ids: Optional[list[str]] = None, where: Optional[dict] = None) -> None:
+        """Supprime des chunks par identifiant ou par filtre de métadonnées."""
+
+    @abstractmethod
+    def query(
+        self,
+        query_embeddings: Optional[np.ndarray] = None,
+        query_texts: Optional[list[str]] = None,
+        n_results: int = 10,
+        where: Optional[dict] = None,
+        include: Optional[list[str]] = None,
+    ) -> dict:
+        """Recherche les plus proches voisins (distance cosinus).
+
+        Returns:
+            {"ids", "documents", "metadatas", "distances"} : une liste par requête.
+        """
+
+    def clear(self) -> None:
+        """Vide le stockage."""
+        ids = self.get()["ids"]
+        if ids:
+            self.delete(ids=ids)
+
+    def drop(self) -> None:
+        """Supprime le stockage (reset complet)."""
+        self.clear()
+
+
+class ChromaVectorStore(VectorStore):
+    """Backend ChromaDB (collection persistante, index HNSW cosinus)."""
+
+    backend = "chromadb"
+
+    def __init__(self, collection_name: str, persist_dir: Optional[Path] = None):
+        self.collection_name = collection_name
+        self.persist_dir = persist_dir
+        self._client = None
+        self._collection = None
+
+    def _get_client(self):
+        """Initialise le client ChromaDB (lazy)."""
+        if self._client is None:
+            import chromadb
+            if self.persist_dir:
+                self._client = chromadb.PersistentClient(path=str(self.persist_dir))
+            else:
+                self._client = chromadb.Client()
+        return self._client
+
+    @property
+    def collection(self):
+        """Collection ChromaDB sous-jacente (créée à la demande)."""
+        if self._collection is None:
+            self._collection = self._get_client().get_or_create_collection(
+                name=self.collection_name,
+                metadata={"hnsw:space": "cosine"},
+            )
+        return self._collection
+
+    def count(self) -> int:
+        return self.collection.count()
+
+    def add(self, ids, documents, metadatas, embeddings=None) -> None:
+        kwargs = {"ids": ids, "documents": documents, "metadatas": metadatas}
+        if embeddings is not None and len(embeddings):
+            kwargs["embeddings"] = embeddings
+        self.collection.add(**kwargs)
+
+    def get(self, ids=None, where=None, include=None) -> dict:
+        kwargs = {}
+        if ids is not None:
+            kwargs["ids"] = ids
+        if where:
+            kwargs["where"] = where
+        if include is not None:
+            kwargs["include"] = include
+        return self.collection.get(**kwargs)
+
+    def delete(self, ids=None, where=None) -> None:
+        kwargs = {}
+        if ids is not None:
+            kwargs["ids"] = ids
+        if where:
+            kwargs["where"] = where
+        self.collection.delete(**kwargs)
+
+    def query(self, query_embeddings=None, query_texts=None, n_results=10, where=None, include=None) -> dict:
+        kwargs = {
+            "n_results": n_results,
+            "include": include or ["documents", "metadatas", "distances"],
+        }
+        if where:
+            kwargs["where"] = where
+        if query_embeddings is not None:
+            kwargs["query_embeddings"] = query_embeddings
+        else:
+            kwargs["query_texts"] = query_texts
+        return self.collection.query(**kwargs)
+
+    def drop(self) -> None:
+        if self._client is not None:
+            try:
+                self._client.delete_collection(self.collection_name)
+            except Exception:
+                pass
+        self._collection = None
+
+
+class NumpyVectorStore(VectorStore):
+    """Index plat sur une matrice float32 en mémoire mappée.
+
+    Recherche exacte par défaut ; avec quantization="int8" ou "binary", recherche
+    approximative sur codes compacts puis rescoring exact de la liste restreinte.
+    Sans répertoire, l'index reste entièrement en mémoire (tests, projets
+    éphémères). Thread-safe.
+    """
+
+    backend = "numpy"
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        quantization: str = "none",
+        rescore_factor: int = DEFAULT_RESCORE_FACTOR,
+    ):
+        if quantization not in QUANTIZATION_MODES:
+            logger.warning(f"Quantification inconnue '{quantization}', recherche exacte utilisée")
+            quantization = "none"
+        self.directory = Path(directory) if directory else None
+        self.embedding_function = embedding_function
+        self.quantization = quantization
+        self.rescore_factor = max(1, rescore_factor)
+        self._codes: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dim: Optional[int] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._ids: list[str] = []
+        self._documents: list[str] = []
+        self._metadatas: list[dict] = []
+        self._positions: dict[str, int] = {}
+
+    # ── Chargement ──
+
+    def _path(self, name: str) -> Path:
+        return self.directory / name
+
+    def _load(self) -> None:
+        """Charge l'index depuis le disque (paresseux, sous self._lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.directory is None:
+            return
+        if not self._path(META_FILENAME).exists():
+            # Arrêt avant la première validation : fichiers orphelins éventuels
+            self._remove_files()
+            return
+        try:
+            with open(self._path(META_FILENAME), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self._dim = int(meta["dimension"])
+            committed = meta.get("rows")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Index vectoriel illisible ({self.directory}), réinitialisé : {e}")
+            self._remove_files()
+            return
+
+        records_path = self._path(RECORDS_FILENAME)
+        line_sizes: list[int] = []
+        if records_path.exists():
+            with open(records_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    self._ids.append(record["id"])
+                    self._documents.append(record["document"])
+                    self._metadatas.append(record.get("metadata") or {})
+                    line_sizes.append(len(line))
+
+        vectors_path = self._path(VECTORS_FILENAME)
+        row_bytes = self._dim * 4
+        vector_rows = vectors_path.stat().st_size // row_bytes if vectors_path.exists() else 0
+        n_rows = min(len(self._ids), vector_rows)
+
+        # Lignes validées : doivent concorder avec meta.json (identifiants compris)
+        if committed is not None and (
+            n_rows < committed or _ids_checksum(self._ids[:committed]) != meta.get("ids_sha256")
+        ):
+            logger.warning(
+                f"Index vectoriel incohérent ({self.directory}) : vecteurs et enregistrements "
+                f"ne concordent plus avec {META_FILENAME}, index rejeté (réindexation nécessaire)"
+            )
+            self._remove_files()
+            self._reset_memory()
+            return
+
+        # Réparation après arrêt brutal : tronquer les ajouts incomplets
+        del self._ids[n_rows:], self._documents[n_rows:], self._metadatas[n_rows:]
+        valid_bytes = sum(line_sizes[:n_rows])
+        if records_path.exists() and records_path.stat().st_size != valid_bytes:
+            with open(records_path, "r+b") as f:
+                f.truncate(valid_bytes)
+        if vectors_path.exists() and vectors_path.stat().st_size != n_rows * row_bytes:
+            with open(vectors_path, "r+b") as f:
+                f.truncate(n_rows * row_bytes)
+
+        self._positions = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+        if committed != n_rows:
+            self._write_meta()
+        self._remap()
+        self._load_codes()
+
+    def _load_codes(self) -> None:
+        """Charge les codes quantifiés, ou les reconstruit s'ils sont absents/incohérents."""
+        if self.quantization == "none" or self._vectors is None:
+            return
+        n_rows = len(self._ids)
+        codes_path = self._path(CODES_FILENAMES[self.quantization])
+        width = self._code_width(self.quantization)
+        if codes_path.exists() and codes_path.stat().st_size == n_rows * width:
+            dtype = np.int8 if self.quantization == "int8" else np.uint8
+            codes = np.fromfile(codes_path, dtype=dtype).reshape(n_rows, width)
+            scales = None
+            if self.quantization == "int8":
+                scales_path = self._path(SCALES_FILENAME)
+                if scales_path.exists() and scales_path.stat().st_size == n_rows * 4:
+                    scales = np.fromfile(scales_path, dtype=np.float32)
+            if self.quantization == "binary" or scales is not None:
+                self._codes, self._scales = codes, scales
+                return
+        logger.info(f"Reconstruction des codes {self.quantization} de l'index vectoriel ({n_rows} lignes)")
+        self._codes, self._scales = self._encode_all(self.quantization)
+        self._write_codes(self._codes, self._scales, append=False)
+
+    def _code_width(self, mode: str) -> int:
+        return self._dim if mode == "int8" else (self._dim + 7) // 8
+
+    def _encode_all(self, mode: str) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """Quantifie tous les vecteurs par blocs (sans charger la matrice entière)."""
+        parts = [
+            quantize_vectors(np.asarray(self._vectors[start:start + SCAN_BLOCK_ROWS]), mode)
+            for start in range(0, len(self._ids), SCAN_BLOCK_ROWS)
+        ]
+        codes = np.concatenate([c for c, _ in parts])
+        scales = np.concatenate([sc for _, sc in parts]) if mode == "int8" else None
+        return codes, scales
+
+    def _write_codes(self, codes: np.ndarray, scales: Optional[np.ndarray], append: bool) -> None:
+        if self.directory is None:
+            return
+        mode = "ab" if append else "wb"
+        with open(self._path(CODES_FILENAMES[self.quantization]), mode) as f:
+            f.write(np.ascontiguousarray(codes).tobytes())
+        if scales is not None:
+            with open(self._path(SCALES_FILENAME), mode) as f:
+                f.write(np.ascontiguousarray(scales).tobytes())
+
+    def _remap(self) -> None:
+        """Rouvre la vue mmap des vecteurs après une écriture sur disque."""
+        if self.directory is None:
+            return
+        n_rows = len(self._ids)
+        if not n_rows or self._dim is None:
+            self._vectors = None
+            return
+        self._vectors = np.memmap(self._path(VECTORS_FILENAME), dtype=np.float32, mode="r", shape=(n_rows, self._dim))
+
+    def _write_meta(self) -> None:
+        """Valide les lignes écrites : meta.json remplacé atomiquement, en dernier."""
+        meta = {"dimension": self._dim, "rows": len(self._ids), "ids_sha256": _ids_checksum(self._ids)}
+        meta_tmp = self._path(META_FILENAME + ".tmp")
+        with open(meta_tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(meta_tmp, self._path(META_FILENAME))
+
+    def _remove_files(self) -> None:
+        for name in (VECTORS_FILENAME, RECORDS_FILENAME, META_FILENAME, SCALES_FILENAME, *CODES_FILENAMES.values()):
+            self._path(name).unlink(missing_ok=True)
+
+    def _reset_memory(self) -> None:
+        self._dim = None
+        self._vectors = None
+        self._codes = None
+        self._scales = None
+        self._ids, self._documents, self._metadatas = [], [], []
+        self._positions = {}
+
+    # ── Écriture ──
+
+    def add(self, ids, documents, metadatas, embeddings=None) -> None:
+        if not ids:
+            return
+        if embeddings is None or not len(embeddings):
+            if self.embedding_function is None:
+                raise ValueError("Le backend vectoriel numpy exige des embeddings pré-calculés")
+            embeddings = self.embedding_function(list(documents), "document")
+        matrix = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        if matrix.ndim != 2 or len(matrix) != len(ids):
+            raise ValueError("Nombre d'embeddings différent du nombre de chunks")
+
+        with self._lock:
+            self._load()
+            if self._dim is not None and matrix.shape[1] != self._dim:
+                raise ValueError(f"Dimension d'embedding inattendue ({matrix.shape[1]} vs {self._dim})")
+
+            # Comme ChromaDB : les identifiants déjà présents sont ignorés
+            keep: list[int] = []
+            seen: set[str] = set()
+            for i, chunk_id in enumerate(ids):
+                if chunk_id not in self._positions and chunk_id not in seen:
+                    seen.add(chunk_id)
+                    keep.append(i)
+            if not keep:
+                return
+            if len(keep) != len(ids):
+                matrix = matrix[keep]
+            new_ids = [ids[i] for i in keep]
+            new_docs = [documents[i] for i in keep]
+            new_metas = [dict(metadatas[i] or {}) for i in keep]
+
+            if self._dim is None:
+                self._dim = int(matrix.shape[1])
+                if self.directory is not None:
+                    ensure_dir(self.directory)
+
+            codes = scales = None
+            if self.quantization != "none":
+                codes, scales = quantize_vectors(matrix, self.quantization)
+
+            if self.directory is not None:
+                # Vecteurs d'abord, enregistrements ensuite (voir docstring du module)
+                with open(self._path(VECTORS_FILENAME), "ab") as f:
+                    f.write(np.ascontiguousarray(matrix).tobytes())
+                if codes is not None:
+                    self._write_codes(codes, scales, append=True)
+                with open(self._path(RECORDS_FILENAME), "ab") as f:
+                    f.write(b"".join(_record_line(i, d, m) for i, d, m in zip(new_ids, new_docs, new_metas)))
+            else:
+                self._vectors = matrix if self._vectors is None else np.vstack([self._vectors, matrix])
+
+            if codes is not None:
+                self._codes = codes if self._codes is None else np.concatenate([self._codes, codes])
+                if scales is not None:
+                    self._scales = scales if self._scales is None else np.concatenate([self._scales, scales])
+
+            start = len(self._ids)
+            self._ids.extend(new_ids)
+            self._documents.extend(new_docs)
+            self._metadatas.extend(new_metas)
+            self._positions.update({chunk_id: start + k for k, chunk_id in enumerate(new_ids)})
+            if self.directory is not None:
+                self._write_meta()
+            self._remap()
+
+    def delete(self, ids=None, where=None) -> None:
+        with self._lock:
+            self._load()
+            rows = self._select_rows(ids, where)
+            if not rows:
+                return
+            drop = set(rows)
+            keep = [row for row in range(len(self._ids)) if row not in drop]
+            vectors = np.array(self._vectors[keep]) if keep else None
+            self._ids = [self._ids[r] for r in keep]
+            self._documents = [self._documents[r] for r in keep]
+            self._metadatas = [self._metadatas[r] for r in keep]
+            self._positions = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+            if self._codes is not None:
+                self._codes = self._codes[keep]
+                if self._scales is not None:
+                    self._scales = self._scales[keep]
+            if self.directory is None:
+                self._vectors = vectors
+                return
+            self._vectors = None
+            self._rewrite(vectors)
+            self._remap()
+            if self._codes is not None:
+                self._write_codes(self._codes, self._scales, append=False)
+
+    def _rewrite(self, vectors: Optional[np.ndarray]) -> None:
+        """Réécrit vectors.f32 et records.jsonl (remplacement atomique par fichier),
+        puis meta.json qui valide la nouvelle version."""
+        vectors_tmp = self._path(VECTORS_FILENAME + ".tmp")
+        records_tmp = self._path(RECORDS_FILENAME + ".tmp")
+        with open(vectors_tmp, "wb") as f:
+            if vectors is not None:
+                f.write(np.ascontiguousarray(vectors).tobytes())
+        with open(records_tmp, "wb") as f:
+            f.write(b"".join(
+                _record_line(i, d, m) for i, d, m in zip(self._ids, self._documents, self._metadatas)
+            ))
+        os.replace(vectors_tmp, self._path(VECTORS_FILENAME))
+        os.replace(records_tmp, self._path(RECORDS_FILENAME))
+        self._write_meta()
+
+    def clear(self) -> None:
+        with self._lock:
+            if self.directory is not None:
+                self._vectors = None
+                self._remove_files()
+            self._reset_memory()
+            self._loaded = True
+
+    # ── Lecture ──
+
+    def count(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._ids)
+
+    def get(self, ids=None, where=None, include=None) -> dict:
+        with self._lock:
+            self._load()
+            rows = self._select_rows(ids, where) if (ids is not None or where) else range(len(self._ids))
+            return {
+                "ids": [self._ids[r] for r in rows],
+                "documents": [self._documents[r] for r in rows],
+                "metadatas": [dict(self._metadatas[r]) for r in rows],
+            }
+
+    def query(self, query_embeddings=None, query_texts=None, n_results=10, where=None, include=None) -> dict:
+        if query_embeddings is None:
+            if query_texts is None or self.embedding_function is None:
+                raise ValueError("Le backend vectoriel numpy exige des embeddings de requête")
+            query_embeddings = self.embedding_function(list(query_texts), "query")
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        queries = _normalize_rows(queries)
+        empty = {key: [[] for _ in range(len(queries))] for key in ("ids", "documents", "metadatas", "distances")}
+
+        with self._lock:
+            self._load()
+            if not self._ids or self._vectors is None:
+                return empty
+            rows = None
+            if where:
+                rows = np.asarray(self._select_rows(None, where), dtype=np.int64)
+                if not len(rows):
+                    return empty
+
+            if self._codes is not None:
+                positions, similarities = self._quantized_search(queries, n_results, rows)
+            else:
+                positions, similarities = self._exact_search(queries, n_results, rows)
+
+            result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+            for row_positions, row_sims in zip(positions, similarities):
+                result["ids"].append([self._ids[p] for p in row_positions])
+                result["documents"].append([self._documents[p] for p in row_positions])
+                result["metadatas"].append([dict(self._metadatas[p]) for p in row_positions])
+                result["distances"].append([float(1.0 - s) for s in row_sims])
+            return result
+
+    def _exact_search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        rows: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Recherche exacte : (positions, similarités) triées, shape (n_queries, k)."""
+        matrix = self._vectors if rows is None else self._vectors[rows]
+        top, sims = _top_k(queries @ matrix.T, k)
+        return (top if rows is None else rows[top]), sims
+
+    def _quantized_search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        rows: Optional[np.ndarray] = None,
+        mode: Optional[str] = None,
+        codes: Optional[np.ndarray] = None,
+        scales: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Scan approximatif sur les codes, puis rescoring exact de la liste restreinte.
+
+        Seules les lignes candidates (union sur toutes les requêtes) sont lues
+        dans la matrice float32 en mémoire mappée.
+        """
+        mode = mode or self.quantization
+        codes = self._codes if codes is None else codes
+        scales = self._scales if scales is None else scales
+        n_candidates = len(self._ids) if rows is None else len(rows)
+        shortlist = min(n_candidates, k * self.rescore_factor)
+        if shortlist >= n_candidates:
+            return self._exact_search(queries, k, rows)
+
+        approx = np.empty((len(queries), n_candidates), dtype=np.float32)
+        for start in range(0, n_candidates, SCAN_BLOCK_ROWS):
+            block = slice(start, start + SCAN_BLOCK_ROWS)
+            block_rows = block if rows is None else rows[block]
+            approx[:, block] = _approx_scores(
+                queries, codes[block_rows], scales[block_rows] if scales is not None else None, mode,
+            )
+        candidates, _ = _top_k(approx, shortlist)
+        if rows is not None:
+            candidates = rows[candidates]
+
+        union = np.unique(candidates)
+        exact = queries @ np.asarray(self._vectors[union]).T
+        columns = np.searchsorted(union, candidates)
+        rescored = np.take_along_axis(exact, columns, axis=1)
+        top, sims = _top_k(rescored, k)
+        return np.take_along_axis(candidates, top, axis=1), sims
+
+    def evaluate_recall(
+        self,
+        k: int = 10,
+        sample_size: int = 100,
+        modes: Optional[list[str]] = None,
+        queries: Optional[np.ndarray] = None,
+    ) -> list[dict]:
+        """Mesure le recall@k de chaque mode de quantification face à la recherche exacte.
+
+        Sans requêtes fournies, un échantillon de vecteurs de l'index sert de
+        requêtes. Les modes autres que le mode courant sont évalués avec des
+        codes calculés à la volée (l'index n'est pas modifié).
+
+        Returns:
+            Une entrée par mode : recall@k, taille des codes et facteur de rescoring.
+        """
+        modes = modes or [m for m in QUANTIZATION_MODES if m != "none"]
+        with self._lock:
+            self._load()
+            n_rows = len(self._ids)
+            if not n_rows or self._vectors is None:
+                return []
+            if queries is None:
+                rng = np.random.default_rng(0)
+                sample = np.sort(rng.choice(n_rows, size=min(sample_size, n_rows), replace=False))
+                queries = np.asarray(self._vectors[sample])
+            queries = _normalize_rows(np.asarray(queries, dtype=np.float32).reshape(-1, self._dim))
+            k = min(k, n_rows)
+            exact, _ = self._exact_search(queries, k)
+
+            report = []
+            for mode in modes:
+                if mode == self.quantization and self._codes is not None:
+                    codes, scales = self._codes, self._scales
+                else:
+                    codes, scales = self._encode_all(mode)
+                found, _ = self._quantized_search(queries, k, mode=mode, codes=codes, scales=scales)
+                hits = [len(set(f) & set(e)) for f, e in zip(found.tolist(), exact.tolist())]
+                report.append({
+                    "mode": mode,
+                    "k": k,
+                    "queries": len(queries),
+                    "recall_at_k": round(sum(hits) / (k * len(queries)), 4),
+                    "rescore_factor": self.rescore_factor,
+                    "code_bytes": int(codes.nbytes + (scales.nbytes if scales is not None else 0)),
+                    "vector_bytes": n_rows * self._dim * 4,
+                })
+            return report
+
+    def _select_rows(self, ids: Optional[list[str]], where: Optional[dict]) -> list[int]:
+        """Lignes correspondant aux identifiants et/ou au filtre (sous self._lock)."""
+        if ids is not None:
+            rows = [self._positions[i] for i in ids if i in self._positions]
+        else:
+            rows = range(len(self._ids))
+        if where:
+            rows = [r for r in rows if _matches_where(self._metadatas[r], where)]
+        return list(rows)
+
+
+def create_vector_store(
+    backend: str,
+    collection_name: str,
+    persist_dir: Optional[Path] = None,
+    embedding_function: Optional[EmbeddingFunction] = None,
+    quantization: str = "none",
+    rescore_factor: int = DEFAULT_RESCORE_FACTOR,
+) -> VectorStore:
+    """Instancie le backend configuré (rag.vector_store, rag.vector_quantization)."""
+    if backend not in VECTOR_STORE_BACKENDS:
+        logger.warning(f"Backend vectoriel inconnu '{backend}', utilisation de ChromaDB")
+    if backend == "numpy":
+        directory = Path(persist_dir) / FLAT_INDEX_DIRNAME if persist_dir else None
+        return NumpyVectorStore(
+            directory,
+            embedding_function=embedding_function,
+            quantization=quantization,
+            rescore_factor=rescore_factor,
+        )
+    if quantization != "none":
+        logger.warning("La quantification vectorielle requiert rag.vector_store = \"numpy\", ignorée")
+    return ChromaVectorStore(collection_name, persist_dir)
+
+
+def quantize_vectors(matrix: np.ndarray, mode: str) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """Quantifie des vecteurs normalisés : (codes, échelles par ligne ou None).
+
+    int8   : composantes ramenées sur [-127, 127] avec une échelle par ligne ;
+    binary : signe de chaque composante, 8 dimensions par octet.
+    """
+    if mode == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales.astype(np.float32)
+    if mode == "binary":
+        return np.packbits(matrix > 0, axis=1), None
+    raise ValueError(f"Mode de quantification inconnu : {mode}")
+
+
+def _approx_scores(queries: np.ndarray, codes: np.ndarray, scales: Optional[np.ndarray], mode: str) -> np.ndarray:
+    """Scores approximatifs (plus grand = plus proche), shape (n_queries, n_codes)."""
+    if mode == "int8":
+        return (queries @ codes.astype(np.float32).T) * scales[None, :]
+    query_bits = np.packbits(queries > 0, axis=1)
+    hamming = np.stack([_POPCOUNT[np.bitwise_xor(codes, q)].sum(axis=1) for q in query_bits])
+    return -hamming.astype(np.float32)
+
+
+def _top_k(scores: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Indices et valeurs des k plus grands scores de chaque ligne, triés par ordre décroissant."""
+    k = min(k, scores.shape[1])
+    if k < scores.shape[1]:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(k), (len(scores), k))
+    values = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-values, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(values, order, axis=1)
+
+
+def _record_line(chunk_id: str, document: str, metadata: dict) -> bytes:
+    return (json.dumps(
+        {"id": chunk_id, "document": document, "metadata": metadata},
+        ensure_ascii=False, separators=(",", ":"),
+    ) + "\n").encode("utf-8")
+
+
+def _ids_checksum(ids: list[str]) -> str:
+    return hashlib.sha256("\n".join(ids).encode("utf-8")).hexdigest()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Normalise chaque ligne (norme L2) pour une similarité cosinus par produit scalaire."""
+    if matrix.ndim != 2:
+        return matrix
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+_COMPARISONS = {
+    "$eq": lambda value, operand: value == operand,
+    "$ne": lambda value, operand: value != operand,
+    "$in": lambda value, operand: value in operand,
+    "$nin": lambda value, operand: value not in operand,
+    "$gt": lambda value, operand: value is not None and value > operand,
+    "$gte": lambda value, operand: value is not None and value >= operand,
+    "$lt": lambda value, operand: value is not None and value < operand,
+    "$lte": lambda value, operand: value is not None and value <= operand,
+}
+
+
+def _matches_where(metadata: dict, where: dict) -> bool:
+    """Évalue un filtre de métadonnées au format ChromaDB ($and, $or, $eq, $ne, $in, $nin, $gt, $gte, $lt, $lte).
+
+    Raises:
+        ValueError: Opérateur non supporté (un filtre ignoré renverrait tout).
+    """
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(_matches_where(metadata, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches_where(metadata, sub) for sub in condition):
+                return False
+        elif key.startswith("$"):
+            raise ValueError(f"Opérateur de filtre non supporté : {key}")
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, operand in condition.items():
+                compare = _COMPARISONS.get(op)
+                if compare is None:
+                    raise ValueError(f"Opérateur de filtre non supporté : {op}")
+                if not compare(value, operand):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
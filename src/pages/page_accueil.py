@@ -7,7 +7,8 @@ from pathlib import Path
 from datetime import datetime
 
 from src.utils.config import ROOT_DIR
-from src.utils.file_utils import ensure_dir, save_json, load_json, sanitize_filename
+from src.core.state_store import load_state_dict
+from src.utils.file_utils import ensure_dir, save_json, sanitize_filename
 from src.core.profile_manager import ProfileManager
 from src.core.orchestrator import ProjectState
 from src.utils.providers_registry import PROVIDERS_INFO, create_provider
@@ -129,7 +130,7 @@ def _render_existing_projects():
             state_path = project_dir / "state.json"
             if state_path.exists():
                 try:
-                    data = load_json(state_path)
+                    data = load_state_dict(project_dir)
                     projects.append({
                         "id": project_dir.name,
                         "name": data.get("name", project_dir.name),
@@ -168,10 +169,9 @@ def _load_project(project_id: str):
     la page Configuration avec un message explicatif.
     """
     project_dir = PROJECTS_DIR / project_id
-    state_path = project_dir / "state.json"
 
     try:
-        data = load_json(state_path)
+        data = load_state_dict(project_dir)
         state = ProjectState.from_dict(data)
         st.session_state.project_state = state
         st.session_state.current_project = project_id
@@ -5,12 +5,11 @@ from pathlib import Path
 
 from src.utils.config import ROOT_DIR
 from src.utils.file_utils import ensure_dir, save_json, sanitize_filename
-from src.utils.token_counter import count_tokens
 from src.core.corpus_acquirer import CorpusAcquirer, AcquisitionReport
-from src.core.text_extractor import extract, clear_cache
+from src.core.corpus_analyzer import CorpusAnalyzer
+from src.core.text_extractor import clear_cache
 from src.core.corpus_deduplicator import CorpusDeduplicator
 from src.core.cost_tracker import CostTracker
-from src.utils.content_validator import is_antibot_page
 
 
 PROJECTS_DIR = ROOT_DIR / "projects"
@@ -168,43 +167,27 @@ def _render_corpus_recap(corpus_dir: Path):
             force_files.add(f.name)
             st.session_state[f"_force_extract_{f.name}"] = False
 
-    # Analyse du corpus
-    documents_info = []
+    # Phase 6 (Perf) : analyse incrémentale et parallèle, reprise de
+    # corpus/analysis_index.json pour les fichiers inchangés
+    workers = st.session_state.project_state.config.get("corpus_analysis", {}).get("workers", "auto")
+    analyzer = CorpusAnalyzer(corpus_dir, workers=workers)
+    with st.spinner("Analyse du corpus..."):
+        analyses = analyzer.analyze(files, force=force_files)
     deduplicator = CorpusDeduplicator(corpus_dir)
-    extractions = []
 
-    with st.spinner("Analyse du corpus..."):
-        for f in files:
-            force = f.name in force_files
-            result = extract(f, force=force)
-            extractions.append(result)
-
-            tokens = count_tokens(result.text) if result.text else 0
-            dedup_entry = deduplicator.check_duplicate(result)
-
-            # Évaluation de la qualité du contenu
-            quality = "OK"
-            if result.text:
-                if is_antibot_page(result.text):
-                    quality = "Suspect"
-                elif len(result.text.strip()) < 200:
-                    quality = "Suspect"
-            elif not result.text:
-                quality = "Vide"
-
-            documents_info.append({
-                "Fichier": f.name,
-                "Pages": result.page_count,
-                "Tokens": tokens,
-                "Qualité": quality,
-                "Statut extraction": result.status,
-                "Méthode": result.extraction_method,
-                "Taille (Ko)": round(result.source_size_bytes / 1024, 1),
-                "Doublon": dedup_entry.status,
-            })
-
-            if dedup_entry.status == "unique":
-                deduplicator.register(dedup_entry)
+    documents_info = [
+        {
+            "Fichier": a.filename,
+            "Pages": a.page_count,
+            "Tokens": a.tokens,
+            "Qualité": a.quality,
+            "Statut extraction": a.status,
+            "Méthode": a.method,
+            "Taille (Ko)": round(a.size_bytes / 1024, 1),
+            "Doublon": a.dedup_status,
+        }
+        for a in analyses
+    ]
 
     # Tableau récapitulatif
     import pandas as pd
@@ -433,17 +416,16 @@ def _render_rag_inspection(project_dir: Path):
 
         col1, col2 = st.columns(2)
 
-        # Nombre de chunks ChromaDB
+        # Nombre de chunks indexés (ChromaDB ou index plat NumPy selon rag.vector_store)
         chroma_count = 0
         if has_chromadb:
             try:
-                import chromadb
-                client = chromadb.PersistentClient(path=str(chromadb_dir))
-                collection = client.get_or_create_collection("orchestria_corpus")
-                chroma_count = collection.count()
+                from src.core.rag_engine import RAGEngine
+                config = st.session_state.project_state.config if st.session_state.get("project_state") else {}
+                chroma_count = RAGEngine(persist_dir=chromadb_dir, config=config).indexed_count
             except Exception:
                 pass
-        col1.metric("Chunks ChromaDB", chroma_count)
+        col1.metric("Chunks indexés", chroma_count)
 
         # Nombre de chunks SQLite
         sqlite_count = 0
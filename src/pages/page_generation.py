@@ -1,7 +1,14 @@
-"""Page de génération séquentielle du contenu (Phase 2+3 : multi-pass, agentique, RAG, qualité, factcheck)."""
+"""Page de génération séquentielle du contenu (Phase 2+3 : multi-pass, agentique, RAG, qualité, factcheck).
+
+Phase 6 (Perf) : génération en flux — le texte s'affiche au fil de l'eau et
+le contenu partiel est sauvegardé périodiquement.
+Phase 6 (Perf) : la génération tourne en tâche de fond (generation_jobs) ;
+la page lit ses événements au lieu d'exécuter la boucle elle-même.
+"""
 
 import copy
 import logging
+import time
 
 import streamlit as st
 from pathlib import Path
@@ -13,13 +20,16 @@ from src.core.orchestrator import Orchestrator
 from src.core.corpus_extractor import CorpusExtractor
 from src.core.cost_tracker import CostTracker
 from src.core.checkpoint_manager import CheckpointManager, CheckpointConfig
+from src.core.generation_jobs import GenerationJobManager, read_event_tail
 from src.utils.providers_registry import PROVIDERS_INFO
-from src.utils.reference_cleaner import clean_source_references
 
 logger = logging.getLogger("orchestria")
 
 PROJECTS_DIR = ROOT_DIR / "projects"
 
+# Phase 6 (Perf) : intervalle de relecture des événements du job de génération
+JOB_POLL_SECONDS = 1.0
+
 
 def _get_model(config: dict, provider) -> str:
     """Récupère le modèle depuis la config avec warning si absent."""
@@ -50,10 +60,24 @@ def render():
         st.warning("Aucun plan défini. Rendez-vous sur la page Plan.")
         return
 
+    # Phase 6 (Perf) : génération en cours en tâche de fond — la session
+    # (éventuellement rechargée) reprend l'état tenu par le job
+    job = GenerationJobManager.get_instance().get(st.session_state.current_project)
+    if job is not None and job.is_running and job.orchestrator.state is not None:
+        st.session_state.project_state = job.orchestrator.state
+        st.session_state["orchestrator"] = job.orchestrator
+        st.subheader("Génération en cours")
+        st.caption("La génération continue en arrière-plan même si la page est fermée ou rafraîchie.")
+        _poll_job(job)
+        return
+
     if not provider or not provider.is_available():
         st.warning("Fournisseur IA non configuré. Rendez-vous sur la page Configuration.")
         return
 
+    if job is not None and job.status == "failed":
+        st.error(f"La dernière génération a échoué : {job.error}")
+
     # Bouton retour en haut
     if st.button("← Retour au plan"):
         st.session_state.current_page = "plan"
@@ -63,6 +87,11 @@ def render():
     st.markdown("---")
     _render_launch_and_progress(state, provider)
 
+    # Phase 6 (Perf) : sections interrompues pendant la génération en flux
+    if state.partial_sections:
+        st.markdown("---")
+        _render_partial_sections(state)
+
     # Sections reportées (génération conditionnelle)
     if state.deferred_sections:
         st.markdown("---")
@@ -213,6 +242,16 @@ def _render_launch_and_progress(state, provider):
         col1.metric("Tokens input réels", f"{cost_report.get('total_input_tokens', 0):,}")
         col2.metric("Tokens output réels", f"{cost_report.get('total_output_tokens', 0):,}")
         col3.metric("Coût réel", f"${cost_report.get('total_cost_usd', 0):.4f}")
+    if cost_report and cost_report.get("cache_hits", 0):
+        st.caption(
+            f"Cache de réponses : {cost_report['cache_hits']} appels évités, "
+            f"${cost_report.get('total_saved_usd', 0):.4f} économisés"
+        )
+    if cost_report and cost_report.get("total_cached_input_tokens", 0):
+        st.caption(
+            f"Cache de prompt fournisseur : {cost_report['total_cached_input_tokens']:,} "
+            f"tokens d'entrée servis depuis le cache"
+        )
 
     # Couverture RAG par section
     if state.rag_coverage:
@@ -241,7 +280,14 @@ def _render_launch_and_progress(state, provider):
             label = f"Lancer la génération ({num_passes} passes)"
 
         if st.button(label, type="primary", use_container_width=True):
-            _run_generation(state, provider, tracker)
+            _start_generation(state, provider, tracker)
+
+    # Phase 6 (Perf) : fin du journal d'événements persisté (survit aux redémarrages)
+    events = read_event_tail(PROJECTS_DIR / project_id, limit=30)
+    if events:
+        with st.expander("Événements de la dernière génération"):
+            for event in reversed(events):
+                st.text(_format_event(event.get("type", ""), event.get("data", {}), event.get("timestamp", "")))
 
     # Journal d'activité
     with st.expander("Journal d'activité"):
@@ -254,216 +300,109 @@ def _render_launch_and_progress(state, provider):
             st.info("Aucune activité enregistrée.")
 
 
-def _run_generation(state, provider, tracker):
-    """Exécute la génération séquentielle (avec support multi-pass et RAG)."""
+def _start_generation(state, provider, tracker):
+    """Phase 6 (Perf) : démarre la génération multi-passe en tâche de fond.
+
+    L'Orchestrator et son thread appartiennent au GenerationJobManager du
+    processus : un rafraîchissement du navigateur ne les interrompt pas.
+    """
     project_id = st.session_state.current_project
     project_dir = PROJECTS_DIR / project_id
 
+    # La relecture a lieu après la génération (_render_review) : pas de pause
+    # par section dans cette page
     cp_config = CheckpointConfig.from_dict(state.config.get("checkpoints", {}))
-    checkpoint_mgr = CheckpointManager(config=cp_config)
-    activity_log = st.session_state.activity_log
+    cp_config.after_prompt_generation = False
+    cp_config.after_generation = False
 
     orchestrator = Orchestrator(
         provider=provider,
         project_dir=project_dir,
-        checkpoint_manager=checkpoint_mgr,
+        checkpoint_manager=CheckpointManager(config=cp_config),
         cost_tracker=tracker,
-        activity_log=activity_log,
+        activity_log=st.session_state.activity_log,
         config=copy.deepcopy(state.config),
     )
     orchestrator.state = state
-
-    # Stocker l'orchestrateur en session (Bug #1 fix)
     st.session_state["orchestrator"] = orchestrator
 
-    # Extraction du corpus si nécessaire
-    if not state.corpus:
-        corpus_dir = project_dir / "corpus"
-        if corpus_dir.exists():
-            extractor = CorpusExtractor()
-            state.corpus = extractor.extract_corpus(corpus_dir)
-
-    # Initialiser le RAG et indexer le corpus
-    if state.corpus:
-        orchestrator._init_rag()
-        if orchestrator.rag_engine:
-            orchestrator._init_conditional_generator()
-            if orchestrator.rag_engine.indexed_count == 0:
-                with st.spinner("Indexation du corpus dans ChromaDB..."):
-                    count = orchestrator.index_corpus_rag()
-                    st.info(f"Corpus indexé : {count} blocs dans ChromaDB")
+    def extract_corpus():
+        if not state.corpus:
+            corpus_dir = project_dir / "corpus"
+            if corpus_dir.exists():
+                state.corpus = CorpusExtractor().extract_corpus(corpus_dir)
+
+    GenerationJobManager.get_instance().start(
+        project_id, orchestrator,
+        num_passes=state.config.get("number_of_passes", 1),
+        before_run=extract_corpus,
+    )
+    st.rerun()
 
-    # Initialize Phase 3 engines (glossary, persona, persistent instructions,
-    # citations, etc.) BEFORE the generation loop so that the PromptEngine
-    # already has Phase 3 parameters when building prompts for the first section.
-    orchestrator._ensure_phase3_engine()
 
-    num_passes = state.config.get("number_of_passes", 1)
+def _render_job_progress(job):
+    """Phase 6 (Perf) : suivi d'un job en cours, relu toutes les JOB_POLL_SECONDS."""
+    events = job.bus.since(0)
+    finished = [e for e in events if e.type == "section_finished"]
+    failed = [e for e in events if e.type == "section_failed"]
+    cost = next((e.data["cost_usd"] for e in reversed(events) if "cost_usd" in e.data), 0.0)
 
-    progress_bar = st.progress(0, text="Démarrage de la génération...")
-    status_area = st.empty()
-    log_area = st.empty()
+    st.progress(min(job.progress, 1.0), text=job.message or "Démarrage de la génération...")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Sections terminées", len(finished))
+    col2.metric("En échec", len(failed))
+    col3.metric("Tokens output", f"{sum(e.data.get('output_tokens', 0) for e in finished):,}")
+    col4.metric("Coût", f"${cost:.4f}")
+
+    for sid, text in list(job.live_text.items()):
+        st.markdown(f"**{sid}** — génération en cours")
+        st.markdown(text[-3000:] + " ▌")
+
+    with st.expander("Événements", expanded=False):
+        for event in reversed(events[-15:]):
+            st.text(_format_event(event.type, event.data, event.timestamp))
+
+
+def _format_event(event_type: str, data: dict, timestamp: str) -> str:
+    label = data.get("section_id") or data.get("message") or data.get("error") or ""
+    if event_type == "section_finished":
+        label += f" ({data.get('output_tokens', 0)} tokens, ${data.get('cost_usd', 0):.4f})"
+    elif event_type == "section_failed":
+        label += f" : {data.get('error', '')}"
+    return f"[{timestamp[11:19]}] {event_type} {label}"
+
+
+def _poll_job(job):
+    """Rafraîchit le suivi du job sans bloquer l'interface, puis la page à la fin."""
+    fragment = getattr(st, "fragment", None)
+    if fragment is None:
+        # Streamlit < 1.37 : relecture complète de la page
+        _render_job_progress(job)
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+        return
 
-    plan = state.plan
+    @fragment(run_every=JOB_POLL_SECONDS)
+    def progress_fragment():
+        if not job.is_running:
+            st.rerun()
+        _render_job_progress(job)
 
-    for pass_num in range(1, num_passes + 1):
-        state.current_pass = pass_num
-        is_refinement = pass_num > 1
+    progress_fragment()
 
-        if is_refinement:
-            status_area.info(f"**Passe de raffinement {pass_num}/{num_passes}**")
-            sections_to_process = list(plan.sections)
-        else:
-            sections_to_process = [
-                s for s in plan.sections
-                if s.status != "generated" and s.id not in state.deferred_sections
-            ]
-
-        total = len(sections_to_process)
-
-        for i, section in enumerate(sections_to_process):
-            progress_bar.progress(i / max(total, 1), text=f"[Passe {pass_num}] {section.id}: {section.title}")
-            task = "Raffinement" if is_refinement else "Génération"
-            status_area.info(f"{task} de **{section.id} {section.title}**...")
-
-            corpus_chunks = []
-            extra_instruction = ""
-
-            if orchestrator.rag_engine and orchestrator.rag_engine.indexed_count > 0:
-                rag_result = orchestrator.rag_engine.search_for_section(
-                    section.id, section.title, section.description or ""
-                )
-                # Pass RAG result dicts directly — the prompt engine's
-                # _get_chunk_attr already handles both dicts and objects.
-                corpus_chunks = rag_result.chunks
-
-                if orchestrator.conditional_generator and not is_refinement:
-                    assessment = orchestrator.conditional_generator.assess_coverage(rag_result)
-                    state.rag_coverage[section.id] = assessment.to_dict()
-
-                    if not assessment.should_generate:
-                        section.status = "deferred"
-                        if section.id not in state.deferred_sections:
-                            state.deferred_sections.append(section.id)
-                        activity_log.warning(assessment.message, section=section.id)
-                        save_json(PROJECTS_DIR / project_id / "state.json", state.to_dict())
-                        continue
-
-                    if assessment.extra_prompt_instruction:
-                        extra_instruction = assessment.extra_prompt_instruction
-            elif state.corpus:
-                corpus_chunks = state.corpus.get_chunks_for_section(section.title)
-
-            if is_refinement:
-                prompt = orchestrator.prompt_engine.build_refinement_prompt(
-                    section=section, plan=plan,
-                    draft_content=state.generated_sections.get(section.id, ""),
-                    corpus_chunks=corpus_chunks,
-                    previous_summaries=state.section_summaries,
-                    target_pages=state.config.get("target_pages"),
-                    extra_instruction=extra_instruction,
-                )
-            else:
-                prompt = orchestrator.prompt_engine.build_section_prompt(
-                    section=section, plan=plan,
-                    corpus_chunks=corpus_chunks,
-                    previous_summaries=state.section_summaries,
-                    target_pages=state.config.get("target_pages"),
-                    extra_instruction=extra_instruction,
-                )
-
-            system_prompt = orchestrator.prompt_engine.build_system_prompt(
-                has_corpus=bool(corpus_chunks),
-                section_id=section.id,
-            )
 
-            try:
-                response = provider.generate(
-                    prompt=prompt, system_prompt=system_prompt,
-                    model=_get_model(state.config, provider),
-                    temperature=state.config.get("temperature", 0.7),
-                    max_tokens=state.config.get("max_tokens", 4096),
-                )
-
-                tracker.record(
-                    section_id=section.id,
-                    model=_get_model(state.config, provider),
-                    provider=provider.name,
-                    input_tokens=response.input_tokens,
-                    output_tokens=response.output_tokens,
-                    task_type="refinement" if is_refinement else "generation",
-                )
-
-                # Post-traitement : nettoyage des références [Source N] résiduelles
-                cleaned_content = clean_source_references(response.content)
-                state.generated_sections[section.id] = cleaned_content
-                section.status = "generated"
-                section.generated_content = cleaned_content
-
-                if not is_refinement:
-                    # Générer un résumé par l'IA pour un meilleur contexte inter-sections
-                    try:
-                        summary_prompt = orchestrator.prompt_engine.build_summary_prompt(
-                            section.title, response.content
-                        )
-                        summary_response = provider.generate(
-                            prompt=summary_prompt,
-                            system_prompt=orchestrator.prompt_engine.build_system_prompt(has_corpus=False),
-                            model=_get_model(state.config, provider),
-                            temperature=0.3,
-                            max_tokens=200,
-                        )
-                        summary = summary_response.content.strip()
-                        tracker.record(
-                            section_id=section.id,
-                            model=_get_model(state.config, provider),
-                            provider=provider.name,
-                            input_tokens=summary_response.input_tokens,
-                            output_tokens=summary_response.output_tokens,
-                            task_type="summary",
-                        )
-                    except Exception:
-                        summary = response.content[:200] + "..."
-                    state.section_summaries.append(f"[{section.id}] {section.title}: {summary}")
-
-                task_label = "raffinée" if is_refinement else "générée"
-                activity_log.success(
-                    f"Section {section.id} {task_label} ({response.output_tokens} tokens)",
-                    section=section.id,
-                )
-
-                # Phase 3: run post-generation evaluation (quality + factcheck)
-                try:
-                    orchestrator._init_phase3_engines()
-                    corrected = orchestrator._run_post_generation_evaluation(
-                        section, cleaned_content, plan, corpus_chunks,
-                        is_refinement=is_refinement,
-                    )
-                    if corrected:
-                        state.generated_sections[section.id] = corrected
-                        section.generated_content = corrected
-                except Exception as eval_err:
-                    logger.warning(f"Phase 3 evaluation failed for {section.id}: {eval_err}")
-
-            except Exception as e:
-                section.status = "failed"
-                activity_log.error(f"Erreur section {section.id}: {e}", section=section.id)
-                status_area.error(f"Erreur sur la section {section.id}: {e}")
-
-            state.cost_report = tracker.report.to_dict()
-            save_json(PROJECTS_DIR / project_id / "state.json", state.to_dict())
-
-            recent_logs = activity_log.get_recent(5)
-            log_text = "\n".join(f"[{l['level'].upper()}] {l['message']}" for l in recent_logs)
-            log_area.code(log_text, language=None)
-
-        progress_bar.progress(1.0, text=f"Passe {pass_num}/{num_passes} terminée")
-
-    progress_bar.progress(1.0, text="Génération terminée !")
-    status_area.success(f"Toutes les passes terminées. Coût total : ${tracker.report.total_cost_usd:.4f}")
-
-    state.current_step = "review"
-    save_json(PROJECTS_DIR / project_id / "state.json", state.to_dict())
+def _render_partial_sections(state):
+    """Phase 6 (Perf) : affiche le texte partiel des sections interrompues."""
+    st.subheader("Sections interrompues")
+    st.warning(
+        f"{len(state.partial_sections)} section(s) interrompue(s) en cours de génération. "
+        "Le texte reçu est conservé ; relancez la génération pour les compléter."
+    )
+    for sid, text in state.partial_sections.items():
+        section = state.plan.get_section(sid) if state.plan else None
+        title = section.title if section else sid
+        with st.expander(f"{sid} {title} — texte partiel ({len(text)} caractères)"):
+            st.markdown(text)
 
 
 def _render_deferred_sections(state):
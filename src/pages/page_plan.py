@@ -147,7 +147,7 @@ def _render_generate_plan(state):
             if state.corpus:
                 orchestrator._init_rag()
                 if orchestrator.rag_engine:
-                    if orchestrator.rag_engine.indexed_count == 0:
+                    if orchestrator.needs_corpus_indexing():
                         with st.spinner("Indexation du corpus..."):
                             orchestrator.index_corpus_rag()
 
@@ -1,19 +1,30 @@
 """Fournisseur Anthropic (Claude) pour Orchestr'IA.
 
 Phase 2.5 : ajout du support batch via Message Batches API.
+Phase 6 (Perf) : agenerate() natif via AsyncAnthropic.
+Phase 6 (Perf) : cache de prompt — le préfixe stable (avant
+           PROMPT_CACHE_BOUNDARY) du prompt système et du prompt utilisateur
+           est marqué ``cache_control`` ; l'usage lu/écrit dans le cache est
+           reporté dans l'AIResponse.
+Phase 6 (Perf) : generate_stream() natif via ``client.messages.stream``.
 """
 
+import asyncio
 import os
 import time
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 from src.providers.base import (
-    AIResponse, BaseProvider, BatchRequest, BatchStatus, BatchStatusEnum, BatchError,
+    AIResponse, BaseProvider, BatchRequest, BatchStatus, BatchStatusEnum, BatchError, StreamChunk,
+    split_cache_boundary, usage_count,
 )
+from src.utils.rate_limiter import backoff_delay
 
 logger = logging.getLogger("orchestria")
 
+_CACHE_CONTROL = {"type": "ephemeral"}
+
 
 class AnthropicProvider(BaseProvider):
     """Fournisseur Anthropic (Claude) avec support batch."""
@@ -50,53 +61,138 @@ class AnthropicProvider(BaseProvider):
     ) -> AIResponse:
         """Génère du contenu via l'API Anthropic avec retry automatique."""
         model = model or self.get_default_model()
+        kwargs = self._request_kwargs(prompt, system_prompt, model, temperature, max_tokens)
 
         last_error = None
         for attempt in range(self._max_retries + 1):
             try:
-                client = self._get_client()
-
-                kwargs = {
-                    "model": model,
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                    "messages": [{"role": "user", "content": prompt}],
-                }
-                if system_prompt:
-                    kwargs["system"] = system_prompt
-
-                response = client.messages.create(**kwargs)
-
-                content = ""
-                for block in response.content:
-                    if block.type == "text":
-                        content += block.text
-
-                input_tokens = response.usage.input_tokens if response.usage else 0
-                output_tokens = response.usage.output_tokens if response.usage else 0
-
-                return AIResponse(
-                    content=content,
-                    model=model,
-                    provider=self.name,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    total_tokens=input_tokens + output_tokens,
-                    finish_reason=response.stop_reason or "",
-                    raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
-                )
+                with self._rate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    client = self._get_client()
+                    response = client.messages.create(**kwargs)
+                    return lease.settle(self._to_response(response, model))
+            except Exception as e:
+                last_error = e
+                if attempt < self._max_retries:
+                    time.sleep(self._retry_delay(attempt, e))
+
+        raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AIResponse:
+        """Phase 6 (Perf) : génération asynchrone via AsyncAnthropic."""
+        model = model or self.get_default_model()
+        kwargs = self._request_kwargs(prompt, system_prompt, model, temperature, max_tokens)
+
+        last_error = None
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._arate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    client = self._get_async_client()
+                    response = await client.messages.create(**kwargs)
+                    return lease.settle(self._to_response(response, model))
             except Exception as e:
                 last_error = e
                 if attempt < self._max_retries:
-                    delay = self._base_delay * (2 ** attempt)
-                    logger.warning(
-                        f"Erreur API Anthropic (tentative {attempt + 1}/{self._max_retries + 1}): {e}. "
-                        f"Retry dans {delay}s..."
-                    )
-                    time.sleep(delay)
+                    await asyncio.sleep(self._retry_delay(attempt, e))
 
         raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[StreamChunk]:
+        """Phase 6 (Perf) : génération en flux via ``client.messages.stream``."""
+        model = model or self.get_default_model()
+        kwargs = self._request_kwargs(prompt, system_prompt, model, temperature, max_tokens)
+
+        def stream_once():
+            with self._get_client().messages.stream(**kwargs) as stream:
+                for text in stream.text_stream:
+                    yield text
+                message = stream.get_final_message()
+            return self._to_response(message, model)
+
+        return self._stream_with_retry(model, prompt, system_prompt, max_tokens, stream_once)
+
+    def _get_async_client(self):
+        def factory():
+            from anthropic import AsyncAnthropic
+            return AsyncAnthropic(api_key=self._api_key)
+        return self._loop_bound_client(factory)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        delay = backoff_delay(error, attempt, self._base_delay)
+        logger.warning(
+            f"Erreur API Anthropic (tentative {attempt + 1}/{self._max_retries + 1}): {error}. "
+            f"Retry dans {delay}s..."
+        )
+        return delay
+
+    @staticmethod
+    def _request_kwargs(
+        prompt: str, system_prompt: Optional[str], model: str, temperature: float, max_tokens: int,
+    ) -> dict:
+        kwargs = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": AnthropicProvider._cacheable_blocks(prompt)}],
+        }
+        if system_prompt:
+            kwargs["system"] = AnthropicProvider._cacheable_blocks(system_prompt)
+        return kwargs
+
+    @staticmethod
+    def _cacheable_blocks(text: str):
+        """Convertit un texte en blocs avec point de cache sur le préfixe stable.
+
+        Sans frontière de cache, le texte est transmis tel quel.
+        """
+        prefix, suffix = split_cache_boundary(text)
+        if not prefix:
+            return suffix
+        blocks = [{"type": "text", "text": prefix, "cache_control": dict(_CACHE_CONTROL)}]
+        if suffix:
+            blocks.append({"type": "text", "text": suffix})
+        return blocks
+
+    def _to_response(self, response, model: str) -> AIResponse:
+        content = ""
+        for block in response.content:
+            if block.type == "text":
+                content += block.text
+
+        usage = response.usage
+        input_tokens = usage.input_tokens if usage else 0
+        output_tokens = usage.output_tokens if usage else 0
+        # input_tokens exclut les tokens lus/écrits dans le cache de prompt
+        cache_read = usage_count(usage, "cache_read_input_tokens")
+        cache_write = usage_count(usage, "cache_creation_input_tokens")
+        input_tokens += cache_read + cache_write
+
+        return AIResponse(
+            content=content,
+            model=model,
+            provider=self.name,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            cached_input_tokens=cache_read,
+            cache_write_tokens=cache_write,
+            finish_reason=response.stop_reason or "",
+            raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
+        )
+
     def is_available(self) -> bool:
         """Vérifie si la clé API est configurée."""
         return bool(self._api_key and self._api_key != "sk-ant-REDACTED")
@@ -127,10 +223,10 @@ class AnthropicProvider(BaseProvider):
                 "model": model,
                 "max_tokens": req.max_tokens,
                 "temperature": req.temperature,
-                "messages": [{"role": "user", "content": req.prompt}],
+                "messages": [{"role": "user", "content": self._cacheable_blocks(req.prompt)}],
             }
             if req.system_prompt:
-                params["system"] = req.system_prompt
+                params["system"] = self._cacheable_blocks(req.system_prompt)
 
             batch_requests.append({
                 "custom_id": req.custom_id,
@@ -1,12 +1,58 @@
 """Interface commune pour les fournisseurs d'IA.
 
 Phase 2.5 : ajout du support batch (soumission, polling, récupération).
+Phase 6 (Perf) : API asynchrone native (agenerate) pour multiplexer des
+           centaines de requêtes sur une seule boucle asyncio.
+Phase 6 (Perf) : chaque tentative d'appel passe par le limiteur de débit
+           partagé (src.utils.rate_limiter).
+Phase 6 (Perf) : cache de prompt côté fournisseur — PROMPT_CACHE_BOUNDARY
+           sépare le préfixe stable d'un prompt de sa partie variable.
+Phase 6 (Perf) : génération en flux (generate_stream) — fragments de texte
+           puis réponse finale avec l'usage.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Iterator, Optional
+
+from src.utils.rate_limiter import get_rate_limiter, is_rate_limit_error
+from src.utils.token_counter import estimate_tokens
+
+# Phase 6 (Perf) : frontière entre le préfixe stable (mis en cache par le
+# fournisseur) et la suite variable d'un prompt. Anthropic y pose un point
+# de cache explicite ; les autres fournisseurs la retirent et s'appuient sur
+# leur cache de préfixe automatique.
+PROMPT_CACHE_BOUNDARY = "\x00cache_boundary\x00"
+
+
+def split_cache_boundary(text: Optional[str]) -> tuple[str, str]:
+    """Sépare un prompt en (préfixe stable, suite variable).
+
+    Sans frontière, tout le texte est considéré comme variable.
+    """
+    if not text:
+        return "", ""
+    prefix, sep, suffix = text.partition(PROMPT_CACHE_BOUNDARY)
+    if not sep:
+        return "", text
+    return prefix, suffix.replace(PROMPT_CACHE_BOUNDARY, "")
+
+
+def strip_cache_boundary(text: Optional[str]) -> Optional[str]:
+    """Retire la frontière de cache (fournisseurs sans point de cache explicite, affichage)."""
+    if not text:
+        return text
+    return text.replace(PROMPT_CACHE_BOUNDARY, "")
+
+
+def usage_count(usage, attr: str) -> int:
+    """Compteur d'usage optionnel d'une réponse de SDK (0 si absent)."""
+    value = getattr(usage, attr, 0) if usage is not None else 0
+    return value if isinstance(value, int) else 0
 
 
 @dataclass
@@ -20,6 +66,40 @@ class AIResponse:
     total_tokens: int = 0
     finish_reason: str = ""
     raw_response: Optional[dict] = field(default=None, repr=False)
+    cached: bool = False  # Phase 6 (Perf) : réponse servie par le cache de réponses
+    # Phase 6 (Perf) : tokens d'entrée lus depuis / écrits dans le cache de
+    # prompt du fournisseur (inclus dans input_tokens)
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
+@dataclass
+class StreamChunk:
+    """Fragment d'une génération en flux.
+
+    Les fragments intermédiaires portent ``text`` ; le dernier porte la
+    réponse complète (contenu intégral et usage) dans ``response``.
+    """
+    text: str = ""
+    response: Optional[AIResponse] = None
+
+
+def consume_stream(chunks: Iterator[StreamChunk], on_text: Optional[Callable[[str], None]] = None) -> AIResponse:
+    """Consomme un flux et retourne la réponse finale.
+
+    Args:
+        chunks: Flux produit par ``generate_stream``.
+        on_text: Appelé avec le texte cumulé après chaque fragment.
+    """
+    text = ""
+    for chunk in chunks:
+        if chunk.text:
+            text += chunk.text
+            if on_text is not None:
+                on_text(text)
+        if chunk.response is not None:
+            return chunk.response
+    raise RuntimeError("Flux interrompu sans réponse finale")
 
 
 @dataclass
@@ -83,6 +163,137 @@ class BaseProvider(ABC):
         """Génère du contenu à partir d'un prompt."""
         ...
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AIResponse:
+        """Version asynchrone de generate().
+
+        Implémentation par défaut : exécute generate() dans un thread pour les
+        fournisseurs sans client asynchrone. Les fournisseurs natifs la
+        surchargent avec le client async de leur SDK.
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[StreamChunk]:
+        """Phase 6 (Perf) : génère en flux (fragments de texte puis réponse finale).
+
+        Implémentation par défaut : un seul fragment contenant la réponse
+        complète de generate(). Les fournisseurs natifs la surchargent avec
+        l'API de streaming de leur SDK.
+        """
+        response = self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        yield StreamChunk(text=response.content, response=response)
+
+    def _stream_with_retry(
+        self, model: str, prompt: str, system_prompt: Optional[str], max_tokens: int, stream_once,
+    ) -> Iterator[StreamChunk]:
+        """Boucle de retry commune aux implémentations natives de generate_stream().
+
+        ``stream_once()`` est un générateur qui produit les fragments de texte
+        et retourne l'AIResponse finale. Une tentative n'est relancée que si
+        aucun fragment n'a encore été transmis ; au-delà, l'erreur remonte.
+        Nécessite ``_max_retries`` et ``_retry_delay()`` (fournisseurs natifs).
+        """
+        last_error = None
+        for attempt in range(self._max_retries + 1):
+            started = False
+            try:
+                with self._rate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    deltas = stream_once()
+                    while True:
+                        try:
+                            text = next(deltas)
+                        except StopIteration as stop:
+                            response = lease.settle(stop.value)
+                            break
+                        started = True
+                        yield StreamChunk(text=text)
+            except Exception as e:
+                if started:
+                    raise RuntimeError(f"Flux interrompu : {e}") from e
+                last_error = e
+                if attempt < self._max_retries:
+                    time.sleep(self._retry_delay(attempt, e))
+                continue
+            yield StreamChunk(response=response)
+            return
+
+        raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
+
+    def _loop_bound_client(self, factory):
+        """Retourne un client async lié à la boucle asyncio courante.
+
+        Les clients HTTP async ne peuvent pas être partagés entre boucles
+        (asyncio.run() successifs) : le client est recréé si la boucle change.
+        """
+        loop = asyncio.get_running_loop()
+        cached = getattr(self, "_async_client_entry", None)
+        if cached is None or cached[0] is not loop:
+            cached = (loop, factory())
+            self._async_client_entry = cached
+        return cached[1]
+
+    def _estimate_request_tokens(self, prompt: str, system_prompt: Optional[str], max_tokens: int) -> int:
+        return estimate_tokens(prompt) + estimate_tokens(system_prompt or "") + max_tokens
+
+    @contextmanager
+    def _rate_limited(self, model: str, prompt: str, system_prompt: Optional[str], max_tokens: int):
+        """Réserve le débit d'une tentative d'appel (bloquant).
+
+        Le bloc appelle ``lease.settle(response)`` en cas de succès ; sinon
+        les tokens réservés sont restitués. Un 429 ralentit tous les
+        appelants du même modèle.
+        """
+        limiter = get_rate_limiter()
+        lease = limiter.acquire(self.name, model, self._estimate_request_tokens(prompt, system_prompt, max_tokens))
+        try:
+            yield lease
+        except Exception as e:
+            if is_rate_limit_error(e):
+                limiter.penalize(self.name, model)
+            raise
+        finally:
+            lease.release()
+
+    @asynccontextmanager
+    async def _arate_limited(self, model: str, prompt: str, system_prompt: Optional[str], max_tokens: int):
+        """Version asynchrone de _rate_limited()."""
+        limiter = get_rate_limiter()
+        lease = await limiter.aacquire(self.name, model, self._estimate_request_tokens(prompt, system_prompt, max_tokens))
+        try:
+            yield lease
+        except Exception as e:
+            if is_rate_limit_error(e):
+                limiter.penalize(self.name, model)
+            raise
+        finally:
+            lease.release()
+
     @abstractmethod
     def is_available(self) -> bool:
         """Vérifie si le fournisseur est configuré et disponible."""
@@ -1,11 +1,19 @@
-"""Fournisseur Google Gemini pour Orchestr'IA."""
+"""Fournisseur Google Gemini pour Orchestr'IA.
 
+Phase 6 (Perf) : agenerate() natif via le client asynchrone ``client.aio``.
+Phase 6 (Perf) : cache implicite de Gemini — la frontière de cache est
+           retirée et les tokens servis depuis le cache sont reportés.
+Phase 6 (Perf) : generate_stream() natif via ``generate_content_stream``.
+"""
+
+import asyncio
 import os
 import time
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
-from src.providers.base import AIResponse, BaseProvider
+from src.providers.base import AIResponse, BaseProvider, StreamChunk, strip_cache_boundary, usage_count
+from src.utils.rate_limiter import backoff_delay
 
 logger = logging.getLogger("orchestria")
 
@@ -43,62 +51,133 @@ class GeminiProvider(BaseProvider):
         max_tokens: int = 4096,
     ) -> AIResponse:
         """Génère du contenu via l'API Google Gemini avec retry automatique."""
-        from google.genai import types
-
         model = model or self.get_default_model()
 
         last_error = None
         for attempt in range(self._max_retries + 1):
             try:
-                client = self._get_client()
-
-                config = types.GenerateContentConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                )
-                if system_prompt:
-                    config.system_instruction = system_prompt
-
-                response = client.models.generate_content(
-                    model=model,
-                    contents=prompt,
-                    config=config,
-                )
-
-                content = response.text or ""
-
-                # Extraire les tokens depuis usage_metadata
-                input_tokens = 0
-                output_tokens = 0
-                if response.usage_metadata:
-                    input_tokens = getattr(response.usage_metadata, "prompt_token_count", 0) or 0
-                    output_tokens = getattr(response.usage_metadata, "candidates_token_count", 0) or 0
-
-                finish_reason = ""
-                if response.candidates and response.candidates[0].finish_reason:
-                    finish_reason = str(response.candidates[0].finish_reason)
-
-                return AIResponse(
-                    content=content,
-                    model=model,
-                    provider=self.name,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    total_tokens=input_tokens + output_tokens,
-                    finish_reason=finish_reason,
-                )
+                with self._rate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    client = self._get_client()
+                    response = client.models.generate_content(
+                        model=model,
+                        contents=strip_cache_boundary(prompt),
+                        config=self._build_config(system_prompt, temperature, max_tokens),
+                    )
+                    return lease.settle(self._to_response(response, model))
             except Exception as e:
                 last_error = e
                 if attempt < self._max_retries:
-                    delay = self._base_delay * (2 ** attempt)
-                    logger.warning(
-                        f"Erreur API Gemini (tentative {attempt + 1}/{self._max_retries + 1}): {e}. "
-                        f"Retry dans {delay}s..."
+                    time.sleep(self._retry_delay(attempt, e))
+
+        raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AIResponse:
+        """Phase 6 (Perf) : génération asynchrone via le client ``aio`` de google-genai."""
+        model = model or self.get_default_model()
+
+        last_error = None
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._arate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    client = self._get_client()
+                    response = await client.aio.models.generate_content(
+                        model=model,
+                        contents=strip_cache_boundary(prompt),
+                        config=self._build_config(system_prompt, temperature, max_tokens),
                     )
-                    time.sleep(delay)
+                    return lease.settle(self._to_response(response, model))
+            except Exception as e:
+                last_error = e
+                if attempt < self._max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, e))
 
         raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
 
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[StreamChunk]:
+        """Phase 6 (Perf) : génération en flux via ``generate_content_stream``."""
+        model = model or self.get_default_model()
+
+        def stream_once():
+            stream = self._get_client().models.generate_content_stream(
+                model=model,
+                contents=strip_cache_boundary(prompt),
+                config=self._build_config(system_prompt, temperature, max_tokens),
+            )
+            parts = []
+            last = None
+            for chunk in stream:
+                last = chunk
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
+            if last is None:
+                return AIResponse(content="", model=model, provider=self.name)
+            # L'usage et la raison d'arrêt figurent sur le dernier fragment
+            return self._to_response(last, model, content="".join(parts))
+
+        return self._stream_with_retry(model, prompt, system_prompt, max_tokens, stream_once)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        delay = backoff_delay(error, attempt, self._base_delay)
+        logger.warning(
+            f"Erreur API Gemini (tentative {attempt + 1}/{self._max_retries + 1}): {error}. "
+            f"Retry dans {delay}s..."
+        )
+        return delay
+
+    @staticmethod
+    def _build_config(system_prompt: Optional[str], temperature: float, max_tokens: int):
+        from google.genai import types
+
+        config = types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+        if system_prompt:
+            config.system_instruction = strip_cache_boundary(system_prompt)
+        return config
+
+    def _to_response(self, response, model: str, content: Optional[str] = None) -> AIResponse:
+        if content is None:
+            content = response.text or ""
+
+        # Extraire les tokens depuis usage_metadata
+        input_tokens = 0
+        output_tokens = 0
+        cached_input_tokens = usage_count(response.usage_metadata, "cached_content_token_count")
+        if response.usage_metadata:
+            input_tokens = getattr(response.usage_metadata, "prompt_token_count", 0) or 0
+            output_tokens = getattr(response.usage_metadata, "candidates_token_count", 0) or 0
+
+        finish_reason = ""
+        if response.candidates and response.candidates[0].finish_reason:
+            finish_reason = str(response.candidates[0].finish_reason)
+
+        return AIResponse(
+            content=content,
+            model=model,
+            provider=self.name,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            cached_input_tokens=cached_input_tokens,
+            finish_reason=finish_reason,
+        )
+
     def is_available(self) -> bool:
         """Vérifie si la clé API est configurée."""
         return bool(self._api_key and self._api_key != "your-google-api-key-here")
@@ -1,18 +1,27 @@
 """Fournisseur OpenAI pour Orchestr'IA.
 
 Phase 2.5 : ajout du support batch via /v1/batches.
+Phase 6 (Perf) : agenerate() natif via AsyncOpenAI.
+Phase 6 (Perf) : cache de prompt automatique d'OpenAI — la frontière de
+           cache est retirée (le préfixe stable est déjà en tête du prompt)
+           et les tokens servis depuis le cache sont reportés.
+Phase 6 (Perf) : generate_stream() natif (``stream=True`` avec l'usage en
+           dernier fragment).
 """
 
+import asyncio
 import json
 import os
 import tempfile
 import time
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 from src.providers.base import (
-    AIResponse, BaseProvider, BatchRequest, BatchStatus, BatchStatusEnum, BatchError,
+    AIResponse, BaseProvider, BatchRequest, BatchStatus, BatchStatusEnum, BatchError, StreamChunk,
+    strip_cache_boundary, usage_count,
 )
+from src.utils.rate_limiter import backoff_delay
 
 logger = logging.getLogger("orchestria")
 
@@ -48,42 +57,140 @@ class OpenAIProvider(BaseProvider):
     ) -> AIResponse:
         """Génère du contenu via l'API OpenAI avec retry automatique."""
         model = model or self.get_default_model()
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt)
 
         last_error = None
         for attempt in range(self._max_retries + 1):
             try:
-                client = self._get_client()
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
-                choice = response.choices[0]
-                usage = response.usage
-                return AIResponse(
-                    content=choice.message.content or "",
-                    model=model,
-                    provider=self.name,
-                    input_tokens=usage.prompt_tokens if usage else 0,
-                    output_tokens=usage.completion_tokens if usage else 0,
-                    total_tokens=usage.total_tokens if usage else 0,
-                    finish_reason=choice.finish_reason or "",
-                    raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
-                )
+                with self._rate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    client = self._get_client()
+                    response = client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    return lease.settle(self._to_response(response, model))
             except Exception as e:
                 last_error = e
                 if attempt < self._max_retries:
-                    delay = self._base_delay * (2 ** attempt)
-                    logger.warning(f"Erreur API OpenAI (tentative {attempt + 1}/{self._max_retries + 1}): {e}. Retry dans {delay}s...")
-                    time.sleep(delay)
+                    time.sleep(self._retry_delay(attempt, e))
 
         raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> AIResponse:
+        """Phase 6 (Perf) : génération asynchrone via AsyncOpenAI."""
+        model = model or self.get_default_model()
+        messages = self._build_messages(prompt, system_prompt)
+
+        last_error = None
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._arate_limited(model, prompt, system_prompt, max_tokens) as lease:
+                    client = self._get_async_client()
+                    response = await client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    return lease.settle(self._to_response(response, model))
+            except Exception as e:
+                last_error = e
+                if attempt < self._max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, e))
+
+        raise RuntimeError(f"Échec après {self._max_retries + 1} tentatives: {last_error}")
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+    ) -> Iterator[StreamChunk]:
+        """Phase 6 (Perf) : génération en flux (``stream=True``)."""
+        model = model or self.get_default_model()
+        messages = self._build_messages(prompt, system_prompt)
+
+        def stream_once():
+            stream = self._get_client().chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            parts = []
+            finish_reason = ""
+            usage = None
+            for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+                    yield choice.delta.content
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            return AIResponse(
+                content="".join(parts),
+                model=model,
+                provider=self.name,
+                input_tokens=usage.prompt_tokens if usage else 0,
+                output_tokens=usage.completion_tokens if usage else 0,
+                total_tokens=usage.total_tokens if usage else 0,
+                cached_input_tokens=usage_count(getattr(usage, "prompt_tokens_details", None), "cached_tokens"),
+                finish_reason=finish_reason,
+            )
+
+        return self._stream_with_retry(model, prompt, system_prompt, max_tokens, stream_once)
+
+    def _get_async_client(self):
+        def factory():
+            from openai import AsyncOpenAI
+            return AsyncOpenAI(api_key=self._api_key)
+        return self._loop_bound_client(factory)
+
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        delay = backoff_delay(error, attempt, self._base_delay)
+        logger.warning(f"Erreur API OpenAI (tentative {attempt + 1}/{self._max_retries + 1}): {error}. Retry dans {delay}s...")
+        return delay
+
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str]) -> list[dict]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": strip_cache_boundary(system_prompt)})
+        messages.append({"role": "user", "content": strip_cache_boundary(prompt)})
+        return messages
+
+    def _to_response(self, response, model: str) -> AIResponse:
+        choice = response.choices[0]
+        usage = response.usage
+        return AIResponse(
+            content=choice.message.content or "",
+            model=model,
+            provider=self.name,
+            input_tokens=usage.prompt_tokens if usage else 0,
+            output_tokens=usage.completion_tokens if usage else 0,
+            total_tokens=usage.total_tokens if usage else 0,
+            cached_input_tokens=usage_count(getattr(usage, "prompt_tokens_details", None), "cached_tokens"),
+            finish_reason=choice.finish_reason or "",
+            raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
+        )
+
     def is_available(self) -> bool:
         """Vérifie si la clé API est configurée."""
         return bool(self._api_key and self._api_key != "sk-your-openai-api-key-here")
@@ -115,10 +222,7 @@ class OpenAIProvider(BaseProvider):
         jsonl_lines = []
         for req in requests:
             model = req.model or self.get_default_model()
-            messages = []
-            if req.system_prompt:
-                messages.append({"role": "system", "content": req.system_prompt})
-            messages.append({"role": "user", "content": req.prompt})
+            messages = self._build_messages(req.prompt, req.system_prompt)
 
             jsonl_lines.append(json.dumps({
                 "custom_id": req.custom_id,
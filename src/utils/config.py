@@ -41,6 +41,12 @@ def load_model_pricing() -> dict:
     return load_yaml(CONFIG_DIR / "model_pricing.yaml")
 
 
+def load_rate_limits() -> dict:
+    """Charge les limites de débit (RPM/TPM) des fournisseurs."""
+    path = CONFIG_DIR / "rate_limits.yaml"
+    return load_yaml(path) if path.exists() else {}
+
+
 def get_nested(data: dict, key_path: str, default: Any = None) -> Any:
     """Accède à une valeur imbriquée via un chemin pointé (ex: 'generation.temperature')."""
     keys = key_path.split(".")
@@ -0,0 +1,326 @@
+"""Limitation de débit partagée par fournisseur et modèle.
+
+Phase 6 (Perf) : génération, résumés, factcheck, évaluation qualité,
+glossaire et analyse de feedback appellent le même fournisseur sans notion
+commune des limites RPM/TPM. Un limiteur unique par processus, indexé par
+(fournisseur, modèle), combine un seau de requêtes et un seau de tokens.
+Le coût en tokens est estimé avant l'appel puis ajusté avec l'usage réel
+de l'AIResponse. Les appelants en attente sont servis par classe de
+priorité : la génération passe avant l'évaluation en arrière-plan.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Optional
+
+logger = logging.getLogger("orchestria")
+
+# Intervalle de réexamen d'un appelant qui n'est pas en tête de file
+_QUEUE_POLL_SECONDS = 0.05
+
+
+class Priority(IntEnum):
+    """Classes de priorité (valeur basse = servie en premier)."""
+    GENERATION = 0
+    DEFAULT = 1
+    BACKGROUND = 2
+
+
+_current_priority: ContextVar[Priority] = ContextVar("orchestria_request_priority", default=Priority.DEFAULT)
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Fixe la priorité des appels API du contexte courant (thread ou tâche asyncio)."""
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _current_priority.get()
+
+
+class TokenBucket:
+    """Seau à jetons : ``capacity`` unités, rechargé de ``per_minute`` par minute.
+
+    Le niveau peut devenir négatif après ajustement (usage réel supérieur à
+    l'estimation) : la dette est remboursée par la recharge.
+    """
+
+    def __init__(self, capacity: float, per_minute: float):
+        self.capacity = float(capacity)
+        self.rate = per_minute / 60.0
+        self.level = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Secondes à attendre avant de pouvoir prélever ``amount``."""
+        self._refill(now)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+    def drain(self) -> None:
+        self.level = min(self.level, 0.0)
+
+
+class ModelLimiter:
+    """Seaux RPM/TPM d'un couple (fournisseur, modèle) et file de priorité."""
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.requests = TokenBucket(rpm, rpm) if rpm else None
+        self.tokens = TokenBucket(tpm, tpm) if tpm else None
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+
+    def acquire(self, tokens: int, priority: Priority) -> None:
+        """Bloque jusqu'à obtenir une requête et ``tokens`` tokens."""
+        tokens = self._clamp(tokens)
+        with self._cond:
+            ticket = self._enqueue(priority)
+            try:
+                while True:
+                    wait = self._try_take(ticket, tokens)
+                    if wait == 0:
+                        return
+                    self._cond.wait(wait)
+            except BaseException:
+                self._dequeue(ticket)
+                raise
+
+    async def aacquire(self, tokens: int, priority: Priority) -> None:
+        """Version asynchrone de acquire() : attend sans bloquer la boucle."""
+        tokens = self._clamp(tokens)
+        with self._cond:
+            ticket = self._enqueue(priority)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_take(ticket, tokens)
+                if wait == 0:
+                    return
+                await asyncio.sleep(min(wait, _QUEUE_POLL_SECONDS))
+        except BaseException:
+            with self._cond:
+                self._dequeue(ticket)
+            raise
+
+    def reconcile(self, estimated: int, actual: int) -> None:
+        """Ajuste le seau de tokens avec l'usage réel."""
+        if self.tokens is None or estimated == actual:
+            return
+        with self._cond:
+            if actual < estimated:
+                self.tokens.give(estimated - actual)
+            else:
+                self.tokens.take(actual - estimated)
+            self._cond.notify_all()
+
+    def penalize(self) -> None:
+        """Vide les seaux après un 429 : tous les appelants ralentissent ensemble."""
+        with self._cond:
+            for bucket in (self.requests, self.tokens):
+                if bucket is not None:
+                    bucket.drain()
+
+    def _clamp(self, tokens: int) -> int:
+        # Une requête plus grosse que le seau ne serait jamais servie
+        if self.tokens is not None:
+            return min(max(tokens, 0), int(self.tokens.capacity))
+        return max(tokens, 0)
+
+    def _enqueue(self, priority: Priority) -> tuple[int, int]:
+        ticket = (int(priority), next(self._seq))
+        heapq.heappush(self._queue, ticket)
+        return ticket
+
+    def _dequeue(self, ticket: tuple[int, int]) -> None:
+        if ticket in self._queue:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._cond.notify_all()
+
+    def _try_take(self, ticket: tuple[int, int], tokens: int) -> float:
+        """Prélève si l'appelant est en tête et que les seaux le permettent.
+
+        Returns:
+            0 si la requête est accordée, sinon le délai d'attente conseillé.
+        """
+        if self._queue[0] != ticket:
+            return _QUEUE_POLL_SECONDS
+        now = time.monotonic()
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1, now))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_time(tokens, now))
+        if wait > 0:
+            return wait
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(tokens)
+        heapq.heappop(self._queue)
+        self._cond.notify_all()
+        return 0
+
+
+class RateLease:
+    """Autorisation d'un appel ; à régler avec l'usage réel de la réponse."""
+
+    def __init__(self, limiter: Optional[ModelLimiter], estimated: int):
+        self._limiter = limiter
+        self.estimated = estimated
+        self._settled = False
+
+    def settle(self, response):
+        """Ajuste le seau avec l'usage réel de ``response`` et la retourne."""
+        if not self._settled:
+            self._settled = True
+            if self._limiter is not None:
+                actual = response.total_tokens or (response.input_tokens + response.output_tokens)
+                self._limiter.reconcile(self.estimated, int(actual or self.estimated))
+        return response
+
+    def release(self) -> None:
+        """Appel échoué : les tokens réservés sont restitués."""
+        if not self._settled:
+            self._settled = True
+            if self._limiter is not None:
+                self._limiter.reconcile(self.estimated, 0)
+
+
+class RateLimiter:
+    """Limiteur partagé par processus, indexé par (fournisseur, modèle).
+
+    ``limits`` suit le format de config/rate_limits.yaml :
+    ``{fournisseur: {modèle | "default": {"rpm": int, "tpm": int}}}``.
+    Un couple sans limite configurée n'est jamais ralenti.
+    """
+
+    def __init__(self, limits: Optional[dict] = None):
+        limits = dict(limits or {})
+        self.enabled = limits.pop("enabled", True)
+        self._limits = limits
+        self._models: dict[tuple[str, str], Optional[ModelLimiter]] = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, provider: str, model: str) -> Optional[ModelLimiter]:
+        key = (provider, model)
+        with self._lock:
+            if key not in self._models:
+                provider_limits = self._limits.get(provider) or {}
+                model_limits = provider_limits.get(model) or provider_limits.get("default") or {}
+                rpm = int(model_limits.get("rpm", 0) or 0)
+                tpm = int(model_limits.get("tpm", 0) or 0)
+                self._models[key] = ModelLimiter(rpm, tpm) if self.enabled and (rpm or tpm) else None
+            return self._models[key]
+
+    def acquire(self, provider: str, model: str, tokens: int, priority: Optional[Priority] = None) -> RateLease:
+        limiter = self._limiter(provider, model)
+        if limiter is not None:
+            limiter.acquire(tokens, current_priority() if priority is None else priority)
+        return RateLease(limiter, tokens)
+
+    async def aacquire(self, provider: str, model: str, tokens: int, priority: Optional[Priority] = None) -> RateLease:
+        limiter = self._limiter(provider, model)
+        if limiter is not None:
+            await limiter.aacquire(tokens, current_priority() if priority is None else priority)
+        return RateLease(limiter, tokens)
+
+    def penalize(self, provider: str, model: str) -> None:
+        limiter = self._limiter(provider, model)
+        if limiter is not None:
+            logger.info(f"Limite de débit atteinte ({provider}/{model}) : ralentissement partagé")
+            limiter.penalize()
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Retourne le limiteur du processus (chargé depuis config/rate_limits.yaml)."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            from src.utils.config import load_rate_limits
+            try:
+                _rate_limiter = RateLimiter(load_rate_limits())
+            except Exception as e:
+                logger.warning(f"Limites de débit non chargées, appels non limités : {e}")
+                _rate_limiter = RateLimiter()
+        return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Remplace le limiteur du processus (None : rechargement depuis la config)."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = limiter
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Indique si une erreur de SDK correspond à un HTTP 429."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return status == 429 or type(error).__name__ in ("RateLimitError", "ResourceExhausted")
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Délai demandé par le serveur (en-têtes ``retry-after-ms`` / ``Retry-After``), ou None."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        values = {str(k).lower(): v for k, v in headers.items()}
+    except AttributeError:
+        return None
+    try:
+        if values.get("retry-after-ms") is not None:
+            return max(0.0, float(values["retry-after-ms"]) / 1000)
+    except (TypeError, ValueError):
+        pass
+    value = values.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    # Format date HTTP
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(error: Exception, attempt: int, base_delay: float) -> float:
+    """Délai avant nouvelle tentative : Retry-After d'un 429 si présent, sinon exponentiel."""
+    if is_rate_limit_error(error):
+        delay = retry_after_seconds(error)
+        if delay is not None:
+            return delay
+    return base_delay * (2 ** attempt)
@@ -19,6 +19,11 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
         return _heuristic_count(text)
 
 
+def estimate_tokens(text: str) -> int:
+    """Estimation rapide sans tokenizer (pré-réservation de débit, ajustée ensuite)."""
+    return _heuristic_count(text) if text else 0
+
+
 def _heuristic_count(text: str) -> int:
     """Estimation heuristique du nombre de tokens (1 token ≈ 4 caractères en français)."""
     return max(1, len(text) // 4)
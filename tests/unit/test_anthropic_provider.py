@@ -1,10 +1,12 @@
 """Tests unitaires pour le fournisseur Anthropic."""
 
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from src.providers.anthropic_provider import AnthropicProvider
-from src.providers.base import AIResponse
+from src.providers.base import AIResponse, PROMPT_CACHE_BOUNDARY
 
 
 class TestAnthropicProviderInit:
@@ -102,6 +104,28 @@ class TestAnthropicProviderGenerate:
         assert result.content == "OK"
         assert mock_client.messages.create.call_count == 2
 
+    @patch("src.providers.anthropic_provider.time.sleep")
+    @patch("src.providers.anthropic_provider.AnthropicProvider._get_client")
+    def test_retry_honours_retry_after(self, mock_get_client, mock_sleep):
+        rate_limited = Exception("Rate limited")
+        rate_limited.status_code = 429
+        rate_limited.response = MagicMock(headers={"retry-after": "3"})
+        mock_client = MagicMock()
+        mock_client.messages.create.side_effect = [
+            rate_limited,
+            MagicMock(
+                content=[MagicMock(type="text", text="OK")],
+                usage=MagicMock(input_tokens=10, output_tokens=5),
+                stop_reason="end_turn",
+                model_dump=MagicMock(return_value={}),
+            ),
+        ]
+        mock_get_client.return_value = mock_client
+
+        provider = AnthropicProvider(api_key="sk-ant-test", base_delay=0.01)
+        assert provider.generate("Test").content == "OK"
+        mock_sleep.assert_called_once_with(3.0)
+
     @patch("src.providers.anthropic_provider.AnthropicProvider._get_client")
     def test_generate_all_retries_fail(self, mock_get_client):
         mock_client = MagicMock()
@@ -111,3 +135,80 @@ class TestAnthropicProviderGenerate:
         provider = AnthropicProvider(api_key="sk-ant-test", max_retries=1, base_delay=0.01)
         with pytest.raises(RuntimeError, match="Échec après"):
             provider.generate("Test")
+
+
+class TestAnthropicPromptCaching:
+    """Phase 6 (Perf) : point de cache sur le préfixe stable."""
+
+    def test_boundary_becomes_cache_control_blocks(self):
+        kwargs = AnthropicProvider._request_kwargs(
+            f"Préfixe{PROMPT_CACHE_BOUNDARY}Suite", f"Système{PROMPT_CACHE_BOUNDARY}", "m", 0.7, 100,
+        )
+        assert kwargs["system"] == [{"type": "text", "text": "Système", "cache_control": {"type": "ephemeral"}}]
+        assert kwargs["messages"][0]["content"] == [
+            {"type": "text", "text": "Préfixe", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "Suite"},
+        ]
+
+    def test_plain_prompt_unchanged(self):
+        kwargs = AnthropicProvider._request_kwargs("Prompt", "Système", "m", 0.7, 100)
+        assert kwargs["system"] == "Système"
+        assert kwargs["messages"][0]["content"] == "Prompt"
+
+    def test_cache_usage_reported(self):
+        response = MagicMock(
+            content=[MagicMock(type="text", text="OK")],
+            usage=MagicMock(input_tokens=50, output_tokens=10, cache_read_input_tokens=900, cache_creation_input_tokens=0),
+            stop_reason="end_turn",
+        )
+        result = AnthropicProvider(api_key="sk-ant-test")._to_response(response, "m")
+        assert result.input_tokens == 950
+        assert result.cached_input_tokens == 900
+        assert result.cache_write_tokens == 0
+
+
+class TestAnthropicProviderAsync:
+    """Tests de génération asynchrone (Phase 6)."""
+
+    def _response(self, text):
+        return MagicMock(
+            content=[MagicMock(type="text", text=text)],
+            usage=MagicMock(input_tokens=10, output_tokens=5),
+            stop_reason="end_turn",
+            model_dump=MagicMock(return_value={}),
+        )
+
+    @patch("src.providers.anthropic_provider.AnthropicProvider._get_async_client")
+    def test_agenerate_uses_async_client(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=self._response("Async"))
+        mock_get_client.return_value = mock_client
+
+        provider = AnthropicProvider(api_key="sk-ant-test")
+        result = asyncio.run(provider.agenerate("Test", system_prompt="System"))
+
+        assert result.content == "Async"
+        assert result.output_tokens == 5
+        assert mock_client.messages.create.call_args.kwargs["system"] == "System"
+
+    @patch("src.providers.anthropic_provider.AnthropicProvider._get_async_client")
+    def test_agenerate_retries(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=[Exception("Rate limited"), self._response("OK")])
+        mock_get_client.return_value = mock_client
+
+        provider = AnthropicProvider(api_key="sk-ant-test", base_delay=0.01)
+        result = asyncio.run(provider.agenerate("Test"))
+
+        assert result.content == "OK"
+        assert mock_client.messages.create.await_count == 2
+
+    def test_async_client_recreated_per_event_loop(self):
+        provider = AnthropicProvider(api_key="sk-ant-test")
+
+        async def get_client():
+            return provider._loop_bound_client(object)
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
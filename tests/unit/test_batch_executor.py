@@ -0,0 +1,161 @@
+"""Tests unitaires pour l'exécution en batch (Phase 6)."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.core.batch_executor import BATCH_FINISH_REASON, BatchExecutor
+from src.core.orchestrator import Orchestrator, ProjectState
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.providers.base import AIResponse, BatchError, BatchRequest, BatchStatus, BatchStatusEnum
+
+
+@pytest.fixture(autouse=True)
+def no_tokenizer():
+    with patch("src.core.batch_executor.count_tokens", side_effect=lambda text, model="": len(text) // 4), \
+         patch("src.core.orchestrator.count_tokens", return_value=100):
+        yield
+
+
+def _provider(status=BatchStatusEnum.COMPLETED, results=None):
+    provider = MagicMock()
+    provider.name = "openai"
+    provider.supports_batch.return_value = True
+    provider.get_default_model.return_value = "gpt-4o"
+    provider.submit_batch.return_value = "batch_1"
+    provider.poll_batch.return_value = BatchStatus(batch_id="batch_1", status=status)
+    provider.retrieve_batch_results.return_value = results or {}
+    provider.generate.side_effect = lambda prompt, **kw: AIResponse(
+        content=f"temps réel: {prompt}", model="gpt-4o", provider="openai", output_tokens=3,
+    )
+    return provider
+
+
+REQUESTS = [BatchRequest(custom_id="a", prompt="A"), BatchRequest(custom_id="b", prompt="B")]
+
+
+class TestBatchExecutor:
+    def test_completed_batch(self):
+        provider = _provider(results={"a": "réponse A", "b": "réponse B"})
+        submitted = []
+        results = BatchExecutor(provider, sleep=lambda s: None).run(REQUESTS, on_submit=submitted.append)
+
+        assert submitted == ["batch_1"]
+        assert results["a"].content == "réponse A"
+        assert results["a"].finish_reason == BATCH_FINISH_REASON
+        assert results["a"].output_tokens > 0
+        provider.generate.assert_not_called()
+
+    def test_missing_items_fall_back_individually(self):
+        provider = _provider(results={"a": "réponse A", "b": ""})
+        results = BatchExecutor(provider, sleep=lambda s: None).run(REQUESTS)
+        assert results["a"].finish_reason == BATCH_FINISH_REASON
+        assert results["b"].content == "temps réel: B"
+        assert provider.generate.call_count == 1
+
+    def test_failed_batch_falls_back(self):
+        provider = _provider(status=BatchStatusEnum.FAILED)
+        results = BatchExecutor(provider, sleep=lambda s: None).run(REQUESTS)
+        assert {r.content for r in results.values()} == {"temps réel: A", "temps réel: B"}
+
+    def test_failure_without_fallback_raises(self):
+        provider = _provider(status=BatchStatusEnum.EXPIRED)
+        with pytest.raises(BatchError):
+            BatchExecutor(provider, fallback_to_realtime=False, sleep=lambda s: None).run(REQUESTS)
+
+    def test_resume_skips_submission(self):
+        provider = _provider(results={"a": "A", "b": "B"})
+        BatchExecutor(provider, sleep=lambda s: None).run(REQUESTS, batch_id="batch_0")
+        provider.submit_batch.assert_not_called()
+        provider.poll_batch.assert_called_with("batch_0")
+
+    def test_polls_until_completed(self):
+        provider = _provider(results={"a": "A", "b": "B"})
+        provider.poll_batch.side_effect = [
+            BatchStatus(batch_id="batch_1", status=BatchStatusEnum.IN_PROGRESS),
+            BatchStatus(batch_id="batch_1", status=BatchStatusEnum.COMPLETED),
+        ]
+        sleeps = []
+        BatchExecutor(provider, poll_interval=5, sleep=sleeps.append).run(REQUESTS)
+        assert sleeps == [5]
+
+
+def _orchestrator(tmp_path, provider, **batch):
+    config = {
+        "mode": "agentic",
+        "batch": {"enabled": True, "use_for_refinement": True, "fallback_to_realtime": False, **batch},
+    }
+    orch = Orchestrator(provider=provider, project_dir=tmp_path, config=config)
+    plan = NormalizedPlan(title="Doc", sections=[
+        PlanSection(id="1", title="Intro", level=1, status="generated"),
+        PlanSection(id="1.1", title="Contexte", level=2, parent_id="1", status="generated"),
+    ])
+    orch.init_project("test", plan)
+    orch.state.generated_sections = {"1": "brouillon 1", "1.1": "brouillon 1.1"}
+    orch._ensure_phase3_engine = MagicMock()
+    orch._run_post_generation_evaluation_background = MagicMock()
+    return orch
+
+
+class TestOrchestratorBatchRefinement:
+    def test_refinement_pass_uses_batch(self, tmp_path):
+        provider = _provider(results={"pass2-0": "raffiné 1", "pass2-1": "raffiné 1.1"})
+        orch = _orchestrator(tmp_path, provider)
+
+        result = orch.generate_all_sections(pass_number=2)
+
+        assert result == {"1": "raffiné 1", "1.1": "raffiné 1.1"}
+        provider.generate.assert_not_called()
+        assert orch.state.pending_batches == {}
+        assert orch.state.current_step == "review"
+        entries = orch.cost_tracker.report.entries
+        assert {e.task_type for e in entries} == {"refinement"}
+
+    def test_draft_pass_stays_realtime(self, tmp_path):
+        orch = _orchestrator(tmp_path, _provider())
+        assert orch._use_batch("refinement")
+        orch.config["batch"]["enabled"] = False
+        assert not orch._use_batch("refinement")
+
+    def test_batch_id_persisted_and_resumed(self, tmp_path):
+        provider = _provider(status=BatchStatusEnum.IN_PROGRESS)
+        orch = _orchestrator(tmp_path, provider, timeout_seconds=0)
+
+        orch.generate_all_sections(pass_number=2)
+        pending = orch.state.pending_batches["refinement_pass_2"]
+        assert pending["batch_id"] == "batch_1"
+        assert orch.state.current_step == "generation"
+        saved = ProjectState.from_dict(orch.state.to_dict())
+        assert saved.pending_batches == orch.state.pending_batches
+
+        # Redémarrage : le batch est repris, pas resoumis
+        provider.submit_batch.reset_mock()
+        provider.poll_batch.return_value = BatchStatus(batch_id="batch_1", status=BatchStatusEnum.COMPLETED)
+        provider.retrieve_batch_results.return_value = {"pass2-0": "R1", "pass2-1": "R2"}
+        orch.config["batch"]["timeout_seconds"] = 3600
+        result = orch.generate_all_sections(pass_number=2)
+
+        provider.submit_batch.assert_not_called()
+        assert result == {"1": "R1", "1.1": "R2"}
+        assert orch.state.pending_batches == {}
+
+    def test_quality_evaluation_batched(self, tmp_path):
+        provider = _provider()
+        provider.retrieve_batch_results.side_effect = [
+            {"pass2-0": "raffiné 1", "pass2-1": "raffiné 1.1"},
+            {
+                "quality-pass2-0": '{"C1": {"score": 5, "justification": "ok"}}',
+                "quality-pass2-1": '{"C1": {"score": 2, "justification": "bof"}}',
+            },
+        ]
+        orch = _orchestrator(tmp_path, provider, use_for_evaluation=True)
+        orch._init_phase3_engines = MagicMock()
+        from src.core.quality_evaluator import QualityEvaluator
+        orch._quality_evaluator = QualityEvaluator(provider=provider)
+
+        orch.generate_all_sections(pass_number=2)
+
+        assert provider.submit_batch.call_count == 2
+        calls = orch._run_post_generation_evaluation_background.call_args_list
+        scores = {c.args[0].id: c.args[5] for c in calls}
+        assert scores["1"]["C1"]["score"] == 5
+        assert scores["1.1"]["C1"]["score"] == 2
@@ -7,6 +7,12 @@ from unittest.mock import patch, MagicMock
 from src.core.corpus_acquirer import CorpusAcquirer, AcquisitionReport, AcquisitionStatus
 
 
+@pytest.fixture(autouse=True)
+def _use_tmp_cache(tmp_path, monkeypatch):
+    """Redirige le cache d'extraction (CACHE_DIR) vers un répertoire temporaire."""
+    monkeypatch.setattr("src.core.text_extractor.CACHE_DIR", tmp_path / "cache")
+
+
 @pytest.fixture
 def corpus_dir(tmp_path):
     d = tmp_path / "corpus"
@@ -0,0 +1,96 @@
+"""Tests unitaires pour l'analyse incrémentale du corpus (Phase 6)."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.core import corpus_analyzer
+from src.core.corpus_analyzer import INDEX_FILENAME, CorpusAnalyzer, assess_quality
+
+LONG_TEXT = "Les politiques publiques de formation professionnelle évoluent. " * 10
+
+
+@pytest.fixture(autouse=True)
+def isolated_extraction(tmp_path):
+    """Cache d'extraction temporaire et comptage de tokens sans tiktoken."""
+    with patch("src.core.text_extractor.CACHE_DIR", tmp_path / "cache"), \
+         patch("src.utils.token_counter.count_tokens", side_effect=lambda text, *a, **k: len(text.split())):
+        yield
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    d = tmp_path / "corpus"
+    d.mkdir()
+    (d / "001_rapport.txt").write_text(LONG_TEXT, encoding="utf-8")
+    (d / "002_note.txt").write_text("Trop court.", encoding="utf-8")
+    return d
+
+
+def _analyze(corpus_dir, **kwargs):
+    analyzer = CorpusAnalyzer(corpus_dir, workers=1)
+    return analyzer, analyzer.analyze(**kwargs)
+
+
+class TestAssessQuality:
+    def test_levels(self):
+        assert assess_quality("") == "Vide"
+        assert assess_quality("Trop court.") == "Suspect"
+        assert assess_quality(LONG_TEXT) == "OK"
+
+
+class TestCorpusAnalyzer:
+    def test_first_run_analyzes_every_file(self, corpus_dir):
+        analyzer, analyses = _analyze(corpus_dir)
+
+        assert [a.filename for a in analyses] == ["001_rapport.txt", "002_note.txt"]
+        assert analyses[0].tokens == len(LONG_TEXT.split())
+        assert [a.quality for a in analyses] == ["OK", "Suspect"]
+        assert analyzer.last_stats == {"files": 2, "analyzed": 2, "reused": 0}
+        assert (corpus_dir / INDEX_FILENAME).exists()
+
+    def test_second_run_reuses_index(self, corpus_dir):
+        _, first = _analyze(corpus_dir)
+        with patch.object(corpus_analyzer, "_analyze_path") as worker:
+            analyzer, second = _analyze(corpus_dir)
+
+        worker.assert_not_called()
+        assert analyzer.last_stats["reused"] == 2
+        assert second == first
+
+    def test_modified_file_is_reanalyzed(self, corpus_dir):
+        _analyze(corpus_dir)
+        note = corpus_dir / "002_note.txt"
+        note.write_text(LONG_TEXT + " Mise à jour.", encoding="utf-8")
+        os.utime(note, ns=(note.stat().st_atime_ns, note.stat().st_mtime_ns + 10**9))
+
+        analyzer, analyses = _analyze(corpus_dir)
+
+        assert analyzer.last_stats["analyzed"] == 1
+        assert analyses[1].quality == "OK"
+
+    def test_force_reanalyzes_known_file(self, corpus_dir):
+        _analyze(corpus_dir)
+        analyzer, _ = _analyze(corpus_dir, force=["001_rapport.txt"])
+        assert analyzer.last_stats["analyzed"] == 1
+
+    def test_duplicates_detected_from_stored_hashes(self, corpus_dir):
+        (corpus_dir / "003_copie.txt").write_text(LONG_TEXT, encoding="utf-8")
+
+        analyzer, analyses = _analyze(corpus_dir)
+
+        assert analyzer.last_stats["analyzed"] == 2  # contenu identique analysé une fois
+        assert analyses[2].dedup_status == "doublon_exact"
+        assert analyses[2].original_ref == "001_rapport.txt"
+        assert analyses[2].tokens == analyses[0].tokens
+
+    def test_removed_files_are_pruned(self, corpus_dir):
+        analyzer, _ = _analyze(corpus_dir)
+        (corpus_dir / "002_note.txt").unlink()
+
+        analyzer.analyze()
+        index = analyzer._load_index()
+
+        assert list(index["files"]) == ["001_rapport.txt"]
+        assert len(index["records"]) == 1
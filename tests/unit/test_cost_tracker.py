@@ -31,6 +31,13 @@ class TestCalculateCost:
         cost = tracker.calculate_cost("openai", "gpt-4o", 0, 0)
         assert cost == 0.0
 
+    def test_prompt_cache_pricing(self, tracker):
+        full = tracker.calculate_cost("anthropic", "claude-sonnet-4-5-20250514", 1_000_000, 0)
+        read = tracker.calculate_cost("anthropic", "claude-sonnet-4-5-20250514", 1_000_000, 0, cached_input_tokens=1_000_000)
+        write = tracker.calculate_cost("anthropic", "claude-sonnet-4-5-20250514", 1_000_000, 0, cache_write_tokens=1_000_000)
+        assert read == pytest.approx(full * 0.1)
+        assert write == pytest.approx(full * 1.25)
+
 
 class TestRecord:
     def test_record_entry(self, tracker):
@@ -115,6 +122,13 @@ class TestCostReport:
         assert "total_cost_usd" in data
         assert len(data["entries"]) == 1
 
+    def test_cached_input_totals(self, tracker):
+        tracker.record("1", "gpt-4o", "openai", 2000, 500, cached_input_tokens=1500)
+        tracker.record("2", "gpt-4o", "openai", 2000, 500, cached_input_tokens=1500)
+        data = tracker.report.to_dict()
+        assert data["total_cached_input_tokens"] == 3000
+        assert data["entries"][0]["cached_input_tokens"] == 1500
+
     def test_reset(self, tracker):
         tracker.record("1", "gpt-4o", "openai", 1000, 500)
         tracker.reset()
@@ -0,0 +1,111 @@
+"""Tests unitaires pour le cache persistant d'embeddings (Phase 6)."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.core.embedding_cache import EmbeddingCache, KEYS_FILENAME, VECTORS_FILENAME
+from src.core.rag_engine import RAGEngine
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EmbeddingCache(tmp_path, provider="local", model="intfloat/multilingual-e5-large", prefix_mode="passage")
+
+
+class TestEmbeddingCache:
+    def test_empty_cache_all_misses(self, cache):
+        positions, vectors, misses = cache.lookup(["a", "b"])
+        assert len(positions) == 0
+        assert vectors.shape[0] == 0
+        assert misses == [0, 1]
+        assert cache.hit_rate == 0.0
+
+    def test_store_then_lookup(self, cache):
+        cache.store(["a", "b"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        positions, vectors, misses = cache.lookup(["b", "c", "a"])
+        assert misses == [1]
+        assert positions.tolist() == [0, 2]
+        assert vectors.dtype == np.float32
+        np.testing.assert_allclose(vectors, [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]])
+
+    def test_store_ignores_duplicates(self, cache):
+        assert cache.store(["a", "a"], [[1.0, 2.0], [1.0, 2.0]]) == 1
+        assert cache.store(["a"], [[1.0, 2.0]]) == 0
+        assert len(cache) == 1
+
+    def test_persistence_across_instances(self, tmp_path, cache):
+        cache.store(["chunk"], [[0.5, 0.25]])
+        reopened = EmbeddingCache(tmp_path, provider="local", model="intfloat/multilingual-e5-large", prefix_mode="passage")
+        _, vectors, misses = reopened.lookup(["chunk"])
+        assert misses == []
+        np.testing.assert_allclose(vectors[0], [0.5, 0.25])
+
+    def test_key_includes_model_and_prefix(self, tmp_path, cache):
+        cache.store(["chunk"], [[0.5, 0.25]])
+        other_model = EmbeddingCache(tmp_path, provider="openai", model="text-embedding-3-small")
+        _, _, misses = other_model.lookup(["chunk"])
+        assert misses == [0]
+
+    def test_dimension_mismatch_is_ignored(self, cache):
+        cache.store(["a"], [[1.0, 2.0]])
+        assert cache.store(["b"], [[1.0, 2.0, 3.0]]) == 0
+
+    def test_truncated_write_is_repaired(self, tmp_path, cache):
+        cache.store(["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+        # Simuler un arrêt brutal : un vecteur écrit sans sa clé
+        with open(cache.directory / VECTORS_FILENAME, "ab") as f:
+            f.write(np.zeros(2, dtype=np.float32).tobytes())
+        reopened = EmbeddingCache(tmp_path, provider="local", model="intfloat/multilingual-e5-large", prefix_mode="passage")
+        assert len(reopened) == 2
+        assert (reopened.directory / VECTORS_FILENAME).stat().st_size == 2 * 2 * 4
+        assert (reopened.directory / KEYS_FILENAME).stat().st_size == 2 * 32
+
+    def test_stats(self, cache):
+        cache.store(["a"], [[1.0]])
+        cache.lookup(["a", "b"])
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+class TestRAGEngineEmbeddingCache:
+    def _engine(self, tmp_path):
+        return RAGEngine(
+            persist_dir=tmp_path / "chromadb",
+            config={"rag": {"embedding_provider": "openai", "embedding_model": "text-embedding-3-small"}},
+        )
+
+    def test_default_cache_dir_next_to_chromadb(self, tmp_path):
+        engine = self._engine(tmp_path)
+        assert engine._embedding_cache_dir == tmp_path / "embedding_cache"
+
+    def test_cache_disabled_by_config(self, tmp_path):
+        engine = RAGEngine(
+            persist_dir=tmp_path / "chromadb",
+            config={"rag": {"embedding_provider": "openai", "embedding_cache": {"enabled": False}}},
+        )
+        assert engine._get_embedding_cache() is None
+
+    def test_only_misses_are_embedded(self, tmp_path):
+        engine = self._engine(tmp_path)
+        with patch.object(engine, "_get_embeddings", side_effect=lambda texts, mode: [[float(len(t)), 1.0] for t in texts]) as mock_embed:
+            first = engine._compute_embeddings_only(["aa", "bbb"])
+            second = engine._compute_embeddings_only(["bbb", "cccc", "aa"])
+
+        assert first.dtype == np.float32
+        np.testing.assert_allclose(first, [[2.0, 1.0], [3.0, 1.0]])
+        np.testing.assert_allclose(second, [[3.0, 1.0], [4.0, 1.0], [2.0, 1.0]])
+        assert mock_embed.call_args_list[1].args[0] == ["cccc"]
+
+    def test_pipeline_reports_hit_rate(self, tmp_path):
+        engine = self._engine(tmp_path)
+        collection = MagicMock()
+        with patch.object(engine, "_get_embeddings", side_effect=lambda texts, mode: [[1.0, 0.0] for _ in texts]):
+            engine._pipeline_index_batches(collection, [(["x", "y"], [{}, {}], ["1", "2"])])
+            engine._pipeline_index_batches(collection, [(["x", "z"], [{}, {}], ["1", "3"])])
+
+        assert engine.last_embedding_cache_stats["hits"] == 1
+        assert engine.last_embedding_cache_stats["misses"] == 1
+        assert engine.last_embedding_cache_stats["hit_rate"] == 0.5
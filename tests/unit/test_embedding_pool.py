@@ -0,0 +1,123 @@
+"""Tests unitaires pour le pool multi-processus d'embeddings (Phase 6)."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.core import embedding_pool
+from src.core.embedding_pool import EmbeddingPool, compute_embedding_workers
+from src.core.local_embedder import LocalEmbedder
+from src.core.rag_engine import RAGEngine
+
+
+class _FakeWorkerEmbedder:
+    def embed_documents(self, texts, batch_size=16):
+        return np.array([[float(t), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def pool():
+    # Exécuteur à threads : même contrat que le ProcessPoolExecutor (map ordonné)
+    pool = EmbeddingPool("model", "./models", workers=3, shard_size=2)
+    pool._executor = ThreadPoolExecutor(max_workers=3)
+    with patch.object(embedding_pool, "_worker_embedder", _FakeWorkerEmbedder()):
+        yield pool
+    pool.close()
+
+
+class TestComputeEmbeddingWorkers:
+    def _vm(self, available_gb):
+        return MagicMock(available=available_gb * 1024 ** 3)
+
+    def test_bounded_by_cores_and_threads(self):
+        with patch("psutil.virtual_memory", return_value=self._vm(64)), \
+             patch("os.cpu_count", return_value=32):
+            assert compute_embedding_workers(threads_per_worker=2) == 16
+
+    def test_bounded_by_ram(self):
+        # Modèle inconnu : budget prudent de 3 Go par worker
+        with patch("psutil.virtual_memory", return_value=self._vm(14)), \
+             patch("os.cpu_count", return_value=32):
+            assert compute_embedding_workers(threads_per_worker=2) == 4
+
+    def test_ram_budget_follows_model(self):
+        with patch("psutil.virtual_memory", return_value=self._vm(32)), \
+             patch("os.cpu_count", return_value=32):
+            assert compute_embedding_workers(2, "intfloat/multilingual-e5-large") == 10
+            assert compute_embedding_workers(2, "intfloat/multilingual-e5-small") == 16
+
+    def test_at_least_one_worker(self):
+        with patch("psutil.virtual_memory", return_value=self._vm(1)), \
+             patch("os.cpu_count", return_value=1):
+            assert compute_embedding_workers(threads_per_worker=4) == 1
+
+
+class TestEmbeddingPool:
+    def test_results_in_input_order(self, pool):
+        texts = [str(i) for i in range(7)]
+        result = pool.embed_documents(texts)
+        assert result.dtype == np.float32
+        assert result.shape == (7, 2)
+        assert result[:, 0].tolist() == [float(i) for i in range(7)]
+
+    def test_reports_throughput(self, pool):
+        pool.embed_documents(["1", "2", "3"])
+        assert pool.last_stats["chunks"] == 3
+        assert pool.last_stats["shards"] == 2
+        assert pool.last_stats["workers"] == 3
+        assert pool.last_stats["chunks_per_s"] >= 0
+
+    def test_empty_input(self, pool):
+        assert pool.embed_documents([]).shape[0] == 0
+
+
+class TestRAGEngineEmbeddingPool:
+    def _engine(self, workers):
+        return RAGEngine(config={"rag": {
+            "embedding_cache": {"enabled": False},
+            "embedding_pool": {"workers": workers, "shard_size": 2},
+        }})
+
+    @pytest.fixture(autouse=True)
+    def embedder(self):
+        embedder = MagicMock(spec=LocalEmbedder)
+        embedder.model_name = "model"
+        embedder.cache_dir = "./models"
+        embedder.embed_documents.side_effect = lambda texts, batch_size=16: np.zeros((len(texts), 2), np.float32)
+        with patch.object(LocalEmbedder, "get_instance", return_value=embedder):
+            yield embedder
+
+    def test_single_worker_stays_in_process(self, embedder):
+        engine = self._engine(1)
+        engine._get_embeddings(["a", "b", "c", "d"])
+        embedder.embed_documents.assert_called_once()
+        assert engine._embedding_pool is None
+
+    def test_large_batch_uses_pool(self, embedder):
+        engine = self._engine(4)
+        with patch.object(EmbeddingPool, "embed_documents", return_value=np.ones((4, 2), np.float32)) as pooled:
+            result = engine._get_embeddings(["a", "b", "c", "d"])
+        pooled.assert_called_once()
+        embedder.embed_documents.assert_not_called()
+        assert result.shape == (4, 2)
+
+    def test_small_batch_skips_pool(self, embedder):
+        engine = self._engine(4)
+        with patch.object(EmbeddingPool, "embed_documents") as pooled:
+            engine._get_embeddings(["a"])
+        pooled.assert_not_called()
+
+    def test_pool_failure_falls_back_in_process(self, embedder):
+        engine = self._engine(4)
+        with patch.object(EmbeddingPool, "embed_documents", side_effect=RuntimeError("worker mort")):
+            result = engine._get_embeddings(["a", "b", "c", "d"])
+        assert result.shape == (4, 2)
+        assert engine._embedding_pool_workers == 1
+
+    def test_pipeline_reports_throughput(self, embedder):
+        engine = self._engine(1)
+        engine._pipeline_index_batches(MagicMock(), [(["x", "y"], [{}, {}], ["1", "2"])])
+        assert engine.last_embedding_throughput["chunks"] == 2
+        assert "chunks_per_s" in engine.last_embedding_throughput
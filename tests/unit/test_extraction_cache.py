@@ -0,0 +1,97 @@
+"""Tests unitaires pour le cache d'extraction adressé par contenu (Phase 6)."""
+
+import os
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from src.core import extraction_cache
+from src.core.extraction_cache import ExtractionCache, LazyExtractionResult
+from src.core.text_extractor import extract_text_file
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(tmp_path / "cache")
+
+
+def _source(tmp_path, name, content):
+    f = tmp_path / name
+    f.write_text(content, encoding="utf-8")
+    return f
+
+
+def _store(cache, path):
+    result = extract_text_file(path)
+    cache.put(result, cache.content_hash(path), path.suffix)
+    return result
+
+
+class TestExtractionCache:
+    def test_payload_loaded_lazily(self, cache, tmp_path):
+        path = _source(tmp_path, "doc.txt", "Texte du document. " * 50)
+        original = _store(cache, path)
+
+        with patch.object(extraction_cache, "_read_payload", wraps=extraction_cache._read_payload) as reader:
+            cached = cache.get(path)
+            assert cached.word_count == original.word_count
+            reader.assert_not_called()
+            assert cached.text == original.text
+            assert cached.structure is None
+            reader.assert_called_once()
+
+    def test_payload_is_compressed(self, cache, tmp_path):
+        path = _source(tmp_path, "doc.txt", "Contenu répétitif. " * 500)
+        _store(cache, path)
+        payload = next(cache.directory.glob("*.payload.z"))
+        assert payload.stat().st_size < path.stat().st_size / 10
+
+    def test_extension_is_part_of_the_key(self, cache, tmp_path):
+        txt = _source(tmp_path, "data.txt", "a;b\n1;2")
+        csv = _source(tmp_path, "data.csv", "a;b\n1;2")
+        _store(cache, txt)
+        assert cache.get(csv) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        paths = [_source(tmp_path, f"doc{i}.txt", f"Document {i} " * 200) for i in range(3)]
+        probe = ExtractionCache(tmp_path / "probe")
+        _store(probe, paths[0])
+        entry_size = probe.stats()["bytes"]
+
+        cache = ExtractionCache(tmp_path / "cache", max_bytes=int(entry_size * 2.5))
+        _store(cache, paths[0])
+        _store(cache, paths[1])
+        meta_0 = next(cache.directory.glob(f"{cache.content_hash(paths[0])}*.meta.json"))
+        os.utime(meta_0, (1, 1))  # doc0 = le moins récemment utilisé
+        cache.get(paths[1])
+        _store(cache, paths[2])
+
+        assert not cache.contains(paths[0])
+        assert cache.contains(paths[1]) and cache.contains(paths[2])
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_lazy_result_survives_pickling(self, cache, tmp_path):
+        path = _source(tmp_path, "doc.txt", "Texte transmis entre processus.")
+        _store(cache, path)
+        restored = pickle.loads(pickle.dumps(cache.get(path)))
+        assert isinstance(restored, LazyExtractionResult)
+        assert restored.text == "Texte transmis entre processus."
+
+    def test_corrupted_meta_is_a_miss(self, cache, tmp_path):
+        path = _source(tmp_path, "doc.txt", "Texte.")
+        _store(cache, path)
+        next(cache.directory.glob("*.meta.json")).write_text("{tronqué", encoding="utf-8")
+
+        assert cache.get(path) is None
+        assert not cache.contains(path)
+
+    def test_legacy_entries_removed(self, cache, tmp_path):
+        cache.directory.mkdir(parents=True)
+        legacy = cache.directory / ("0" * 32 + ".json")
+        legacy.write_text("{}", encoding="utf-8")
+
+        assert cache.stats()["bytes"] == 0
+        assert not legacy.exists()
@@ -1,7 +1,9 @@
 """Tests unitaires pour le fournisseur Google Gemini."""
 
+import asyncio
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from src.providers.gemini_provider import GeminiProvider
 from src.providers.base import AIResponse
@@ -104,3 +106,26 @@ class TestGeminiProviderGenerate:
         with patch.dict("sys.modules", {"google": MagicMock(), "google.genai": MagicMock(), "google.genai.types": MagicMock()}):
             with pytest.raises(RuntimeError, match="Échec après"):
                 provider.generate("Test")
+
+
+class TestGeminiProviderAsync:
+    """Tests de génération asynchrone (Phase 6)."""
+
+    @patch("src.providers.gemini_provider.GeminiProvider._get_client")
+    def test_agenerate_uses_aio_client(self, mock_get_client):
+        pytest.importorskip("google.genai")
+        mock_response = MagicMock()
+        mock_response.text = "Contenu async"
+        mock_response.usage_metadata = MagicMock(prompt_token_count=8, candidates_token_count=4)
+        mock_response.candidates = [MagicMock(finish_reason="STOP")]
+
+        mock_client = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
+
+        provider = GeminiProvider(api_key="test-key")
+        result = asyncio.run(provider.agenerate("Test", system_prompt="System"))
+
+        assert result.content == "Contenu async"
+        assert result.total_tokens == 12
+        mock_client.models.generate_content.assert_not_called()
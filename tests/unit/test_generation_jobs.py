@@ -0,0 +1,97 @@
+"""Tests unitaires pour la génération en tâche de fond (Phase 6)."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.generation_jobs import EVENTS_FILENAME, EventBus, GenerationJobManager, read_event_tail
+from src.core.orchestrator import Orchestrator
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.providers.base import AIResponse
+
+
+class TestEventBus:
+    def test_since_and_persisted_tail(self, tmp_path):
+        bus = EventBus(tmp_path / EVENTS_FILENAME, tail_size=3)
+        for i in range(8):
+            bus.publish("progress", percent=i / 8)
+
+        assert [e.seq for e in bus.since(6)] == [7, 8]
+        assert len(bus.since(0)) == 3
+        tail = read_event_tail(tmp_path)
+        assert tail[-1]["seq"] == 8
+        assert len(tail) <= 6  # compaction à 2 x tail_size
+
+    def test_wait_returns_new_events(self):
+        bus = EventBus()
+        threading.Timer(0.05, lambda: bus.publish("job_started")).start()
+        events = bus.wait(0, timeout=2)
+        assert [e.type for e in events] == ["job_started"]
+
+
+class _SlowProvider:
+    name = "fake"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def generate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        self.calls += 1
+        self.release.wait(2)
+        return AIResponse(content="Contenu.", model=model, provider=self.name, input_tokens=10, output_tokens=5)
+
+
+@pytest.fixture
+def manager():
+    GenerationJobManager.reset_instance()
+    yield GenerationJobManager.get_instance()
+    GenerationJobManager.reset_instance()
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    with patch("src.core.orchestrator.count_tokens", return_value=100):
+        orch = Orchestrator(
+            provider=_SlowProvider(),
+            project_dir=tmp_path,
+            config={"mode": "agentic", "summarization": {"mode": "extractive"}},
+        )
+        orch.init_project("test", NormalizedPlan(title="Doc", sections=[
+            PlanSection(id="1", title="Intro", level=1),
+            PlanSection(id="2", title="Suite", level=1),
+        ]))
+        orch._ensure_phase3_engine = MagicMock()
+        orch._run_post_generation_evaluation_background = MagicMock()
+        yield orch
+        orch.close()
+
+
+class TestGenerationJobManager:
+    def test_job_runs_in_background_and_publishes_events(self, manager, orchestrator):
+        job = manager.start("p1", orchestrator)
+        assert job.is_running
+        assert manager.start("p1", orchestrator) is job  # pas de doublon pendant l'exécution
+
+        orchestrator.provider.release.set()
+        job.join(5)
+
+        assert job.status == "done"
+        types = [e.type for e in job.bus.since(0)]
+        assert types[0] == "job_started" and types[-1] == "job_finished"
+        finished = [e for e in job.bus.since(0) if e.type == "section_finished"]
+        assert [e.data["section_id"] for e in finished] == ["1", "2"]
+        assert finished[0].data["output_tokens"] == 5
+        assert set(orchestrator.state.generated_sections) == {"1", "2"}
+        assert orchestrator.event_callback is None
+
+    def test_failure_is_reported(self, manager, orchestrator):
+        job = manager.start("p1", orchestrator, before_run=MagicMock(side_effect=RuntimeError("corpus illisible")))
+        job.join(5)
+
+        assert job.status == "failed" and job.error == "corpus illisible"
+        assert read_event_tail(orchestrator.project_dir)[-1]["type"] == "job_failed"
@@ -0,0 +1,166 @@
+"""Tests de la ré-indexation incrémentale du corpus (Phase 6)."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.core.corpus_extractor import StructuredCorpus
+from src.core.metadata_store import MetadataStore
+from src.core.orchestrator import Orchestrator, ProjectState
+from src.core.rag_engine import RAGEngine
+from src.core.text_extractor import ExtractionResult
+
+pytest.importorskip("chromadb")
+
+
+def _extraction(name: str, text: str) -> ExtractionResult:
+    return ExtractionResult(
+        text=text,
+        page_count=1,
+        char_count=len(text),
+        word_count=len(text.split()),
+        extraction_method="test",
+        status="success",
+        source_filename=name,
+        source_size_bytes=len(text),
+        hash_binary=f"bin_{name}_{len(text)}",
+        hash_text=f"txt_{name}_{len(text)}",
+    )
+
+
+def _fake_embeddings(texts, mode="document"):
+    return [[float(len(t) % 7) + 1.0, 1.0, 0.5] for t in texts]
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    config = {
+        "rag": {
+            "embedding_provider": "openai",
+            "chunking": {"max_chunk_tokens": 60, "min_chunk_tokens": 5, "overlap_sentences": 0},
+        },
+    }
+    orch = Orchestrator(provider=MagicMock(), project_dir=tmp_path, config=config)
+    orch.state = ProjectState(name="test", corpus=StructuredCorpus())
+    with patch.object(RAGEngine, "_get_embeddings", side_effect=_fake_embeddings) as mock_embed:
+        orch._mock_embed = mock_embed
+        yield orch
+
+
+def _texts_embedded(mock_embed) -> int:
+    return sum(len(call.args[0]) for call in mock_embed.call_args_list)
+
+
+class TestMetadataStoreManifest:
+    def test_manifest_roundtrip(self, tmp_path):
+        store = MetadataStore(str(tmp_path))
+        store.upsert_index_manifest([
+            {"doc_id": "a", "hash_binary": "hb", "hash_textual": "ht", "chunking_signature": "s", "chunk_count": 3},
+        ])
+        manifest = store.get_index_manifest()
+        assert manifest["a"]["chunk_count"] == 3
+        store.delete_index_manifest(["a"])
+        assert store.get_index_manifest() == {}
+        store.close()
+
+
+class TestIncrementalIndexing:
+    def test_first_run_is_full_and_writes_manifest(self, orchestrator):
+        doc_a = _extraction("a.txt", "Premier document sur la cybersécurité. " * 5)
+        doc_b = _extraction("b.txt", "Second document sur la formation. " * 5)
+        orchestrator.state.corpus.extractions = [doc_a, doc_b]
+        count = orchestrator.index_corpus_rag()
+        assert count > 0
+        manifest = orchestrator._metadata_store.get_index_manifest()
+        assert set(manifest) == {doc_a.hash_binary, doc_b.hash_binary}
+        assert sum(e["chunk_count"] for e in manifest.values()) == count
+
+    def test_unchanged_corpus_embeds_nothing(self, orchestrator):
+        orchestrator.state.corpus.extractions = [
+            _extraction("a.txt", "Premier document sur la cybersécurité. " * 5),
+        ]
+        first = orchestrator.index_corpus_rag()
+        embedded = _texts_embedded(orchestrator._mock_embed)
+
+        second = orchestrator.index_corpus_rag()
+        assert second == first
+        assert _texts_embedded(orchestrator._mock_embed) == embedded
+
+    def test_added_and_removed_documents(self, orchestrator):
+        doc_a = _extraction("a.txt", "Premier document sur la cybersécurité. " * 5)
+        doc_b = _extraction("b.txt", "Second document sur la formation. " * 5)
+        doc_c = _extraction("c.txt", "Troisième document sur le numérique. " * 5)
+        orchestrator.state.corpus.extractions = [doc_a, doc_b]
+        orchestrator.index_corpus_rag()
+        chunks_a = orchestrator._metadata_store.get_chunks_by_doc(doc_a.hash_binary)
+
+        orchestrator._mock_embed.reset_mock()
+        orchestrator.state.corpus.extractions = [doc_a, doc_c]
+        count = orchestrator.index_corpus_rag()
+
+        store = orchestrator._metadata_store
+        assert set(store.get_index_manifest()) == {doc_a.hash_binary, doc_c.hash_binary}
+        assert store.get_chunks_by_doc(doc_b.hash_binary) == []
+        assert store.get_document(doc_b.hash_binary) is None
+        # Seuls les chunks du nouveau document ont été vectorisés
+        assert _texts_embedded(orchestrator._mock_embed) == len(store.get_chunks_by_doc(doc_c.hash_binary))
+        assert count == len(chunks_a) + len(store.get_chunks_by_doc(doc_c.hash_binary))
+        remaining = orchestrator.rag_engine.collection.get(include=["metadatas"])["metadatas"]
+        assert {m["doc_id"] for m in remaining} == {doc_a.hash_binary, doc_c.hash_binary}
+
+    def test_chunking_change_forces_full_rebuild(self, orchestrator):
+        orchestrator.state.corpus.extractions = [
+            _extraction("a.txt", "Premier document sur la cybersécurité. " * 5),
+        ]
+        orchestrator.index_corpus_rag()
+        orchestrator._mock_embed.reset_mock()
+
+        orchestrator.config["rag"]["chunking"]["max_chunk_tokens"] = 120
+        with patch.object(RAGEngine, "index_corpus_semantic", wraps=orchestrator.rag_engine.index_corpus_semantic) as full:
+            orchestrator.index_corpus_rag()
+        full.assert_called_once()
+
+    def test_needs_corpus_indexing(self, orchestrator):
+        orchestrator._init_rag()
+        assert orchestrator.needs_corpus_indexing() is True
+        orchestrator.config["rag"]["incremental_indexing"] = False
+        with patch.object(RAGEngine, "indexed_count", new=5):
+            assert orchestrator.needs_corpus_indexing() is False
+
+    def test_needs_corpus_indexing_only_when_corpus_changes(self, orchestrator):
+        doc_a = _extraction("a.txt", "Premier document sur la cybersécurité. " * 5)
+        orchestrator.state.corpus.extractions = [doc_a]
+        orchestrator.index_corpus_rag()
+        assert orchestrator.needs_corpus_indexing() is False
+
+        orchestrator.state.corpus.extractions = [doc_a, _extraction("b.txt", "Second document. " * 5)]
+        assert orchestrator.needs_corpus_indexing() is True
+        orchestrator.index_corpus_rag()
+        assert orchestrator.needs_corpus_indexing() is False
+
+        orchestrator.config["rag"]["chunking"]["max_chunk_tokens"] = 120
+        assert orchestrator.needs_corpus_indexing() is True
+
+    def test_unchanged_corpus_does_not_contact_grobid(self, orchestrator):
+        orchestrator.config["grobid"] = {"enabled": True}
+        orchestrator.state.corpus.extractions = [
+            _extraction("a.pdf", "Premier document sur la cybersécurité. " * 5),
+        ]
+        with patch.object(Orchestrator, "_create_grobid_client", return_value=None) as grobid:
+            orchestrator.index_corpus_rag()
+            orchestrator.index_corpus_rag()
+        grobid.assert_called_once()
+
+    def test_fixed_chunking_is_not_rebuilt_when_unchanged(self, orchestrator):
+        orchestrator.config["rag"]["chunking"]["strategy"] = "fixed"
+        doc_a = _extraction("a.txt", "Premier document sur la cybersécurité. " * 5)
+        orchestrator.state.corpus.extractions = [doc_a]
+        first = orchestrator.index_corpus_rag()
+        assert orchestrator.needs_corpus_indexing() is False
+
+        with patch.object(RAGEngine, "index_corpus") as rebuild:
+            assert orchestrator.index_corpus_rag() == first
+        rebuild.assert_not_called()
+
+        orchestrator.state.corpus.extractions = [doc_a, _extraction("b.txt", "Second document. " * 5)]
+        assert orchestrator.needs_corpus_indexing() is True
+        assert orchestrator.index_corpus_rag() > first
@@ -0,0 +1,144 @@
+"""Tests unitaires pour la file de jobs sans interface (Phase 6)."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core.job_runner import JobQueue, JobRecord, JobRunner, JobSpec, build_job_config, load_job_specs
+from src.core.orchestrator import Orchestrator, ProjectState
+from src.core.plan_parser import PlanParser
+from src.core.state_store import load_state_dict
+from src.providers.base import AIResponse, BaseProvider
+
+PLAN = "1. Introduction\n2. Analyse\n3. Conclusion\n"
+
+
+class _FakeProvider(BaseProvider):
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        return "fake"
+
+    def generate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        with self._lock:
+            self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError("service indisponible")
+        return AIResponse(content="Contenu généré.", model=model, provider=self.name, input_tokens=10, output_tokens=5)
+
+    def is_available(self):
+        return True
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def list_models(self):
+        return ["gpt-4o"]
+
+
+@pytest.fixture(autouse=True)
+def no_tokenizer(tmp_path):
+    with patch("src.core.orchestrator.count_tokens", return_value=100), \
+            patch("src.core.text_extractor.CACHE_DIR", tmp_path / "cache"), \
+            patch.object(Orchestrator, "_ensure_phase3_engine"), \
+            patch.object(Orchestrator, "_run_post_generation_evaluation_background"):
+        yield
+
+
+@pytest.fixture
+def plan_file(tmp_path):
+    path = tmp_path / "plan.txt"
+    path.write_text(PLAN, encoding="utf-8")
+    return path
+
+
+def _runner(tmp_path, provider, max_attempts=2):
+    config = {
+        "default_provider": "fake",
+        "summarization": {"mode": "extractive"},
+        "headless": {"max_concurrent_projects": 2, "max_attempts": max_attempts, "export_docx": False},
+    }
+    queue = JobQueue(tmp_path / "queue")
+    return JobRunner(
+        queue,
+        projects_dir=tmp_path / "projects",
+        output_dir=tmp_path / "output",
+        base_config=config,
+        provider_factory=lambda name: provider,
+    )
+
+
+class TestJobSpecs:
+    def test_load_resolves_relative_paths(self, tmp_path, plan_file):
+        spec_file = tmp_path / "jobs.yaml"
+        spec_file.write_text("jobs:\n  - name: Rapport A\n    plan: plan.txt\n    corpus: corpus\n", encoding="utf-8")
+        [spec] = load_job_specs(spec_file)
+        assert spec.plan == str(plan_file.resolve())
+        assert spec.corpus == str((tmp_path / "corpus").resolve())
+        assert spec.job_id == "Rapport_A"
+
+    def test_invalid_specs_are_rejected(self):
+        with pytest.raises(ValueError, match="'plan' ou 'objective'"):
+            JobSpec.from_dict({"name": "Vide"})
+        with pytest.raises(ValueError, match="inconnues"):
+            JobSpec.from_dict({"name": "X", "objective": "o", "pages": 3})
+
+    def test_config_is_agentic_and_spec_wins_over_profile(self):
+        spec = JobSpec(name="X", objective="o", model="gpt-4.1", passes=2)
+        config = build_job_config(spec, {"mode": "manual"}, {"model": "gpt-4o", "number_of_passes": 1})
+        assert config["mode"] == "agentic"
+        assert config["model"] == "gpt-4.1" and config["number_of_passes"] == 2
+
+
+class TestJobRunner:
+    def test_runs_queued_jobs_to_completion(self, tmp_path, plan_file):
+        provider = _FakeProvider()
+        runner = _runner(tmp_path, provider)
+        runner.queue.submit([JobSpec(name=f"Rapport {i}", plan=str(plan_file)) for i in range(3)])
+
+        counts = runner.run()
+
+        assert counts["done"] == 3
+        assert len(provider.prompts) == 9  # 3 sections x 3 projets, résumés locaux
+        saved = ProjectState.from_dict(load_state_dict(tmp_path / "projects" / "Rapport_0"))
+        assert set(saved.generated_sections) == {"1", "2", "3"}
+        assert not list(runner.queue.inbox_dir.glob("*.json"))
+        assert JobQueue(tmp_path / "queue").load().records["Rapport_1"].completed_passes == 1
+
+    def test_interrupted_job_resumes_from_project_state(self, tmp_path, plan_file):
+        provider = _FakeProvider()
+        runner = _runner(tmp_path, provider)
+        spec = JobSpec(name="Rapport", plan=str(plan_file))
+
+        # Arrêt brutal après la première section
+        orch = Orchestrator(provider=provider, project_dir=tmp_path / "projects" / "Rapport", config={})
+        plan = PlanParser().parse_file(plan_file)
+        orch.init_project("Rapport", plan)
+        plan.sections[0].status = "generated"
+        orch.state.generated_sections["1"] = "Déjà généré."
+        orch.save_state()
+        orch.close()
+        runner.queue.records = {spec.job_id: JobRecord(spec=spec, status="running", attempts=1)}
+        runner.queue.save()
+
+        assert runner.run()["done"] == 1
+        assert len(provider.prompts) == 2
+        saved = ProjectState.from_dict(load_state_dict(tmp_path / "projects" / "Rapport"))
+        assert saved.generated_sections["1"] == "Déjà généré."
+
+    def test_failed_sections_are_retried_then_job_fails(self, tmp_path, plan_file):
+        provider = _FakeProvider(fail=True)
+        runner = _runner(tmp_path, provider, max_attempts=2)
+        runner.queue.submit([JobSpec(name="Rapport", plan=str(plan_file))])
+
+        counts = runner.run()
+
+        record = runner.queue.records["Rapport"]
+        assert counts["failed"] == 1
+        assert record.attempts == 2 and "section(s) en échec" in record.error
+        assert record.completed_passes == 0
@@ -66,7 +66,7 @@ class TestEmbedDocuments:
         assert texts[1] == "passage: texte 2"
 
     @patch("src.core.local_embedder.LocalEmbedder._load_model")
-    def test_embed_documents_returns_list_of_lists(self, mock_load):
+    def test_embed_documents_returns_float32_matrix(self, mock_load):
         mock_model = MagicMock()
         mock_model.embed.return_value = iter([
             np.random.randn(1024) for _ in range(3)
@@ -76,13 +76,11 @@ class TestEmbedDocuments:
         embedder = LocalEmbedder()
         result = embedder.embed_documents(["a", "b", "c"])
 
-        assert isinstance(result, list)
-        assert len(result) == 3
-        assert isinstance(result[0], list)
-        assert len(result[0]) == 1024
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (3, 1024)
 
     @patch("src.core.local_embedder.LocalEmbedder._load_model")
-    def test_embed_documents_returns_native_floats(self, mock_load):
+    def test_embed_documents_dtype_float32(self, mock_load):
         mock_model = MagicMock()
         mock_model.embed.return_value = iter([np.ones(1024)])
         mock_load.return_value = mock_model
@@ -90,8 +88,9 @@ class TestEmbedDocuments:
         embedder = LocalEmbedder()
         result = embedder.embed_documents(["texte"])
 
-        # Vérifie que les valeurs sont des float Python natifs, pas np.float32
-        assert isinstance(result[0][0], float)
+        # Phase 6 (Perf) : matrice float32, sans conversion en floats Python
+        assert result.dtype == np.float32
+        assert result.flags["C_CONTIGUOUS"]
 
     @patch("src.core.local_embedder.LocalEmbedder._load_model")
     def test_embed_documents_custom_batch_size(self, mock_load):
@@ -133,7 +132,7 @@ class TestEmbedQuery:
         assert texts[0] == "query: ma requête"
 
     @patch("src.core.local_embedder.LocalEmbedder._load_model")
-    def test_embed_query_returns_list(self, mock_load):
+    def test_embed_query_returns_vector(self, mock_load):
         mock_model = MagicMock()
         mock_model.embed.return_value = iter([np.random.randn(1024)])
         mock_load.return_value = mock_model
@@ -141,11 +140,11 @@ class TestEmbedQuery:
         embedder = LocalEmbedder()
         result = embedder.embed_query("test")
 
-        assert isinstance(result, list)
-        assert len(result) == 1024
+        assert isinstance(result, np.ndarray)
+        assert result.shape == (1024,)
 
     @patch("src.core.local_embedder.LocalEmbedder._load_model")
-    def test_embed_query_returns_native_floats(self, mock_load):
+    def test_embed_query_dtype_float32(self, mock_load):
         mock_model = MagicMock()
         mock_model.embed.return_value = iter([np.ones(1024)])
         mock_load.return_value = mock_model
@@ -153,8 +152,28 @@ class TestEmbedQuery:
         embedder = LocalEmbedder()
         result = embedder.embed_query("test")
 
-        # Vérifie que les valeurs sont des float Python natifs, pas np.float32
-        assert isinstance(result[0], float)
+        assert result.dtype == np.float32
+
+
+class TestEmbedQueries:
+    @patch("src.core.local_embedder.LocalEmbedder._load_model")
+    def test_embed_queries_single_model_call(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.embed.return_value = iter([np.zeros(1024), np.ones(1024)])
+        mock_load.return_value = mock_model
+
+        embedder = LocalEmbedder()
+        result = embedder.embed_queries(["a", "b"])
+
+        mock_model.embed.assert_called_once()
+        assert mock_model.embed.call_args[0][0] == ["query: a", "query: b"]
+        assert result.shape == (2, 1024)
+        assert result.dtype == np.float32
+
+    def test_embed_queries_empty(self):
+        embedder = LocalEmbedder()
+        result = embedder.embed_queries([])
+        assert result.shape == (0, embedder.dimension)
 
 
 class TestLazyLoading:
@@ -1,8 +1,11 @@
 """Tests unitaires pour le module prompt_engine."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from src.core.prompt_engine import PromptEngine
+from src.core.prompt_engine import PREVIOUS_CONTEXT_SLOT, PromptEngine
+from src.providers.base import PROMPT_CACHE_BOUNDARY, split_cache_boundary
 from src.core.plan_parser import PlanSection, NormalizedPlan
 from src.core.corpus_extractor import CorpusChunk
 
@@ -93,6 +96,66 @@ class TestBuildSectionPrompt:
         assert "3.0" in prompt or "page" in prompt.lower()
 
 
+class TestPreparedPrompt:
+    def test_render_matches_full_prompt(self, engine, sample_plan, sample_chunks):
+        section = sample_plan.sections[1]
+        summaries = [f"[{i}] Section {i}: résumé" for i in range(7)]
+        prepared = engine.prepare_section_prompt(section, sample_plan, sample_chunks, extra_instruction="Bref.")
+        assert PREVIOUS_CONTEXT_SLOT not in prepared.static_text
+        assert prepared.render(summaries) == engine.build_section_prompt(
+            section, sample_plan, sample_chunks, summaries, extra_instruction="Bref.",
+        )
+        assert "[1] Section 1" not in prepared.render(summaries)  # 5 derniers résumés
+
+    def test_refinement_render(self, engine, sample_plan):
+        section = sample_plan.sections[0]
+        prepared = engine.prepare_refinement_prompt(section, sample_plan, "Brouillon.", [])
+        assert "Aucune section précédente." in prepared.render([])
+        assert "Brouillon." in prepared.render([])
+
+
+class TestCacheStableLayout:
+    """Phase 6 (Perf) : préfixe identique d'une section à l'autre."""
+
+    def test_section_prefix_is_shared(self, engine, sample_plan, sample_chunks):
+        first, second = (
+            engine.build_section_prompt(s, sample_plan, sample_chunks, [], extra_instruction="Bref.")
+            for s in sample_plan.sections
+        )
+        prefix, suffix = split_cache_boundary(first)
+        assert prefix and prefix == split_cache_boundary(second)[0]
+        assert "Créer un rapport" in prefix and "Introduction" not in prefix
+        assert "Introduction" in suffix and "Bref." in suffix
+
+    def test_refinement_prefix_is_shared(self, engine, sample_plan):
+        prefixes = {
+            split_cache_boundary(engine.build_refinement_prompt(s, sample_plan, f"Brouillon {s.id}", [], []))[0]
+            for s in sample_plan.sections
+        }
+        assert len(prefixes) == 1
+
+    def test_system_instructions_follow_the_boundary(self):
+        engine = PromptEngine(persistent_instructions="Ton formel.")
+        prefix, suffix = split_cache_boundary(engine.build_system_prompt())
+        assert "RÈGLES DE FIABILITÉ" in prefix
+        assert "Ton formel." in suffix
+
+    def test_small_glossary_goes_to_prefix(self, sample_plan):
+        glossary = MagicMock(enabled=True, max_terms_per_prompt=15)
+        glossary.get_all_terms.return_value = [{"term": "IA", "definition": "Intelligence artificielle"}]
+        glossary.format_for_prompt.side_effect = lambda terms: "GLOSSAIRE " + ", ".join(t["term"] for t in terms)
+        engine = PromptEngine(glossary_engine=glossary)
+        prompt = engine.build_section_prompt(sample_plan.sections[0], sample_plan, [], [])
+        assert "GLOSSAIRE IA" in split_cache_boundary(prompt)[0]
+        glossary.get_terms_for_section.assert_not_called()
+
+    def test_caching_disabled(self, sample_plan):
+        engine = PromptEngine(prompt_caching=False)
+        prompt = engine.build_section_prompt(sample_plan.sections[0], sample_plan, [], [])
+        assert PROMPT_CACHE_BOUNDARY not in prompt
+        assert PROMPT_CACHE_BOUNDARY not in engine.build_system_prompt()
+
+
 class TestBuildPlanGenerationPrompt:
     def test_plan_prompt(self, engine):
         prompt = engine.build_plan_generation_prompt("Analyser le marché de l'IA", 20)
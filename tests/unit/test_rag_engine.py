@@ -160,3 +160,61 @@ class TestRAGEngineProperties:
 
         engine = RAGEngine()
         assert engine.indexed_count == 42
+
+
+class TestRAGEngineSearchMany:
+    """Tests de la recherche groupée pour tout le plan (Phase 6)."""
+
+    @staticmethod
+    def _section(section_id, title, description=""):
+        section = MagicMock()
+        section.id = section_id
+        section.title = title
+        section.description = description
+        return section
+
+    @patch("src.core.rag_engine.RAGEngine._get_collection")
+    def test_single_query_call_and_cache_fill(self, mock_get_collection):
+        mock_collection = MagicMock()
+        mock_collection.count.return_value = 5
+        mock_collection.query.return_value = {
+            "documents": [["A"], ["B"]],
+            "metadatas": [[{"source_file": "a.txt"}], [{"source_file": "b.txt"}]],
+            "distances": [[0.1], [0.4]],
+            "ids": [["a_0"], ["b_0"]],
+        }
+        mock_get_collection.return_value = mock_collection
+
+        engine = RAGEngine(config={"rag": {"embedding_provider": "openai"}})
+        sections = [self._section("1", "Intro"), self._section("2", "Suite", "Détails")]
+        results = engine.search_many(sections)
+
+        mock_collection.query.assert_called_once()
+        assert mock_collection.query.call_args.kwargs["query_texts"] == ["Intro", "Suite. Détails"]
+        assert results["1"].chunks[0]["source_file"] == "a.txt"
+        assert results["2"].section_title == "Suite"
+
+        # Les recherches suivantes sont servies par le cache
+        engine.search = MagicMock()
+        assert engine.search_for_section("2", "Suite", "Détails") is results["2"]
+        engine.search.assert_not_called()
+
+    @patch("src.core.rag_engine.RAGEngine._get_collection")
+    def test_batched_rerank(self, mock_get_collection):
+        mock_collection = MagicMock()
+        mock_collection.count.return_value = 5
+        mock_collection.query.return_value = {
+            "documents": [["A1", "A2"], ["B1", "B2"]],
+            "metadatas": [[{}, {}], [{}, {}]],
+            "distances": [[0.1, 0.2], [0.1, 0.2]],
+        }
+        mock_get_collection.return_value = mock_collection
+
+        engine = RAGEngine(top_k=1, config={"rag": {"embedding_provider": "openai"}})
+        with patch.object(engine, "_rerank_many", wraps=engine._rerank_many) as rerank_many, \
+                patch("src.core.reranker.Reranker.rerank_many", side_effect=lambda q, c, top_k: [l[:top_k] for l in c]):
+            results = engine.search_many([self._section("1", "X"), self._section("2", "Y")])
+
+        rerank_many.assert_called_once()
+        assert len(results["1"].chunks) == 1
+        assert len(results["2"].chunks) == 1
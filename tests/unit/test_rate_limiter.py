@@ -0,0 +1,186 @@
+"""Tests unitaires pour le limiteur de débit partagé (Phase 6)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.providers.base import AIResponse
+from src.providers.openai_provider import OpenAIProvider
+from src.utils.rate_limiter import (
+    ModelLimiter,
+    Priority,
+    RateLimiter,
+    TokenBucket,
+    backoff_delay,
+    current_priority,
+    is_rate_limit_error,
+    request_priority,
+    retry_after_seconds,
+    set_rate_limiter,
+)
+
+
+@pytest.fixture
+def shared_limiter():
+    limiter = RateLimiter({"openai": {"gpt-4o": {"rpm": 600, "tpm": 100_000}}})
+    set_rate_limiter(limiter)
+    yield limiter
+    set_rate_limiter(None)
+
+
+class TestTokenBucket:
+    def test_wait_time_follows_refill_rate(self):
+        bucket = TokenBucket(capacity=60, per_minute=60)
+        now = time.monotonic()
+        assert bucket.wait_time(60, now) == 0
+        bucket.take(60)
+        assert bucket.wait_time(2, now) == pytest.approx(2.0, abs=0.05)
+
+    def test_give_is_capped_and_debt_allowed(self):
+        bucket = TokenBucket(capacity=10, per_minute=60)
+        bucket.give(100)
+        assert bucket.level == 10
+        bucket.take(15)
+        assert bucket.level == -5
+
+
+class TestModelLimiter:
+    def test_request_bucket_throttles(self):
+        limiter = ModelLimiter(rpm=600)  # 10 requêtes/s, rafale de 600
+        limiter.requests.level = 1
+        start = time.monotonic()
+        limiter.acquire(0, Priority.DEFAULT)
+        limiter.acquire(0, Priority.DEFAULT)
+        assert time.monotonic() - start >= 0.08
+
+    def test_reconcile_returns_unused_tokens(self):
+        limiter = ModelLimiter(tpm=1000)
+        limiter.acquire(800, Priority.DEFAULT)
+        limiter.reconcile(estimated=800, actual=300)
+        assert limiter.tokens.level == pytest.approx(700, abs=5)
+
+    def test_oversized_request_is_clamped(self):
+        limiter = ModelLimiter(tpm=100)
+        limiter.acquire(10_000, Priority.DEFAULT)
+        assert limiter.tokens.level == pytest.approx(0, abs=5)
+
+    def test_generation_served_before_background(self):
+        limiter = ModelLimiter(rpm=600)
+        limiter.requests.level = 0
+        order = []
+
+        def worker(priority, name):
+            limiter.acquire(0, priority)
+            order.append(name)
+
+        background = threading.Thread(target=worker, args=(Priority.BACKGROUND, "background"))
+        background.start()
+        time.sleep(0.02)
+        generation = threading.Thread(target=worker, args=(Priority.GENERATION, "generation"))
+        generation.start()
+        background.join(2)
+        generation.join(2)
+        assert order == ["generation", "background"]
+
+    def test_async_acquire(self):
+        limiter = ModelLimiter(rpm=600)
+        limiter.requests.level = 1
+
+        async def run():
+            await limiter.aacquire(0, Priority.DEFAULT)
+            await limiter.aacquire(0, Priority.DEFAULT)
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.08
+
+    def test_penalize_drains_buckets(self):
+        limiter = ModelLimiter(rpm=60, tpm=6000)
+        limiter.penalize()
+        assert limiter.requests.level <= 0 and limiter.tokens.level <= 0
+
+
+class TestRateLimiter:
+    def test_default_limits_and_unlimited_models(self):
+        limiter = RateLimiter({"openai": {"default": {"rpm": 10}}})
+        assert limiter._limiter("openai", "gpt-4.1") is not None
+        assert limiter._limiter("anthropic", "claude-opus-4-6") is None
+        assert RateLimiter({"enabled": False, "openai": {"default": {"rpm": 10}}})._limiter("openai", "x") is None
+
+    def test_priority_context(self):
+        assert current_priority() == Priority.DEFAULT
+        with request_priority(Priority.BACKGROUND):
+            assert current_priority() == Priority.BACKGROUND
+        assert current_priority() == Priority.DEFAULT
+
+    def test_lease_settles_with_actual_usage(self):
+        limiter = RateLimiter({"openai": {"gpt-4o": {"tpm": 10_000}}})
+        lease = limiter.acquire("openai", "gpt-4o", 4000)
+        lease.settle(AIResponse(content="", model="gpt-4o", provider="openai", total_tokens=1000))
+        lease.release()  # sans effet après settle
+        assert limiter._limiter("openai", "gpt-4o").tokens.level == pytest.approx(9000, abs=5)
+
+    def test_rate_limit_error_detection(self):
+        error = Exception("Too many requests")
+        error.status_code = 429
+        assert is_rate_limit_error(error)
+        assert not is_rate_limit_error(RuntimeError("boom"))
+
+    def test_backoff_uses_retry_after_on_rate_limit(self):
+        error = Exception("Too many requests")
+        error.status_code = 429
+        error.response = MagicMock(headers={"Retry-After": "7"})
+        assert retry_after_seconds(error) == 7.0
+        assert backoff_delay(error, attempt=0, base_delay=2.0) == 7.0
+
+        error.response = MagicMock(headers={"retry-after-ms": "1500", "retry-after": "2"})
+        assert backoff_delay(error, attempt=3, base_delay=2.0) == 1.5
+
+    def test_backoff_falls_back_to_exponential(self):
+        error = Exception("Too many requests")
+        error.status_code = 429
+        assert backoff_delay(error, attempt=2, base_delay=2.0) == 8.0
+        # Retry-After ignoré hors 429 (ex. 503)
+        other = Exception("Unavailable")
+        other.status_code = 503
+        other.response = MagicMock(headers={"Retry-After": "30"})
+        assert backoff_delay(other, attempt=0, base_delay=2.0) == 2.0
+
+
+class TestProviderIntegration:
+    def _provider(self):
+        provider = OpenAIProvider(api_key="sk-test", max_retries=1, base_delay=0)
+        provider._client = MagicMock()
+        return provider
+
+    def test_generate_reconciles_usage(self, shared_limiter):
+        provider = self._provider()
+        response = MagicMock()
+        response.choices = [MagicMock(finish_reason="stop")]
+        response.choices[0].message.content = "Bonjour"
+        response.usage.prompt_tokens = 10
+        response.usage.completion_tokens = 5
+        response.usage.total_tokens = 15
+        provider._client.chat.completions.create.return_value = response
+
+        provider.generate("prompt", model="gpt-4o", max_tokens=1000)
+
+        bucket = shared_limiter._limiter("openai", "gpt-4o").tokens
+        assert bucket.level == pytest.approx(100_000 - 15, abs=5)
+
+    def test_429_slows_every_caller(self, shared_limiter):
+        provider = self._provider()
+        error = Exception("rate limited")
+        error.status_code = 429
+        provider._client.chat.completions.create.side_effect = error
+        limiter = shared_limiter._limiter("openai", "gpt-4o")
+        limiter.penalize = MagicMock(wraps=limiter.penalize)
+
+        with pytest.raises(RuntimeError):
+            provider.generate("prompt", model="gpt-4o")
+        assert limiter.penalize.call_count >= 1
+        # Les tokens réservés des tentatives échouées sont restitués
+        assert limiter.tokens.level > 0
@@ -4,7 +4,13 @@ import pytest
 from unittest.mock import patch, MagicMock
 import numpy as np
 
-from src.core.reranker import Reranker, ScoredChunk, build_context, DEFAULT_RERANKER_MODEL
+from src.core.reranker import (
+    DEFAULT_RERANKER_MODEL,
+    Reranker,
+    ScoredChunk,
+    build_context,
+    resolve_reranker_backend,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -170,6 +176,38 @@ class TestRerank:
         assert result[0].doc_title == "Rapport"
 
 
+class TestRerankMany:
+    @patch("src.core.reranker.Reranker._load_model")
+    def test_single_predict_call_for_all_queries(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.predict.return_value = np.array([0.1, 0.9, 0.7, 0.2])
+        mock_load.return_value = mock_model
+
+        r = Reranker()
+        results = r.rerank_many(
+            ["q1", "q2"],
+            [
+                [_make_scored_chunk(chunk_id="a"), _make_scored_chunk(chunk_id="b")],
+                [_make_scored_chunk(chunk_id="c"), _make_scored_chunk(chunk_id="d")],
+            ],
+            top_k=1,
+        )
+
+        mock_model.predict.assert_called_once()
+        assert len(mock_model.predict.call_args[0][0]) == 4
+        assert [c.chunk_id for c in results[0]] == ["b"]
+        assert [c.chunk_id for c in results[1]] == ["c"]
+
+    def test_empty_candidates(self):
+        r = Reranker()
+        assert r.rerank_many(["q1", "q2"], [[], []]) == [[], []]
+
+    def test_length_mismatch_raises(self):
+        r = Reranker()
+        with pytest.raises(ValueError):
+            r.rerank_many(["q1"], [[], []])
+
+
 class TestLazyLoading:
     def test_model_not_loaded_on_init(self):
         r = Reranker()
@@ -227,3 +265,112 @@ class TestBuildContext:
         )
         result = build_context([chunk])
         assert "doc_xyz" in result
+
+
+# ── Tests backend ONNX (Phase 6) ──
+
+class TestOnnxBackend:
+    def test_resolve_default_backend(self):
+        assert resolve_reranker_backend(DEFAULT_RERANKER_MODEL) == ("sentence-transformers", DEFAULT_RERANKER_MODEL)
+
+    def test_resolve_onnx_alias(self):
+        assert resolve_reranker_backend("onnx:cross-encoder/ms-marco-MiniLM-L-12-v2") == (
+            "onnx", "Xenova/ms-marco-MiniLM-L-12-v2",
+        )
+        assert resolve_reranker_backend("onnx:BAAI/bge-reranker-base") == ("onnx", "BAAI/bge-reranker-base")
+
+    def test_onnx_scores_are_sigmoid_of_logits(self):
+        fake_model = MagicMock()
+        fake_model.rerank_pairs.side_effect = lambda pairs, batch_size: iter([0.0, 4.0, -4.0])
+        fake_module = MagicMock(TextCrossEncoder=MagicMock(return_value=fake_model))
+        with patch.dict("sys.modules", {"fastembed.rerank.cross_encoder": fake_module}):
+            reranker = Reranker("onnx:cross-encoder/ms-marco-MiniLM-L-12-v2")
+            chunks = [
+                _make_scored_chunk(chunk_id="a"),
+                _make_scored_chunk(chunk_id="b"),
+                _make_scored_chunk(chunk_id="c"),
+            ]
+            result = reranker.rerank("requête", chunks, top_k=3)
+
+        assert reranker.backend == "onnx"
+        assert [c.chunk_id for c in result] == ["b", "a", "c"]
+        assert result[1].rerank_score == pytest.approx(0.5)
+        assert all(0.0 < c.rerank_score < 1.0 for c in result)
+
+    @patch("src.core.reranker.Reranker._load_model")
+    def test_reports_latency_per_pair(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.predict.return_value = np.array([0.2, 0.4])
+        mock_load.return_value = mock_model
+
+        reranker = Reranker()
+        reranker.rerank("q", [_make_scored_chunk(chunk_id="a"), _make_scored_chunk(chunk_id="b")])
+        assert reranker.last_stats["pairs"] == 2
+        assert reranker.last_stats["backend"] == "sentence-transformers"
+        assert reranker.last_stats["ms_per_pair"] >= 0
+
+    def test_get_instance_switches_model(self):
+        r1 = Reranker.get_instance()
+        assert Reranker.get_instance(DEFAULT_RERANKER_MODEL) is r1
+        r2 = Reranker.get_instance("onnx:cross-encoder/ms-marco-MiniLM-L-12-v2")
+        assert r2 is not r1
+        assert r2.backend == "onnx"
+
+
+# ── Tests cache de scores (Phase 6) ──
+
+class TestScoreCache:
+    @patch("src.core.reranker.Reranker._load_model")
+    def test_repeated_query_hits_cache(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda pairs, batch_size: np.linspace(0.1, 0.9, len(pairs))
+        mock_load.return_value = mock_model
+
+        r = Reranker()
+        first = r.rerank("q", [_make_scored_chunk(chunk_id="a"), _make_scored_chunk(chunk_id="b")])
+        second = r.rerank("q", [_make_scored_chunk(chunk_id="a"), _make_scored_chunk(chunk_id="b")])
+
+        mock_model.predict.assert_called_once()
+        assert [c.rerank_score for c in second] == [c.rerank_score for c in first]
+        assert r.score_cache_stats()["hits"] == 2
+
+    @patch("src.core.reranker.Reranker._load_model")
+    def test_only_unique_unseen_pairs_are_scored(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda pairs, batch_size: np.full(len(pairs), 0.5)
+        mock_load.return_value = mock_model
+
+        r = Reranker()
+        r.rerank("q1", [_make_scored_chunk(chunk_id="a")])
+        r.rerank_many(
+            ["q1", "q2", "q2"],
+            [
+                [_make_scored_chunk(chunk_id="a"), _make_scored_chunk(chunk_id="b")],
+                [_make_scored_chunk(chunk_id="a")],
+                [_make_scored_chunk(chunk_id="a")],
+            ],
+        )
+
+        pairs = mock_model.predict.call_args[0][0]
+        assert len(pairs) == 2  # (q1, b) et (q2, a) ; (q1, a) est en cache
+
+    @patch("src.core.reranker.Reranker._load_model")
+    def test_cache_is_bounded(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda pairs, batch_size: np.full(len(pairs), 0.5)
+        mock_load.return_value = mock_model
+
+        r = Reranker(score_cache_size=2)
+        r.rerank("q", [_make_scored_chunk(chunk_id=f"c{i}") for i in range(5)])
+        assert r.score_cache_stats()["entries"] == 2
+
+    @patch("src.core.reranker.Reranker._load_model")
+    def test_cache_disabled(self, mock_load):
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda pairs, batch_size: np.full(len(pairs), 0.5)
+        mock_load.return_value = mock_model
+
+        r = Reranker(score_cache_size=0)
+        r.rerank("q", [_make_scored_chunk(chunk_id="a")])
+        r.rerank("q", [_make_scored_chunk(chunk_id="a")])
+        assert mock_model.predict.call_count == 2
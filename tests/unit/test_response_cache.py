@@ -0,0 +1,171 @@
+"""Tests unitaires pour le cache de réponses IA (Phase 6)."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.cost_tracker import CostTracker
+from src.core.orchestrator import Orchestrator
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.core.response_cache import CachedProvider, ResponseCache, current_task, llm_task, response_key
+from src.providers.base import AIResponse, BaseProvider
+
+
+class _CountingProvider(BaseProvider):
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def name(self):
+        return "openai"
+
+    def generate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        self.calls += 1
+        return AIResponse(
+            content=f"Réponse {self.calls}", model=model or "gpt-4o", provider=self.name,
+            input_tokens=1000, output_tokens=500, total_tokens=1500, finish_reason="stop",
+        )
+
+    def is_available(self):
+        return True
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def list_models(self):
+        return ["gpt-4o"]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "response_cache")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def provider(cache):
+    return CachedProvider(_CountingProvider(), cache, tasks={"factcheck": True, "generation": False})
+
+
+class TestResponseKey:
+    def test_every_parameter_is_part_of_the_key(self):
+        base = response_key("openai", "gpt-4o", "sys", "prompt", 0.1, 300)
+        assert base == response_key("openai", "gpt-4o", "sys", "prompt", 0.1, 300)
+        assert base != response_key("anthropic", "gpt-4o", "sys", "prompt", 0.1, 300)
+        assert base != response_key("openai", "gpt-4o", None, "prompt", 0.1, 300)
+        assert base != response_key("openai", "gpt-4o", "sys", "prompt", 0.3, 300)
+        assert base != response_key("openai", "gpt-4o", "sys", "prompt", 0.1, 301)
+
+
+class TestCachedProvider:
+    def test_identical_calls_hit_the_cache(self, provider):
+        with llm_task("factcheck"):
+            first = provider.generate("prompt", system_prompt="sys", temperature=0.1, max_tokens=300)
+            second = provider.generate("prompt", system_prompt="sys", temperature=0.1, max_tokens=300)
+        assert provider.inner.calls == 1
+        assert not first.cached and second.cached
+        assert second.content == first.content
+        assert second.input_tokens == 1000 and second.finish_reason == "stop"
+
+    def test_disabled_task_types_bypass_the_cache(self, provider):
+        with llm_task("generation"):
+            provider.generate("prompt")
+            provider.generate("prompt")
+        provider.generate("prompt")  # type "default" absent → désactivé
+        provider.generate("prompt")
+        assert provider.inner.calls == 4
+
+    def test_persists_across_instances(self, tmp_path, provider):
+        with llm_task("factcheck"):
+            provider.generate("prompt", temperature=0.1)
+        provider.cache.close()
+        reopened = CachedProvider(_CountingProvider(), ResponseCache(tmp_path / "response_cache"), {"factcheck": True})
+        with llm_task("factcheck"):
+            assert reopened.generate("prompt", temperature=0.1).cached
+        assert reopened.inner.calls == 0
+        reopened.cache.close()
+
+    def test_async_path(self, provider):
+        async def run():
+            with llm_task("factcheck"):
+                await provider.agenerate("prompt")
+                return await provider.agenerate("prompt")
+
+        assert asyncio.run(run()).cached
+        assert provider.inner.calls == 1
+
+    def test_task_context_is_restored(self):
+        with llm_task("summary"):
+            assert current_task() == "summary"
+        assert current_task() == "default"
+
+    def test_delegates_provider_api(self, provider):
+        assert provider.name == "openai"
+        assert provider.get_default_model() == "gpt-4o"
+        assert provider.calls == 0  # attribut du fournisseur enveloppé
+
+
+class TestEviction:
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=600)
+        for i in range(20):
+            cache.put(f"k{i}", AIResponse(content=f"contenu {i} " + "x" * 50, model="m", provider="p"))
+        stats = cache.stats()
+        assert stats["bytes"] <= 600
+        assert stats["evictions"] > 0
+        assert cache.get("k0") is None
+        assert cache.get("k19") is not None
+        cache.close()
+
+
+class TestCostTracking:
+    def test_hits_are_recorded_at_zero_cost(self):
+        tracker = CostTracker()
+        tracker.record("1", "gpt-4o", "openai", 1000, 500, task_type="factcheck")
+        entry = tracker.record("1", "gpt-4o", "openai", 1000, 500, task_type="factcheck", cached=True)
+        assert entry.cost_usd == 0.0
+        assert entry.saved_usd > 0
+        report = tracker.report.to_dict()
+        assert report["cache_hits"] == 1
+        assert report["total_saved_usd"] == pytest.approx(report["total_cost_usd"])
+        assert report["total_input_tokens"] == 1000
+
+    def test_savings_survive_resume(self, tmp_path):
+        config = {"mode": "agentic", "summarization": {"mode": "extractive"}}
+        with patch("src.core.orchestrator.count_tokens", return_value=100):
+            orch = Orchestrator(provider=_CountingProvider(), project_dir=tmp_path, config=config)
+            orch.init_project("test", NormalizedPlan(title="Doc", sections=[PlanSection(id="1", title="Intro", level=1)]))
+            orch.cost_tracker.record("1", "gpt-4o", "openai", 1000, 500, task_type="summary")
+            orch.cost_tracker.record("1", "gpt-4o", "openai", 1000, 500, task_type="summary", cached=True)
+            saved = orch.cost_tracker.report.to_dict()
+            orch.state.cost_report = saved
+            orch.save_state()
+            orch.close()
+
+            resumed = Orchestrator(provider=_CountingProvider(), project_dir=tmp_path, config=config)
+            resumed.load_state()
+            resumed._ensure_phase3_engine = MagicMock()
+            resumed._run_post_generation_evaluation_background = MagicMock()
+            resumed.generate_multi_pass(num_passes=1)
+            report = resumed.state.cost_report
+            resumed.close()
+
+        assert report["cache_hits"] == 1
+        assert report["total_saved_usd"] == pytest.approx(saved["total_saved_usd"])
+        assert report["total_input_tokens"] > saved["total_input_tokens"]  # passe reprise comptabilisée
+        assert len(report["entries"]) > len(saved["entries"])
+
+
+class TestOrchestratorIntegration:
+    def test_provider_wrapped_when_enabled(self, tmp_path):
+        config = {"response_cache": {"enabled": True, "tasks": {"summary": True}}}
+        orch = Orchestrator(provider=_CountingProvider(), project_dir=tmp_path, config=config)
+        assert isinstance(orch.provider, CachedProvider)
+        assert orch.provider.cache.directory == tmp_path / "response_cache"
+        orch.close()
+
+    def test_not_wrapped_by_default(self, tmp_path):
+        provider = MagicMock()
+        assert Orchestrator(provider=provider, project_dir=tmp_path).provider is provider
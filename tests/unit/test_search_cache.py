@@ -0,0 +1,107 @@
+"""Tests unitaires pour le cache de recherche RAG (Phase 6)."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.core.rag_engine import RAGEngine, RAGResult
+from src.core.search_cache import SearchCache, persistent_key
+
+
+class TestSearchCacheMemory:
+    def test_hit_and_miss_counters(self):
+        cache = SearchCache(max_entries=2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction_by_entries(self):
+        cache = SearchCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" devient le moins récent
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        cache = SearchCache(max_entries=100, max_bytes=100)
+        cache.put("a", 1, size_bytes=60)
+        cache.put("b", 2, size_bytes=60)
+        assert len(cache) == 1
+        assert cache.get("b") == 2
+
+    def test_clear(self):
+        cache = SearchCache()
+        cache.put("a", 1, size_bytes=10)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats()["bytes"] == 0
+
+
+class TestSearchCacheDisk:
+    def test_roundtrip(self, tmp_path):
+        cache = SearchCache(disk_dir=tmp_path)
+        key = persistent_key("fp1", "query", 10, True)
+        cache.put_persistent(key, "fp1", {"value": 1})
+        reopened = SearchCache(disk_dir=tmp_path)
+        assert reopened.get_persistent(key) == {"value": 1}
+
+    def test_key_depends_on_parameters(self):
+        base = persistent_key("fp", "q", 10, True)
+        assert base != persistent_key("fp2", "q", 10, True)
+        assert base != persistent_key("fp", "q", 5, True)
+        assert base != persistent_key("fp", "q", 10, False)
+
+    def test_new_fingerprint_prunes_old_entries(self, tmp_path):
+        cache = SearchCache(disk_dir=tmp_path)
+        old_key = persistent_key("old", "q", 10, True)
+        cache.put_persistent(old_key, "old", {"value": 1})
+        cache.put_persistent(persistent_key("new", "q", 10, True), "new", {"value": 2})
+        assert cache.get_persistent(old_key) is None
+
+    def test_disk_entries_bounded(self, tmp_path):
+        cache = SearchCache(disk_dir=tmp_path, max_disk_entries=2)
+        keys = [persistent_key("fp", f"q{i}", 10, True) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put_persistent(key, "fp", {"value": i})
+        assert cache.get_persistent(keys[0]) is None
+        assert cache.get_persistent(keys[2]) == {"value": 2}
+
+
+class TestRAGEngineSearchCache:
+    def _result(self):
+        return RAGResult(
+            section_id="", section_title="q",
+            chunks=[{"text": "chunk"}], scores=[0.8], avg_score=0.8, num_relevant=1,
+        )
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        persist_dir = tmp_path / "chromadb"
+        with patch.object(RAGEngine, "indexed_count", new=3):
+            engine = RAGEngine(persist_dir=persist_dir)
+            engine.search = MagicMock(return_value=self._result())
+            engine.search_for_section("1", "Intro")
+
+            restarted = RAGEngine(persist_dir=persist_dir)
+            restarted.search = MagicMock()
+            result = restarted.search_for_section("1", "Intro")
+
+        restarted.search.assert_not_called()
+        assert result.section_id == "1"
+        assert result.chunks == [{"text": "chunk"}]
+        assert restarted.search_cache_stats["disk_hits"] == 1
+
+    def test_reindex_changes_fingerprint(self, tmp_path):
+        with patch.object(RAGEngine, "indexed_count", new=3):
+            engine = RAGEngine(persist_dir=tmp_path / "chromadb")
+            before = engine._collection_fingerprint()
+            engine._invalidate_search_cache()
+            assert engine._collection_fingerprint() != before
+
+    def test_no_disk_tier_without_persist_dir(self):
+        engine = RAGEngine()
+        assert engine._collection_fingerprint() is None
@@ -0,0 +1,248 @@
+"""Tests unitaires pour le scheduler parallèle des sections (Phase 6)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.orchestrator import Orchestrator
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.core.section_scheduler import build_generation_dag, chapter_of, section_context_ids
+from src.providers.base import AIResponse, BaseProvider
+
+
+def _plan():
+    return NormalizedPlan(title="Doc", sections=[
+        PlanSection(id="1", title="Intro", level=1),
+        PlanSection(id="1.1", title="Contexte", level=2, parent_id="1"),
+        PlanSection(id="1.2", title="Enjeux", level=2, parent_id="1"),
+        PlanSection(id="2", title="Analyse", level=1),
+        PlanSection(id="2.1", title="Marché", level=2, parent_id="2"),
+        PlanSection(id="2.1.1", title="Acteurs", level=3, parent_id="2.1"),
+    ])
+
+
+class TestSectionDependencies:
+    def test_chapter_of_follows_parents(self):
+        plan = _plan()
+        by_id = {s.id: s for s in plan.sections}
+        assert chapter_of(by_id["2.1.1"], by_id) == "2"
+        assert chapter_of(by_id["1"], by_id) == "1"
+
+    def test_context_stays_within_chapter(self):
+        context = section_context_ids(_plan(), summary_window=5)
+        assert context["1"] == []
+        assert context["1.2"] == ["1", "1.1"]
+        assert context["2"] == []
+        assert context["2.1.1"] == ["2", "2.1"]
+
+    def test_summary_window_limits_siblings(self):
+        context = section_context_ids(_plan(), summary_window=1)
+        assert context["1.2"] == ["1", "1.1"]  # parent toujours inclus
+        context = section_context_ids(_plan(), summary_window=0)
+        assert context["1.2"] == ["1"]
+
+    def test_already_generated_sections_are_not_dependencies(self):
+        plan = _plan()
+        pending = [s for s in plan.sections if s.id != "1"]
+        dag = build_generation_dag(pending, plan)
+        assert dag["1.1"] == []
+        assert dag["1.2"] == ["1.1"]
+
+    def test_refinement_is_fully_independent(self):
+        plan = _plan()
+        dag = build_generation_dag(plan.sections, plan, independent=True)
+        assert all(deps == [] for deps in dag.values())
+
+
+class _SlowProvider:
+    """Fournisseur factice : mesure le nombre d'appels simultanés."""
+
+    name = "fake"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def generate(self, prompt, system_prompt="", model=None, temperature=0.7, max_tokens=4096):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return AIResponse(content="Contenu généré.", model=model, provider=self.name, input_tokens=10, output_tokens=5)
+
+
+@pytest.fixture(autouse=True)
+def no_tokenizer():
+    with patch("src.core.orchestrator.count_tokens", return_value=100):
+        yield
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    provider = _SlowProvider()
+    orch = Orchestrator(
+        provider=provider,
+        project_dir=tmp_path,
+        config={"mode": "agentic", "max_parallel_sections": 4, "model": "gpt-4o"},
+    )
+    orch.init_project("test", _plan())
+    orch._ensure_phase3_engine = MagicMock()
+    orch._run_post_generation_evaluation_background = MagicMock()
+    orch._generate_summary = lambda section, content, model, system_prompt: f"résumé {section.id}"
+    return orch
+
+
+class TestParallelGeneration:
+    def test_independent_chapters_run_concurrently(self, orchestrator):
+        result = orchestrator.generate_all_sections()
+        assert set(result) == {s.id for s in orchestrator.state.plan.sections}
+        assert orchestrator.provider.max_active >= 2
+        assert orchestrator.state.current_step == "review"
+
+    def test_summaries_follow_plan_order(self, orchestrator):
+        orchestrator.generate_all_sections()
+        ids = [s.split("]")[0][1:] for s in orchestrator.state.section_summaries]
+        assert ids == ["1", "1.1", "1.2", "2", "2.1", "2.1.1"]
+
+    def test_prompt_receives_only_context_summaries(self, orchestrator):
+        seen = {}
+        prepare = orchestrator._prepare_section
+
+        def spy(section, settings, previous_summaries, *args):
+            seen[section.id] = list(previous_summaries)
+            return prepare(section, settings, previous_summaries, *args)
+
+        orchestrator._prepare_section = spy
+        orchestrator.generate_all_sections()
+        assert seen["2"] == []
+        assert seen["2.1.1"] == ["[2] Analyse: résumé 2", "[2.1] Marché: résumé 2.1"]
+
+    def test_sequential_by_default(self, tmp_path):
+        provider = _SlowProvider()
+        orch = Orchestrator(provider=provider, project_dir=tmp_path, config={"mode": "agentic"})
+        orch.init_project("test", _plan())
+        orch._ensure_phase3_engine = MagicMock()
+        orch._run_post_generation_evaluation_background = MagicMock()
+        orch._generate_summary = lambda *args: "résumé"
+        orch.generate_all_sections()
+        assert provider.max_active == 1
+
+    def test_manual_checkpoints_force_sequential(self, orchestrator):
+        orchestrator.config["mode"] = "manual"
+        orchestrator.checkpoint_mgr.should_pause = MagicMock(return_value=True)
+        assert orchestrator._generation_may_pause()
+
+
+class _AsyncProvider(BaseProvider):
+    """Fournisseur factice : agenerate natif, mesure les requêtes en vol."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.sync_calls = 0
+
+    @property
+    def name(self):
+        return "fake"
+
+    def generate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        self.sync_calls += 1
+        return AIResponse(content="sync", model=model, provider=self.name)
+
+    async def agenerate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return AIResponse(content="Contenu async.", model=model, provider=self.name, output_tokens=3)
+
+    def is_available(self):
+        return True
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def list_models(self):
+        return ["gpt-4o"]
+
+
+class TestAsyncGeneration:
+    @pytest.fixture
+    def orch(self, tmp_path):
+        orch = Orchestrator(provider=_AsyncProvider(), project_dir=tmp_path, config={"mode": "agentic"})
+        orch.init_project("test", _plan())
+        orch._ensure_phase3_engine = MagicMock()
+        orch._run_post_generation_evaluation_background = MagicMock()
+        return orch
+
+    def test_default_agenerate_runs_sync_generate_in_thread(self):
+        provider = _SlowProvider()
+        result = asyncio.run(BaseProvider.agenerate(provider, "prompt", model="gpt-4o"))
+        assert result.content == "Contenu généré."
+
+    def test_fans_out_on_one_event_loop(self, orch):
+        result = asyncio.run(orch.agenerate_all_sections())
+        assert set(result) == {s.id for s in orch.state.plan.sections}
+        assert orch.provider.sync_calls == 0
+        assert orch.provider.max_active >= 2
+        ids = [s.split("]")[0][1:] for s in orch.state.section_summaries]
+        assert ids == ["1", "1.1", "1.2", "2", "2.1", "2.1.1"]
+        assert orch.state.current_step == "review"
+
+    def test_inflight_limit(self, orch):
+        orch.config["max_inflight_requests"] = 1
+        asyncio.run(orch.agenerate_all_sections())
+        assert orch.provider.max_active == 1
+
+    def test_several_projects_share_one_loop(self, tmp_path):
+        orchs = []
+        for name in ("a", "b"):
+            orch = Orchestrator(provider=_AsyncProvider(), project_dir=tmp_path / name, config={"mode": "agentic"})
+            orch.init_project(name, _plan())
+            orch._ensure_phase3_engine = MagicMock()
+            orch._run_post_generation_evaluation_background = MagicMock()
+            orchs.append(orch)
+
+        async def run_all():
+            return await asyncio.gather(*(o.agenerate_all_sections() for o in orchs))
+
+        results = asyncio.run(run_all())
+        assert all(len(r) == 6 for r in results)
+
+
+class TestSectionPrefetch:
+    def test_upcoming_sections_are_prefetched(self, tmp_path):
+        orch = Orchestrator(provider=_SlowProvider(), project_dir=tmp_path,
+                            config={"mode": "agentic", "prefetch_sections": 2})
+        orch.init_project("test", _plan())
+        orch._ensure_phase3_engine = MagicMock()
+        orch._run_post_generation_evaluation_background = MagicMock()
+        orch._generate_summary = lambda *args: "résumé"
+        prefetch = MagicMock(wraps=orch._prefetch_section)
+        orch._prefetch_section = prefetch
+        received = []
+        prepare = orch._prepare_section
+        orch._prepare_section = lambda section, settings, summaries, index, prefetched: (
+            received.append(prefetched is not None) or prepare(section, settings, summaries, index, prefetched)
+        )
+
+        orch.generate_all_sections()
+
+        assert prefetch.call_count == 6
+        # Seule la première section est préparée sans pré-calcul
+        assert received == [False, True, True, True, True, True]
+
+    def test_failed_prefetch_is_recomputed(self, orchestrator):
+        from concurrent.futures import Future
+        future = Future()
+        future.set_exception(RuntimeError("RAG indisponible"))
+        assert orchestrator._take_prefetch(future, orchestrator.state.plan.sections[0]) is None
@@ -0,0 +1,105 @@
+"""Tests unitaires pour le résumé extractif des sections (Phase 6)."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.orchestrator import Orchestrator
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.core.section_summarizer import ExtractiveSummarizer, summary_mode
+from src.providers.base import AIResponse
+
+CONTENT = """**Contexte du marché**
+
+Le marché européen de l'intelligence artificielle progresse rapidement depuis cinq ans.
+Les entreprises européennes investissent massivement dans l'intelligence artificielle générative.
+Il fait beau aujourd'hui sur la côte bretonne et les touristes apprécient les plages.
+Les investissements européens dans l'intelligence artificielle dépassent désormais les prévisions du marché.
+- Les startups françaises du secteur lèvent des fonds importants auprès des investisseurs européens.
+{{NEEDS_SOURCE: chiffres précis des levées de fonds}}
+"""
+
+
+class TestExtractiveSummarizer:
+    def test_selects_central_sentences_in_text_order(self):
+        summary = ExtractiveSummarizer(max_sentences=2).summarize(CONTENT, "Marché de l'intelligence artificielle")
+        assert "plages" not in summary
+        assert "intelligence artificielle" in summary
+        sentences = ExtractiveSummarizer.split_sentences(CONTENT)
+        positions = [sentences.index(s) for s in sentences if s in summary]
+        assert positions == sorted(positions) and len(positions) == 2
+
+    def test_markup_and_markers_are_removed(self):
+        sentences = ExtractiveSummarizer.split_sentences(CONTENT)
+        assert "Contexte du marché" in sentences
+        assert not any("**" in s or "NEEDS_SOURCE" in s or s.startswith("-") for s in sentences)
+
+    def test_length_is_bounded(self):
+        long_text = " ".join(f"Phrase numéro {i} sur le marché européen de l'énergie solaire." for i in range(200))
+        assert len(ExtractiveSummarizer(max_chars=300).summarize(long_text)) <= 303
+
+    def test_short_text_falls_back_to_text(self):
+        assert ExtractiveSummarizer().summarize("Texte bref.") == "Texte bref."
+        assert ExtractiveSummarizer().summarize("") == ""
+
+    def test_mode_selection(self):
+        assert summary_mode({}) == "llm"
+        assert summary_mode({"summarization": {"mode": "extractive"}}) == "extractive"
+        assert summary_mode({"summarization": {"mode": "inconnu"}}) == "llm"
+
+
+class _SummaryProvider:
+    name = "fake"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def generate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        self.calls += 1
+        self.release.wait(2)
+        return AIResponse(content="Résumé IA.", model=model, provider=self.name, input_tokens=10, output_tokens=5)
+
+
+@pytest.fixture
+def section_setup(tmp_path):
+    def make(mode):
+        provider = _SummaryProvider()
+        orch = Orchestrator(provider=provider, project_dir=tmp_path, config={"summarization": {"mode": mode}})
+        plan = NormalizedPlan(title="Doc", sections=[PlanSection(id="1", title="Marché", level=1)])
+        orch.init_project("test", plan)
+        return orch, provider, plan
+    return make
+
+
+class TestOrchestratorSummaries:
+    def test_extractive_mode_makes_no_api_call(self, section_setup):
+        orch, provider, plan = section_setup("extractive")
+        orch._summarize_section(plan.sections[0], CONTENT, "gpt-4o", "", plan)
+        assert provider.calls == 0
+        assert orch.state.section_summaries[0].startswith("[1] Marché: ")
+        orch.close()
+
+    def test_hybrid_mode_upgrades_in_background(self, section_setup):
+        orch, provider, plan = section_setup("hybrid")
+        local = orch._summarize_section(plan.sections[0], CONTENT, "gpt-4o", "", plan)
+        assert orch.state.section_summaries == [f"[1] Marché: {local}"]
+        provider.release.set()
+        for future in orch._pending_evaluations:
+            future.result(2)
+        assert orch.state.section_summaries == ["[1] Marché: Résumé IA."]
+        assert orch.cost_tracker.report.entries[-1].task_type == "summary"
+        orch.close()
+
+    def test_hybrid_keeps_local_summary_on_failure(self, section_setup):
+        orch, provider, plan = section_setup("hybrid")
+        orch.provider.generate = MagicMock(side_effect=RuntimeError("indisponible"))
+        orch._summarize_section(plan.sections[0], CONTENT, "gpt-4o", "", plan)
+        for future in orch._pending_evaluations:
+            future.result(2)
+        assert "Résumé IA." not in orch.state.section_summaries[0]
+        orch.close()
@@ -0,0 +1,216 @@
+"""Tests unitaires pour la persistance incrémentale de l'état projet (Phase 6)."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.orchestrator import Orchestrator, ProjectState
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.core.state_store import JOURNAL_FILENAME, SNAPSHOT_FILENAME, StateJournal, StateSaver, load_state_dict
+from src.utils.file_utils import load_json, save_json
+
+
+def _state():
+    state = ProjectState(name="Projet")
+    state.plan = NormalizedPlan(title="Doc", sections=[
+        PlanSection(id="1", title="Intro", level=1),
+        PlanSection(id="2", title="Analyse", level=1),
+    ])
+    return state
+
+
+def _journal_lines(tmp_path):
+    return (tmp_path / JOURNAL_FILENAME).read_text(encoding="utf-8").splitlines()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return StateJournal(tmp_path, fsync=False)
+
+
+class TestStateJournal:
+    def test_first_save_writes_full_snapshot(self, tmp_path, store):
+        data = _state().to_dict()
+        store.save(data)
+        assert load_json(tmp_path / SNAPSHOT_FILENAME) == data
+        assert not (tmp_path / JOURNAL_FILENAME).exists()
+
+    def test_round_trip_through_journal(self, tmp_path, store):
+        state = _state()
+        store.save(state.to_dict())
+        state.generated_sections["1"] = "Contenu 1"
+        state.current_section_index = 1
+        store.save(state.to_dict())
+        state.plan.sections.append(PlanSection(id="3", title="Conclusion", level=1))
+        state.generated_sections["2"] = "Contenu 2"
+        data = state.to_dict()
+        store.save(data)
+
+        assert load_state_dict(tmp_path) == data
+        restored = ProjectState.from_dict(load_state_dict(tmp_path))
+        assert [s.id for s in restored.plan.sections] == ["1", "2", "3"]
+
+    def test_only_dirty_entries_are_appended(self, tmp_path, store):
+        state = _state()
+        for i in range(20):
+            state.generated_sections[f"old{i}"] = "x" * 1000
+        store.save(state.to_dict())
+        state.generated_sections["1"] = "Nouveau"
+        data = state.to_dict()
+        store.save(data)
+
+        lines = [json.loads(line) for line in _journal_lines(tmp_path)]
+        assert sorted(op.get("set") for op in lines[:-1]) == ["generated_sections\x1f1", "updated_at"]
+        assert "commit" in lines[-1]
+        # Aucune modification : rien n'est écrit
+        store.save(data)
+        assert len(_journal_lines(tmp_path)) == 3
+
+    def test_deleted_entries_are_replayed(self, tmp_path, store):
+        state = _state()
+        state.generated_sections["1"] = "Contenu"
+        store.save(state.to_dict())
+        del state.generated_sections["1"]
+        store.save(state.to_dict())
+        assert load_state_dict(tmp_path)["generated_sections"] == {}
+
+    def test_torn_batch_is_ignored(self, tmp_path, store):
+        state = _state()
+        store.save(state.to_dict())
+        state.generated_sections["1"] = "Commité"
+        store.save(state.to_dict())
+        # Arrêt brutal : lot sans commit puis ligne tronquée
+        with open(tmp_path / JOURNAL_FILENAME, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"set": "generated_sections\x1f2", "v": "Perdu"}) + "\n")
+            f.write('{"set": "current_st')
+        data = load_state_dict(tmp_path)
+        assert data["generated_sections"] == {"1": "Commité"}
+
+    def test_external_snapshot_rewrite_wins(self, tmp_path, store):
+        state = _state()
+        store.save(state.to_dict())
+        state.generated_sections["1"] = "Journalisé"
+        store.save(state.to_dict())
+        # Une page réécrit state.json directement
+        external = _state()
+        external.name = "Renommé" * 3
+        save_json(tmp_path / SNAPSHOT_FILENAME, external.to_dict())
+        assert load_state_dict(tmp_path)["generated_sections"] == {}
+
+        # La sauvegarde suivante repart d'un instantané complet
+        state.generated_sections["2"] = "Suite"
+        data = state.to_dict()
+        store.save(data)
+        assert load_json(tmp_path / SNAPSHOT_FILENAME) == data
+
+    def test_compaction_above_threshold(self, tmp_path):
+        store = StateJournal(tmp_path, compact_bytes=2000, fsync=False)
+        state = _state()
+        store.save(state.to_dict())
+        for i in range(5):
+            state.generated_sections[str(i)] = "y" * 800
+            data = state.to_dict()
+            store.save(data)
+        assert not (tmp_path / JOURNAL_FILENAME).exists() or (tmp_path / JOURNAL_FILENAME).stat().st_size <= 2000
+        assert load_json(tmp_path / SNAPSHOT_FILENAME)["generated_sections"]["2"] == "y" * 800
+        assert load_state_dict(tmp_path) == data
+
+    def test_legacy_snapshot_loads(self, tmp_path):
+        data = _state().to_dict()
+        save_json(tmp_path / SNAPSHOT_FILENAME, data)
+        assert load_state_dict(tmp_path) == data
+        assert load_state_dict(tmp_path / "absent") is None
+
+
+class TestStateSaver:
+    def _saver(self, tmp_path, state, interval_ms=50):
+        store = StateJournal(tmp_path, fsync=False)
+        calls = []
+
+        def snapshot():
+            calls.append(time.monotonic())
+            return state.to_dict()
+
+        return StateSaver(store, snapshot, interval_ms=interval_ms), calls
+
+    def _wait_idle(self, saver):
+        deadline = time.monotonic() + 2
+        while (saver.dirty or saver._writer is not None) and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def test_marks_are_coalesced(self, tmp_path):
+        state = _state()
+        saver, calls = self._saver(tmp_path, state, interval_ms=100)
+        for i in range(50):
+            state.generated_sections[str(i)] = f"Contenu {i}"
+            saver.mark_dirty()
+        self._wait_idle(saver)
+        assert 1 <= len(calls) <= 2
+        assert load_state_dict(tmp_path)["generated_sections"]["49"] == "Contenu 49"
+
+    def test_writes_are_spaced_by_interval(self, tmp_path):
+        state = _state()
+        saver, calls = self._saver(tmp_path, state, interval_ms=40)
+        saver.mark_dirty()
+        self._wait_idle(saver)
+        saver.mark_dirty()
+        self._wait_idle(saver)
+        assert len(calls) == 2
+        assert calls[1] - calls[0] >= 0.035
+
+    def test_barrier_writes_durable_snapshot(self, tmp_path):
+        state = _state()
+        saver, _ = self._saver(tmp_path, state, interval_ms=10_000)
+        saver.flush(barrier=False)  # premier instantané
+        state.generated_sections["1"] = "Contenu"
+        saver.mark_dirty()
+        saver.flush()
+        assert not saver.dirty
+        assert load_json(tmp_path / SNAPSHOT_FILENAME)["generated_sections"] == {"1": "Contenu"}
+        assert not (tmp_path / JOURNAL_FILENAME).exists()
+
+    def test_snapshot_taken_outside_caller_thread(self, tmp_path):
+        state = _state()
+        threads = []
+        store = StateJournal(tmp_path, fsync=False)
+        saver = StateSaver(store, lambda: threads.append(threading.current_thread().name) or state.to_dict(), 0)
+        saver.mark_dirty()
+        self._wait_idle(saver)
+        assert threads == ["state-writer"]
+
+    def test_background_failure_is_logged(self, tmp_path):
+        saver = StateSaver(StateJournal(tmp_path), MagicMock(side_effect=OSError("disque plein")), 0)
+        saver.mark_dirty()
+        self._wait_idle(saver)
+        assert not saver.dirty
+        with pytest.raises(OSError):
+            saver.flush()
+
+
+class TestOrchestratorPersistence:
+    def test_write_behind_then_barrier(self, tmp_path):
+        orch = Orchestrator(provider=MagicMock(), project_dir=tmp_path, config={"persistence": {"fsync": False}})
+        orch.init_project("Projet", _state().plan)
+        orch.state.generated_sections["1"] = "Contenu"
+        orch.mark_state_dirty()
+        orch._state_saver.flush(barrier=False)
+        assert (tmp_path / JOURNAL_FILENAME).exists()
+
+        reloaded = Orchestrator(provider=MagicMock(), project_dir=tmp_path)
+        assert reloaded.load_state().generated_sections == {"1": "Contenu"}
+
+        orch.save_state()
+        assert not (tmp_path / JOURNAL_FILENAME).exists()
+        assert load_json(tmp_path / SNAPSHOT_FILENAME)["generated_sections"] == {"1": "Contenu"}
+
+    def test_close_flushes_pending_changes(self, tmp_path):
+        orch = Orchestrator(provider=MagicMock(), project_dir=tmp_path, config={"persistence": {"write_behind_ms": 60_000}})
+        orch.init_project("Projet", _state().plan)
+        orch._state_saver.flush(barrier=False)
+        orch.state.generated_sections["1"] = "Contenu"
+        orch.mark_state_dirty()
+        orch.close()
+        assert load_json(tmp_path / SNAPSHOT_FILENAME)["generated_sections"] == {"1": "Contenu"}
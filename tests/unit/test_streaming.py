@@ -0,0 +1,167 @@
+"""Tests unitaires pour la génération en flux (Phase 6)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.orchestrator import Orchestrator, ProjectState
+from src.core.plan_parser import NormalizedPlan, PlanSection
+from src.core.state_store import load_state_dict
+from src.providers.anthropic_provider import AnthropicProvider
+from src.providers.base import AIResponse, BaseProvider, StreamChunk, consume_stream
+from src.providers.openai_provider import OpenAIProvider
+
+
+class _StreamingProvider(BaseProvider):
+    """Fournisseur factice : un fragment par mot, échec optionnel en cours de flux."""
+
+    def __init__(self, words, fail_after=None):
+        self.words = words
+        self.fail_after = fail_after
+        self.seen = []  # texte cumulé observé par le rappel
+
+    @property
+    def name(self):
+        return "fake"
+
+    def generate(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        raise AssertionError("generate_stream attendu")
+
+    def generate_stream(self, prompt, system_prompt=None, model=None, temperature=0.7, max_tokens=4096):
+        for i, word in enumerate(self.words):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("connexion perdue")
+            yield StreamChunk(text=word)
+        content = "".join(self.words)
+        yield StreamChunk(response=AIResponse(
+            content=content, model=model, provider=self.name, input_tokens=10, output_tokens=len(self.words),
+        ))
+
+    def is_available(self):
+        return True
+
+    def get_default_model(self):
+        return "gpt-4o"
+
+    def list_models(self):
+        return ["gpt-4o"]
+
+
+class TestConsumeStream:
+    def test_default_implementation_yields_complete_response(self):
+        provider = _StreamingProvider([])
+        provider.generate = lambda **kwargs: AIResponse(content="Bonjour", model="m", provider="fake")
+        texts = []
+        response = consume_stream(BaseProvider.generate_stream(provider, "prompt"), texts.append)
+        assert response.content == "Bonjour"
+        assert texts == ["Bonjour"]
+
+    def test_missing_final_response_raises(self):
+        with pytest.raises(RuntimeError, match="sans réponse finale"):
+            consume_stream(iter([StreamChunk(text="début")]))
+
+
+class TestProviderStreams:
+    def test_openai_stream_collects_deltas_and_usage(self):
+        provider = OpenAIProvider(api_key="sk-test", max_retries=0)
+        provider._client = MagicMock()
+
+        def chunk(content=None, finish=None, usage=None):
+            choices = [SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish)] if content or finish else []
+            return SimpleNamespace(choices=choices, usage=usage)
+
+        usage = SimpleNamespace(
+            prompt_tokens=20, completion_tokens=2, total_tokens=22,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=16),
+        )
+        provider._client.chat.completions.create.return_value = iter([
+            chunk("Bon"), chunk("jour"), chunk(finish="stop"), chunk(usage=usage),
+        ])
+
+        chunks = list(provider.generate_stream("prompt", model="gpt-4o"))
+
+        assert [c.text for c in chunks if c.text] == ["Bon", "jour"]
+        response = chunks[-1].response
+        assert response.content == "Bonjour"
+        assert response.finish_reason == "stop"
+        assert response.input_tokens == 20 and response.cached_input_tokens == 16
+        assert provider._client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_anthropic_stream_uses_final_message(self):
+        provider = AnthropicProvider(api_key="sk-ant-test", max_retries=0)
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        stream.text_stream = iter(["Salut", " !"])
+        stream.get_final_message.return_value = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="Salut !")],
+            usage=SimpleNamespace(input_tokens=5, output_tokens=3),
+            stop_reason="end_turn",
+        )
+        provider._client = MagicMock()
+        provider._client.messages.stream.return_value = stream
+
+        response = consume_stream(provider.generate_stream("prompt"))
+
+        assert response.content == "Salut !"
+        assert response.total_tokens == 8
+
+    def test_retry_only_before_first_delta(self):
+        provider = OpenAIProvider(api_key="sk-test", max_retries=2, base_delay=0)
+        provider._client = MagicMock()
+        provider._client.chat.completions.create.side_effect = [Exception("503"), iter([])]
+        assert consume_stream(provider.generate_stream("prompt")).content == ""
+        assert provider._client.chat.completions.create.call_count == 2
+
+        def broken():
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Dé"), finish_reason=None)], usage=None)
+            raise ConnectionError("coupure")
+
+        provider._client.chat.completions.create.side_effect = None
+        provider._client.chat.completions.create.return_value = broken()
+        with pytest.raises(RuntimeError, match="Flux interrompu"):
+            consume_stream(provider.generate_stream("prompt"))
+
+
+@pytest.fixture(autouse=True)
+def no_tokenizer():
+    with patch("src.core.orchestrator.count_tokens", return_value=100):
+        yield
+
+
+def _orchestrator(tmp_path, provider):
+    orch = Orchestrator(
+        provider=provider,
+        project_dir=tmp_path,
+        config={"mode": "agentic", "model": "gpt-4o", "streaming": True, "stream_checkpoint_seconds": 0},
+    )
+    orch.init_project("test", NormalizedPlan(title="Doc", sections=[PlanSection(id="1", title="Intro", level=1)]))
+    orch._ensure_phase3_engine = MagicMock()
+    orch._run_post_generation_evaluation_background = MagicMock()
+    orch._generate_summary = lambda *args: "résumé"
+    return orch
+
+
+class TestOrchestratorStreaming:
+    def test_stream_callback_and_partial_cleanup(self, tmp_path):
+        provider = _StreamingProvider(["Un ", "deux ", "trois."])
+        orch = _orchestrator(tmp_path, provider)
+        orch.stream_callback = lambda section_id, text: provider.seen.append((section_id, text))
+
+        orch.generate_all_sections()
+
+        assert provider.seen[-1] == ("1", "Un deux trois.")
+        assert orch.state.generated_sections["1"] == "Un deux trois."
+        assert orch.state.partial_sections == {}
+        orch.close()
+
+    def test_partial_text_survives_interrupted_stream(self, tmp_path):
+        orch = _orchestrator(tmp_path, _StreamingProvider(["Un ", "deux ", "trois."], fail_after=2))
+
+        orch.generate_all_sections()
+        orch.save_state()
+
+        assert orch.state.plan.sections[0].status == "failed"
+        saved = ProjectState.from_dict(load_state_dict(tmp_path))
+        assert saved.partial_sections == {"1": "Un deux "}
+        orch.close()
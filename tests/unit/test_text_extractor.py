@@ -15,13 +15,17 @@ from src.core.text_extractor import (
     ExtractionResult,
     _detect_pdf_libraries,
     _AVAILABLE_PDF_LIBS,
-    _get_file_hash,
-    _save_to_cache,
-    _load_from_cache,
-    _cache_path_for,
+    _get_cache,
     clear_cache,
     CACHE_DIR,
 )
+from src.core.extraction_cache import LazyExtractionResult
+
+
+@pytest.fixture(autouse=True)
+def _use_tmp_cache(tmp_path, monkeypatch):
+    """Redirige CACHE_DIR vers un répertoire temporaire pour chaque test."""
+    monkeypatch.setattr("src.core.text_extractor.CACHE_DIR", tmp_path / "cache")
 
 
 @pytest.fixture
@@ -166,61 +170,60 @@ class TestExtractLatin1:
 
 class TestFileHash:
     def test_hash_deterministic(self, tmp_text_file):
-        h1 = _get_file_hash(tmp_text_file)
-        h2 = _get_file_hash(tmp_text_file)
+        h1 = _get_cache().content_hash(tmp_text_file)
+        h2 = _get_cache().content_hash(tmp_text_file)
         assert h1 == h2
 
     def test_hash_changes_on_content_change(self, tmp_path):
         f = tmp_path / "changing.txt"
         f.write_text("contenu original")
-        h1 = _get_file_hash(f)
+        h1 = _get_cache().content_hash(f)
         f.write_text("contenu modifié")
-        h2 = _get_file_hash(f)
+        h2 = _get_cache().content_hash(f)
         assert h1 != h2
 
 
 class TestDiskCache:
-    @pytest.fixture(autouse=True)
-    def _use_tmp_cache(self, tmp_path, monkeypatch):
-        """Redirige CACHE_DIR vers un répertoire temporaire pour chaque test."""
-        monkeypatch.setattr("src.core.text_extractor.CACHE_DIR", tmp_path / "cache")
-
     def test_cache_miss_then_hit(self, tmp_text_file):
         """Premier appel = extraction réelle, deuxième = cache."""
         result1 = extract(tmp_text_file)
         assert result1.status == "success"
         assert "texte de test" in result1.text
-
-        # Le fichier cache doit exister
-        file_hash = _get_file_hash(tmp_text_file)
-        assert _cache_path_for(file_hash).exists()
+        assert _get_cache().contains(tmp_text_file)
 
         # Deuxième appel : chargé depuis le cache
         result2 = extract(tmp_text_file)
+        assert isinstance(result2, LazyExtractionResult)
         assert result2.status == "success"
         assert result2.text == result1.text
         assert result2.extraction_method == result1.extraction_method
+        assert _get_cache().stats()["hits"] == 1
+
+    def test_file_read_once_per_extraction(self, tmp_text_file):
+        """La clé de cache et hash_binary proviennent d'une seule lecture."""
+        result = extract(tmp_text_file)
+        stats = _get_cache().stats()
+        assert stats["hashed_bytes"] == tmp_text_file.stat().st_size
+        assert result.hash_binary == _get_cache().content_hash(tmp_text_file)
 
     def test_cache_force_bypass(self, tmp_text_file):
         """force=True ignore le cache et ré-extrait."""
         result1 = extract(tmp_text_file)
-        file_hash = _get_file_hash(tmp_text_file)
-        assert _cache_path_for(file_hash).exists()
+        assert _get_cache().contains(tmp_text_file)
 
         result2 = extract(tmp_text_file, force=True)
         assert result2.status == "success"
+        assert not isinstance(result2, LazyExtractionResult)
         assert result2.text == result1.text
 
     def test_clear_cache(self, tmp_text_file):
-        """clear_cache supprime le fichier JSON du cache."""
+        """clear_cache supprime l'entrée du cache."""
         extract(tmp_text_file)
-        file_hash = _get_file_hash(tmp_text_file)
-        cache_file = _cache_path_for(file_hash)
-        assert cache_file.exists()
+        assert _get_cache().contains(tmp_text_file)
 
         removed = clear_cache(tmp_text_file)
         assert removed is True
-        assert not cache_file.exists()
+        assert not _get_cache().contains(tmp_text_file)
 
     def test_clear_cache_absent(self, tmp_text_file):
         """clear_cache retourne False si aucun cache n'existe."""
@@ -232,30 +235,36 @@ class TestDiskCache:
         f = tmp_path / "evolving.txt"
         f.write_text("version 1", encoding="utf-8")
 
-        result1 = extract(f)
-        hash1 = _get_file_hash(f)
-        assert _cache_path_for(hash1).exists()
+        extract(f)
+        assert _get_cache().contains(f)
 
         f.write_text("version 2 avec plus de contenu", encoding="utf-8")
-        hash2 = _get_file_hash(f)
-        assert hash1 != hash2
-        # L'ancien cache existe encore, mais le nouveau hash n'a pas de cache
-        assert not _cache_path_for(hash2).exists()
+        assert not _get_cache().contains(f)
 
         result2 = extract(f)
         assert result2.text == "version 2 avec plus de contenu"
-        assert _cache_path_for(hash2).exists()
+        assert _get_cache().contains(f)
 
-    def test_cache_json_round_trip(self, tmp_text_file):
-        """Le JSON du cache contient toutes les propriétés d'ExtractionResult."""
-        result = extract(tmp_text_file)
-        file_hash = _get_file_hash(tmp_text_file)
-        cache_file = _cache_path_for(file_hash)
-
-        with open(cache_file, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+    def test_cache_meta_round_trip(self, tmp_path, tmp_text_file):
+        """La meta compacte contient les propriétés d'ExtractionResult hors texte et structure."""
+        extract(tmp_text_file)
+        meta_files = list((tmp_path / "cache").glob("*.meta.json"))
+        assert len(meta_files) == 1
 
+        raw = meta_files[0].read_text(encoding="utf-8")
+        data = json.loads(raw)
+        assert "\n" not in raw  # sérialisation compacte
         assert data["source_filename"] == "test.txt"
         assert data["status"] == "success"
         assert data["extraction_method"] == "direct"
-        assert "texte de test" in data["text"]
+        assert "text" not in data and "structure" not in data
+
+    def test_same_content_other_name_reuses_entry(self, tmp_path, tmp_text_file):
+        """Cache adressé par contenu : un fichier copié réutilise l'entrée, sous son propre nom."""
+        extract(tmp_text_file)
+        copy = tmp_path / "copie.txt"
+        copy.write_bytes(tmp_text_file.read_bytes())
+
+        result = extract(copy)
+        assert isinstance(result, LazyExtractionResult)
+        assert result.source_filename == "copie.txt"
@@ -0,0 +1,232 @@
+"""Tests unitaires pour les backends de stockage vectoriel (Phase 6)."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.core.rag_engine import RAGEngine
+from src.core.vector_store import (
+    META_FILENAME,
+    RECORDS_FILENAME,
+    VECTORS_FILENAME,
+    ChromaVectorStore,
+    NumpyVectorStore,
+    create_vector_store,
+)
+
+IDS = ["a", "b", "c"]
+DOCS = ["alpha", "bravo", "charlie"]
+METAS = [{"doc_id": "d1", "language": "fr"}, {"doc_id": "d1", "language": "en"}, {"doc_id": "d2", "language": "fr"}]
+VECTORS = np.array([[1.0, 0.0, 0.0], [0.7, 0.7, 0.0], [0.0, 0.0, 1.0]], dtype=np.float32)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = NumpyVectorStore(tmp_path / "flat_index")
+    store.add(ids=IDS, documents=DOCS, metadatas=METAS, embeddings=VECTORS)
+    return store
+
+
+class TestNumpyVectorStore:
+    def test_query_orders_by_cosine_distance(self, store):
+        result = store.query(query_embeddings=np.array([[1.0, 0.1, 0.0]]), n_results=2)
+        assert result["ids"] == [["a", "b"]]
+        assert result["documents"][0][0] == "alpha"
+        assert result["distances"][0][0] < result["distances"][0][1]
+        assert result["distances"][0][0] == pytest.approx(1 - 1 / np.sqrt(1.01), abs=1e-5)
+
+    def test_multi_query(self, store):
+        result = store.query(query_embeddings=np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]), n_results=1)
+        assert result["ids"] == [["a"], ["c"]]
+
+    def test_where_filter(self, store):
+        result = store.query(query_embeddings=np.array([1.0, 0.0, 0.0]), n_results=3, where={"language": "fr"})
+        assert result["ids"] == [["a", "c"]]
+        assert store.get(where={"doc_id": {"$in": ["d2"]}})["ids"] == ["c"]
+
+    def test_where_comparison_operators(self, tmp_path):
+        store = NumpyVectorStore(tmp_path / "flat_years")
+        store.add(ids=IDS, documents=DOCS, metadatas=[{"year": 2019}, {"year": 2022}, {}], embeddings=VECTORS)
+        assert store.get(where={"year": {"$gte": 2020}})["ids"] == ["b"]
+        assert store.get(where={"year": {"$lt": 2020}})["ids"] == ["a"]
+
+    def test_unsupported_where_operator_raises(self, store):
+        with pytest.raises(ValueError, match=r"\$regex"):
+            store.get(where={"language": {"$regex": "f.*"}})
+        with pytest.raises(ValueError, match=r"\$not"):
+            store.query(query_embeddings=np.array([1.0, 0.0, 0.0]), n_results=3, where={"$not": {"language": "fr"}})
+
+    def test_duplicate_ids_are_ignored(self, store):
+        store.add(ids=["a"], documents=["autre"], metadatas=[{}], embeddings=VECTORS[:1])
+        assert store.count() == 3
+        assert store.get(ids=["a"])["documents"] == ["alpha"]
+
+    def test_delete_persists(self, tmp_path, store):
+        store.delete(where={"doc_id": {"$in": ["d1"]}})
+        assert store.count() == 1
+        reopened = NumpyVectorStore(tmp_path / "flat_index")
+        assert reopened.get()["ids"] == ["c"]
+        assert reopened.query(query_embeddings=np.array([[0.0, 0.0, 1.0]]), n_results=5)["ids"] == [["c"]]
+
+    def test_reload_from_disk(self, tmp_path, store):
+        reopened = NumpyVectorStore(tmp_path / "flat_index")
+        assert reopened.count() == 3
+        assert reopened.get(ids=["b"])["metadatas"] == [METAS[1]]
+
+    def test_truncated_write_is_repaired(self, tmp_path, store):
+        directory = tmp_path / "flat_index"
+        # Simuler un arrêt brutal : un vecteur écrit sans son enregistrement
+        with open(directory / VECTORS_FILENAME, "ab") as f:
+            f.write(np.zeros(3, dtype=np.float32).tobytes())
+        with open(directory / RECORDS_FILENAME, "ab") as f:
+            f.write(b'{"id": "partiel"')
+        reopened = NumpyVectorStore(directory)
+        assert reopened.count() == 3
+        assert (directory / VECTORS_FILENAME).stat().st_size == 3 * 3 * 4
+
+    def test_crash_between_rewrite_replaces_rejects_index(self, tmp_path, store):
+        directory = tmp_path / "flat_index"
+        real_replace = os.replace
+
+        def crash_on_records(src, dst):
+            if str(dst).endswith(RECORDS_FILENAME):
+                raise OSError("arrêt brutal simulé")
+            real_replace(src, dst)
+
+        # vectors.f32 réécrit (2 lignes), records.jsonl encore à 3 lignes
+        with patch("src.core.vector_store.os.replace", side_effect=crash_on_records):
+            with pytest.raises(OSError):
+                store.delete(ids=["a"])
+
+        reopened = NumpyVectorStore(directory)
+        assert reopened.count() == 0
+        assert not (directory / VECTORS_FILENAME).exists()
+        reopened.add(ids=IDS, documents=DOCS, metadatas=METAS, embeddings=VECTORS)
+        assert NumpyVectorStore(directory).query(query_embeddings=np.array([[0.0, 0.0, 1.0]]), n_results=1)["ids"] == [["c"]]
+
+    def test_legacy_meta_is_upgraded(self, tmp_path, store):
+        directory = tmp_path / "flat_index"
+        (directory / META_FILENAME).write_text('{"dimension": 3}', encoding="utf-8")
+        assert NumpyVectorStore(directory).count() == 3
+        assert json.loads((directory / META_FILENAME).read_text(encoding="utf-8"))["rows"] == 3
+
+    def test_clear(self, store):
+        store.clear()
+        assert store.count() == 0
+        assert store.query(query_embeddings=np.array([[1.0, 0.0, 0.0]]))["ids"] == [[]]
+
+    def test_requires_embeddings_without_function(self):
+        store = NumpyVectorStore()
+        with pytest.raises(ValueError):
+            store.add(ids=["a"], documents=["alpha"], metadatas=[{}])
+
+    def test_query_texts_use_embedding_function(self):
+        calls = []
+
+        def embed(texts, mode):
+            calls.append(mode)
+            return np.array([[1.0, 0.0] if t == "alpha" else [0.0, 1.0] for t in texts], dtype=np.float32)
+
+        store = NumpyVectorStore(embedding_function=embed)
+        store.add(ids=["a", "b"], documents=["alpha", "bravo"], metadatas=[{}, {}])
+        result = store.query(query_texts=["bravo"], n_results=1)
+        assert result["ids"] == [["b"]]
+        assert calls == ["document", "query"]
+
+
+class TestCreateVectorStore:
+    def test_numpy_backend_in_project_dir(self, tmp_path):
+        store = create_vector_store("numpy", "orchestria_corpus", tmp_path / "chromadb")
+        assert isinstance(store, NumpyVectorStore)
+        assert store.directory == tmp_path / "chromadb" / "flat_index"
+
+    def test_unknown_backend_falls_back_to_chromadb(self):
+        assert isinstance(create_vector_store("faiss", "orchestria_corpus"), ChromaVectorStore)
+
+
+class TestBackendParity:
+    def test_same_ranking_as_chromadb(self, tmp_path, store):
+        pytest.importorskip("chromadb")
+        chroma = ChromaVectorStore("parity_test", tmp_path / "chromadb")
+        chroma.add(ids=IDS, documents=DOCS, metadatas=METAS, embeddings=VECTORS)
+        query = np.array([[0.9, 0.4, 0.1]], dtype=np.float32)
+        expected = chroma.query(query_embeddings=query, n_results=3)
+        result = store.query(query_embeddings=query, n_results=3)
+        assert result["ids"] == expected["ids"]
+        np.testing.assert_allclose(result["distances"], expected["distances"], atol=1e-4)
+
+
+class TestRAGEngineNumpyBackend:
+    def test_index_and_search(self, tmp_path):
+        engine = RAGEngine(
+            persist_dir=tmp_path / "chromadb",
+            config={"rag": {"vector_store": "numpy", "embedding_provider": "openai", "reranking_enabled": False}},
+        )
+        fake = lambda texts, mode="document": np.array(
+            [[1.0, 0.0] if "cyber" in t else [0.0, 1.0] for t in texts], dtype=np.float32,
+        )
+        with patch.object(engine, "_get_embeddings", side_effect=fake):
+            count = engine.index_corpus([
+                {"text": "Texte sur la cybersécurité.", "source_file": "a.txt"},
+                {"text": "Texte sur la formation.", "source_file": "b.txt"},
+            ])
+            result = engine.search("cyber", top_k=1)
+
+        assert count == 2
+        assert engine.collection.backend == "numpy"
+        assert result.chunks[0]["source_file"] == "a.txt"
+
+
+class TestQuantizedIndex:
+    @pytest.fixture
+    def corpus(self):
+        rng = np.random.default_rng(42)
+        return rng.standard_normal((600, 64)).astype(np.float32)
+
+    def _store(self, tmp_path, corpus, mode, rescore_factor=8):
+        store = NumpyVectorStore(tmp_path / "flat_index", quantization=mode, rescore_factor=rescore_factor)
+        ids = [f"c{i}" for i in range(len(corpus))]
+        store.add(ids=ids, documents=ids, metadatas=[{"parity": i % 2} for i in range(len(corpus))], embeddings=corpus)
+        return store
+
+    @pytest.mark.parametrize("mode", ["int8", "binary"])
+    def test_top1_matches_exact_search(self, tmp_path, corpus, mode):
+        store = self._store(tmp_path, corpus, mode)
+        result = store.query(query_embeddings=corpus[:5], n_results=3)
+        assert [ids[0] for ids in result["ids"]] == [f"c{i}" for i in range(5)]
+        # Distances rescorées en pleine précision
+        assert result["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+
+    def test_codes_are_persisted_and_rebuilt(self, tmp_path, corpus):
+        self._store(tmp_path, corpus, "int8")
+        codes_path = tmp_path / "flat_index" / "codes.int8"
+        assert codes_path.stat().st_size == 600 * 64
+        codes_path.unlink()
+        reopened = NumpyVectorStore(tmp_path / "flat_index", quantization="int8")
+        assert reopened.query(query_embeddings=corpus[7], n_results=1)["ids"] == [["c7"]]
+        assert codes_path.stat().st_size == 600 * 64
+
+    def test_where_and_delete_with_codes(self, tmp_path, corpus):
+        store = self._store(tmp_path, corpus, "binary")
+        result = store.query(query_embeddings=corpus[3], n_results=2, where={"parity": 1})
+        assert result["ids"][0][0] == "c3"
+        store.delete(where={"parity": 1})
+        assert store.count() == 300
+        result = store.query(query_embeddings=corpus[4], n_results=1)
+        assert result["ids"] == [["c4"]]
+
+    def test_recall_report(self, tmp_path, corpus):
+        store = self._store(tmp_path, corpus, "none")
+        report = {r["mode"]: r for r in store.evaluate_recall(k=10, sample_size=20)}
+        assert set(report) == {"int8", "binary"}
+        assert report["int8"]["recall_at_k"] >= 0.9
+        assert 0.0 < report["binary"]["recall_at_k"] <= 1.0
+        assert report["binary"]["code_bytes"] < report["int8"]["code_bytes"] < report["int8"]["vector_bytes"]
+
+    def test_rag_engine_recall_requires_numpy_backend(self, tmp_path):
+        engine = RAGEngine(persist_dir=tmp_path / "chromadb")
+        with patch.object(engine, "_get_collection", return_value=object()):
+            assert engine.evaluate_index_recall() == []